@@ -26,8 +26,9 @@ class VacancySerializer(serializers.ModelSerializer):
             "status",
             "workers_count",
             "extra",
+            "is_paid",
         ]
-        read_only_fields = ["id", "status", "extra"]
+        read_only_fields = ["id", "status", "extra", "is_paid"]
 
     def get_workers_count(self, obj):
         return VacancyUser.objects.filter(vacancy=obj, status="member").count()
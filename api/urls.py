@@ -4,6 +4,7 @@ from rest_framework.permissions import IsAdminUser
 from rest_framework_simplejwt.views import TokenRefreshView
 
 from api.views.auth import TelegramAuthView
+from api.views.dashboard import DashboardSummaryView
 from api.views.payment import MonobankWebhookView
 from api.views.user import UserProfileView
 from api.views.vacancy import VacancyDetailView, VacancyListView
@@ -16,6 +17,7 @@ v1_urlpatterns = [
     path("auth/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     # User
     path("users/me/", UserProfileView.as_view(), name="user_profile"),
+    path("users/me/dashboard/", DashboardSummaryView.as_view(), name="dashboard_summary"),
     # Vacancies
     path("vacancies/", VacancyListView.as_view(), name="vacancy_list"),
     path("vacancies/<int:pk>/", VacancyDetailView.as_view(), name="vacancy_detail"),
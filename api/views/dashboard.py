@@ -0,0 +1,18 @@
+from django.utils.decorators import method_decorator
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from service.db_routing import replica_reads
+from work.service.dashboard import get_dashboard_summary
+
+
+@method_decorator(replica_reads, name="dispatch")
+class DashboardSummaryView(APIView):
+    """Стан головної сторінки Mini App (те саме, що бачить шаблон)."""
+
+    def get(self, request):
+        summary = get_dashboard_summary(request.user)
+        if summary is None:
+            return Response({"detail": "Work profile role is not set."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(summary)
@@ -42,9 +42,9 @@ class MonobankWebhookView(APIView):
             if payment and payment.status == "success" and payment.vacancy_id:
                 try:
                     vacancy = payment.vacancy
-                    if not vacancy.extra.get("is_paid"):
-                        vacancy.extra["is_paid"] = True
-                        vacancy.save(update_fields=["extra"])
+                    if not vacancy.is_paid:
+                        vacancy.is_paid = True
+                        vacancy.save(update_fields=["is_paid"])
                         logger.info(f"Vacancy {vacancy.pk} marked as paid via webhook")
                 except Exception as e:
                     logger.warning(f"Failed to update vacancy after payment: {e}")
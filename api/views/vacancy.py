@@ -1,9 +1,12 @@
+from django.utils.decorators import method_decorator
 from rest_framework import generics
 
 from api.serializers.vacancy import VacancyListSerializer, VacancySerializer
+from service.db_routing import replica_reads
 from vacancy.models import Vacancy
 
 
+@method_decorator(replica_reads, name="dispatch")
 class VacancyListView(generics.ListAPIView):
     """Список активных вакансий текущего пользователя (для Заказчика)."""
 
@@ -44,6 +44,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "service.db_routing.DatabaseRoutingMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "user.middleware.UserLanguageMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -70,16 +71,44 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "config.wsgi.application"
 
-DATABASES = {
-    "default": {
+# Connections: DB_CONN_MAX_AGE keeps them open between requests/tasks (seconds,
+# health-checked); DB_POOL=1 uses Django's psycopg 3 pool instead (needs
+# `psycopg[pool]` installed; the two are mutually exclusive).
+DB_CONN_MAX_AGE = int(os.getenv("DB_CONN_MAX_AGE", "0"))
+DB_POOL = os.getenv("DB_POOL", "0") == "1"
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+
+
+def _postgres(prefix: str = "POSTGRESQL", fallback: str | None = None) -> dict:
+    def env(name):
+        value = os.getenv(f"{prefix}_{name}")
+        return value if value or fallback is None else os.getenv(f"{fallback}_{name}")
+
+    db = {
         "ENGINE": "django.db.backends.postgresql",
-        "NAME": os.getenv("POSTGRESQL_NAME"),
-        "USER": os.getenv("POSTGRESQL_USER"),
-        "PASSWORD": os.getenv("POSTGRESQL_PASSWORD"),
-        "HOST": os.getenv("POSTGRESQL_HOST"),
-        "PORT": os.getenv("POSTGRESQL_PORT"),
+        "NAME": env("NAME"),
+        "USER": env("USER"),
+        "PASSWORD": env("PASSWORD"),
+        "HOST": env("HOST"),
+        "PORT": env("PORT"),
     }
-}
+    if DB_POOL:
+        db["OPTIONS"] = {"pool": {"min_size": DB_POOL_MIN_SIZE, "max_size": DB_POOL_MAX_SIZE}}
+    else:
+        db["CONN_MAX_AGE"] = DB_CONN_MAX_AGE
+        db["CONN_HEALTH_CHECKS"] = DB_CONN_MAX_AGE > 0
+    return db
+
+
+DATABASES = {"default": _postgres()}
+
+# Optional read replica for @replica_reads views (service/db_routing.py);
+# unset POSTGRESQL_REPLICA_* values fall back to the primary's.
+if os.getenv("POSTGRESQL_REPLICA_HOST"):
+    DATABASES["replica"] = {**_postgres("POSTGRESQL_REPLICA", fallback="POSTGRESQL"), "TEST": {"MIRROR": "default"}}
+
+DATABASE_ROUTERS = ["service.db_routing.ReadReplicaRouter"]
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -257,8 +286,50 @@ BASE_URL = os.getenv("BASE_URL", "").rstrip("/")
 
 # Telegram IDs of administrators for notifications
 CELERY_BROKER_URL = f"redis://:{os.getenv('REDIS_PASSWORD')}@localhost:6379/0"
+
+# Shared cache for locks, dedupe markers, dashboards and reference data: the
+# broker's Redis, on its own DB so a cache flush never touches the queues.
+REDIS_CACHE_DB = int(os.getenv("REDIS_CACHE_DB", "1"))
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv(
+            "REDIS_CACHE_URL", f"redis://:{os.getenv('REDIS_PASSWORD')}@localhost:6379/{REDIS_CACHE_DB}"
+        ),
+        "KEY_PREFIX": "robochi",
+        "TIMEOUT": 300,
+    }
+}
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
+CELERY_TASK_ROUTES = {
+    "telegram.tasks.deliver_telegram_task": {"queue": "telegram_outbound"},
+    "telegram.tasks.kick_users_task": {"queue": "telegram_outbound"},
+    "vacancy.tasks.observers.run_vacancy_observers_task": {"queue": "vacancy_observers"},
+}
+
+# Vacancy observers subscribed as on_commit/celery (vacancy/services/observers/
+# subscriber_setup.py) are deferred only when this is on; it needs a worker for
+# the "vacancy_observers" queue:
+#   celery -A config worker -Q vacancy_observers -c 4
+VACANCY_OBSERVERS_ASYNC = os.getenv("VACANCY_OBSERVERS_ASYNC", "0") == "1"
+
+# Clear closed vacancy groups in recycle_group_task steps instead of inside the
+# closing task (telegram/service/group_recycling.py).
+GROUP_RECYCLE_ASYNC = os.getenv("GROUP_RECYCLE_ASYNC", "0") == "1"
+
+# Coalesce bursts of admin alerts into one digest per DIGEST_WINDOW
+# (service/admin_notifications.py). Needs only the default Celery worker and
+# the shared cache, not the outbound queue.
+ADMIN_DIGEST_ENABLED = os.getenv("ADMIN_DIGEST_ENABLED", "1") == "1"
+
+# Admins are alerted when fewer ready groups than this are left in the pool
+# (telegram/service/group_pool.py).
+GROUP_POOL_LOW_WATERMARK = int(os.getenv("GROUP_POOL_LOW_WATERMARK", "3"))
+
+# Bearer token for the Prometheus scrape at /metrics (service.metrics); without
+# it the endpoint is visible to staff sessions only.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
 from config.settings.sentry import *  # noqa: E402, F403
 from config.settings.telegram_bot import *  # noqa: E402, F403
 
@@ -25,3 +25,18 @@ STORAGES = {
         "BACKEND": "django.core.files.storage.FileSystemStorage",
     },
 }
+
+# Per-process cache: no Redis in tests, and the suite clears it between tests
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# Deliver Telegram broadcasts inline — no broker in tests
+TELEGRAM_OUTBOUND_ASYNC = False
+
+# Run every vacancy observer inline
+VACANCY_OBSERVERS_ASYNC = False
+
+# Recycle groups inline
+GROUP_RECYCLE_ASYNC = False
+
+# Send admin alerts right away instead of scheduling a digest flush
+ADMIN_DIGEST_ENABLED = False
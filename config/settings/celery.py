@@ -3,31 +3,38 @@ from datetime import timedelta
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import task_postrun, task_prerun
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.django.production")
 app = Celery("config")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
+
+# Runtime and DB query count of every task run (service.metrics).
+@task_prerun.connect
+def _task_metrics_start(task_id=None, **kwargs):
+    from service.metrics import task_run_started
+
+    task_run_started(task_id)
+
+
+@task_postrun.connect
+def _task_metrics_finish(task_id=None, task=None, state=None, **kwargs):
+    from service.metrics import task_run_finished
+
+    task_run_finished(task_id, task.name if task else "unknown", state)
+
+
 app.conf.beat_schedule = {
     "test_heartbeat": {
         "task": "vacancy.tasks.call.test_heartbeat",
         "schedule": timedelta(seconds=30),
     },
-    "before_start_call_task": {
-        "task": "vacancy.tasks.call.before_start_call_task",
-        "schedule": timedelta(seconds=30),
-    },
-    "after_first_call_check_task": {
-        "task": "vacancy.tasks.call.after_first_call_check_task",
-        "schedule": timedelta(seconds=30),
-    },
-    "start_call_check_task": {
-        "task": "vacancy.tasks.call.start_call_check_task",
-        "schedule": timedelta(seconds=30),
-    },
-    "final_call_check_task": {
-        "task": "vacancy.tasks.call.final_call_check_task",
+    # Rollcall/close/renewal deadlines are armed per vacancy (VacancyTimer);
+    # this tick only pops the rows that are due.
+    "dispatch_vacancy_timers_task": {
+        "task": "vacancy.tasks.call.dispatch_vacancy_timers_task",
         "schedule": timedelta(seconds=30),
     },
     "disputed_rollcall_reminders_task": {
@@ -42,10 +49,6 @@ app.conf.beat_schedule = {
         "task": "vacancy.tasks.call.send_unpaid_reminders_task",
         "schedule": timedelta(seconds=60),
     },
-    "close_vacancy_task": {
-        "task": "vacancy.tasks.call.close_vacancy_task",
-        "schedule": timedelta(seconds=30),
-    },
     "close_lifecycle_timer_task": {
         "task": "vacancy.tasks.call.close_lifecycle_timer_task",
         "schedule": timedelta(seconds=30),
@@ -54,6 +57,16 @@ app.conf.beat_schedule = {
         "task": "vacancy.tasks.call.worker_join_confirm_check_task",
         "schedule": timedelta(seconds=30),
     },
+    "drain_stale_telegram_updates_task": {
+        "task": "telegram.tasks.drain_stale_telegram_updates_task",
+        "schedule": timedelta(seconds=60),
+    },
+    # Group recycling re-queues its own steps; this restarts lost ones and
+    # re-verifies the groups waiting in the pool.
+    "refill_group_pool_task": {
+        "task": "telegram.tasks.refill_group_pool_task",
+        "schedule": timedelta(minutes=5),
+    },
     "resend_vacancies_to_channel_task": {
         "task": "vacancy.tasks.resend.resend_vacancies_to_channel_task",
         "schedule": timedelta(seconds=30),
@@ -62,9 +75,11 @@ app.conf.beat_schedule = {
         "task": "user.tasks.cleanup_inactive_users_task",
         "schedule": crontab(hour=3, minute=0),  # Every night at 03:00
     },
-    "renewal_offer_task": {
-        "task": "vacancy.tasks.call.renewal_offer_task",
-        "schedule": timedelta(seconds=30),
+    # Resumes where the previous run stopped: accounts are re-probed only once
+    # telegram_checked_at is older than PROBE_INTERVAL_DAYS.
+    "probe_telegram_accounts": {
+        "task": "user.tasks.probe_telegram_accounts_task",
+        "schedule": timedelta(minutes=15),
     },
     "renewal_worker_check_task": {
         "task": "vacancy.tasks.call.renewal_worker_check_task",
@@ -74,6 +89,14 @@ app.conf.beat_schedule = {
         "task": "user.tasks.cleanup_unregistered_users_task",
         "schedule": crontab(hour=3, minute=30),
     },
+    "refresh_rating_params": {
+        "task": "user.tasks.refresh_rating_params_task",
+        "schedule": timedelta(minutes=10),
+    },
+    "recount_rating_stats": {
+        "task": "user.tasks.recount_rating_stats_task",
+        "schedule": crontab(hour=3, minute=45),
+    },
     "check_system": {
         "task": "work.tasks.check_system_task",
         "schedule": crontab(hour=4, minute=0),  # Every night at 04:00 Kyiv time
@@ -29,3 +29,20 @@ TELEGRAM_BOT_ALLOWED_UPDATES = [
     "chat_member",
     "chat_join_request",
 ]
+
+# Outbound queue (service.telegram_outbound): broadcasts go through the
+# "telegram_outbound" Celery queue, consumed by one worker process that enforces
+# the Bot API limits. Enable only once that worker is running:
+#   celery -A config worker -Q telegram_outbound -c 1
+TELEGRAM_OUTBOUND_ASYNC = os.getenv("TELEGRAM_OUTBOUND_ASYNC", "0") == "1"
+TELEGRAM_RATE_GLOBAL_PER_SECOND = 30
+TELEGRAM_RATE_CHAT_PER_SECOND = 1
+TELEGRAM_RATE_GROUP_PER_MINUTE = 20
+
+# Webhook processing (telegram.service.updates):
+#   inline - process inside the request (telebot's own thread pool)
+#   thread - persist, answer 200, drain per chat in an in-process thread pool
+#   celery - persist, answer 200, drain per chat in a Celery worker
+# thread/celery require the secret token header: re-run `manage.py set_tg_webhook`.
+TELEGRAM_WEBHOOK_MODE = os.getenv("TELEGRAM_WEBHOOK_MODE", "inline")
+TELEGRAM_WEBHOOK_THREADS = int(os.getenv("TELEGRAM_WEBHOOK_THREADS", "4"))
@@ -4,6 +4,7 @@ from django.contrib import admin
 from django.urls import include, path
 
 from work.views.index import index
+from work.views.metrics import metrics
 
 urlpatterns = [
     path("taya-panel/", admin.site.urls),
@@ -11,6 +12,7 @@ urlpatterns = [
     path("telegram/", include("telegram.urls", namespace="telegram")),
     path("work/", include("work.urls", namespace="work")),
     path("vacancy/", include("vacancy.urls", namespace="vacancy")),
+    path("metrics", metrics, name="metrics"),
     path("", index, name="index"),
 ]
 
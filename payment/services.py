@@ -116,9 +116,13 @@ def process_webhook(*, invoice_id: str, webhook_data: dict) -> MonobankPayment |
         # Mark vacancy as paid
         vacancy = payment.vacancy
         if vacancy:
-            vacancy.extra["is_paid"] = True
+            vacancy.is_paid = True
             vacancy.status = "paid"
-            vacancy.save(update_fields=["extra", "status"])
+            vacancy.save(update_fields=["is_paid", "status"])
+
+            from vacancy.services.timers import schedule_renewal_timer
+
+            schedule_renewal_timer(vacancy)
 
         # Remove unpaid block
         from user.models import UserBlock
@@ -0,0 +1,161 @@
+"""Admin notification channel.
+
+Recipients come from a cached list of staff ids (kept in step with User saves
+by user/signals.py). Messages go through TelegramBroadcastService, i.e. the
+outbound queue when TELEGRAM_OUTBOUND_ASYNC is on.
+
+Alerts that arrive in bursts use notify_admins_digest(): items of one kind are
+collected for DIGEST_WINDOW seconds and flushed by
+telegram.tasks.flush_admin_digest_task as a single message per admin
+(settings.ADMIN_DIGEST_ENABLED, independent of the outbound queue). Items
+are stored under per-item keys numbered by cache.incr(), so concurrent
+producers never overwrite each other. A number is taken before its item is
+written, so a flush stops at the first missing item and re-arms; an item
+still missing one flush later belonged to a producer that died and is
+skipped.
+"""
+
+import html
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .db_routing import primary_reads
+from .notifications import NotificationMethod
+from .telegram_outbound import DeliveryHandle
+
+logger = logging.getLogger(__name__)
+
+ADMIN_IDS_CACHE_KEY = "admin_recipient_ids"
+ADMIN_IDS_TTL = 60 * 60
+
+DIGEST_WINDOW = 60
+DIGEST_MAX_ITEMS = 30
+DIGEST_ITEM_TTL = 24 * 60 * 60
+_DIGEST_COUNTER_KEY = "admin_digest:{kind}:counter"
+_DIGEST_FLUSHED_KEY = "admin_digest:{kind}:flushed"
+_DIGEST_ITEM_KEY = "admin_digest:{kind}:{index}"
+_DIGEST_SCHEDULED_KEY = "admin_digest:{kind}:scheduled"
+_DIGEST_GAP_KEY = "admin_digest:{kind}:gap"
+
+DIGEST_NEW_USER = "new_user"
+DIGEST_NO_GROUP = "no_group"
+
+DIGEST_TITLES = {
+    DIGEST_NEW_USER: "🆕 <b>Нові користувачі: {count}</b>",
+    DIGEST_NO_GROUP: "⚠️ <b>Немає вільних груп</b>\nВакансій без автопідтвердження: {count}",
+}
+
+
+def get_admin_ids() -> list[int]:
+    ids = cache.get(ADMIN_IDS_CACHE_KEY)
+    if ids is None:
+        from user.models import User
+
+        with primary_reads():
+            ids = list(User.objects.filter(is_staff=True).order_by("id").values_list("id", flat=True))
+        cache.set(ADMIN_IDS_CACHE_KEY, ids, ADMIN_IDS_TTL)
+    return ids
+
+
+def invalidate_admin_ids() -> None:
+    cache.delete(ADMIN_IDS_CACHE_KEY)
+
+
+def sync_admin_ids(user_id: int, is_staff: bool) -> None:
+    """Drop the cached list if `user_id`'s staff flag no longer matches it."""
+    ids = cache.get(ADMIN_IDS_CACHE_KEY)
+    if ids is not None and is_staff != (user_id in ids):
+        invalidate_admin_ids()
+
+
+def notify_admins(text: str, method: NotificationMethod = NotificationMethod.TEXT, **kwargs) -> DeliveryHandle | None:
+    from service.broadcast_service import TelegramBroadcastService
+    from service.notifications_impl import TelegramNotifier
+    from telegram.handlers.bot_instance import get_bot
+
+    admin_ids = get_admin_ids()
+    if not admin_ids:
+        return None
+    kwargs.setdefault("parse_mode", "HTML")
+    broadcast = TelegramBroadcastService(notifier=TelegramNotifier(get_bot()))
+    return broadcast.broadcast(chat_ids=admin_ids, method=method, text=text, **kwargs)
+
+
+def notify_admins_digest(kind: str, text: str, summary: str) -> None:
+    """
+    Queue `text` for a digest of `kind`. A lone item is sent as `text`; several
+    within DIGEST_WINDOW become one message listing their `summary` lines (HTML).
+    With ADMIN_DIGEST_ENABLED off the text is sent right away.
+    """
+    if not getattr(settings, "ADMIN_DIGEST_ENABLED", False):
+        notify_admins(text)
+        return
+
+    cache.add(_DIGEST_COUNTER_KEY.format(kind=kind), 0, None)
+    index = cache.incr(_DIGEST_COUNTER_KEY.format(kind=kind))
+    cache.set(_DIGEST_ITEM_KEY.format(kind=kind, index=index), {"text": text, "summary": summary}, DIGEST_ITEM_TTL)
+    if not _schedule_flush(kind):
+        flush_admin_digest(kind)
+
+
+def _schedule_flush(kind: str) -> bool:
+    """Arm flush_admin_digest_task unless one is pending; False if the broker is unreachable."""
+    if not cache.add(_DIGEST_SCHEDULED_KEY.format(kind=kind), True, DIGEST_WINDOW * 5):
+        return True
+    try:
+        from telegram.tasks import flush_admin_digest_task
+
+        flush_admin_digest_task.apply_async(args=[kind], countdown=DIGEST_WINDOW)
+    except Exception as e:
+        logger.warning(f"admin_digest_schedule_failed ({kind}): {e}")
+        return False
+    return True
+
+
+def render_digest(kind: str, items: list[dict]) -> str:
+    if len(items) == 1:
+        return items[0]["text"]
+    title = DIGEST_TITLES.get(kind, "<b>{count}</b>").format(count=len(items))
+    lines = [f"• {item['summary']}" for item in items[:DIGEST_MAX_ITEMS]]
+    if len(items) > DIGEST_MAX_ITEMS:
+        lines.append(f"… ще {len(items) - DIGEST_MAX_ITEMS}")
+    return title + "\n\n" + "\n".join(lines)
+
+
+def flush_admin_digest(kind: str) -> int:
+    """Send everything queued for `kind` since the last flush; returns the item count."""
+    # Release the schedule flag first: items pushed from here on arm a new flush.
+    cache.delete(_DIGEST_SCHEDULED_KEY.format(kind=kind))
+    end = cache.get(_DIGEST_COUNTER_KEY.format(kind=kind)) or 0
+    start = cache.get(_DIGEST_FLUSHED_KEY.format(kind=kind)) or 0
+    if end <= start:
+        return 0
+
+    keys = {i: _DIGEST_ITEM_KEY.format(kind=kind, index=i) for i in range(start + 1, end + 1)}
+    found = cache.get_many(keys.values())
+    gap_key = _DIGEST_GAP_KEY.format(kind=kind)
+    items, flushed = [], start
+    for index, key in keys.items():
+        if key in found:
+            items.append(found[key])
+        elif cache.get(gap_key) != index:
+            # Numbered but not written yet: leave it, and what follows, to the next flush.
+            cache.set(gap_key, index, DIGEST_ITEM_TTL)
+            break
+        flushed = index
+    cache.set(_DIGEST_FLUSHED_KEY.format(kind=kind), flushed, None)
+    cache.delete_many([keys[i] for i in range(start + 1, flushed + 1)])
+    if flushed < end:
+        _schedule_flush(kind)
+    if items:
+        notify_admins(render_digest(kind, items))
+    logger.info("admin_digest_flushed", extra={"kind": kind, "items": len(items)})
+    return len(items)
+
+
+def user_summary(user) -> str:
+    name = html.escape(user.full_name or "—")
+    username = f" @{html.escape(user.username)}" if user.username else ""
+    return f"{name}{username} (<code>{user.id}</code>)"
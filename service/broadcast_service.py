@@ -1,20 +1,31 @@
+import logging
 from types import SimpleNamespace
 
-from user.models import User
-
 from .notifications import NotificationMethod
 from .notifications_impl import TelegramNotifier
+from .telegram_outbound import OP_SEND, DeliveryHandle, enqueue_delivery, outbound_enabled
+
+logger = logging.getLogger(__name__)
 
 
 class TelegramBroadcastService:
     def __init__(self, notifier: TelegramNotifier):
         self.notifier = notifier
 
-    def broadcast(self, chat_ids: list[int], method: NotificationMethod, **kwargs) -> None:
+    def broadcast(self, chat_ids: list[int], method: NotificationMethod, **kwargs) -> DeliveryHandle | None:
+        """Queue one outbound delivery for all chats; sends inline when the queue is off/unreachable."""
+        chat_ids = list(chat_ids)
+        if outbound_enabled() and chat_ids:
+            try:
+                return enqueue_delivery(OP_SEND, chat_ids, method, **kwargs)
+            except Exception as e:
+                logger.warning(f"outbound_enqueue_failed: {e}")
         for chat_id in chat_ids:
             recipient = SimpleNamespace(chat_id=chat_id)
-            self.notifier.notify(recipient, method, **kwargs)
+            self.notifier.send_inline(recipient, method, **kwargs)
+        return None
+
+    def admin_broadcast(self, method: NotificationMethod = NotificationMethod.TEXT, **kwargs) -> DeliveryHandle | None:
+        from .admin_notifications import get_admin_ids
 
-    def admin_broadcast(self, method: NotificationMethod = NotificationMethod.TEXT, **kwargs) -> None:
-        ids = User.objects.filter(is_staff=True).values_list("id", flat=True)
-        self.broadcast(chat_ids=ids, method=method, **kwargs)
+        return self.broadcast(chat_ids=get_admin_ids(), method=method, **kwargs)
@@ -0,0 +1,123 @@
+"""
+Read-replica routing.
+
+When settings.DATABASES has a "replica" alias (POSTGRESQL_REPLICA_HOST is
+set), views wrapped in @replica_reads send their reads there; everything
+else - writes, Celery tasks, the webhook, undecorated views - stays on
+"default". Read-your-writes:
+
+  - within a request, the first write pins the rest of the request to the
+    primary (ReadReplicaRouter.db_for_write);
+  - across requests, a user who wrote something reads from the primary for
+    PRIMARY_PIN_SECONDS afterwards (DatabaseRoutingMiddleware), which covers
+    the usual POST -> redirect -> read page flow and replication lag.
+
+The pin only covers the writer's own requests. Shared caches (dashboard
+summary, block status, reference data) are invalidated by writes from
+anyone - other users, Celery, the webhook - so they are always refilled
+inside primary_reads(): a lagging replica must not put stale data back
+for a whole TTL.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+
+REPLICA_ALIAS = "replica"
+PRIMARY_PIN_SECONDS = 10
+_PIN_KEY = "db_primary_pin:{user_id}"
+
+
+@dataclass
+class _RoutingState:
+    replica_allowed: bool = False
+    wrote: bool = False
+
+
+_state: ContextVar[_RoutingState | None] = ContextVar("db_routing_state", default=None)
+
+
+def replica_configured() -> bool:
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+class ReadReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is not None and state.replica_allowed and not state.wrote and replica_configured():
+            return REPLICA_ALIAS
+        return "default"
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica gets its schema through replication.
+        return db == "default"
+
+
+@contextmanager
+def primary_reads():
+    """Read from the primary inside the block, even within a @replica_reads view."""
+    state = _state.get()
+    if state is None or not state.replica_allowed:
+        yield
+        return
+    state.replica_allowed = False
+    try:
+        yield
+    finally:
+        state.replica_allowed = True
+
+
+def _pinned(request) -> bool:
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return False
+    return bool(cache.get(_PIN_KEY.format(user_id=user.pk)))
+
+
+def replica_reads(view):
+    """Let a read-only view read from the replica (see the module docstring)."""
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        state = _state.get()
+        if state is None or not replica_configured() or _pinned(request):
+            return view(request, *args, **kwargs)
+        state.replica_allowed = True
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            state.replica_allowed = False
+
+    return wrapper
+
+
+class DatabaseRoutingMiddleware:
+    """Per-request routing state; pins a user who wrote to the primary for a few seconds."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = _RoutingState()
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        user = getattr(request, "user", None)
+        if state.wrote and replica_configured() and user is not None and user.is_authenticated:
+            cache.set(_PIN_KEY.format(user_id=user.pk), True, PRIMARY_PIN_SECONDS)
+        return response
@@ -0,0 +1,332 @@
+"""
+Process-wide histograms and counters, exported in Prometheus text format.
+
+observe()/inc() only touch an in-process dict under a lock. Once FLUSH_INTERVAL
+seconds have passed they wake a per-process daemon thread, which adds the
+deltas to shared cache counters (one cache.incr per non-zero field), so the
+/metrics endpoint sees web and Celery processes alike and the request or Bot
+API call that crossed the interval never waits on the cache. Bucket bounds are fixed
+per histogram and label values come from code (task, observer, event, Bot API
+method names), which keeps the number of series bounded.
+
+Sources:
+  vacancy_event_duration_seconds     - vacancy_publisher.notify(), inline part
+  vacancy_observer_duration_seconds  - each observer run (any dispatch policy)
+  telegram_api_duration_seconds      - Bot API HTTP calls, by method
+  telegram_update_duration_seconds   - handling one queued webhook update
+  telegram_webhook_duration_seconds  - webhook request until the 200 reply
+  celery_task_duration_seconds       - every Celery task run (incl. beat)
+  celery_task_db_queries             - DB queries issued by one task run
+  telegram_webhook_updates_total     - webhook updates by intake outcome (counter)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+COUNT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+FLUSH_INTERVAL = 10
+_SUM_SCALE = 1_000_000  # sums are stored as integer micro-units so cache.incr() can add them
+
+_SERIES_INDEX_KEY = "metrics:series"
+_FIELD_KEY = "metrics:{series}:{field}"
+
+
+@dataclass(frozen=True)
+class Histogram:
+    name: str
+    help: str
+    buckets: tuple[float, ...] = SECONDS_BUCKETS
+
+
+HISTOGRAMS = {
+    h.name: h
+    for h in (
+        Histogram("vacancy_event_duration_seconds", "Inline part of vacancy_publisher.notify()"),
+        Histogram("vacancy_observer_duration_seconds", "One vacancy observer run"),
+        Histogram("telegram_api_duration_seconds", "Bot API HTTP call"),
+        Histogram("telegram_update_duration_seconds", "Handling of one queued webhook update"),
+        Histogram("telegram_webhook_duration_seconds", "Webhook request until the reply"),
+        Histogram("celery_task_duration_seconds", "Celery task run"),
+        Histogram("celery_task_db_queries", "DB queries per Celery task run", COUNT_BUCKETS),
+    )
+}
+
+
+@dataclass(frozen=True)
+class Counter:
+    name: str
+    help: str
+
+
+COUNTERS = {
+    c.name: c
+    for c in (Counter("telegram_webhook_updates_total", "Webhook updates by intake outcome: new, retry, duplicate"),)
+}
+
+
+class _Pending:
+    """Deltas of one series since the last flush."""
+
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size
+        self.count = 0
+        self.sum = 0
+
+
+def _series_id(name: str, labels: tuple[tuple[str, str], ...]) -> str:
+    raw = json.dumps([name, labels], separators=(",", ":"))
+    return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()[:16]
+
+
+class MetricsRegistry:
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, tuple], _Pending] = {}
+        self._last_flush = clock()
+        self._flush_wanted = threading.Event()
+        self._flusher_lock = threading.Lock()
+        self._flusher_pid: int | None = None
+
+    def _pending_for(self, name: str, labels: dict, size: int) -> _Pending:
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _Pending(size)
+        return pending
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        histogram = HISTOGRAMS[name]
+        with self._lock:
+            pending = self._pending_for(name, labels, len(histogram.buckets) + 1)
+            for i, bound in enumerate(histogram.buckets):
+                if value <= bound:
+                    pending.buckets[i] += 1
+                    break
+            else:
+                pending.buckets[-1] += 1
+            pending.count += 1
+            pending.sum += int(value * _SUM_SCALE)
+            due = self._clock() - self._last_flush >= FLUSH_INTERVAL
+        if due:
+            self._request_flush()
+
+    def inc(self, name: str, amount: int = 1, **labels) -> None:
+        COUNTERS[name]  # unknown names fail loudly, as in observe()
+        with self._lock:
+            self._pending_for(name, labels, 0).count += amount
+            due = self._clock() - self._last_flush >= FLUSH_INTERVAL
+        if due:
+            self._request_flush()
+
+    def _request_flush(self) -> None:
+        """Wake the flush thread, starting it first in a new (or freshly forked) process."""
+        pid = os.getpid()
+        if self._flusher_pid != pid:
+            with self._flusher_lock:
+                if self._flusher_pid != pid:
+                    self._flush_wanted = threading.Event()  # never reuse one inherited through fork()
+                    threading.Thread(target=self._run_flusher, name="metrics-flush", daemon=True).start()
+                    self._flusher_pid = pid
+        self._flush_wanted.set()
+
+    def _run_flusher(self) -> None:
+        while True:
+            self._flush_wanted.wait()
+            self._flush_wanted.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.warning("metrics_flush_failed", exc_info=True)
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = self._clock()
+        if not pending:
+            return
+        index = cache.get(_SERIES_INDEX_KEY) or {}
+        new_series = {}
+        for (name, labels), delta in pending.items():
+            series = _series_id(name, labels)
+            if series not in index:
+                new_series[series] = [name, list(labels)]
+            fields = {f"b{i}": n for i, n in enumerate(delta.buckets) if n}
+            fields["count"] = delta.count
+            if name not in COUNTERS:
+                fields["sum"] = delta.sum
+            for field, amount in fields.items():
+                if amount:
+                    _add_to_field(_FIELD_KEY.format(series=series, field=field), amount)
+        if new_series:
+            # Re-read right before writing to narrow the window for a concurrent flush.
+            index = cache.get(_SERIES_INDEX_KEY) or {}
+            index.update(new_series)
+            cache.set(_SERIES_INDEX_KEY, index, None)
+
+    def collect(self) -> list[dict]:
+        """Flushed state of every series: name, labels, cumulative buckets, count, sum (counters: value)."""
+        self.flush()
+        index = cache.get(_SERIES_INDEX_KEY) or {}
+        rows = []
+        for series, (name, labels) in sorted(index.items(), key=lambda item: item[1]):
+            if name in COUNTERS:
+                key = _FIELD_KEY.format(series=series, field="count")
+                rows.append({"name": name, "labels": dict(labels), "value": cache.get(key, 0)})
+                continue
+            histogram = HISTOGRAMS.get(name)
+            if histogram is None:
+                continue
+            fields = [f"b{i}" for i in range(len(histogram.buckets) + 1)] + ["count", "sum"]
+            keys = {field: _FIELD_KEY.format(series=series, field=field) for field in fields}
+            values = cache.get_many(keys.values())
+            raw = [values.get(keys[f"b{i}"], 0) for i in range(len(histogram.buckets) + 1)]
+            cumulative, running = [], 0
+            for n in raw:
+                running += n
+                cumulative.append(running)
+            rows.append(
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "buckets": list(zip([*histogram.buckets, float("inf")], cumulative, strict=True)),
+                    "count": values.get(keys["count"], 0),
+                    "sum": values.get(keys["sum"], 0) / _SUM_SCALE,
+                }
+            )
+        return rows
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pending = {}
+
+
+def _add_to_field(key: str, amount: int) -> None:
+    try:
+        cache.incr(key, amount)
+    except ValueError:  # first write of this field
+        if not cache.add(key, amount, None):
+            cache.incr(key, amount)
+
+
+registry = MetricsRegistry()
+
+
+def observe(name: str, value: float, **labels) -> None:
+    registry.observe(name, value, **labels)
+
+
+def inc(name: str, amount: int = 1, **labels) -> None:
+    registry.inc(name, amount, **labels)
+
+
+@contextmanager
+def timed(name: str, **labels):
+    started = time.monotonic()
+    try:
+        yield labels
+    finally:
+        observe(name, time.monotonic() - started, **labels)
+
+
+def get_histogram(name: str, **labels) -> dict | None:
+    wanted = {k: str(v) for k, v in labels.items()}
+    return next((row for row in registry.collect() if row["name"] == name and row["labels"] == wanted), None)
+
+
+def get_counter(name: str, **labels) -> int:
+    wanted = {k: str(v) for k, v in labels.items()}
+    return next((row["value"] for row in registry.collect() if row["name"] == name and row["labels"] == wanted), 0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str], extra: dict[str, str] | None = None) -> str:
+    merged = {**labels, **(extra or {})}
+    if not merged:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in merged.items()) + "}"
+
+
+def render_prometheus() -> str:
+    lines = []
+    described = set()
+    for row in registry.collect():
+        name = row["name"]
+        if name in COUNTERS:
+            if name not in described:
+                lines.append(f"# HELP {name} {COUNTERS[name].help}")
+                lines.append(f"# TYPE {name} counter")
+                described.add(name)
+            lines.append(f"{name}{_format_labels(row['labels'])} {row['value']}")
+            continue
+        if name not in described:
+            lines.append(f"# HELP {name} {HISTOGRAMS[name].help}")
+            lines.append(f"# TYPE {name} histogram")
+            described.add(name)
+        for bound, count in row["buckets"]:
+            le = "+Inf" if bound == float("inf") else repr(float(bound))
+            lines.append(f"{name}_bucket{_format_labels(row['labels'], {'le': le})} {count}")
+        lines.append(f"{name}_sum{_format_labels(row['labels'])} {row['sum']}")
+        lines.append(f"{name}_count{_format_labels(row['labels'])} {row['count']}")
+    return "\n".join(lines) + "\n"
+
+
+# --- Bot API -----------------------------------------------------------------
+
+
+def timed_request_sender(method, url, **kwargs):
+    """telebot apihelper.CUSTOM_REQUEST_SENDER: the default session request, timed per Bot API method."""
+    from telebot import apihelper
+
+    api_method = url.rsplit("/", 1)[-1]
+    with timed("telegram_api_duration_seconds", method=api_method):
+        return apihelper._get_req_session().request(method, url, **kwargs)
+
+
+# --- Celery ------------------------------------------------------------------
+
+_task_runs: dict[str, tuple[float, list[int], object]] = {}
+
+
+def task_run_started(task_id: str) -> None:
+    from django.db import connection
+
+    counter = [0]
+
+    def count_queries(execute, sql, params, many, context):
+        counter[0] += 1
+        return execute(sql, params, many, context)
+
+    connection.execute_wrappers.append(count_queries)
+    _task_runs[task_id] = (time.monotonic(), counter, count_queries)
+
+
+def task_run_finished(task_id: str, task_name: str, state: str | None) -> None:
+    from django.db import connection
+
+    run = _task_runs.pop(task_id, None)
+    if run is None:
+        return
+    started, counter, wrapper = run
+    if wrapper in connection.execute_wrappers:
+        connection.execute_wrappers.remove(wrapper)
+    outcome = "ok" if state in (None, "SUCCESS") else "error"
+    observe("celery_task_duration_seconds", time.monotonic() - started, task=task_name, outcome=outcome)
+    observe("celery_task_db_queries", counter[0], task=task_name)
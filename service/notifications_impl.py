@@ -4,10 +4,8 @@ import sentry_sdk
 from django.contrib import messages
 from telebot import TeleBot
 
-from telegram.choices import MessageStatus
-from telegram.models import Channel, ChannelMessage, Group, GroupMessage
-
 from .notifications import NotificationMethod, Notifier
+from .telegram_outbound import OP_SEND, OP_UPDATE, DeliveryHandle, MessageLogBuffer, enqueue_delivery, outbound_enabled
 from .telegram_strategy_factory import TelegramStrategyFactory
 
 logger = logging.getLogger(__name__)
@@ -33,7 +31,28 @@ class TelegramNotifier(Notifier):
     def __init__(self, bot: TeleBot):
         self.bot = bot
 
-    def notify(self, recipient, method: NotificationMethod = NotificationMethod.TEXT, **kwargs):
+    def notify(
+        self, recipient, method: NotificationMethod = NotificationMethod.TEXT, **kwargs
+    ) -> DeliveryHandle | None:
+        """Send a message, or edit one with is_update=True and message_id.
+
+        With TELEGRAM_OUTBOUND_ASYNC on the call is queued on the outbound worker
+        and its DeliveryHandle returned; otherwise, or when the broker is
+        unreachable, it runs inline.
+        """
+        chat_id = getattr(recipient, "chat_id", None)
+        if chat_id and outbound_enabled():
+            queued = dict(kwargs)
+            op = OP_UPDATE if queued.pop("is_update", False) else OP_SEND
+            message_id = queued.pop("message_id", None)
+            try:
+                return enqueue_delivery(op, [chat_id], method, message_id=message_id, **queued)
+            except Exception as e:
+                logger.warning(f"outbound_enqueue_failed: {e}")
+        self.send_inline(recipient, method, **kwargs)
+        return None
+
+    def send_inline(self, recipient, method: NotificationMethod = NotificationMethod.TEXT, **kwargs) -> None:
         chat_id = getattr(recipient, "chat_id", None)
         is_update = kwargs.pop("is_update", False)
         vacancy = kwargs.pop("vacancy", None)
@@ -53,44 +72,14 @@ class TelegramNotifier(Notifier):
                 logger.error("notification_failed", extra={"user_id": chat_id, "error": str(e)})
                 return
 
+            if is_update:
+                return  # the edited message was logged when it was sent
             if message:
+                log = MessageLogBuffer()
+                log.add(chat_id, message, vacancy.id if vacancy else None)
                 try:
-                    channel = Channel.objects.get(id=chat_id)
-
-                    content = {
-                        "channel_id": channel.id,
-                    }
-                    match message.content_type:
-                        case "text":
-                            content["text"] = message.text
-
-                    ChannelMessage.objects.create(
-                        channel=channel,
-                        content_type=message.content_type,
-                        message_id=message.message_id,
-                        content=content,
-                        status=MessageStatus.RECEIVED,
-                        extra={"vacancy_id": vacancy.id} if vacancy else None,
-                    )
-                    ...
+                    log.flush()
                 except Exception:
-                    try:
-                        group = Group.objects.get(id=chat_id)
-                        content = {
-                            "text": message.text or "",
-                        }
-                        GroupMessage.objects.create(
-                            group=group,
-                            user_id=message.from_user.id,
-                            content_type=message.content_type,
-                            message_id=message.message_id,
-                            content=content,
-                            status=MessageStatus.RECEIVED,
-                            extra={"vacancy_id": vacancy.id} if vacancy else None,
-                        )
-                    except Exception:
-                        sentry_sdk.capture_exception()
-                finally:
-                    ...
+                    sentry_sdk.capture_exception()
             else:
                 raise ValueError("chat_id must be defined")
@@ -0,0 +1,318 @@
+"""Queued, rate-limited delivery of Telegram send/edit operations.
+
+TelegramNotifier.notify() and TelegramBroadcastService.broadcast() enqueue
+with enqueue_delivery() while TELEGRAM_OUTBOUND_ASYNC is on and get a DeliveryHandle
+back. The work runs in telegram.tasks.deliver_telegram_task, routed to the
+"telegram_outbound" queue (CELERY_TASK_ROUTES), which is meant to be consumed
+by a single worker process (`celery -A config worker -Q telegram_outbound -c 1`) so that the
+in-process token buckets below see every outgoing call.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+from telebot import types
+from telebot.apihelper import ApiTelegramException
+
+from telegram.choices import MessageStatus
+from telegram.models import Channel, ChannelMessage, Group, GroupMessage
+
+from .notifications import NotificationMethod
+from .telegram_strategy_factory import TelegramStrategyFactory
+
+logger = logging.getLogger(__name__)
+
+OP_SEND = "send"
+OP_UPDATE = "update"
+
+_MAX_TRACKED_CHATS = 10_000
+_EPSILON = 1e-9  # float refill can land a hair below a whole token
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, at most `capacity` stored."""
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 - _EPSILON else (1 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        self.tokens -= 1
+
+
+class TelegramRateLimiter:
+    """Global + per-chat limits from the Bot API FAQ, plus a global pause for retry_after."""
+
+    def __init__(
+        self,
+        global_per_second: float = 30,
+        chat_per_second: float = 1,
+        group_per_minute: float = 20,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.chat_per_second = chat_per_second
+        self.group_per_minute = group_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._global = TokenBucket(global_per_second, global_per_second, clock())
+        self._chats: OrderedDict[int, list[TokenBucket]] = OrderedDict()
+        self._paused_until = 0.0
+
+    @classmethod
+    def from_settings(cls) -> "TelegramRateLimiter":
+        return cls(
+            global_per_second=settings.TELEGRAM_RATE_GLOBAL_PER_SECOND,
+            chat_per_second=settings.TELEGRAM_RATE_CHAT_PER_SECOND,
+            group_per_minute=settings.TELEGRAM_RATE_GROUP_PER_MINUTE,
+        )
+
+    def _chat_buckets(self, chat_id: int, now: float) -> list[TokenBucket]:
+        buckets = self._chats.get(chat_id)
+        if buckets is None:
+            buckets = [TokenBucket(self.chat_per_second, 1, now)]
+            if chat_id < 0:  # groups and channels have negative ids
+                buckets.append(TokenBucket(self.group_per_minute / 60, self.group_per_minute, now))
+            self._chats[chat_id] = buckets
+            if len(self._chats) > _MAX_TRACKED_CHATS:
+                self._chats.popitem(last=False)
+        else:
+            self._chats.move_to_end(chat_id)
+        return buckets
+
+    def acquire(self, chat_id: int) -> float:
+        """Block until a message to `chat_id` is allowed. Returns the total time waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                buckets = [self._global, *self._chat_buckets(chat_id, now)]
+                wait = max([self._paused_until - now] + [b.wait_time(now) for b in buckets])
+                if wait <= 0:
+                    for bucket in buckets:
+                        bucket.consume()
+                    return waited
+            self._sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float) -> None:
+        """Stop all sending for `seconds` (Telegram answered 429 with retry_after)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+_rate_limiter: TelegramRateLimiter | None = None
+
+
+def get_rate_limiter() -> TelegramRateLimiter:
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = TelegramRateLimiter.from_settings()
+    return _rate_limiter
+
+
+def encode_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Make strategy kwargs JSON-safe for the Celery payload (markups, preview options)."""
+    encoded = {}
+    for key, value in kwargs.items():
+        if hasattr(value, "to_dict"):
+            value = {"__telebot__": type(value).__name__, "data": value.to_dict()}
+        encoded[key] = value
+    return encoded
+
+
+def decode_kwargs(payload: dict[str, Any]) -> dict[str, Any]:
+    decoded = {}
+    for key, value in payload.items():
+        if isinstance(value, dict) and "__telebot__" in value:
+            value = getattr(types, value["__telebot__"]).de_json(value["data"])
+        decoded[key] = value
+    return decoded
+
+
+class MessageLogBuffer:
+    """Collects sent messages and writes ChannelMessage/GroupMessage rows in bulk."""
+
+    def __init__(self):
+        self._entries: list[tuple[int, types.Message, int | None]] = []
+
+    def add(self, chat_id: int, message: types.Message, vacancy_id: int | None = None) -> None:
+        self._entries.append((chat_id, message, vacancy_id))
+
+    def flush(self) -> int:
+        if not self._entries:
+            return 0
+        chat_ids = {chat_id for chat_id, _, _ in self._entries}
+        channels = Channel.objects.in_bulk(chat_ids)
+        groups = Group.objects.in_bulk(chat_ids - set(channels))
+        channel_rows, group_rows = [], []
+        for chat_id, message, vacancy_id in self._entries:
+            extra = {"vacancy_id": vacancy_id} if vacancy_id else None
+            if chat_id in channels:
+                content = {"channel_id": chat_id}
+                if message.content_type == "text":
+                    content["text"] = message.text
+                channel_rows.append(
+                    ChannelMessage(
+                        channel=channels[chat_id],
+                        content_type=message.content_type,
+                        message_id=message.message_id,
+                        content=content,
+                        status=MessageStatus.RECEIVED,
+                        vacancy_id=vacancy_id,
+                        extra=extra,
+                    )
+                )
+            elif chat_id in groups:
+                group_rows.append(
+                    GroupMessage(
+                        group=groups[chat_id],
+                        user_id=message.from_user.id,
+                        content_type=message.content_type,
+                        message_id=message.message_id,
+                        content={"text": message.text or ""},
+                        status=MessageStatus.RECEIVED,
+                        vacancy_id=vacancy_id,
+                        extra=extra,
+                    )
+                )
+        ChannelMessage.objects.bulk_create(channel_rows)
+        GroupMessage.objects.bulk_create(group_rows)
+        self._entries = []
+        return len(channel_rows) + len(group_rows)
+
+
+@dataclass
+class DeliveryReport:
+    sent: dict[int, int | None] = field(default_factory=dict)
+    failed: list[int] = field(default_factory=list)
+    pending: list[int] = field(default_factory=list)
+    retry_after: int | None = None
+
+
+def _retry_after(error: ApiTelegramException) -> int | None:
+    if error.error_code != 429:
+        return None
+    return int((error.result_json or {}).get("parameters", {}).get("retry_after", 1))
+
+
+def deliver(
+    op: str,
+    chat_ids: list[int],
+    method: str = NotificationMethod.TEXT.name,
+    payload: dict[str, Any] | None = None,
+    vacancy_id: int | None = None,
+    message_id: int | None = None,
+    bot=None,
+    limiter: TelegramRateLimiter | None = None,
+) -> DeliveryReport:
+    """Run one queued operation for every chat. Stops at the first 429 and reports what is left."""
+    if bot is None:
+        from telegram.handlers.bot_instance import get_bot
+
+        bot = get_bot()
+    strategy = TelegramStrategyFactory.get_strategy(NotificationMethod[method])
+    kwargs = decode_kwargs(payload or {})
+    report = DeliveryReport()
+    log = MessageLogBuffer()
+
+    for index, chat_id in enumerate(chat_ids):
+        if limiter is not None:
+            limiter.acquire(chat_id)
+        try:
+            if op == OP_SEND:
+                message = strategy.send(bot, chat_id, **kwargs)
+            elif op == OP_UPDATE:
+                message = strategy.update(bot, chat_id, message_id=message_id, **kwargs)
+            else:
+                raise ValueError(f"Unknown outbound operation: {op}")
+        except ApiTelegramException as e:
+            retry_after = _retry_after(e)
+            if retry_after is not None:
+                if limiter is not None:
+                    limiter.pause(retry_after)
+                report.pending = list(chat_ids[index:])
+                report.retry_after = retry_after
+                break
+            logger.error("notification_failed", extra={"user_id": chat_id, "error": str(e)})
+            report.failed.append(chat_id)
+            continue
+        except Exception as e:
+            logger.error("notification_failed", extra={"user_id": chat_id, "error": str(e)})
+            report.failed.append(chat_id)
+            continue
+
+        report.sent[chat_id] = getattr(message, "message_id", None)
+        if op == OP_SEND and isinstance(message, types.Message):
+            log.add(chat_id, message, vacancy_id)
+
+    try:
+        log.flush()
+    except Exception:
+        import sentry_sdk
+
+        sentry_sdk.capture_exception()
+    logger.info(
+        "outbound_delivered",
+        extra={"op": op, "sent": len(report.sent), "failed": len(report.failed), "pending": len(report.pending)},
+    )
+    return report
+
+
+class DeliveryHandle:
+    """What enqueue_delivery() returns instead of blocking on the Bot API."""
+
+    def __init__(self, async_result):
+        self._async_result = async_result
+
+    @property
+    def id(self) -> str:
+        return self._async_result.id
+
+    def ready(self) -> bool:
+        return self._async_result.ready()
+
+    def get(self, timeout: float | None = None) -> dict[int, int | None]:
+        """Message ids by chat id (None for edits that returned no message)."""
+        return {int(k): v for k, v in self._async_result.get(timeout=timeout).items()}
+
+
+def outbound_enabled() -> bool:
+    return getattr(settings, "TELEGRAM_OUTBOUND_ASYNC", False)
+
+
+def enqueue_delivery(
+    op: str,
+    chat_ids: list[int],
+    method: NotificationMethod = NotificationMethod.TEXT,
+    vacancy_id: int | None = None,
+    message_id: int | None = None,
+    **kwargs,
+) -> DeliveryHandle:
+    """Queue an operation on the outbound worker. Raises if the broker is unreachable."""
+    from telegram.tasks import deliver_telegram_task
+
+    vacancy = kwargs.pop("vacancy", None)
+    if vacancy is not None:
+        vacancy_id = vacancy.id
+
+    result = deliver_telegram_task.apply_async(
+        args=[op, [int(c) for c in chat_ids], method.name, encode_kwargs(kwargs), vacancy_id, message_id],
+    )
+    return DeliveryHandle(result)
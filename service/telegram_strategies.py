@@ -1,8 +1,29 @@
+import hashlib
 from abc import ABC, abstractmethod
 
+from django.core.cache import cache
 from telebot import TeleBot
 from telebot.types import LinkPreviewOptions, Message
 
+SENT_TEXT_TTL = 24 * 60 * 60
+_SENT_TEXT_KEY = "tg_sent_text:{chat_id}:{message_id}"
+
+
+def _content_digest(text: str, reply_markup) -> str:
+    markup = reply_markup.to_json() if hasattr(reply_markup, "to_json") else repr(reply_markup)
+    return hashlib.md5(f"{text}\x00{markup}".encode(), usedforsecurity=False).hexdigest()
+
+
+def remember_sent_text(chat_id: int, message_id: int, text: str, reply_markup=None) -> None:
+    """What the message shows now, so an identical edit can be skipped."""
+    key = _SENT_TEXT_KEY.format(chat_id=chat_id, message_id=message_id)
+    cache.set(key, _content_digest(text, reply_markup), SENT_TEXT_TTL)
+
+
+def is_unchanged(chat_id: int, message_id: int, text: str, reply_markup=None) -> bool:
+    key = _SENT_TEXT_KEY.format(chat_id=chat_id, message_id=message_id)
+    return cache.get(key) == _content_digest(text, reply_markup)
+
 
 class TelegramSendStrategy(ABC):
     default_link_preview_options = LinkPreviewOptions(is_disabled=True)
@@ -17,24 +38,34 @@ class TelegramSendStrategy(ABC):
 
 class TextStrategy(TelegramSendStrategy):
     def send(self, bot: TeleBot, chat_id: int, **kwargs) -> Message:
-        return bot.send_message(
+        reply_markup = kwargs.get("reply_markup", self.default_reply_markup)
+        message = bot.send_message(
             chat_id=chat_id,
             text=kwargs["text"],
-            reply_markup=kwargs.get("reply_markup", self.default_reply_markup),
+            reply_markup=reply_markup,
             link_preview_options=kwargs.get("link_preview_options", self.default_link_preview_options),
             disable_notification=kwargs.get("disable_notification", False),
         )
+        if isinstance(getattr(message, "message_id", None), int):
+            remember_sent_text(chat_id, message.message_id, kwargs["text"], reply_markup)
+        return message
 
     def update(self, bot: TeleBot, chat_id: int, message_id: int, **kwargs) -> Message | None:
+        """Edit the message; skipped (returns None) when it already shows this text and markup."""
         try:
             if kwargs.get("text"):
-                return bot.edit_message_text(
+                reply_markup = kwargs.get("reply_markup", self.default_reply_markup)
+                if is_unchanged(chat_id, message_id, kwargs["text"], reply_markup):
+                    return None
+                message = bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=message_id,
                     text=kwargs["text"],
-                    reply_markup=kwargs.get("reply_markup", self.default_reply_markup),
+                    reply_markup=reply_markup,
                     link_preview_options=kwargs.get("link_preview_options", self.default_link_preview_options),
                 )
+                remember_sent_text(chat_id, message_id, kwargs["text"], reply_markup)
+                return message
             elif kwargs.get("reply_markup"):
                 return bot.edit_message_reply_markup(
                     chat_id=chat_id,
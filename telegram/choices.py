@@ -37,9 +37,17 @@ class MessageStatus(models.TextChoices):
     DELETE_FAILED = "delete_failed", _("Delete failed")
 
 
+class UpdateStatus(models.TextChoices):
+    RECEIVED = "received", _("Received")
+    DONE = "done", _("Done")
+    FAILED = "failed", _("Failed")
+
+
 STATUS_AVAILABLE = "available"
 STATUS_PROCESS = "process"
+STATUS_RECYCLING = "recycling"
 STATUS_CHOICES = [
     (STATUS_AVAILABLE, _("Available")),
     (STATUS_PROCESS, _("Process")),
+    (STATUS_RECYCLING, _("Recycling")),
 ]
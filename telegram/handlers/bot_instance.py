@@ -1,17 +1,31 @@
+import functools
 import logging
 
 import telebot
 from django.conf import settings
+from telebot import apihelper
+
+from service.metrics import timed_request_sender
 
 logger = logging.getLogger(__name__)
 
 bot = telebot.TeleBot(settings.TELEGRAM_BOT_TOKEN, parse_mode="HTML")
 
+# Time every Bot API call per method (service.metrics.telegram_api_duration_seconds).
+if apihelper.CUSTOM_REQUEST_SENDER is None:
+    apihelper.CUSTOM_REQUEST_SENDER = timed_request_sender
+
 
 def get_bot():
     return bot
 
 
+@functools.cache
+def get_me() -> telebot.types.User:
+    """The bot's own account. It never changes while the process runs, so Telegram is asked once."""
+    return bot.get_me()
+
+
 _handlers_loaded = False
 
 
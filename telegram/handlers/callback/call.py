@@ -41,8 +41,8 @@ def confirm_before_start_call(callback: CallbackQuery, user: User, **kwargs: dic
                 "call_confirmed", extra={"user_id": user.id, "vacancy_id": vacancy.id, "call_type": data["call_type"]}
             )
             vacancy.extra["renewal_accepted"] = True
-            vacancy.extra["renewal_offered"] = True
-            vacancy.save(update_fields=["extra"])
+            vacancy.renewal_offered = True
+            vacancy.save(update_fields=["extra", "renewal_offered"])
             from django.conf import settings
 
             url = settings.BASE_URL.rstrip("/") + reverse("vacancy:resume_search", args=[vacancy.id])
@@ -64,9 +64,9 @@ def confirm_before_start_call(callback: CallbackQuery, user: User, **kwargs: dic
             from django.utils import timezone as tz
 
             vacancy.extra["renewal_declined"] = True
-            vacancy.extra["renewal_offered"] = True
+            vacancy.renewal_offered = True
             vacancy.closed_at = tz.now()
-            vacancy.save(update_fields=["extra", "closed_at"])
+            vacancy.save(update_fields=["extra", "renewal_offered", "closed_at"])
             if vacancy.group:
                 try:
                     GroupService.kick_user(chat_id=vacancy.group.id, user_id=user.id)
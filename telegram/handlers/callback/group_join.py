@@ -40,10 +40,16 @@ def handle_group_join(callback: CallbackQuery) -> None:
             text="Упс, схоже ця вакансія вже зайнята! Натискайте Перейти та обирайте інші вакансії!",
         )
         # Mark user as LEFT since vacancy is full
+        from django.utils import timezone
+
         from telegram.choices import Status
         from vacancy.models import VacancyUser
+        from vacancy.services.vacancy_formatter import bump_render_version
+        from work.service.dashboard import invalidate_dashboard
 
-        VacancyUser.objects.filter(user=user, vacancy=vacancy).update(status=Status.LEFT)
+        VacancyUser.objects.filter(user=user, vacancy=vacancy).update(status=Status.LEFT, updated_at=timezone.now())
+        bump_render_version(vacancy.pk)
+        invalidate_dashboard(user.id)
         bot.answer_callback_query(callback.id)
         return
 
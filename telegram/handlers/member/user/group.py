@@ -13,6 +13,8 @@ from vacancy.choices import GENDER_ANY, STATUS_APPROVED
 from vacancy.models import Vacancy, VacancyUser
 from vacancy.services.call_formatter import CallVacancyTelegramTextFormatter
 from vacancy.services.observers import events
+from vacancy.services.vacancy_formatter import bump_render_version
+from work.service.dashboard import invalidate_dashboard
 
 logger = logging.getLogger(__name__)
 
@@ -91,12 +93,16 @@ def auto_approve(req: ChatJoinRequest):
             logger.info(
                 "join_approved", extra={"user_id": req.from_user.id, "group_id": req.chat.id, "vacancy_id": vacancy.id}
             )
-            time.sleep(1)
-            GroupService.set_default_owner_permissions(chat_id=req.chat.id, user_id=req.from_user.id)
-            GroupService.set_admin_custom_title(
-                chat_id=req.chat.id, user_id=req.from_user.id, custom_title="Роботодавець"
-            )
-            GroupService.set_member_tag(chat_id=req.chat.id, user_id=req.from_user.id, tag="Роботодавець")
+            # Telegram needs a moment to register the join before promote works —
+            # wait in a worker instead of the update handler.
+            try:
+                from telegram.tasks import setup_group_owner_task
+
+                setup_group_owner_task.apply_async(args=[req.chat.id, req.from_user.id], countdown=1)
+            except Exception:
+                logger.warning("setup_group_owner_task enqueue failed, promoting inline", exc_info=True)
+                time.sleep(1)
+                GroupService.setup_owner(chat_id=req.chat.id, user_id=req.from_user.id)
             return
 
         # Employer cannot join another employer's vacancy group
@@ -372,6 +378,8 @@ def handle_user_status_change(event: ChatMemberUpdated):
         from django.utils import timezone as left_tz
 
         VacancyUser.objects.filter(user=user, vacancy=vacancy).update(status=Status.LEFT, updated_at=left_tz.now())
+        bump_render_version(vacancy.pk)
+        invalidate_dashboard(user.id)
         # Delete invite message from bot chat
         try:
             invites = (vacancy.extra or {}).get("apply_invite_msg_ids", {})
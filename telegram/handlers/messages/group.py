@@ -17,6 +17,20 @@ PHONE_PATTERNS = [
     re.compile(r"(?<!\d)0\d{9}(?!\d)"),  # 0XXXXXXXXX (10 digits starting with 0)
 ]
 
+# Service messages are logged too, so group recycling knows every id it has to delete.
+GROUP_SERVICE_CONTENT_TYPES = [
+    "new_chat_members",
+    "left_chat_member",
+    "pinned_message",
+    "new_chat_title",
+    "new_chat_photo",
+    "delete_chat_photo",
+    "video_chat_started",
+    "video_chat_ended",
+    "video_chat_participants_invited",
+    "video_chat_scheduled",
+]
+
 
 def contains_phone_number(text: str) -> bool:
     """Check if text contains a Ukrainian phone number."""
@@ -32,7 +46,7 @@ def contains_phone_number(text: str) -> bool:
 
 @bot.message_handler(
     func=lambda message: message.chat.type in ["supergroup"],
-    content_types=settings.TELEGRAM_BOT_ALL_GROUP_CONTENT_TYPES,
+    content_types=settings.TELEGRAM_BOT_ALL_GROUP_CONTENT_TYPES + GROUP_SERVICE_CONTENT_TYPES,
 )
 def handle_all_messages(message: types.Message):
     group = Group.objects.get(id=message.chat.id)
@@ -68,7 +82,7 @@ def handle_all_messages(message: types.Message):
     telegram_dt = datetime.datetime.fromtimestamp(message.date, tz=datetime.UTC)
     group_message = GroupMessage(
         group=group,
-        user_id=message.from_user.id,
+        user_id=message.from_user.id if message.from_user else None,
         content_type=message.content_type,
         content=content,
         message_id=message.message_id,
@@ -79,8 +93,14 @@ def handle_all_messages(message: types.Message):
         "new_chat_members",
         "left_chat_member",
     ]:
-        bot.delete_message(
-            chat_id=message.chat.id,
-            message_id=message.message_id,
-        )
-        group_message.status = MessageStatus.DELETED
+        try:
+            bot.delete_message(
+                chat_id=message.chat.id,
+                message_id=message.message_id,
+            )
+            group_message.status = MessageStatus.DELETED
+        except Exception:
+            # Stays RECEIVED; group recycling deletes it later.
+            sentry_sdk.capture_exception()
+
+    group_message.save()
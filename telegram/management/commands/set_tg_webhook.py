@@ -5,6 +5,7 @@ from django.core.management.base import BaseCommand
 from django.urls import reverse
 
 from telegram.handlers.bot_instance import bot
+from telegram.service.updates import webhook_secret_token
 
 
 class Command(BaseCommand):
@@ -14,4 +15,10 @@ class Command(BaseCommand):
         bot.remove_webhook()
         url = settings.BASE_URL + reverse("telegram:telegram_webhook")
         print(url)
-        print(bot.set_webhook(url=url, allowed_updates=settings.TELEGRAM_BOT_ALLOWED_UPDATES))
+        print(
+            bot.set_webhook(
+                url=url,
+                allowed_updates=settings.TELEGRAM_BOT_ALLOWED_UPDATES,
+                secret_token=webhook_secret_token(),
+            )
+        )
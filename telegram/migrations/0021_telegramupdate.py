@@ -0,0 +1,30 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telegram', '0020_alter_useringroup_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TelegramUpdate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('update_id', models.BigIntegerField(unique=True, verbose_name='Update ID')),
+                ('chat_id', models.BigIntegerField(blank=True, null=True, verbose_name='Chat ID')),
+                ('payload', models.JSONField(verbose_name='Payload')),
+                ('status', models.CharField(choices=[('received', 'Received'), ('done', 'Done'), ('failed', 'Failed')], default='received', max_length=20, verbose_name='Status')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='Processed at')),
+            ],
+            options={
+                'verbose_name': 'Оновлення Telegram',
+                'verbose_name_plural': 'Оновлення Telegram',
+                'indexes': [models.Index(condition=models.Q(('status', 'received')), fields=['chat_id', 'update_id'], name='tg_update_pending_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telegram', '0021_telegramupdate'),
+        ('vacancy', '0032_vacancytimer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='channelmessage',
+            name='vacancy',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='channel_messages', to='vacancy.vacancy', verbose_name='Vacancy'),
+        ),
+        migrations.AddField(
+            model_name='groupmessage',
+            name='vacancy',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='group_messages', to='vacancy.vacancy', verbose_name='Vacancy'),
+        ),
+        migrations.AddIndex(
+            model_name='channelmessage',
+            index=models.Index(fields=['vacancy', 'status', 'created_at'], name='channel_msg_vacancy_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='groupmessage',
+            index=models.Index(fields=['vacancy', 'status', 'created_at'], name='group_msg_vacancy_idx'),
+        ),
+    ]
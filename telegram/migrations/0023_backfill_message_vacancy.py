@@ -0,0 +1,42 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+BATCH_SIZE = 2000
+
+
+def _backfill(Model, vacancy_ids):
+    by_vacancy = defaultdict(list)
+    rows = (
+        Model.objects.filter(vacancy__isnull=True, extra__has_key='vacancy_id')
+        .values_list('id', 'extra')
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    for pk, extra in rows:
+        try:
+            vacancy_id = int(extra['vacancy_id'])
+        except (TypeError, ValueError, KeyError):
+            continue
+        if vacancy_id in vacancy_ids:
+            by_vacancy[vacancy_id].append(pk)
+    for vacancy_id, pks in by_vacancy.items():
+        for start in range(0, len(pks), BATCH_SIZE):
+            Model.objects.filter(id__in=pks[start:start + BATCH_SIZE]).update(vacancy_id=vacancy_id)
+
+
+def backfill_message_vacancy(apps, schema_editor):
+    Vacancy = apps.get_model('vacancy', 'Vacancy')
+    vacancy_ids = set(Vacancy.objects.values_list('id', flat=True))
+    _backfill(apps.get_model('telegram', 'ChannelMessage'), vacancy_ids)
+    _backfill(apps.get_model('telegram', 'GroupMessage'), vacancy_ids)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telegram', '0022_message_vacancy'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_message_vacancy, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telegram', '0023_backfill_message_vacancy'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='group',
+            name='recycle_cursor',
+            field=models.BigIntegerField(default=1, help_text='Message ids up to this one are already deleted.', verbose_name='Recycle cursor'),
+        ),
+        migrations.AddField(
+            model_name='group',
+            name='recycle_target',
+            field=models.BigIntegerField(blank=True, null=True, verbose_name='Recycle target'),
+        ),
+        migrations.AddField(
+            model_name='group',
+            name='recycle_updated_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Recycle updated at'),
+        ),
+        migrations.AlterField(
+            model_name='group',
+            name='status',
+            field=models.CharField(choices=[('available', 'Available'), ('process', 'Process'), ('recycling', 'Recycling')], default='available', max_length=20, verbose_name='Status'),
+        ),
+    ]
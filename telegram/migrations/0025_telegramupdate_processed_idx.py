@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-18 16:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telegram', '0024_group_recycling'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='telegramupdate',
+            index=models.Index(condition=models.Q(('processed_at__isnull', False)), fields=['status', 'processed_at'], name='tg_update_processed_idx'),
+        ),
+    ]
@@ -1,7 +1,7 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from telegram.choices import STATUS_AVAILABLE, STATUS_CHOICES, MessageStatus, Status
+from telegram.choices import STATUS_AVAILABLE, STATUS_CHOICES, MessageStatus, Status, UpdateStatus
 
 
 class Chat(models.Model):
@@ -37,11 +37,23 @@ class ChannelMessage(models.Model):
         max_length=20, choices=MessageStatus.choices, default=MessageStatus.RECEIVED, verbose_name=_("Status")
     )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Created at"))
+    vacancy = models.ForeignKey(
+        "vacancy.Vacancy",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=False,  # covered by the composite index below
+        related_name="channel_messages",
+        verbose_name=_("Vacancy"),
+    )
     extra = models.JSONField(blank=True, default=dict)
 
     class Meta:
         verbose_name = _("Повідомлення в каналі")
         verbose_name_plural = _("Повідомлення в каналах")
+        indexes = [
+            models.Index(fields=["vacancy", "status", "created_at"], name="channel_msg_vacancy_idx"),
+        ]
 
     def __str__(self):
         return f"{self.channel.title} [{self.message_id}]"
@@ -55,6 +67,12 @@ class Group(Chat):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_AVAILABLE, verbose_name=_("Status"))
     invite_link = models.URLField(_("Invite link"), null=True, blank=True)
     last_used_at = models.DateTimeField(_("Last used at"), null=True, blank=True)
+    # Recycling progress (telegram/service/group_recycling.py)
+    recycle_cursor = models.BigIntegerField(
+        _("Recycle cursor"), default=1, help_text=_("Message ids up to this one are already deleted.")
+    )
+    recycle_target = models.BigIntegerField(_("Recycle target"), null=True, blank=True)
+    recycle_updated_at = models.DateTimeField(_("Recycle updated at"), null=True, blank=True)
 
     class Meta:
         verbose_name = _("Група вакансії")
@@ -74,11 +92,23 @@ class GroupMessage(models.Model):
         max_length=20, choices=MessageStatus.choices, default=MessageStatus.RECEIVED, verbose_name=_("Status")
     )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Created at"))
+    vacancy = models.ForeignKey(
+        "vacancy.Vacancy",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=False,  # covered by the composite index below
+        related_name="group_messages",
+        verbose_name=_("Vacancy"),
+    )
     extra = models.JSONField(blank=True, default=dict)
 
     class Meta:
         verbose_name = _("Повідомлення в групі")
         verbose_name_plural = _("Повідомлення в групах")
+        indexes = [
+            models.Index(fields=["vacancy", "status", "created_at"], name="group_msg_vacancy_idx"),
+        ]
 
     def __str__(self):
         return f"{self.group.title}"
@@ -96,3 +126,35 @@ class UserInGroup(models.Model):
 
     def __str__(self):
         return f"{self.user} in {self.group}"
+
+
+class TelegramUpdate(models.Model):
+    """Raw webhook update, persisted before processing (see telegram.service.updates)."""
+
+    update_id = models.BigIntegerField(unique=True, verbose_name=_("Update ID"))
+    chat_id = models.BigIntegerField(null=True, blank=True, verbose_name=_("Chat ID"))
+    payload = models.JSONField(verbose_name=_("Payload"))
+    status = models.CharField(
+        max_length=20, choices=UpdateStatus.choices, default=UpdateStatus.RECEIVED, verbose_name=_("Status")
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Created at"))
+    processed_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Processed at"))
+
+    class Meta:
+        verbose_name = _("Оновлення Telegram")
+        verbose_name_plural = _("Оновлення Telegram")
+        indexes = [
+            models.Index(
+                fields=["chat_id", "update_id"],
+                condition=models.Q(status=UpdateStatus.RECEIVED),
+                name="tg_update_pending_idx",
+            ),
+            models.Index(
+                fields=["status", "processed_at"],
+                condition=models.Q(processed_at__isnull=False),
+                name="tg_update_processed_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.update_id} [{self.status}]"
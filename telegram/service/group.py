@@ -3,12 +3,14 @@ import time
 from collections.abc import Iterable
 
 import sentry_sdk
-from django.db.models import F, QuerySet
+from django.db import transaction
+from django.db.models import QuerySet
 from telebot.types import ChatPermissions
 
-from telegram.choices import STATUS_AVAILABLE, STATUS_PROCESS, Status
-from telegram.handlers.bot_instance import bot
+from telegram.choices import Status
+from telegram.handlers.bot_instance import bot, get_me
 from telegram.models import Group, UserInGroup
+from telegram.service import group_pool
 from vacancy.models import Vacancy
 
 logger = logging.getLogger(__name__)
@@ -23,29 +25,25 @@ class GroupService:
 
     @classmethod
     def get_available_group(cls) -> Group | None:
-        from django.db.models import Count, Q
-
-        return (
-            Group.objects.filter(status=STATUS_AVAILABLE, is_active=True, invite_link__isnull=False)
-            .annotate(
-                active_users=Count(
-                    "user_links",
-                    filter=Q(user_links__status__in=[Status.MEMBER, Status.OWNER]),
-                ),
-            )
-            .filter(active_users=0)
-            .order_by(F("last_used_at").asc(nulls_first=True))
-            .first()
-        )
+        """Next group allocate_group() would hand out, without claiming it."""
+        return group_pool.ready_groups().first()
+
+    @classmethod
+    def allocate_group(cls) -> Group | None:
+        """Claim a group from the pool; it comes back already in STATUS_PROCESS.
+
+        Assign it in the same transaction.atomic() block, or a failure leaves it claimed by no vacancy.
+        """
+        return group_pool.allocate()
 
     @classmethod
     def find_and_set_group(cls, vacancy: Vacancy) -> Group | None:
-        group = cls.get_available_group()
+        with transaction.atomic():
+            group = cls.allocate_group()
+            if group:
+                vacancy.group = group
+                vacancy.save()
         if group:
-            vacancy.group = group
-            vacancy.save()
-            group.status = STATUS_PROCESS
-            group.save()
             logger.info("group_assigned", extra={"group_id": group.id, "vacancy_id": vacancy.id})
             return group
         return None
@@ -64,6 +62,10 @@ class GroupService:
                 Group.objects.get(pk=chat_id)
                 UserInGroup.objects.filter(group_id=chat_id, user_id=user_id).update(status=Status.KICKED)
                 from vacancy.models import Vacancy, VacancyUser
+                from vacancy.services.vacancy_formatter import bump_render_version
+                from work.service.dashboard import invalidate_dashboard
+
+                invalidate_dashboard(user_id)
 
                 vacancy = Vacancy.objects.filter(group_id=chat_id).first()
                 if vacancy:
@@ -74,6 +76,7 @@ class GroupService:
                         user_id=user_id,
                         status=Status.MEMBER,
                     ).update(status=Status.KICKED, updated_at=kick_tz.now())
+                    bump_render_version(vacancy.pk)
             except Group.DoesNotExist:
                 pass
             except Exception as e:
@@ -90,6 +93,25 @@ class GroupService:
             except Exception as e:
                 logger.warning(f"Failed to unban {user_id=} from {chat_id=}: {e=}")
 
+    @classmethod
+    def kick_users(cls, chat_id: int, user_ids: Iterable[int]) -> None:
+        """kick_user() for many users; one queued task on the outbound worker when TELEGRAM_OUTBOUND_ASYNC is on."""
+        from service.telegram_outbound import outbound_enabled
+
+        user_ids = [int(user_id) for user_id in user_ids]
+        if not user_ids:
+            return
+        if outbound_enabled():
+            from telegram.tasks import kick_users_task
+
+            try:
+                kick_users_task.apply_async(args=[chat_id, user_ids])
+                return
+            except Exception as e:
+                logger.warning(f"kick_users: broker unavailable, kicking inline in {chat_id=}: {e}")
+        for user_id in user_ids:
+            cls.kick_user(chat_id=chat_id, user_id=user_id)
+
     @classmethod
     def kick_all_users(cls, group: Group, statuses: Iterable[str] | None = None) -> None:
         if not statuses:
@@ -206,6 +228,13 @@ class GroupService:
         except Exception:
             sentry_sdk.capture_exception()
 
+    @classmethod
+    def setup_owner(cls, chat_id: int, user_id: int) -> None:
+        """Owner permissions, admin title and member tag for the vacancy owner."""
+        cls.set_default_owner_permissions(chat_id=chat_id, user_id=user_id)
+        cls.set_admin_custom_title(chat_id=chat_id, user_id=user_id, custom_title="Роботодавець")
+        cls.set_member_tag(chat_id=chat_id, user_id=user_id, tag="Роботодавець")
+
     @classmethod
     def set_admin_custom_title(cls, chat_id: int, user_id: int, custom_title: str) -> None:
         try:
@@ -227,61 +256,22 @@ class GroupService:
 
     @classmethod
     def reset_group(cls, group: Group) -> None:
-        """Full group reset: delete messages, kick everyone (except bot & creator), reset permissions."""
+        """Full group reset, run in the background: see telegram/service/group_recycling.py."""
+        from telegram.service.group_recycling import start_recycling
+
+        start_recycling(group)
+
+    @classmethod
+    def reset_members(cls, group: Group) -> None:
+        """Kick everyone (except bot & creator) and reset permissions; the last step of group recycling."""
         chat_id = group.id
 
         try:
-            bot_id = bot.get_me().id
+            bot_id = get_me().id
         except Exception:
             bot_id = None
 
-        # 1. Get pinned message ID BEFORE unpinning (to know max message range)
-        max_msg_id = 0
-        try:
-            chat = bot.get_chat(chat_id)
-            if chat.pinned_message:
-                max_msg_id = chat.pinned_message.message_id
-        except Exception as e:
-            logger.warning(f"reset_group: get_chat failed: {e}")
-
-        # Also check GroupMessage DB
-        from telegram.models import GroupMessage
-
-        db_max = (
-            GroupMessage.objects.filter(group=group)
-            .order_by("-message_id")
-            .values_list("message_id", flat=True)
-            .first()
-        )
-        if db_max:
-            max_msg_id = max(max_msg_id, db_max)
-
-        # Fallback: if we still don't know max ID, use a reasonable default
-        if max_msg_id == 0:
-            max_msg_id = 500
-
-        # 2. Unpin all messages
-        try:
-            bot.unpin_all_chat_messages(chat_id=chat_id)
-            logger.info("reset_group: unpinned all", extra={"group_id": chat_id})
-        except Exception as e:
-            logger.warning(f"reset_group: unpin failed: {e}")
-
-        # 3. Delete ALL messages one by one (skip ID=1 — undeletable group creation msg)
-        upper = max_msg_id + 100
-        deleted_count = 0
-        for msg_id in range(2, upper + 1):
-            try:
-                bot.delete_message(chat_id=chat_id, message_id=msg_id)
-                deleted_count += 1
-            except Exception:
-                pass
-        logger.info(
-            f"reset_group: deleted {deleted_count} messages (range 2..{upper})",
-            extra={"group_id": chat_id},
-        )
-
-        # 4. Get ALL admins from Telegram API (not from our DB)
+        # 1. Get ALL admins from Telegram API (not from our DB)
         creator_id = None
         telegram_admin_ids = []
         try:
@@ -294,9 +284,9 @@ class GroupService:
                     continue
                 telegram_admin_ids.append(admin.user.id)
         except Exception as e:
-            logger.warning(f"reset_group: get_chat_administrators failed: {e}")
+            logger.warning(f"reset_members: get_chat_administrators failed: {e}")
 
-        # 5. Demote and kick admins (from Telegram API)
+        # 2. Demote and kick admins (from Telegram API)
         for uid in telegram_admin_ids:
             try:
                 bot.promote_chat_member(
@@ -320,7 +310,7 @@ class GroupService:
                     can_delete_stories=False,
                 )
             except Exception as e:
-                logger.warning(f"reset_group: demote admin {uid} failed: {e}")
+                logger.warning(f"reset_members: demote admin {uid} failed: {e}")
             try:
                 bot.ban_chat_member(
                     chat_id=chat_id,
@@ -329,13 +319,13 @@ class GroupService:
                     until_date=int(time.time()) + 35,
                 )
             except Exception as e:
-                logger.warning(f"reset_group: ban admin {uid} failed: {e}")
+                logger.warning(f"reset_members: ban admin {uid} failed: {e}")
             try:
                 bot.unban_chat_member(chat_id=chat_id, user_id=uid, only_if_banned=True)
             except Exception as e:
-                logger.warning(f"reset_group: unban admin {uid} failed: {e}")
+                logger.warning(f"reset_members: unban admin {uid} failed: {e}")
 
-        # 6. Kick regular users from UserInGroup (workers, employers)
+        # 3. Kick regular users from UserInGroup (workers, employers)
         all_uig = UserInGroup.objects.filter(group=group)
         for uig in all_uig:
             if uig.user_id == bot_id or uig.user_id == creator_id:
@@ -350,27 +340,24 @@ class GroupService:
                     until_date=int(time.time()) + 35,
                 )
             except Exception as e:
-                logger.warning(f"reset_group: kick user {uig.user_id} failed: {e}")
+                logger.warning(f"reset_members: kick user {uig.user_id} failed: {e}")
             try:
                 bot.unban_chat_member(chat_id=chat_id, user_id=uig.user_id, only_if_banned=True)
             except Exception:
                 pass
 
-        # 7. Delete ALL UserInGroup records
+        # 4. Delete ALL UserInGroup records
         all_uig.delete()
-        logger.info("reset_group: UserInGroup cleaned", extra={"group_id": chat_id})
+        logger.info("reset_members: UserInGroup cleaned", extra={"group_id": chat_id})
 
-        # 8. Reset group permissions
+        # 5. Reset group permissions
         try:
             cls.set_default_permissions(group)
-            logger.info("reset_group: permissions reset", extra={"group_id": chat_id})
+            logger.info("reset_members: permissions reset", extra={"group_id": chat_id})
         except Exception as e:
-            logger.warning(f"reset_group: permissions reset failed: {e}")
-
-        # 9. Clean GroupMessage DB records
-        GroupMessage.objects.filter(group=group).delete()
+            logger.warning(f"reset_members: permissions reset failed: {e}")
 
-        # 10. Re-check admins and kick any remaining (could appear during reset)
+        # 6. Re-check admins and kick any remaining (could appear during reset)
         try:
             admins_after = bot.get_chat_administrators(chat_id)
             for admin in admins_after:
@@ -412,11 +399,11 @@ class GroupService:
                     bot.unban_chat_member(chat_id=chat_id, user_id=uid, only_if_banned=True)
                 except Exception:
                     pass
-                logger.info(f"reset_group: kicked remaining admin {uid}", extra={"group_id": chat_id})
+                logger.info(f"reset_members: kicked remaining admin {uid}", extra={"group_id": chat_id})
         except Exception as e:
-            logger.warning(f"reset_group: re-check admins failed: {e}")
+            logger.warning(f"reset_members: re-check admins failed: {e}")
 
-        # 11. Detect untracked regular users
+        # 7. Detect untracked regular users
         try:
             telegram_count = bot.get_chat_member_count(chat_id)
             tracked = 1  # bot
@@ -425,10 +412,10 @@ class GroupService:
             untracked = telegram_count - tracked
             if untracked > 0:
                 logger.warning(
-                    f"reset_group: {untracked} untracked users remain in group {chat_id} "
+                    f"reset_members: {untracked} untracked users remain in group {chat_id} "
                     f"(telegram_count={telegram_count}, tracked={tracked}). "
                     f"They joined outside bot flow — cannot kick without user_id.",
                     extra={"group_id": chat_id, "untracked_count": untracked},
                 )
         except Exception as e:
-            logger.warning(f"reset_group: untracked users check failed: {e}")
+            logger.warning(f"reset_members: untracked users check failed: {e}")
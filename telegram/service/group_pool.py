@@ -0,0 +1,118 @@
+"""
+Pool of vacancy groups ready to be handed out.
+
+A group is in the pool when it is STATUS_AVAILABLE (recycling finished), active,
+has an invite link, the bot administers it and nobody is left in it as member
+or owner. allocate() claims the least recently used one with SELECT ... FOR
+UPDATE SKIP LOCKED, so concurrent approvals get different groups without
+waiting on each other. Callers claim and assign the group in one transaction,
+so a failure before the vacancy is saved puts the group back in the pool.
+
+Recycled groups re-enter the pool when group_recycling finishes with them.
+refill_group_pool_task restarts stalled recyclings and runs verify(), which
+re-checks the bot's admin rights in pooled groups every POOL_VERIFY_INTERVAL
+and drops the groups that lost them. Admins are alerted once fewer than
+GROUP_POOL_LOW_WATERMARK groups are left.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, QuerySet
+from telebot.apihelper import ApiTelegramException
+
+from telegram.choices import STATUS_AVAILABLE, STATUS_PROCESS, Status
+from telegram.models import Group, UserInGroup
+
+logger = logging.getLogger(__name__)
+
+POOL_VERIFY_INTERVAL = 6 * 60 * 60
+POOL_ALERT_INTERVAL = 60 * 60
+_VERIFIED_KEY = "group_pool_verified:{group_id}"
+_LOW_ALERT_KEY = "group_pool_low_alert"
+
+
+def low_watermark() -> int:
+    return getattr(settings, "GROUP_POOL_LOW_WATERMARK", 3)
+
+
+def ready_groups() -> QuerySet[Group]:
+    occupied = UserInGroup.objects.filter(group=OuterRef("pk"), status__in=[Status.MEMBER, Status.OWNER])
+    return (
+        Group.objects.filter(
+            status=STATUS_AVAILABLE,
+            is_active=True,
+            has_bot_administrator=True,
+            invite_link__isnull=False,
+        )
+        .exclude(invite_link="")
+        .filter(~Exists(occupied))
+        .order_by(F("last_used_at").asc(nulls_first=True), "pk")
+    )
+
+
+def allocate() -> Group | None:
+    """Claim a pooled group (status -> STATUS_PROCESS); None when the pool is empty.
+
+    Call it inside the transaction that saves the vacancy holding the group.
+    """
+    with transaction.atomic():
+        group = ready_groups().select_for_update(skip_locked=True).first()
+        if group is not None:
+            group.status = STATUS_PROCESS
+            group.save(update_fields=["status"])
+    if group is not None:
+        logger.info("group_allocated", extra={"group_id": group.id})
+    transaction.on_commit(check_low_watermark)
+    return group
+
+
+def check_low_watermark() -> int:
+    """Pool size; admins hear about it (at most once per POOL_ALERT_INTERVAL) when it runs low."""
+    size = ready_groups().count()
+    if size < low_watermark() and cache.add(_LOW_ALERT_KEY, True, POOL_ALERT_INTERVAL):
+        from service.admin_notifications import notify_admins
+
+        logger.warning(f"group_pool: {size} groups left (low watermark {low_watermark()})")
+        try:
+            notify_admins(f"⚠️ <b>Закінчуються вільні групи</b>\nУ пулі залишилось: {size}")
+        except Exception:
+            logger.exception("group_pool: low-watermark alert failed")
+    return size
+
+
+def _bot_is_admin(group: Group) -> bool | None:
+    """None when Telegram could not be asked."""
+    from telegram.handlers.bot_instance import bot, get_me
+
+    try:
+        member = bot.get_chat_member(group.id, get_me().id)
+    except ApiTelegramException as e:
+        if e.error_code == 429:
+            return None
+        return False  # chat gone or the bot was removed
+    except Exception as e:
+        logger.warning(f"group_pool: get_chat_member failed for {group.id}: {e}")
+        return None
+    return member.status in ("administrator", "creator")
+
+
+def verify() -> int:
+    """Re-check pooled groups not checked for POOL_VERIFY_INTERVAL; returns the pool size afterwards."""
+    groups = list(ready_groups())
+    keys = {group.pk: _VERIFIED_KEY.format(group_id=group.pk) for group in groups}
+    verified = cache.get_many(keys.values())
+    for group in groups:
+        if keys[group.pk] in verified:
+            continue
+        is_admin = _bot_is_admin(group)
+        if is_admin is None:
+            continue
+        if is_admin:
+            cache.set(keys[group.pk], True, POOL_VERIFY_INTERVAL)
+        else:
+            Group.objects.filter(pk=group.pk).update(has_bot_administrator=False)
+            logger.warning(f"group_pool: bot is not an admin of {group.id}, removed from the pool")
+    return check_low_watermark()
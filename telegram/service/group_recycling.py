@@ -0,0 +1,192 @@
+"""
+Group recycling: clear a vacancy group after close and return it to the pool.
+
+Messages are deleted through deleteMessages, DELETE_BATCH_SIZE ids per call:
+
+  - every id the GroupMessage log still has as RECEIVED (incoming, bot-sent
+    and service messages are all logged);
+  - the ids the log has no row for between Group.recycle_cursor and the
+    highest id seen (plus SWEEP_MARGIN), for messages that predate the log
+    or slipped past it. Telegram skips ids that do not exist.
+
+The work runs in steps of RECYCLE_BATCHES_PER_STEP calls (recycle_group_task,
+or inline when GROUP_RECYCLE_ASYNC is off). Each call advances
+Group.recycle_cursor, so a step cut short by a 429 or a worker restart resumes
+where it stopped. The group is STATUS_RECYCLING throughout and becomes
+STATUS_AVAILABLE only after the last step has removed the members.
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+from telebot.apihelper import ApiTelegramException
+
+from telegram.choices import STATUS_AVAILABLE, STATUS_RECYCLING, MessageStatus
+from telegram.handlers.bot_instance import bot, get_me
+from telegram.models import Group, GroupMessage
+from telegram.service.message_delete import DELETE_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+RECYCLE_BATCHES_PER_STEP = 20
+SWEEP_MARGIN = 100  # ids past the highest known one: join/leave notices posted while the vacancy closed
+LEGACY_SWEEP_UPPER = 500  # groups recycled before anything was logged
+RECYCLE_STALL_AFTER = timedelta(minutes=10)
+
+
+class RecycleDeferred(Exception):
+    """Telegram asked to slow down; run the next step after retry_after seconds."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+def recycle_async_enabled() -> bool:
+    return getattr(settings, "GROUP_RECYCLE_ASYNC", False)
+
+
+def record_bot_message(group_id: int, message, vacancy_id: int | None = None) -> None:
+    """Log a message the bot sent to a group, so recycling deletes it by id."""
+    try:
+        GroupMessage.objects.create(
+            group_id=group_id,
+            user_id=get_me().id,
+            content_type="text",
+            message_id=message.message_id,
+            vacancy_id=vacancy_id,
+        )
+    except Exception as e:
+        logger.warning(f"record_bot_message: {group_id=}: {e}")
+
+
+def _pinned_message_id(group: Group) -> int:
+    try:
+        chat = bot.get_chat(group.id)
+        if chat.pinned_message:
+            return chat.pinned_message.message_id
+    except Exception as e:
+        logger.warning(f"recycle: get_chat failed for {group.id}: {e}")
+    return 0
+
+
+def start_recycling(group: Group) -> None:
+    """Take the group out of the pool and clear it in the background."""
+    highest = max(
+        _pinned_message_id(group),
+        GroupMessage.objects.filter(group=group).aggregate(top=Max("message_id"))["top"] or 0,
+    )
+    if highest == 0 and group.recycle_cursor <= 1:
+        highest = LEGACY_SWEEP_UPPER
+
+    try:
+        bot.unpin_all_chat_messages(chat_id=group.id)
+    except Exception as e:
+        logger.warning(f"recycle: unpin failed for {group.id}: {e}")
+
+    group.status = STATUS_RECYCLING
+    group.recycle_target = max(highest, group.recycle_cursor)
+    group.recycle_updated_at = timezone.now()
+    group.save(update_fields=["status", "recycle_target", "recycle_updated_at"])
+    logger.info("group_recycle_started", extra={"group_id": group.id, "target": group.recycle_target})
+    schedule_step(group.id)
+
+
+def schedule_step(group_id: int, countdown: int = 0) -> None:
+    if recycle_async_enabled():
+        from telegram.tasks import recycle_group_task
+
+        try:
+            recycle_group_task.apply_async(args=[group_id], countdown=countdown)
+            return
+        except Exception as e:
+            logger.warning(f"recycle: broker unavailable, recycling {group_id} inline: {e}")
+    run_inline(group_id)
+
+
+def run_inline(group_id: int) -> None:
+    while True:
+        try:
+            if recycle_step(group_id):
+                return
+        except RecycleDeferred as e:
+            time.sleep(e.retry_after)
+
+
+def _deletion_plan(group: Group) -> list[int]:
+    """Ids still to delete, ascending: RECEIVED log rows plus the unlogged ids of the sweep range."""
+    logged = dict(GroupMessage.objects.filter(group=group).values_list("message_id", "status"))
+    pending = {message_id for message_id, status in logged.items() if status == MessageStatus.RECEIVED}
+    sweep_upper = (group.recycle_target or group.recycle_cursor) + SWEEP_MARGIN
+    unlogged = set(range(group.recycle_cursor + 1, sweep_upper + 1)) - set(logged)
+    return sorted(pending | unlogged)
+
+
+def _delete_batch(group: Group, message_ids: list[int]) -> None:
+    status = MessageStatus.DELETED
+    try:
+        bot.delete_messages(chat_id=group.id, message_ids=message_ids)
+    except ApiTelegramException as e:
+        if e.error_code == 429:
+            raise RecycleDeferred(int((e.result_json or {}).get("parameters", {}).get("retry_after", 1))) from e
+        logger.warning(f"recycle: deleteMessages failed in {group.id}: {e}")
+        status = MessageStatus.DELETE_FAILED
+    except Exception as e:
+        logger.warning(f"recycle: deleteMessages failed in {group.id}: {e}")
+        status = MessageStatus.DELETE_FAILED
+
+    GroupMessage.objects.filter(group=group, message_id__in=message_ids, status=MessageStatus.RECEIVED).update(
+        status=status
+    )
+    group.recycle_cursor = max(group.recycle_cursor, message_ids[-1])
+    group.recycle_updated_at = timezone.now()
+    group.save(update_fields=["recycle_cursor", "recycle_updated_at"])
+
+
+def recycle_step(group_id: int) -> bool:
+    """Up to RECYCLE_BATCHES_PER_STEP deleteMessages calls; True once the group is back in the pool."""
+    group = Group.objects.filter(pk=group_id, status=STATUS_RECYCLING).first()
+    if group is None:
+        return True
+
+    plan = _deletion_plan(group)
+    step_size = DELETE_BATCH_SIZE * RECYCLE_BATCHES_PER_STEP
+    for start in range(0, min(len(plan), step_size), DELETE_BATCH_SIZE):
+        _delete_batch(group, plan[start : start + DELETE_BATCH_SIZE])
+    if len(plan) > step_size:
+        return False
+
+    finish(group)
+    return True
+
+
+def finish(group: Group) -> None:
+    from telegram.service.group import GroupService
+
+    GroupService.reset_members(group)
+    GroupMessage.objects.filter(group=group).delete()
+
+    group.status = STATUS_AVAILABLE
+    # Margin ids swept now may belong to messages posted later; the next sweep starts at the last real id.
+    group.recycle_cursor = group.recycle_target or group.recycle_cursor
+    group.recycle_target = None
+    group.recycle_updated_at = timezone.now()
+    group.save(update_fields=["status", "recycle_cursor", "recycle_target", "recycle_updated_at"])
+    logger.info("group_recycled", extra={"group_id": group.id})
+
+
+def resume_stalled() -> int:
+    """Reschedule recyclings whose step was lost (worker restart, broker hiccup)."""
+    stalled = list(
+        Group.objects.filter(
+            status=STATUS_RECYCLING, recycle_updated_at__lt=timezone.now() - RECYCLE_STALL_AFTER
+        ).values_list("pk", flat=True)
+    )
+    for group_id in stalled:
+        Group.objects.filter(pk=group_id).update(recycle_updated_at=timezone.now())
+        schedule_step(group_id)
+    return len(stalled)
@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from collections.abc import Iterable
 from typing import TypedDict
 
@@ -10,6 +11,8 @@ from vacancy.models import Vacancy
 
 logger = logging.getLogger(__name__)
 
+DELETE_BATCH_SIZE = 100  # Bot API deleteMessages limit
+
 
 class MessageDeleter:
     def __init__(self, bot_instance: TeleBot):
@@ -32,6 +35,15 @@ class MessageDeleter:
             message.save(update_fields=["status"])
             return False
 
+    def delete_batch(self, chat_id: int, message_ids: list[int]) -> bool:
+        """One deleteMessages call (up to 100 ids). Telegram skips ids it cannot find."""
+        try:
+            self.bot.delete_messages(chat_id=chat_id, message_ids=message_ids)
+            return True
+        except Exception as e:
+            logger.warning(f"Error deleting {len(message_ids)} messages in chat {chat_id}: {e}")
+            return False
+
 
 class DeleteStats(TypedDict):
     total: int
@@ -44,20 +56,33 @@ class MessageDeleteService:
         self.deleter = deleter
 
     def delete_messages(self, queryset: QuerySet[GroupMessage | ChannelMessage]) -> DeleteStats:
-        deleted = 0
-        failed = 0
-
-        for msg in queryset:
-            success = self.deleter.delete_message(msg)
-            if success:
-                deleted += 1
-            else:
-                failed += 1
+        """Delete through deleteMessages in chunks per chat; statuses are set with one UPDATE per outcome."""
+        model = queryset.model
+        chat_field = "group_id" if model is GroupMessage else "channel_id"
+
+        by_chat: dict[int, list[tuple[int, int]]] = defaultdict(list)
+        total = 0
+        for pk, chat_id, message_id in queryset.values_list("pk", chat_field, "message_id"):
+            by_chat[chat_id].append((pk, message_id))
+            total += 1
+
+        deleted_pks: list[int] = []
+        failed_pks: list[int] = []
+        for chat_id, rows in by_chat.items():
+            for start in range(0, len(rows), DELETE_BATCH_SIZE):
+                chunk = rows[start : start + DELETE_BATCH_SIZE]
+                ok = self.deleter.delete_batch(chat_id, [message_id for _, message_id in chunk])
+                (deleted_pks if ok else failed_pks).extend(pk for pk, _ in chunk)
+
+        if deleted_pks:
+            model.objects.filter(pk__in=deleted_pks).update(status=MessageStatus.DELETED)
+        if failed_pks:
+            model.objects.filter(pk__in=failed_pks).update(status=MessageStatus.DELETE_FAILED)
 
         return {
-            "total": queryset.count(),
-            "deleted": deleted,
-            "failed": failed,
+            "total": total,
+            "deleted": len(deleted_pks),
+            "failed": len(failed_pks),
         }
 
     def delete_by_groups(self, groups: Iterable[Group]) -> DeleteStats:
@@ -69,13 +94,13 @@ class MessageDeleteService:
     def delete_in_channel_by_vacancy(self, vacancy: Vacancy) -> DeleteStats:
         messages = ChannelMessage.objects.filter(
             status__in=[MessageStatus.RECEIVED, MessageStatus.DELETE_FAILED],
-            extra__vacancy_id=vacancy.id,
+            vacancy=vacancy,
         )
         return self.delete_messages(messages)
 
     def delete_in_group_by_vacancy(self, vacancy: Vacancy) -> DeleteStats:
         messages = GroupMessage.objects.filter(
             status__in=[MessageStatus.RECEIVED, MessageStatus.DELETE_FAILED],
-            extra__vacancy_id=vacancy.id,
+            vacancy=vacancy,
         )
         return self.delete_messages(messages)
@@ -0,0 +1,250 @@
+"""Queued webhook updates.
+
+The webhook view stores the raw update (TelegramUpdate, unique update_id) and
+returns 200 at once; processing happens in a thread pool or a Celery worker
+depending on TELEGRAM_WEBHOOK_MODE. Updates of one chat are always drained in
+update_id order by whoever holds that chat's lock.
+
+Telegram redelivers an update when the webhook answers slowly or with an
+error. claim_update() records every update_id in the cache for
+UPDATE_SEEN_TTL (a bounded, self-expiring set shared by all workers), so a
+redelivery is dropped before it reaches the database or the handlers, in
+inline mode too. An intake that fails before the update is stored releases
+its claim, and Telegram's next attempt is let through as a retry. A body
+that is not an update object is logged and acknowledged, never retried.
+telegram_webhook_updates_total{outcome=new|retry|duplicate|invalid} counts them.
+
+Processed rows are purged by purge_processed_updates(): DONE ones after
+DONE_RETENTION (longer than UPDATE_SEEN_TTL, so the unique update_id still
+catches a redelivery the cache has forgotten), FAILED ones after
+FAILED_RETENTION, which leaves time to inspect them.
+"""
+
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any
+
+import telebot
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+
+from service.metrics import inc, timed
+from telegram.choices import UpdateStatus
+from telegram.models import TelegramUpdate
+
+logger = logging.getLogger(__name__)
+
+MODE_INLINE = "inline"
+MODE_THREAD = "thread"
+MODE_CELERY = "celery"
+
+CHAT_LOCK_TIMEOUT = 300
+STALE_AFTER = timedelta(minutes=1)
+
+INTAKE_NEW = "new"
+INTAKE_RETRY = "retry"
+INTAKE_DUPLICATE = "duplicate"
+INTAKE_INVALID = "invalid"
+
+UPDATE_SEEN_TTL = 6 * 60 * 60
+DONE_RETENTION = timedelta(hours=12)
+FAILED_RETENTION = timedelta(days=7)
+PURGE_BATCH_SIZE = 5000
+_SEEN_KEY = "tg_update_seen:{update_id}"
+_SEEN_TAKEN = "taken"
+_SEEN_FAILED = "failed"
+
+_CHAT_KEYS = ("message", "edited_message", "channel_post", "edited_channel_post")
+_MEMBER_KEYS = ("my_chat_member", "chat_member", "chat_join_request")
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def webhook_secret_token() -> str:
+    """Value for setWebhook(secret_token=...); Telegram echoes it in X-Telegram-Bot-Api-Secret-Token."""
+    return hashlib.sha256(settings.TELEGRAM_WEBHOOK_SECRET.encode()).hexdigest()
+
+
+def verify_secret_token(header_value: str | None, required: bool) -> bool:
+    if header_value is None:
+        return not required
+    return header_value == webhook_secret_token()
+
+
+def extract_chat_id(data: dict[str, Any]) -> int | None:
+    """Chat the update belongs to — the ordering key."""
+    for key in _CHAT_KEYS + _MEMBER_KEYS:
+        if key in data:
+            return data[key].get("chat", {}).get("id")
+    if "callback_query" in data:
+        callback = data["callback_query"]
+        chat = (callback.get("message") or {}).get("chat")
+        return chat["id"] if chat else callback.get("from", {}).get("id")
+    return None
+
+
+def claim_update(update_id: int) -> str:
+    """INTAKE_NEW or INTAKE_RETRY when this delivery should be handled, INTAKE_DUPLICATE otherwise."""
+    key = _SEEN_KEY.format(update_id=update_id)
+    if cache.add(key, _SEEN_TAKEN, UPDATE_SEEN_TTL):
+        return INTAKE_NEW
+    if cache.get(key) == _SEEN_FAILED:
+        cache.set(key, _SEEN_TAKEN, UPDATE_SEEN_TTL)
+        return INTAKE_RETRY
+    return INTAKE_DUPLICATE
+
+
+def release_update(update_id: int) -> None:
+    """The intake failed before the update was stored: let the redelivery through."""
+    cache.set(_SEEN_KEY.format(update_id=update_id), _SEEN_FAILED, UPDATE_SEEN_TTL)
+
+
+def count_intake(outcome: str, update_id: int | None) -> None:
+    inc("telegram_webhook_updates_total", outcome=outcome)
+    if outcome != INTAKE_NEW:
+        logger.info(f"webhook_{outcome}", extra={"update_id": update_id})
+
+
+def is_update(data: Any) -> bool:
+    """A JSON object carrying an integer update_id; anything else cannot be stored or deduplicated."""
+    return isinstance(data, dict) and isinstance(data.get("update_id"), int) and not isinstance(data["update_id"], bool)
+
+
+def persist_update(data: dict[str, Any]) -> TelegramUpdate | None:
+    """Store the update; returns None for a duplicate update_id (Telegram redelivery)."""
+    try:
+        with transaction.atomic():
+            return TelegramUpdate.objects.create(
+                update_id=data["update_id"],
+                chat_id=extract_chat_id(data),
+                payload=data,
+            )
+    except IntegrityError:
+        return None
+
+
+def _pending(chat_id: int | None):
+    qs = TelegramUpdate.objects.filter(status=UpdateStatus.RECEIVED)
+    return qs.filter(chat_id__isnull=True) if chat_id is None else qs.filter(chat_id=chat_id)
+
+
+def _process(row: TelegramUpdate) -> None:
+    from telegram.handlers.bot_instance import get_bot, load_handlers_once
+
+    load_handlers_once()
+    bot = get_bot()
+    # Already off the request thread: run handlers here, in order, not in telebot's own pool.
+    bot.threaded = False
+    kind = next((key for key in row.payload if key != "update_id"), "unknown")
+    with timed("telegram_update_duration_seconds", kind=kind) as labels:
+        try:
+            bot.process_new_updates([telebot.types.Update.de_json(row.payload)])
+            row.status = UpdateStatus.DONE
+        except Exception:
+            logger.exception("webhook_update_failed", extra={"update_id": row.update_id})
+            row.status = UpdateStatus.FAILED
+        labels["outcome"] = row.status
+    row.processed_at = timezone.now()
+    row.save(update_fields=["status", "processed_at"])
+
+
+def drain_chat_updates(chat_id: int | None) -> int:
+    """Process every pending update of the chat in update_id order. Returns how many were processed."""
+    lock_key = f"tg_updates_chat_lock:{chat_id}"
+    processed = 0
+    while True:
+        if not cache.add(lock_key, True, timeout=CHAT_LOCK_TIMEOUT):
+            # Another worker is draining this chat and re-checks after releasing.
+            return processed
+        try:
+            while row := _pending(chat_id).order_by("update_id").first():
+                _process(row)
+                processed += 1
+        finally:
+            cache.delete(lock_key)
+        # An update may have landed between the last query and the release.
+        if not _pending(chat_id).exists():
+            return processed
+
+
+def _drain_in_thread(chat_id: int | None) -> None:
+    close_old_connections()
+    try:
+        drain_chat_updates(chat_id)
+    except Exception:
+        logger.exception("webhook_drain_failed", extra={"chat_id": chat_id})
+    finally:
+        close_old_connections()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.TELEGRAM_WEBHOOK_THREADS, thread_name_prefix="tg-updates")
+    return _executor
+
+
+def dispatch_update(row: TelegramUpdate) -> None:
+    """Hand a stored update to the configured worker pool."""
+    if settings.TELEGRAM_WEBHOOK_MODE == MODE_CELERY:
+        from telegram.tasks import process_telegram_updates_task
+
+        try:
+            process_telegram_updates_task.delay(row.chat_id)
+            return
+        except Exception as e:
+            logger.warning(f"webhook_enqueue_failed, using thread pool: {e}")
+    _get_executor().submit(_drain_in_thread, row.chat_id)
+
+
+def receive_update(data: dict[str, Any]) -> str:
+    """Queued-mode intake: dedupe, store, hand to the worker pool. Returns the intake outcome.
+
+    A storage error propagates (the view answers 500, so Telegram retries).
+    A payload that is not an update is dropped: retrying it would never succeed.
+    """
+    if not is_update(data):
+        logger.warning("webhook_invalid_update", extra={"payload": repr(data)[:200]})
+        count_intake(INTAKE_INVALID, None)
+        return INTAKE_INVALID
+    update_id = data["update_id"]
+    outcome = claim_update(update_id)
+    if outcome != INTAKE_DUPLICATE:
+        try:
+            row = persist_update(data)
+        except Exception:
+            release_update(update_id)
+            raise
+        if row is None:
+            outcome = INTAKE_DUPLICATE  # claim expired, but the row is still there
+        else:
+            dispatch_update(row)
+    count_intake(outcome, update_id)
+    return outcome
+
+
+def drain_stale_updates() -> int:
+    """Pick up updates left behind by a restarted worker."""
+    threshold = timezone.now() - STALE_AFTER
+    chat_ids = set(
+        TelegramUpdate.objects.filter(status=UpdateStatus.RECEIVED, created_at__lte=threshold).values_list(
+            "chat_id", flat=True
+        )
+    )
+    return sum(drain_chat_updates(chat_id) for chat_id in chat_ids)
+
+
+def purge_processed_updates() -> int:
+    """Delete processed updates past their retention, at most PURGE_BATCH_SIZE per status. Returns how many."""
+    now = timezone.now()
+    deleted = 0
+    for status, retention in ((UpdateStatus.DONE, DONE_RETENTION), (UpdateStatus.FAILED, FAILED_RETENTION)):
+        expired = TelegramUpdate.objects.filter(status=status, processed_at__lte=now - retention)
+        ids = list(expired.order_by("processed_at").values_list("pk", flat=True)[:PURGE_BATCH_SIZE])
+        if ids:
+            deleted += TelegramUpdate.objects.filter(pk__in=ids).delete()[0]
+    return deleted
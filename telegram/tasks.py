@@ -0,0 +1,114 @@
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=10)
+def deliver_telegram_task(
+    self,
+    op: str,
+    chat_ids: list[int],
+    method: str,
+    payload: dict,
+    vacancy_id: int | None = None,
+    message_id: int | None = None,
+):
+    """
+    Outbound worker for service.telegram_outbound. Sends at the Bot API limits;
+    on 429 the rest of the chats are retried after Telegram's retry_after.
+    """
+    from service.telegram_outbound import deliver, get_rate_limiter
+
+    report = deliver(
+        op,
+        chat_ids,
+        method=method,
+        payload=payload,
+        vacancy_id=vacancy_id,
+        message_id=message_id,
+        limiter=get_rate_limiter(),
+    )
+    if report.pending:
+        logger.warning(f"deliver_telegram_task: 429, {len(report.pending)} chats retry in {report.retry_after}s")
+        raise self.retry(
+            args=[op, report.pending, method, payload, vacancy_id, message_id],
+            countdown=report.retry_after,
+        )
+    return report.sent
+
+
+@shared_task
+def process_telegram_updates_task(chat_id: int | None):
+    """Drain queued webhook updates of one chat (TELEGRAM_WEBHOOK_MODE=celery)."""
+    from telegram.service.updates import drain_chat_updates
+
+    drain_chat_updates(chat_id)
+
+
+@shared_task
+def drain_stale_telegram_updates_task():
+    """Runs every 60s. Processes webhook updates left pending by a restarted worker and purges old processed ones."""
+    logger.info("task_started", extra={"task": "drain_stale_telegram_updates_task"})
+    from telegram.service.updates import drain_stale_updates, purge_processed_updates
+
+    processed = drain_stale_updates()
+    purged = purge_processed_updates()
+    logger.info(
+        "task_completed",
+        extra={"task": "drain_stale_telegram_updates_task", "processed": processed, "purged": purged},
+    )
+
+
+@shared_task
+def setup_group_owner_task(chat_id: int, user_id: int):
+    """Promote the vacancy owner once Telegram has registered the approved join request."""
+    from telegram.service.group import GroupService
+
+    GroupService.setup_owner(chat_id=chat_id, user_id=user_id)
+
+
+@shared_task
+def kick_users_task(chat_id: int, user_ids: list[int]):
+    """Kicks queued by GroupService.kick_users (rollcall no-shows, rejected workers)."""
+    from telegram.service.group import GroupService
+
+    for user_id in user_ids:
+        GroupService.kick_user(chat_id=chat_id, user_id=user_id)
+
+
+@shared_task
+def flush_admin_digest_task(kind: str):
+    """Armed by service.admin_notifications.notify_admins_digest; sends the collected digest."""
+    from service.admin_notifications import flush_admin_digest
+
+    flush_admin_digest(kind)
+
+
+@shared_task
+def recycle_group_task(group_id: int):
+    """One step of group recycling; re-queues itself until the group is back in the pool."""
+    from telegram.service.group_recycling import RecycleDeferred, recycle_step, schedule_step
+
+    try:
+        done = recycle_step(group_id)
+    except RecycleDeferred as e:
+        schedule_step(group_id, countdown=e.retry_after)
+        return False
+    if not done:
+        schedule_step(group_id)
+    return done
+
+
+@shared_task
+def refill_group_pool_task():
+    """Runs every 5 minutes. Restarts stalled recyclings, re-verifies pooled groups, alerts on a low pool."""
+    from telegram.service import group_pool
+    from telegram.service.group_recycling import resume_stalled
+
+    resumed = resume_stalled()
+    if resumed:
+        logger.warning(f"refill_group_pool_task: resumed {resumed} stalled recyclings")
+    size = group_pool.verify()
+    logger.info("task_completed", extra={"task": "refill_group_pool_task", "pool_size": size})
@@ -68,20 +68,15 @@ def _build_full_name(first_name: str = "", last_name: str = "") -> str:
 
 
 def notify_admins_new_user(user: User) -> None:
-    """Send notification to all admins about a new user registration."""
-    from service.broadcast_service import TelegramBroadcastService
-    from service.notifications_impl import TelegramNotifier
-    from telegram.handlers.bot_instance import get_bot
+    """Send notification to all admins about a new user registration (coalesced into digests)."""
+    from service.admin_notifications import DIGEST_NEW_USER, notify_admins_digest, user_summary
     from vacancy.services.admin_format import format_user_block
 
     text = f"🆕 <b>Новий користувач</b>\n\n{format_user_block(user)}"
 
     try:
-        bot = get_bot()
-        notifier = TelegramNotifier(bot)
-        broadcast = TelegramBroadcastService(notifier=notifier)
-        broadcast.admin_broadcast(text=text, parse_mode="HTML")
-        logger.info("New user notification sent to admins")
+        notify_admins_digest(DIGEST_NEW_USER, text, user_summary(user))
+        logger.info("New user notification queued for admins")
     except Exception as e:
         logger.error(f"Failed to notify admins about new user: {e}")
 
@@ -3,6 +3,7 @@ import logging
 from urllib.parse import parse_qsl, unquote
 
 import telebot
+from django.conf import settings
 from django.contrib.auth import login
 from django.core.handlers.wsgi import WSGIRequest
 from django.http import HttpResponse
@@ -11,7 +12,10 @@ from django.urls import reverse
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.views.decorators.csrf import csrf_exempt
 
+from service.metrics import timed
 from telegram.handlers.bot_instance import get_bot, load_handlers_once
+from telegram.service import updates
+from telegram.service.updates import verify_secret_token
 
 from .utils import check_webapp_signature, get_or_create_user
 
@@ -92,10 +96,35 @@ def telegram_webhook(request: WSGIRequest) -> HttpResponse:
     if request.method != "POST":
         return HttpResponse("Only POST allowed", status=405)
 
+    mode = settings.TELEGRAM_WEBHOOK_MODE
+    with timed("telegram_webhook_duration_seconds", mode=mode):
+        return _handle_webhook(request, mode)
+
+
+def _handle_webhook(request: WSGIRequest, mode: str) -> HttpResponse:
+    if not verify_secret_token(
+        request.headers.get("X-Telegram-Bot-Api-Secret-Token"), required=mode != updates.MODE_INLINE
+    ):
+        logger.warning("webhook_rejected", extra={"reason": "secret_token"})
+        return HttpResponse(status=403)
+
+    if mode != updates.MODE_INLINE:
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            logger.warning("Webhook body is not JSON. body=%r", request.body[:200])
+            return HttpResponse("ok")
+        updates.receive_update(data)
+        return HttpResponse("ok")
+
     try:
         json_str = request.body.decode("utf-8")
         update = telebot.types.Update.de_json(json_str)
         logger.debug("webhook_received", extra={"update_id": update.update_id})
+        outcome = updates.claim_update(update.update_id)
+        updates.count_intake(outcome, update.update_id)
+        if outcome == updates.INTAKE_DUPLICATE:
+            return HttpResponse("ok")
         get_bot().process_new_updates([update])
     except Exception:
         logger.exception("Webhook processing failed. body=%r", (request.body[:200] if request.body else b""))
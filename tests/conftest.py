@@ -6,14 +6,39 @@ Strategy:
   so tests never depend on a real .env being present.
 - mock_bot_api (autouse) — patches the already-created TeleBot instance so no
   real Telegram API calls are made during any test.
+- clear_cache (autouse) — empties the Django cache and unflushed metrics so
+  cached state (block status, rating params, locks) never leaks between tests.
 - Factory fixtures — thin wrappers that return the factory class; individual tests
   call them with @pytest.mark.django_db to get DB access.
+- Benchmarks — tests marked `benchmark` are skipped unless --run-benchmarks is
+  given; --update-baselines rewrites tests/benchmarks.json from the current run.
 """
 
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+# ---------------------------------------------------------------------------
+# Command-line options
+# ---------------------------------------------------------------------------
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-benchmarks", action="store_true", help="run tests marked `benchmark`")
+    parser.addoption(
+        "--update-baselines", action="store_true", help="record benchmark timings into tests/benchmarks.json"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark: pass --run-benchmarks to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 # ---------------------------------------------------------------------------
 # Settings / environment overrides
 # ---------------------------------------------------------------------------
@@ -27,6 +52,19 @@ def override_settings(settings):
     settings.BASE_URL = "https://test.robochi.example"
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    from django.core.cache import cache
+
+    from service.metrics import registry
+
+    registry.reset()
+    cache.clear()
+    yield
+    registry.reset()
+    cache.clear()
+
+
 # ---------------------------------------------------------------------------
 # Telegram bot mock — prevents any real API calls
 # ---------------------------------------------------------------------------
@@ -38,22 +76,26 @@ def mock_bot_api():
     Patch all commonly used TeleBot methods on the singleton bot instance.
     New methods can be added here as the test suite grows.
     """
-    from telegram.handlers.bot_instance import bot
+    from telegram.handlers.bot_instance import bot, get_me
 
     send_result = MagicMock(message_id=1)
+    get_me.cache_clear()
 
     with (
         patch.object(bot, "send_message", return_value=send_result),
         patch.object(bot, "send_photo", return_value=send_result),
         patch.object(bot, "edit_message_text", return_value=send_result),
         patch.object(bot, "delete_message", return_value=True),
+        patch.object(bot, "delete_messages", return_value=True),
         patch.object(bot, "answer_callback_query", return_value=True),
         patch.object(bot, "get_webhook_info", return_value=MagicMock(url="")),
         patch.object(bot, "ban_chat_member", return_value=True),
         patch.object(bot, "unban_chat_member", return_value=True),
         patch.object(bot, "kick_chat_member", return_value=True),
+        patch.object(bot, "get_me", return_value=MagicMock(id=0, username="robochi_test_bot")),
     ):
         yield
+    get_me.cache_clear()
 
 
 # ---------------------------------------------------------------------------
@@ -101,3 +143,8 @@ def group_factory():
     from tests.factories import GroupFactory
 
     return GroupFactory
+
+
+@pytest.fixture
+def update_baselines(request):
+    return request.config.getoption("--update-baselines")
@@ -75,6 +75,7 @@ class GroupFactory(DjangoModelFactory):
     id = factory.Sequence(lambda n: -1_000_000 - n)
     title = factory.Sequence(lambda n: f"Test Group {n}")
     is_active = True
+    has_bot_administrator = True
     status = "available"
     invite_link = factory.Sequence(lambda n: f"https://t.me/+group{n:08d}")
 
@@ -0,0 +1,242 @@
+"""
+Helpers for the query-budget and benchmark suites.
+
+seed_world() bulk-inserts a realistic data set (employers, workers with work
+profiles, vacancies, members, feedback, channel/group messages) around one
+"hot" approved vacancy that the views and handlers under test act on. Rows go
+in with bulk_create, so model save() hooks and signals do not run; the
+derived columns they maintain (User.search_text/phone_digits,
+UserRatingStats) are filled in here instead.
+
+assert_max_queries() fails a test when the wrapped block issues more queries
+than its budget and prints the captured SQL, so an N+1 shows up in the
+failure output rather than as a slow page in production.
+
+Wall-time baselines live in tests/benchmarks.json (name -> median seconds).
+check_baseline() flags a run slower than baseline * (1 + tolerance) (and
+more than BENCHMARK_NOISE_FLOOR above it); with --update-baselines the
+measured value is written back instead.
+"""
+
+import json
+import statistics
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import Decimal
+from itertools import count
+from pathlib import Path
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tests.factories import ChannelFactory, EmployerFactory, GroupFactory
+
+BASELINES_PATH = Path(__file__).with_name("benchmarks.json")
+BENCHMARK_TOLERANCE = 0.5  # a run may be up to 50% slower than its baseline
+BENCHMARK_NOISE_FLOOR = 0.01  # ...and always 10 ms, so millisecond-scale timings don't flap
+
+# Seeded ids stay clear of the UserFactory sequence (100_000_000 + n).
+_user_ids = count(700_000_000)
+_message_ids = count(1)
+
+
+@dataclass
+class PerfWorld:
+    owner: object
+    hot_vacancy: object
+    members: list = field(default_factory=list)
+    workers: list = field(default_factory=list)
+    employers: list = field(default_factory=list)
+
+
+def _bulk_users(n: int, role: str, prefix: str) -> list:
+    from user.models import User
+    from user.search import build_phone_digits, build_search_text
+    from work.models import UserWorkProfile
+
+    users = []
+    for _ in range(n):
+        uid = next(_user_ids)
+        user = User(
+            id=uid,
+            telegram_id=uid,
+            username=f"{prefix}_{uid}",
+            full_name=f"{prefix.title()} Петренко {uid}",
+            phone_number=f"+38067{uid % 10_000_000:07d}",
+            gender="M" if uid % 2 else "F",
+        )
+        user.search_text = build_search_text(user)
+        user.phone_digits = build_phone_digits(user)
+        users.append(user)
+    User.objects.bulk_create(users, batch_size=500)
+    UserWorkProfile.objects.bulk_create(
+        [UserWorkProfile(user=u, role=role, is_completed=True, agreement_accepted=True) for u in users],
+        batch_size=500,
+    )
+    return users
+
+
+def _vacancy(owner, **kwargs):
+    from vacancy.models import Vacancy
+
+    now = timezone.localtime()
+    defaults = {
+        "owner": owner,
+        "people_count": 5,
+        "has_passport": False,
+        "address": "вул. Хрещатик 1, Київ",
+        "date": now.date(),
+        "start_time": (now + timedelta(hours=3)).time().replace(second=0, microsecond=0),
+        "end_time": (now + timedelta(hours=8)).time().replace(second=0, microsecond=0),
+        "payment_amount": Decimal("300.00"),
+        "skills": "Загальні роботи",
+    }
+    return Vacancy(**{**defaults, **kwargs})
+
+
+def seed_world(
+    *,
+    employers: int = 20,
+    workers: int = 200,
+    vacancies: int = 100,
+    members_per_vacancy: int = 3,
+    feedback: int = 400,
+    messages: int = 200,
+    hot_members: int = 5,
+) -> PerfWorld:
+    """Bulk-insert a data set of the given size; see the module docstring."""
+    from telegram.choices import Status
+    from telegram.models import ChannelMessage, GroupMessage, UserInGroup
+    from user.models import UserFeedback
+    from user.rating import recount_rating_stats
+    from vacancy.choices import STATUS_APPROVED, STATUS_CLOSED, STATUS_PENDING
+    from vacancy.models import Vacancy, VacancyUser
+
+    owner = EmployerFactory(phone_number="+380670000001")
+    channel = ChannelFactory()
+    group = GroupFactory(status="process")
+    employer_rows = _bulk_users(employers, "employer", "employer")
+    worker_rows = _bulk_users(workers, "worker", "worker")
+
+    statuses = (STATUS_CLOSED, STATUS_CLOSED, STATUS_APPROVED, STATUS_PENDING)
+    background = Vacancy.objects.bulk_create(
+        [
+            _vacancy(employer_rows[i % employers], status=statuses[i % len(statuses)], channel=channel)
+            for i in range(vacancies)
+        ],
+        batch_size=500,
+    )
+    hot = _vacancy(owner, status=STATUS_APPROVED, channel=channel, group=group, people_count=hot_members + 2)
+    hot.save()
+
+    hot_workers = worker_rows[:hot_members]
+    rest = worker_rows[hot_members:]
+    VacancyUser.objects.bulk_create(
+        [VacancyUser(vacancy=hot, user=w, status=Status.MEMBER) for w in hot_workers]
+        + [
+            VacancyUser(vacancy=v, user=rest[(i * members_per_vacancy + j) % len(rest)], status=Status.LEFT)
+            for i, v in enumerate(background)
+            for j in range(members_per_vacancy)
+        ],
+        batch_size=500,
+    )
+    UserInGroup.objects.bulk_create(
+        [UserInGroup(user=w, group=group, status=Status.MEMBER) for w in [owner, *hot_workers]]
+    )
+    UserFeedback.objects.bulk_create(
+        [
+            UserFeedback(
+                owner=employer_rows[i % employers],
+                user=worker_rows[i % workers],
+                rating=("like", "dislike", "none")[i % 3],
+                text="Все добре" if i % 2 else "",
+            )
+            for i in range(feedback)
+        ],
+        batch_size=500,
+    )
+    ChannelMessage.objects.bulk_create(
+        [
+            ChannelMessage(
+                channel=channel,
+                vacancy=background[i % vacancies] if vacancies else hot,
+                content_type="text",
+                message_id=next(_message_ids),
+            )
+            for i in range(messages)
+        ],
+        batch_size=500,
+    )
+    GroupMessage.objects.bulk_create(
+        [
+            GroupMessage(
+                group=group,
+                vacancy=hot,
+                user_id=hot_workers[i % hot_members].id,
+                content_type="text",
+                message_id=next(_message_ids),
+            )
+            for i in range(messages)
+        ]
+        if hot_members
+        else [],
+        batch_size=500,
+    )
+    recount_rating_stats()
+    return PerfWorld(owner=owner, hot_vacancy=hot, members=hot_workers, workers=worker_rows, employers=employer_rows)
+
+
+@contextmanager
+def assert_max_queries(budget: int, label: str = ""):
+    """Fail when the block runs more than `budget` queries; the SQL goes into the message."""
+    with CaptureQueriesContext(connection) as ctx:
+        yield ctx
+    executed = len(ctx.captured_queries)
+    if executed > budget:
+        sql = "\n".join(f"{i}. {q['sql']}" for i, q in enumerate(ctx.captured_queries, start=1))
+        raise AssertionError(f"{label or 'block'} ran {executed} queries, budget is {budget}:\n{sql}")
+
+
+def measure(func, *, rounds: int = 5, warmup: int = 1) -> float:
+    """Median wall time of `func()` in seconds, after `warmup` untimed calls."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def load_baselines(path: Path = BASELINES_PATH) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(name: str, seconds: float, path: Path = BASELINES_PATH) -> None:
+    baselines = load_baselines(path)
+    baselines[name] = round(seconds, 6)
+    path.write_text(json.dumps(dict(sorted(baselines.items())), indent=2) + "\n")
+
+
+def check_baseline(
+    name: str, seconds: float, *, update: bool = False, tolerance: float = BENCHMARK_TOLERANCE, path=BASELINES_PATH
+) -> str | None:
+    """None when `seconds` is within tolerance of the recorded baseline, otherwise the reason.
+
+    A benchmark without a baseline, or any benchmark when `update` is set,
+    records the measured value and passes.
+    """
+    baseline = load_baselines(path).get(name)
+    if update or baseline is None:
+        save_baseline(name, seconds, path)
+        return None
+    limit = max(baseline * (1 + tolerance), baseline + BENCHMARK_NOISE_FLOOR)
+    if seconds > limit:
+        return f"{name}: {seconds * 1000:.1f} ms, baseline {baseline * 1000:.1f} ms (+{tolerance:.0%} allowed)"
+    return None
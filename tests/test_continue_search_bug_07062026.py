@@ -88,7 +88,7 @@ def test_confirm_rollcall_sets_continue_mode_but_defers_snapshot(
     vacancy.refresh_from_db()
     assert vacancy.first_rollcall_passed is True
     assert is_in_continue_mode(vacancy)
-    assert vacancy.extra.get("continue_deadline")
+    assert vacancy.continue_deadline
     # Snapshot is intentionally NOT saved yet
     assert get_snapshot_user_ids(vacancy) == []
 
@@ -67,7 +67,7 @@ def test_e2e_continue_search_after_first_rollcall(
     vacancy.refresh_from_db()
     assert vacancy.first_rollcall_passed is True
     assert is_in_continue_mode(vacancy)
-    assert vacancy.extra.get("continue_deadline")
+    assert vacancy.continue_deadline
     # Snapshot intentionally deferred
     assert get_snapshot_user_ids(vacancy) == []
 
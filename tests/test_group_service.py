@@ -1,10 +1,12 @@
 """
 Tests for GroupService.get_available_group (telegram/service/group.py).
 
-The method returns the first Group with:
+The method returns the first Group in the pool (telegram/service/group_pool.py):
   - status = "available"
   - is_active = True
-  - invite_link IS NOT NULL
+  - has_bot_administrator = True
+  - invite_link neither NULL nor empty
+  - no member/owner left in it
 
 All Telegram bot calls (create_chat_invite_link, etc.) are mocked via
 the autouse mock_bot_api fixture in conftest.py.
@@ -60,17 +62,13 @@ def test_ignores_group_without_invite_link(group_factory):
 
 @pytest.mark.django_db
 def test_ignores_group_with_empty_invite_link(group_factory):
-    """invite_link='' is not NULL — the filter uses isnull=False so empty
-    string would be returned.  Verify behaviour is consistent with the query."""
+    """invite_link='' is not a usable link: the pool excludes it like NULL."""
 
-    group = group_factory(status="available", is_active=True, invite_link="")
+    group_factory(status="available", is_active=True, invite_link="")
 
     result = GroupService.get_available_group()
 
-    # Empty string passes isnull=False — this documents the current behaviour.
-    # If this changes (e.g. blank="" check added), update this assertion.
-    assert result is not None
-    assert result.id == group.id
+    assert result is None
 
 
 @pytest.mark.django_db
@@ -31,7 +31,7 @@ class TestRegressionInvoiceAfterAutoConfirm(TestCase):
         owner = UserFactory(phone_number="+380501110001")
         worker = UserFactory(phone_number="+380501110002")
         vacancy = VacancyFactory(owner=owner, has_passport=False, skills="")
-        vacancy.extra = {"sent_final_call": True}
+        vacancy.sent_final_call = True
         vacancy.first_rollcall_passed = True
         vacancy.save()
         VacancyUser.objects.create(vacancy=vacancy, user=worker, status="member")
@@ -93,7 +93,7 @@ class TestRegressionAdminMarkAsPaid(TestCase):
         owner = UserFactory(phone_number="+380501110004")
         vacancy = VacancyFactory(owner=owner, has_passport=False, skills="")
         vacancy.status = STATUS_AWAITING_PAYMENT
-        vacancy.extra["is_paid"] = False
+        vacancy.is_paid = False
         vacancy.save()
         BlockService.auto_block_employer_unpaid(owner)
         return vacancy, owner
@@ -110,7 +110,7 @@ class TestRegressionAdminMarkAsPaid(TestCase):
         assert count == 1
         vacancy.refresh_from_db()
         assert vacancy.status == STATUS_PAID
-        assert vacancy.extra["is_paid"] is True
+        assert vacancy.is_paid is True
         assert not UserBlock.objects.filter(user=owner, is_active=True, reason="unpaid").exists()
 
     def test_lk_unblock_triggers_mark_paid(self):
@@ -129,7 +129,7 @@ class TestRegressionAdminMarkAsPaid(TestCase):
             admin_block_user(request, owner.id)
         vacancy.refresh_from_db()
         assert vacancy.status == STATUS_PAID
-        assert vacancy.extra["is_paid"] is True
+        assert vacancy.is_paid is True
 
     def test_django_admin_action_marks_paid(self):
         from django.contrib.admin.sites import AdminSite
@@ -160,7 +160,7 @@ class TestRegressionAdminMarkAsPaid(TestCase):
         owner1 = UserFactory(phone_number="+380501110008")
         v1 = VacancyFactory(owner=owner1, has_passport=False, skills="")
         v1.status = STATUS_AWAITING_PAYMENT
-        v1.extra["is_paid"] = False
+        v1.is_paid = False
         v1.save()
         BlockService.auto_block_employer_unpaid(owner1)
         admin_user = UserFactory(phone_number="+380501110010")
@@ -177,7 +177,7 @@ class TestRegressionAdminMarkAsPaid(TestCase):
         owner2 = UserFactory(phone_number="+380501110009")
         v2 = VacancyFactory(owner=owner2, has_passport=False, skills="")
         v2.status = STATUS_AWAITING_PAYMENT
-        v2.extra["is_paid"] = False
+        v2.is_paid = False
         v2.save()
         BlockService.auto_block_employer_unpaid(owner2)
         from django.contrib.admin.sites import AdminSite
@@ -192,5 +192,5 @@ class TestRegressionAdminMarkAsPaid(TestCase):
             ma.mark_as_paid_action(request2, Vacancy.objects.filter(pk=v2.pk))
         v2.refresh_from_db()
         assert v1.status == v2.status == STATUS_PAID
-        assert v1.extra["is_paid"] == v2.extra["is_paid"] is True
+        assert v1.is_paid == v2.is_paid is True
         assert v1.extra["admin_marked_paid"] == v2.extra["admin_marked_paid"] is True
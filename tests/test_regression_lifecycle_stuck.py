@@ -75,7 +75,7 @@ class TestRegressionAdminPaidGroupRelease(TestCase):
         vacancy.group = group
         vacancy.search_stopped_at = timezone.now() - timedelta(hours=4)
         vacancy.extra["admin_marked_paid"] = True
-        vacancy.extra["is_paid"] = True
+        vacancy.is_paid = True
         vacancy.save()
 
         with (
@@ -144,7 +144,7 @@ class TestBlockVacancyCreation:
 
     def test_has_pending_rollcall_flag(self, vacancy_factory, employer_factory):
         emp = employer_factory()
-        v = vacancy_factory(owner=emp, status="approved", extra={"sent_start_call": True})
+        v = vacancy_factory(owner=emp, status="approved", sent_start_call=True)
         v.first_rollcall_passed = False
         v.save()
 
@@ -160,7 +160,7 @@ class TestBlockVacancyCreation:
 
         has_pending = False
         for _v in Vacancy.objects.filter(owner=emp, status__in=[STATUS_APPROVED, STATUS_SEARCH_STOPPED]):
-            if _v.extra.get("sent_start_call") and not _v.first_rollcall_passed:
+            if _v.sent_start_call and not _v.first_rollcall_passed:
                 has_pending = True
                 break
         assert has_pending is True
@@ -19,7 +19,7 @@ class TestRollcallTimeReached:
             owner=owner,
             status="approved",
             first_rollcall_passed=False,
-            extra={"sent_start_call": True},
+            sent_start_call=True,
             date=date.today() + timedelta(days=1),
             start_time=time(9, 0),
         )
@@ -74,7 +74,7 @@ class TestAutoConfirmWritesExtraCalls(TestCase):
 
         owner = UserFactory(phone_number="+380993333333")
         vacancy = VacancyFactory(owner=owner, has_passport=False, skills="")
-        vacancy.extra = {"sent_start_call": True}
+        vacancy.sent_start_call = True
         vacancy.save()
 
         from vacancy.models import VacancyUser
@@ -112,7 +112,7 @@ class TestAdminMarkAsPaid(TestCase):
         owner = UserFactory(phone_number="+380995555555")
         vacancy = VacancyFactory(owner=owner, has_passport=False, skills="")
         vacancy.status = STATUS_AWAITING_PAYMENT
-        vacancy.extra["is_paid"] = False
+        vacancy.is_paid = False
         vacancy.save()
 
         BlockService.auto_block_employer_unpaid(owner)
@@ -138,7 +138,7 @@ class TestAdminMarkAsPaid(TestCase):
 
         vacancy.refresh_from_db()
         assert vacancy.status == STATUS_PAID
-        assert vacancy.extra["is_paid"] is True
+        assert vacancy.is_paid is True
         assert vacancy.extra["admin_marked_paid"] is True
         assert not UserBlock.objects.filter(user=owner, is_active=True, reason="unpaid").exists()
 
@@ -154,7 +154,7 @@ class TestUnblockEmployerMarksPaid(TestCase):
         owner = UserFactory(phone_number="+380997777777")
         vacancy = VacancyFactory(owner=owner, has_passport=False, skills="")
         vacancy.status = STATUS_AWAITING_PAYMENT
-        vacancy.extra["is_paid"] = False
+        vacancy.is_paid = False
         vacancy.save()
 
         BlockService.auto_block_employer_unpaid(owner)
@@ -175,4 +175,4 @@ class TestUnblockEmployerMarksPaid(TestCase):
 
         vacancy.refresh_from_db()
         assert vacancy.status == STATUS_PAID
-        assert vacancy.extra["is_paid"] is True
+        assert vacancy.is_paid is True
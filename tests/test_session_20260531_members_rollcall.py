@@ -90,8 +90,8 @@ class TestMembersPageMode:
         from vacancy.views import vacancy_detail
 
         vacancy_with_members.start_time = time(0, 1)
-        vacancy_with_members.extra["sent_start_call"] = True
-        vacancy_with_members.save(update_fields=["start_time", "extra"])
+        vacancy_with_members.sent_start_call = True
+        vacancy_with_members.save(update_fields=["start_time", "sent_start_call"])
 
         request = factory.get(f"/vacancy/{vacancy_with_members.pk}/detail/")
         request.user = employer
@@ -114,8 +114,8 @@ class TestScenarioDetection:
         from vacancy.views import vacancy_detail
 
         vacancy_approved.start_time = time(0, 1)
-        vacancy_approved.extra["sent_start_call"] = True
-        vacancy_approved.save(update_fields=["start_time", "extra"])
+        vacancy_approved.sent_start_call = True
+        vacancy_approved.save(update_fields=["start_time", "sent_start_call"])
 
         request = factory.get(f"/vacancy/{vacancy_approved.pk}/detail/")
         request.user = employer
@@ -130,8 +130,8 @@ class TestScenarioDetection:
         from vacancy.views import vacancy_detail
 
         vacancy_with_members.start_time = time(0, 1)
-        vacancy_with_members.extra["sent_start_call"] = True
-        vacancy_with_members.save(update_fields=["start_time", "extra"])
+        vacancy_with_members.sent_start_call = True
+        vacancy_with_members.save(update_fields=["start_time", "sent_start_call"])
 
         request = factory.get(f"/vacancy/{vacancy_with_members.pk}/detail/")
         request.user = employer
@@ -149,8 +149,8 @@ class TestScenarioDetection:
 
         vacancy_with_members.people_count = 2
         vacancy_with_members.start_time = time(0, 1)
-        vacancy_with_members.extra["sent_start_call"] = True
-        vacancy_with_members.save(update_fields=["start_time", "people_count", "extra"])
+        vacancy_with_members.sent_start_call = True
+        vacancy_with_members.save(update_fields=["start_time", "people_count", "sent_start_call"])
 
         request = factory.get(f"/vacancy/{vacancy_with_members.pk}/detail/")
         request.user = employer
@@ -189,8 +189,8 @@ class TestEndRollcallGuard:
 
         vacancy_with_members.first_rollcall_passed = True
         vacancy_with_members.status = STATUS_SEARCH_STOPPED
-        vacancy_with_members.extra["sent_final_call"] = True
-        vacancy_with_members.save(update_fields=["first_rollcall_passed", "status", "extra"])
+        vacancy_with_members.sent_final_call = True
+        vacancy_with_members.save(update_fields=["first_rollcall_passed", "status", "sent_final_call"])
 
         request = factory.get(f"/vacancy/{vacancy_with_members.pk}/detail/")
         request.user = employer
@@ -216,8 +216,8 @@ class TestContinueSearchReset:
 
         vacancy_with_members.first_rollcall_passed = True
         vacancy_with_members.second_rollcall_passed = True
-        vacancy_with_members.extra["sent_start_call"] = True
-        vacancy_with_members.extra["sent_final_call"] = True
+        vacancy_with_members.sent_start_call = True
+        vacancy_with_members.sent_final_call = True
         vacancy_with_members.extra["start_call_reminders"] = 5
         vacancy_with_members.save()
 
@@ -235,8 +235,8 @@ class TestContinueSearchReset:
 
         assert vacancy_with_members.first_rollcall_passed is False
         assert vacancy_with_members.second_rollcall_passed is False
-        assert vacancy_with_members.extra.get("sent_start_call") is None
-        assert vacancy_with_members.extra.get("sent_final_call") is None
+        assert vacancy_with_members.sent_start_call is False
+        assert vacancy_with_members.sent_final_call is False
         assert vacancy_with_members.search_active is True
         assert vacancy_with_members.status == STATUS_APPROVED
 
@@ -287,12 +287,19 @@ class TestBotUrlPointsToMembers:
 class TestCloseDeletesRollcallMessages:
     """Test that vacancy close deletes start_call and final_call messages."""
 
-    def test_delete_list_includes_rollcall_keys(self):
+    def test_delete_list_includes_rollcall_keys(self, vacancy_approved):
         """VacancyDeleteEmployerInviteObserver should delete rollcall msg IDs."""
-        import inspect
-
         from vacancy.services.observers.vacancy_close import VacancyDeleteEmployerInviteObserver
 
-        source = inspect.getsource(VacancyDeleteEmployerInviteObserver)
-        assert "start_call_msg_id" in source
-        assert "final_call_msg_id" in source
+        vacancy_approved.start_call_msg_id = 101
+        vacancy_approved.final_call_msg_id = 102
+        vacancy_approved.save(update_fields=["start_call_msg_id", "final_call_msg_id"])
+
+        with patch("vacancy.services.observers.vacancy_close.bot") as mock_bot:
+            VacancyDeleteEmployerInviteObserver(notifier=MagicMock()).update("close", {"vacancy": vacancy_approved})
+
+        deleted = {c.kwargs["message_id"] for c in mock_bot.delete_message.call_args_list}
+        assert deleted == {101, 102}
+        vacancy_approved.refresh_from_db()
+        assert vacancy_approved.start_call_msg_id is None
+        assert vacancy_approved.final_call_msg_id is None
@@ -212,11 +212,11 @@ class TestNoAdminTelegramIds:
         assert "ADMIN_TELEGRAM_IDS" not in base_py, "ADMIN_TELEGRAM_IDS should be removed from config/django/base.py"
 
     def test_notify_admins_new_user_uses_broadcast(self):
-        """notify_admins_new_user must use admin_broadcast, not ADMIN_TELEGRAM_IDS."""
+        """notify_admins_new_user must use the admin channel (cached staff ids), not ADMIN_TELEGRAM_IDS."""
         import inspect
 
         from telegram.utils import notify_admins_new_user
 
         source = inspect.getsource(notify_admins_new_user)
         assert "ADMIN_TELEGRAM_IDS" not in source
-        assert "admin_broadcast" in source
+        assert "notify_admins_digest" in source
@@ -17,7 +17,12 @@ class TestAutoApprove(TestCase):
             id=-1001, title="Test Channel", city=self.city, invite_link="https://t.me/test"
         )
         self.group = Group.objects.create(
-            id=-1002, title="Test Group", status=STATUS_AVAILABLE, is_active=True, invite_link="https://t.me/grp"
+            id=-1002,
+            title="Test Group",
+            status=STATUS_AVAILABLE,
+            is_active=True,
+            has_bot_administrator=True,
+            invite_link="https://t.me/grp",
         )
 
     def _make_vacancy(self, **kwargs):
@@ -36,6 +36,7 @@ class TestAutoApproveRegressionCreate(TestCase):
             title="Test Group",
             status=STATUS_AVAILABLE,
             is_active=True,
+            has_bot_administrator=True,
             invite_link="https://t.me/grp",
         )
 
@@ -84,6 +85,7 @@ class TestAutoApproveRegressionResume(TestCase):
             title="Test Group 2",
             status=STATUS_AVAILABLE,
             is_active=True,
+            has_bot_administrator=True,
             invite_link="https://t.me/grp2",
         )
 
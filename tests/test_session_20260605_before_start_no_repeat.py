@@ -4,7 +4,7 @@ Bug: continue_search shifted start_time and deleted all VacancyUserCall
 records. Next Celery tick re-found the vacancy inside the new 2h window,
 found no BEFORE_START record, and re-sent the message.
 
-Fix: two defense layers (extra["pre_call_done"] flag and
+Fix: two defense layers (Vacancy.pre_call_done flag and
 extra["original_start_datetime"] anchor). Both set at vacancy creation
 and on cycle restart (resume_search / renewal / admin moderation).
 continue_search does NOT touch either — same cycle.
@@ -21,7 +21,7 @@ from django.utils import timezone
 @pytest.mark.django_db
 class TestBeforeStartNoRepeatAfterContinueSearch:
     def test_filter_skips_when_pre_call_done(self, employer_factory, vacancy_factory):
-        """Layer 1: filter must skip vacancies with extra['pre_call_done']."""
+        """Layer 1: filter must skip vacancies with pre_call_done set."""
         from vacancy.tasks.call import get_before_start_vacancies
 
         owner = employer_factory()
@@ -35,8 +35,9 @@ class TestBeforeStartNoRepeatAfterContinueSearch:
             end_time=(future_start + timedelta(hours=4)).time().replace(second=0, microsecond=0),
         )
         orig_aware = timezone.make_aware(datetime.combine(v.date, v.start_time), timezone.get_current_timezone())
-        v.extra = {"original_start_datetime": orig_aware.isoformat(), "pre_call_done": True}
-        v.save(update_fields=["extra"])
+        v.extra = {"original_start_datetime": orig_aware.isoformat()}
+        v.pre_call_done = True
+        v.save(update_fields=["extra", "pre_call_done"])
 
         result = list(get_before_start_vacancies())
         assert v not in result
@@ -80,15 +81,16 @@ class TestBeforeStartNoRepeatAfterContinueSearch:
         orig_iso = timezone.make_aware(
             datetime.combine(v.date, v.start_time), timezone.get_current_timezone()
         ).isoformat()
-        v.extra = {"original_start_datetime": orig_iso, "pre_call_done": True}
-        v.save(update_fields=["extra"])
+        v.extra = {"original_start_datetime": orig_iso}
+        v.pre_call_done = True
+        v.save(update_fields=["extra", "pre_call_done"])
 
         client.force_login(owner)
         with patch("vacancy.services.observers.subscriber_setup.vacancy_publisher.notify"):
             client.get(reverse("vacancy:continue_search", kwargs={"pk": v.pk}))
 
         v.refresh_from_db()
-        assert v.extra.get("pre_call_done") is True
+        assert v.pre_call_done is True
         assert v.extra.get("original_start_datetime") == orig_iso
 
     def test_no_repeat_send_after_continue_search_full_flow(self, client, employer_factory, vacancy_factory):
@@ -109,8 +111,9 @@ class TestBeforeStartNoRepeatAfterContinueSearch:
         orig_iso = timezone.make_aware(
             datetime.combine(v.date, v.start_time), timezone.get_current_timezone()
         ).isoformat()
-        v.extra = {"original_start_datetime": orig_iso, "pre_call_done": True}
-        v.save(update_fields=["extra"])
+        v.extra = {"original_start_datetime": orig_iso}
+        v.pre_call_done = True
+        v.save(update_fields=["extra", "pre_call_done"])
 
         client.force_login(owner)
         with patch("vacancy.services.observers.subscriber_setup.vacancy_publisher.notify"):
@@ -155,7 +158,7 @@ class TestBeforeStartNoRepeatAfterContinueSearch:
             observer.check_before_start(v)
 
         v.refresh_from_db()
-        assert v.extra.get("pre_call_done") is True
+        assert v.pre_call_done is True
 
     def test_check_before_start_skips_when_pre_call_done(self, employer_factory, vacancy_factory, worker_factory):
         """check_before_start must early-return when pre_call_done is True."""
@@ -173,8 +176,8 @@ class TestBeforeStartNoRepeatAfterContinueSearch:
             start_time=future.time().replace(second=0, microsecond=0),
             end_time=(future + timedelta(hours=4)).time().replace(second=0, microsecond=0),
         )
-        v.extra = {"pre_call_done": True}
-        v.save(update_fields=["extra"])
+        v.pre_call_done = True
+        v.save(update_fields=["extra", "pre_call_done"])
 
         worker = worker_factory()
         VacancyUser.objects.create(vacancy=v, user=worker, status=Status.MEMBER.value)
@@ -202,8 +205,9 @@ class TestBeforeStartNoRepeatAfterContinueSearch:
         old_iso = timezone.make_aware(
             datetime.combine(v.date, v.start_time), timezone.get_current_timezone()
         ).isoformat()
-        v.extra = {"original_start_datetime": old_iso, "pre_call_done": True}
-        v.save(update_fields=["extra"])
+        v.extra = {"original_start_datetime": old_iso}
+        v.pre_call_done = True
+        v.save(update_fields=["extra", "pre_call_done"])
 
         # Simulate that resume_search changed start_time to a new value
         new_start = (now + timedelta(hours=5)).time().replace(second=0, microsecond=0)
@@ -213,7 +217,7 @@ class TestBeforeStartNoRepeatAfterContinueSearch:
         reset_before_start_cycle(v)
         v.refresh_from_db()
 
-        assert "pre_call_done" not in v.extra
+        assert v.pre_call_done is False
         new_iso = timezone.make_aware(
             datetime.combine(v.date, v.start_time), timezone.get_current_timezone()
         ).isoformat()
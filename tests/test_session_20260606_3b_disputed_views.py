@@ -41,9 +41,8 @@ def _setup_active_rollcall(vacancy_factory, employer_factory, worker_factory, gr
         end_time=in_one_hour.replace(microsecond=0),
     )
     # Mark sent_final_call so AFTER_START is the expected call type
-    vacancy.extra = dict(vacancy.extra or {})
-    vacancy.extra["sent_final_call"] = True
-    vacancy.save(update_fields=["extra"])
+    vacancy.sent_final_call = True
+    vacancy.save(update_fields=["sent_final_call"])
 
     workers = []
     for _ in range(n):
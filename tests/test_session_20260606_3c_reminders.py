@@ -12,7 +12,6 @@ from telegram.choices import Status
 from vacancy.choices import STATUS_SEARCH_STOPPED
 from vacancy.models import VacancyUser
 from vacancy.services.disputed_rollcall import (
-    DISPUTED_KEY,
     get_disputed,
     mark_disputed,
 )
@@ -83,8 +82,8 @@ def test_no_reminder_within_5_minutes(vacancy_factory, employer_factory, worker_
     state = get_disputed(vacancy)
     state["reminders_count"] = 1
     state["last_reminder_at"] = (timezone.now() - _dt.timedelta(minutes=2)).isoformat()
-    vacancy.extra[DISPUTED_KEY] = state
-    vacancy.save(update_fields=["extra"])
+    vacancy.disputed_rollcall = state
+    vacancy.save(update_fields=["disputed_rollcall"])
 
     disputed_rollcall_reminders_task()
     _stub_bot.send_message.assert_not_called()
@@ -99,8 +98,8 @@ def test_reminder_sent_after_5_minutes(vacancy_factory, employer_factory, worker
     state = get_disputed(vacancy)
     state["reminders_count"] = 1
     state["last_reminder_at"] = (timezone.now() - _dt.timedelta(minutes=6)).isoformat()
-    vacancy.extra[DISPUTED_KEY] = state
-    vacancy.save(update_fields=["extra"])
+    vacancy.disputed_rollcall = state
+    vacancy.save(update_fields=["disputed_rollcall"])
 
     disputed_rollcall_reminders_task()
     _stub_bot.send_message.assert_called_once()
@@ -115,8 +114,8 @@ def test_stop_after_12_reminders(vacancy_factory, employer_factory, worker_facto
     state = get_disputed(vacancy)
     state["reminders_count"] = 12
     state["last_reminder_at"] = (timezone.now() - _dt.timedelta(hours=1)).isoformat()
-    vacancy.extra[DISPUTED_KEY] = state
-    vacancy.save(update_fields=["extra"])
+    vacancy.disputed_rollcall = state
+    vacancy.save(update_fields=["disputed_rollcall"])
 
     disputed_rollcall_reminders_task()
     _stub_bot.send_message.assert_not_called()
@@ -10,7 +10,6 @@ from telegram.choices import CallStatus, CallType, Status
 from vacancy.choices import STATUS_SEARCH_STOPPED
 from vacancy.models import VacancyUser, VacancyUserCall
 from vacancy.services.disputed_rollcall import (
-    DISPUTED_KEY,
     is_disputed,
     mark_disputed,
 )
@@ -72,7 +71,7 @@ def _stub_finalize_side_effects(monkeypatch):
     """Stub invoice/ban/unblock so tests stay isolated."""
     monkeypatch.setattr("vacancy.services.invoice.send_vacancy_invoice", lambda **kw: None)
     monkeypatch.setattr(
-        "user.services.BlockService.auto_block_rollcall_reject",
+        "user.services.BlockService.auto_block_rollcall_reject_many",
         staticmethod(lambda *a, **kw: None),
     )
     monkeypatch.setattr(
@@ -191,10 +190,10 @@ def test_buttons_disabled_alerts_admin(vacancy_factory, employer_factory, worker
         selected_count=1,
         n=2,
     )
-    state = vacancy.extra[DISPUTED_KEY]
+    state = vacancy.disputed_rollcall
     state["admin_buttons_disabled"] = True
-    vacancy.extra[DISPUTED_KEY] = state
-    vacancy.save(update_fields=["extra"])
+    vacancy.disputed_rollcall = state
+    vacancy.save(update_fields=["disputed_rollcall"])
 
     from telegram.handlers.callback.disputed_rollcall import handle_disputed_action
 
@@ -36,9 +36,8 @@ def _setup_with_disputed(
         start_time=one_hour_ago,
         end_time=in_one_hour,
     )
-    vacancy.extra = dict(vacancy.extra or {})
-    vacancy.extra["sent_final_call"] = True
-    vacancy.save(update_fields=["extra"])
+    vacancy.sent_final_call = True
+    vacancy.save(update_fields=["sent_final_call"])
 
     workers = []
     for _ in range(n):
@@ -70,7 +69,7 @@ def _stub_bot_and_side_effects(monkeypatch):
     monkeypatch.setattr("telegram.service.group.GroupService.kick_user", staticmethod(lambda **kw: None))
     monkeypatch.setattr("vacancy.services.invoice.send_vacancy_invoice", lambda **kw: None)
     monkeypatch.setattr(
-        "user.services.BlockService.auto_block_rollcall_reject",
+        "user.services.BlockService.auto_block_rollcall_reject_many",
         staticmethod(lambda *a, **kw: None),
     )
     monkeypatch.setattr(
@@ -74,7 +74,7 @@ def admin_factory(db, employer_factory):
 def _stub_side_effects(monkeypatch):
     monkeypatch.setattr("vacancy.services.invoice.send_vacancy_invoice", lambda **kw: None)
     monkeypatch.setattr(
-        "user.services.BlockService.auto_block_rollcall_reject",
+        "user.services.BlockService.auto_block_rollcall_reject_many",
         staticmethod(lambda *a, **kw: None),
     )
     monkeypatch.setattr(
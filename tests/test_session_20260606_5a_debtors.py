@@ -44,7 +44,7 @@ def test_debtors_list_shows_unpaid_vacancies(
         owner=employer,
         status=STATUS_PAID,
         group=group_factory(),
-        extra={"is_paid": True},
+        is_paid=True,
     )
 
     admin = admin_factory()
@@ -78,7 +78,7 @@ def test_admin_mark_paid_marks_and_unblocks(
     assert resp.status_code in (200, 302)
 
     vacancy.refresh_from_db()
-    assert vacancy.extra.get("is_paid") is True
+    assert vacancy.is_paid is True
     assert vacancy.status == STATUS_PAID
     # UNPAID block lifted
     assert not UserBlock.objects.filter(user=employer, reason=BlockReason.UNPAID, is_active=True).exists()
@@ -94,7 +94,7 @@ def test_admin_mark_paid_idempotent(client, vacancy_factory, employer_factory, g
         owner=employer,
         status=STATUS_PAID,
         group=group_factory(),
-        extra={"is_paid": True},
+        is_paid=True,
     )
 
     admin = admin_factory()
@@ -118,7 +118,7 @@ def test_admin_mark_paid_get_redirects(client, vacancy_factory, employer_factory
     resp = client.get(reverse("work:admin_mark_paid", kwargs={"vacancy_id": vacancy.pk}))
     assert resp.status_code in (302, 405)
     vacancy.refresh_from_db()
-    assert not vacancy.extra.get("is_paid")
+    assert not vacancy.is_paid
 
 
 @pytest.mark.django_db
@@ -138,7 +138,7 @@ def test_management_command_marks_paid(vacancy_factory, employer_factory, group_
     out = StringIO()
     call_command("mark_vacancy_paid", str(vacancy.pk), stdout=out)
     vacancy.refresh_from_db()
-    assert vacancy.extra.get("is_paid") is True
+    assert vacancy.is_paid is True
     assert vacancy.status == STATUS_PAID
     assert not UserBlock.objects.filter(user=employer, reason=BlockReason.UNPAID, is_active=True).exists()
 
@@ -160,5 +160,5 @@ def test_management_command_keep_block(vacancy_factory, employer_factory, group_
     out = StringIO()
     call_command("mark_vacancy_paid", str(vacancy.pk), "--keep-block", stdout=out)
     vacancy.refresh_from_db()
-    assert vacancy.extra.get("is_paid") is True
+    assert vacancy.is_paid is True
     assert UserBlock.objects.filter(user=employer, reason=BlockReason.UNPAID, is_active=True).exists()
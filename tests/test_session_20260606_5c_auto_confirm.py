@@ -48,7 +48,7 @@ def _vacancy_ignored(vacancy_factory, employer_factory, worker_factory, group_fa
 def _stub_side_effects(monkeypatch):
     monkeypatch.setattr("vacancy.services.invoice.send_vacancy_invoice", lambda **kw: None)
     monkeypatch.setattr(
-        "user.services.BlockService.auto_block_rollcall_reject",
+        "user.services.BlockService.auto_block_rollcall_reject_many",
         staticmethod(lambda *a, **kw: None),
     )
     monkeypatch.setattr(
@@ -98,7 +98,7 @@ def test_skips_paid_vacancy(vacancy_factory, employer_factory, group_factory, _s
         owner=employer,
         status=STATUS_AWAITING_PAYMENT,
         group=group_factory(),
-        extra={"is_paid": True},
+        is_paid=True,
     )
     send_unpaid_reminders_task()
     _stub_bot.send_message.assert_not_called()
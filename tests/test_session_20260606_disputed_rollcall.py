@@ -8,7 +8,6 @@ from telegram.choices import CallStatus, CallType, Status
 from vacancy.choices import STATUS_AWAITING_PAYMENT, STATUS_SEARCH_STOPPED
 from vacancy.models import VacancyUser, VacancyUserCall
 from vacancy.services.disputed_rollcall import (
-    DISPUTED_KEY,
     clear_disputed,
     disable_admin_buttons,
     finalize_rollcall,
@@ -109,7 +108,7 @@ def test_clear_disputed(vacancy_factory, worker_factory):
     clear_disputed(vacancy)
     vacancy.refresh_from_db()
     assert not is_disputed(vacancy)
-    assert DISPUTED_KEY not in vacancy.extra
+    assert vacancy.disputed_rollcall is None
 
 
 @pytest.mark.django_db
@@ -130,18 +129,16 @@ def test_finalize_rollcall_confirms_and_rejects(vacancy_factory, worker_factory,
     def _stub_invoice(*args, **kwargs):
         called["invoice"] += 1
 
-    def _stub_ban(*args, **kwargs):
-        called["ban"] += 1
-        from user.models import UserBlock
-
-        return UserBlock(pk=0)
+    def _stub_ban(user_ids, **kwargs):
+        called["ban"] += len(user_ids)
+        return list(user_ids)
 
     def _stub_unblock(*args, **kwargs):
         called["unblock"] += 1
 
     # Patch the real module path because finalize_rollcall does a local import
     monkeypatch.setattr("vacancy.services.invoice.send_vacancy_invoice", _stub_invoice)
-    monkeypatch.setattr("user.services.BlockService.auto_block_rollcall_reject", staticmethod(_stub_ban))
+    monkeypatch.setattr("user.services.BlockService.auto_block_rollcall_reject_many", staticmethod(_stub_ban))
     monkeypatch.setattr("user.services.BlockService.unblock_employer_rollcall_fail", staticmethod(_stub_unblock))
 
     confirmed = finalize_rollcall(vacancy, final_selected_user_ids=[workers[0].id], finalized_by="employer")
@@ -0,0 +1,130 @@
+"""Admin notification channel: cached staff ids and coalesced digests."""
+
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from service.admin_notifications import (
+    DIGEST_NEW_USER,
+    flush_admin_digest,
+    get_admin_ids,
+    notify_admins_digest,
+)
+
+
+@pytest.mark.django_db
+class TestAdminIdsCache:
+    def test_cached_until_staff_flag_changes(self, user_factory):
+        admin = user_factory(is_staff=True)
+        other = user_factory()
+        assert get_admin_ids() == [admin.id]
+
+        with CaptureQueriesContext(connection) as ctx:
+            get_admin_ids()
+        assert len(ctx.captured_queries) == 0
+
+        other.full_name = "Not staff yet"
+        other.save()
+        with CaptureQueriesContext(connection) as ctx:
+            get_admin_ids()
+        assert len(ctx.captured_queries) == 0
+
+        other.is_staff = True
+        other.save()
+        assert get_admin_ids() == [admin.id, other.id]
+
+        admin.delete()
+        assert get_admin_ids() == [other.id]
+
+
+@pytest.mark.django_db
+class TestDigest:
+    @pytest.fixture(autouse=True)
+    def _digest(self, settings):
+        settings.ADMIN_DIGEST_ENABLED = True
+
+    def test_burst_becomes_one_message_per_admin(self, user_factory):
+        user_factory(is_staff=True)
+        with (
+            patch("telegram.tasks.flush_admin_digest_task.apply_async") as schedule,
+            patch("service.admin_notifications.notify_admins") as notify,
+        ):
+            for i in range(20):
+                notify_admins_digest(DIGEST_NEW_USER, f"full {i}", f"user {i}")
+            notify.assert_not_called()
+            assert schedule.call_count == 1
+
+            assert flush_admin_digest(DIGEST_NEW_USER) == 20
+
+        notify.assert_called_once()
+        text = notify.call_args.args[0]
+        assert "Нові користувачі: 20" in text
+        assert "• user 0" in text and "• user 19" in text
+
+    def test_single_item_keeps_full_text_and_rearms(self, user_factory):
+        with (
+            patch("telegram.tasks.flush_admin_digest_task.apply_async") as schedule,
+            patch("service.admin_notifications.notify_admins") as notify,
+        ):
+            notify_admins_digest(DIGEST_NEW_USER, "full text", "summary")
+            flush_admin_digest(DIGEST_NEW_USER)
+            notify_admins_digest(DIGEST_NEW_USER, "next", "next summary")
+
+            assert flush_admin_digest(DIGEST_NEW_USER) == 1
+            assert flush_admin_digest(DIGEST_NEW_USER) == 0
+
+        assert [c.args[0] for c in notify.call_args_list] == ["full text", "next"]
+        assert schedule.call_count == 2
+
+    def test_flush_waits_for_an_item_not_written_yet(self):
+        from django.core.cache import cache
+
+        def numbered_but_unwritten():
+            # A producer that took its number and has not stored the item yet.
+            return cache.incr("admin_digest:new_user:counter")
+
+        with (
+            patch("telegram.tasks.flush_admin_digest_task.apply_async") as schedule,
+            patch("service.admin_notifications.notify_admins") as notify,
+        ):
+            notify_admins_digest(DIGEST_NEW_USER, "first", "first")
+            late = numbered_but_unwritten()
+            notify_admins_digest(DIGEST_NEW_USER, "third", "third")
+
+            assert flush_admin_digest(DIGEST_NEW_USER) == 1
+            assert schedule.call_count == 2  # re-armed for the rest
+
+            cache.set(f"admin_digest:new_user:{late}", {"text": "second", "summary": "second"})
+            assert flush_admin_digest(DIGEST_NEW_USER) == 2
+
+        assert notify.call_args_list[0].args[0] == "first"
+        assert "• second\n• third" in notify.call_args_list[1].args[0]
+
+    def test_item_of_a_dead_producer_is_skipped_one_flush_later(self):
+        from django.core.cache import cache
+
+        with (
+            patch("telegram.tasks.flush_admin_digest_task.apply_async"),
+            patch("service.admin_notifications.notify_admins") as notify,
+        ):
+            cache.add("admin_digest:new_user:counter", 0, None)
+            cache.incr("admin_digest:new_user:counter")
+            notify_admins_digest(DIGEST_NEW_USER, "after", "after")
+
+            assert flush_admin_digest(DIGEST_NEW_USER) == 0
+            assert flush_admin_digest(DIGEST_NEW_USER) == 1
+            assert flush_admin_digest(DIGEST_NEW_USER) == 0
+
+        notify.assert_called_once_with("after")
+
+    def test_new_user_registration_does_not_send_inline(self, user_factory):
+        from telegram.handlers.bot_instance import bot
+        from telegram.utils import notify_admins_new_user
+
+        user_factory(is_staff=True)
+        with patch("telegram.tasks.flush_admin_digest_task.apply_async"):
+            notify_admins_new_user(user_factory(full_name="Новий"))
+
+        bot.send_message.assert_not_called()
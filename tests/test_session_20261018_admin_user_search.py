@@ -0,0 +1,93 @@
+"""Admin user search: normalized columns, phone digits, ranking, active block from one query."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from user.choices import BlockType
+from user.models import User
+from user.search import search_users
+from user.services import BlockService
+
+
+def _search(query):
+    return list(search_users(User.objects.all(), query).order_by("search_rank", "-date_joined"))
+
+
+@pytest.mark.django_db
+class TestSearchColumns:
+    def test_save_keeps_columns_current(self, user_factory):
+        user = user_factory(full_name="Олена  Коваль", phone_number="+38 (067) 123-45-67")
+        assert user.search_text.startswith("олена коваль")
+        assert user.phone_digits == "380671234567"
+
+        user.full_name = "Олена Шевченко"
+        user.save(update_fields=["full_name"])
+
+        user.refresh_from_db()
+        assert user.search_text.startswith("олена шевченко")
+
+    def test_phone_matches_however_typed(self, user_factory):
+        user = user_factory(phone_number="+380671234567")
+        user_factory(phone_number="+380501112233")
+
+        assert _search("067 123 45") == [user]
+
+    def test_short_phone_fragment_still_matches(self, user_factory):
+        user = user_factory(full_name="Олег", phone_number="+380671234567")
+        user_factory(full_name="Ігор", phone_number="+380501112233")
+
+        assert _search("67") == [user]
+        assert _search("+(67)") == [user]
+        assert _search("олег 5") == []
+
+    def test_words_and_case_are_ignored(self, user_factory):
+        user = user_factory(full_name="Іван Петренко")
+        user_factory(full_name="Іван Сидоренко")
+
+        assert _search("петренко ІВАН") == [user]
+
+    def test_exact_id_then_word_start_first(self, user_factory):
+        inner = user_factory(full_name="Маріанна")
+        prefix = user_factory(full_name="Анна")
+        by_id = user_factory(full_name="Хтось")
+
+        assert _search("анна") == [prefix, inner]
+        assert _search(str(by_id.pk))[0] == by_id
+
+
+@pytest.mark.django_db
+class TestAdminSearchView:
+    def _count_queries(self, client, query):
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(reverse("work:admin_search_users"), {"q": query})
+        assert response.status_code == 200
+        return response, len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_results(self, client, user_factory, worker_factory):
+        client.force_login(user_factory(is_staff=True))
+        for i in range(2):
+            BlockService.block_user(worker_factory(full_name=f"Мало {i}"), BlockType.TEMPORARY)
+        for i in range(8):
+            BlockService.block_user(worker_factory(full_name=f"Багато {i}"), BlockType.PERMANENT)
+
+        few, few_queries = self._count_queries(client, "мало")
+        many, many_queries = self._count_queries(client, "багато")
+
+        assert len(few.context["users"]) == 2
+        assert len(many.context["users"]) == 8
+        assert {u.active_block_type for u in many.context["users"]} == {BlockType.PERMANENT}
+        assert many_queries == few_queries
+
+    def test_blocked_filter_uses_active_block(self, client, user_factory, worker_factory):
+        client.force_login(user_factory(is_staff=True))
+        blocked = worker_factory(full_name="Степан")
+        worker_factory(full_name="Степан")
+        block = BlockService.block_user(blocked, BlockType.TEMPORARY)
+        BlockService.unblock_user(block.pk)
+        BlockService.block_user(blocked, BlockType.PERMANENT)
+
+        response = client.get(reverse("work:admin_search_users"), {"q": "степан", "blocked": "1"})
+
+        assert [u.pk for u in response.context["users"]] == [blocked.pk]
@@ -0,0 +1,72 @@
+"""Wall-time benchmarks for hot views, the join-request handler and bulk tasks.
+
+Opt-in: `pytest --run-benchmarks tests/test_session_20261018_benchmarks.py`.
+Each benchmark seeds thousands of rows, takes the median of several warm runs
+and compares it with tests/benchmarks.json; add --update-baselines to record
+new values after an intended change (or on a new machine).
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+
+from tests.perf import check_baseline, measure, seed_world
+from tests.test_blocking_regression import _make_join_request
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow, pytest.mark.django_db]
+
+
+@pytest.fixture
+def world():
+    return seed_world(
+        employers=200, workers=3000, vacancies=2000, members_per_vacancy=4, feedback=5000, messages=3000, hot_members=20
+    )
+
+
+@pytest.fixture
+def wall_time(update_baselines):
+    def run(name, func, **kwargs):
+        reason = check_baseline(name, measure(func, **kwargs), update=update_baselines)
+        if reason:
+            pytest.fail(f"wall-time regression: {reason}")
+
+    return run
+
+
+def test_vacancy_owner_pages(client, world, wall_time):
+    vacancy = world.hot_vacancy
+    client.force_login(world.owner)
+
+    wall_time("vacancy_detail", lambda: client.get(reverse("vacancy:detail", args=[vacancy.pk])))
+    wall_time("vacancy_members_json", lambda: client.get(f"/vacancy/{vacancy.pk}/members-json/"))
+    wall_time("index_employer", lambda: client.get("/"))
+
+
+def test_worker_dashboard(client, world, wall_time):
+    client.force_login(world.members[0])
+
+    wall_time("index_worker", lambda: client.get("/"))
+
+
+def test_admin_search_users(client, world, user_factory, wall_time):
+    client.force_login(user_factory(is_staff=True, phone_number="+380670000002"))
+
+    wall_time("admin_search_users", lambda: client.get(reverse("work:admin_search_users"), {"q": "петренко"}))
+    wall_time("admin_search_users_phone", lambda: client.get(reverse("work:admin_search_users"), {"q": "067 00"}))
+
+
+def test_auto_approve(world, wall_time):
+    from telegram.handlers.bot_instance import bot
+    from telegram.handlers.member.user.group import auto_approve
+
+    request = _make_join_request(world.workers[-1].id, world.hot_vacancy.group_id)
+    with patch.object(bot, "approve_chat_join_request"):
+        wall_time("auto_approve", lambda: auto_approve(request))
+
+
+def test_bulk_tasks(world, wall_time):
+    from user.tasks import cleanup_inactive_users_task, recount_rating_stats_task
+
+    wall_time("cleanup_inactive_users_task", cleanup_inactive_users_task)
+    wall_time("recount_rating_stats_task", recount_rating_stats_task)
@@ -0,0 +1,80 @@
+"""BlockService status cache: one query to fill, invalidation, expiry at blocked_until."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from user.choices import BlockReason, BlockType
+from user.models import UserBlock
+from user.services import BlockService
+
+
+@pytest.mark.django_db
+class TestBlockStatusCache:
+    def test_checks_share_one_query_then_hit_cache(self, worker_factory):
+        user = worker_factory()
+        BlockService.block_user(user, BlockType.TEMPORARY, reason=BlockReason.ROLLCALL_REJECT)
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert BlockService.is_permanently_blocked(user) is False
+            assert BlockService.is_temporarily_blocked(user) is True
+            assert BlockService.is_blocked(user) is True
+
+        assert len(ctx.captured_queries) == 1
+        with CaptureQueriesContext(connection) as ctx:
+            BlockService.is_blocked(user)
+        assert len(ctx.captured_queries) == 0
+
+    def test_block_and_unblock_invalidate(self, worker_factory):
+        user = worker_factory()
+        assert BlockService.is_blocked(user) is False
+
+        block = BlockService.block_user(user, BlockType.PERMANENT)
+        assert BlockService.is_permanently_blocked(user) is True
+
+        BlockService.unblock_user(block.pk)
+        assert BlockService.is_blocked(user) is False
+
+    def test_unblock_all_invalidates(self, worker_factory):
+        user = worker_factory()
+        BlockService.block_user(user, BlockType.TEMPORARY)
+        assert BlockService.is_blocked(user) is True
+
+        BlockService.unblock_user_all(user)
+
+        assert BlockService.is_blocked(user) is False
+
+    def test_status_record_is_compact(self, worker_factory):
+        user = worker_factory()
+        until = timezone.now() + timedelta(days=2)
+        UserBlock.objects.create(user=user, block_type=BlockType.TEMPORARY, reason=BlockReason.UNPAID)
+        UserBlock.objects.create(
+            user=user, block_type=BlockType.TEMPORARY, reason=BlockReason.MANUAL, blocked_until=until
+        )
+
+        status = BlockService.get_status(user)
+
+        assert status.temporary and not status.permanent
+        assert status.reason == BlockReason.MANUAL
+        assert status.blocked_until is None  # the UNPAID block has no end
+
+    def test_temporary_block_expires_at_blocked_until(self, worker_factory):
+        user = worker_factory()
+        until = timezone.now() + timedelta(hours=1)
+        BlockService.block_user(user, BlockType.TEMPORARY, blocked_until=until)
+        assert BlockService.is_blocked(user) is True
+
+        with patch("user.services.timezone.now", return_value=until + timedelta(seconds=1)):
+            assert BlockService.is_blocked(user) is False
+
+    def test_expired_block_is_not_loaded(self, worker_factory):
+        user = worker_factory()
+        UserBlock.objects.create(
+            user=user, block_type=BlockType.TEMPORARY, blocked_until=timezone.now() - timedelta(minutes=1)
+        )
+
+        assert BlockService.is_temporarily_blocked(user) is False
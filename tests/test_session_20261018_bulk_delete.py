@@ -0,0 +1,66 @@
+"""Bulk message deletion through deleteMessages."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from telegram.choices import MessageStatus
+from telegram.models import GroupMessage
+from telegram.service.message_delete import MessageDeleter, MessageDeleteService
+
+
+def _group_messages(group, count, vacancy=None, start=1):
+    return GroupMessage.objects.bulk_create(
+        [GroupMessage(group=group, content_type="text", message_id=start + i, vacancy=vacancy) for i in range(count)]
+    )
+
+
+@pytest.mark.django_db
+class TestBulkDelete:
+    def test_messages_are_chunked_per_chat(self, group_factory):
+        big, small = group_factory(), group_factory()
+        _group_messages(big, 250)
+        _group_messages(small, 3)
+        bot = MagicMock()
+
+        with CaptureQueriesContext(connection) as ctx:
+            stats = MessageDeleteService(MessageDeleter(bot)).delete_messages(GroupMessage.objects.all())
+
+        assert stats == {"total": 253, "deleted": 253, "failed": 0}
+        sizes = sorted((c.kwargs["chat_id"], len(c.kwargs["message_ids"])) for c in bot.delete_messages.call_args_list)
+        assert sizes == sorted([(big.id, 100), (big.id, 100), (big.id, 50), (small.id, 3)])
+        assert len(ctx.captured_queries) == 2  # one SELECT, one UPDATE
+        assert not GroupMessage.objects.exclude(status=MessageStatus.DELETED).exists()
+
+    def test_failed_batch_marks_its_rows_only(self, group_factory):
+        ok_group, broken_group = group_factory(), group_factory()
+        _group_messages(ok_group, 2)
+        _group_messages(broken_group, 2, start=10)
+
+        def delete_messages(chat_id, message_ids):
+            if chat_id == broken_group.id:
+                raise RuntimeError("not enough rights")
+            return True
+
+        bot = MagicMock()
+        bot.delete_messages.side_effect = delete_messages
+
+        stats = MessageDeleteService(MessageDeleter(bot)).delete_messages(GroupMessage.objects.all())
+
+        assert stats == {"total": 4, "deleted": 2, "failed": 2}
+        failed = set(GroupMessage.objects.filter(status=MessageStatus.DELETE_FAILED).values_list("group_id", flat=True))
+        assert failed == {broken_group.id}
+
+    def test_group_by_vacancy_skips_already_deleted(self, group_factory, vacancy_factory):
+        group = group_factory()
+        vacancy = vacancy_factory()
+        rows = _group_messages(group, 3, vacancy=vacancy)
+        GroupMessage.objects.filter(pk=rows[0].pk).update(status=MessageStatus.DELETED)
+        bot = MagicMock()
+
+        stats = MessageDeleteService(MessageDeleter(bot)).delete_in_group_by_vacancy(vacancy)
+
+        assert stats["total"] == 2
+        assert bot.delete_messages.call_args.kwargs["message_ids"] == [2, 3]
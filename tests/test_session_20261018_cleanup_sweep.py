@@ -0,0 +1,103 @@
+"""Set-based inactive-user cleanup and the resumable deleted-account probe sweep."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from telebot.apihelper import ApiTelegramException
+
+from user.models import User, UserFeedback, UserRatingStats
+from user.rating import recount_rating_stats
+from user.tasks import delete_users, inactive_user_ids, probe_telegram_accounts
+from vacancy.models import VacancyUser
+from work.service.dashboard import DASHBOARD_CACHE_KEY
+
+
+def _age(user, days):
+    User.objects.filter(id=user.id).update(date_joined=timezone.now() - timedelta(days=days))
+
+
+@pytest.mark.django_db
+class TestInactiveUserIds:
+    def test_one_query_covers_both_roles(self, worker_factory, employer_factory, vacancy_factory):
+        idle_worker, busy_worker = worker_factory(), worker_factory()
+        idle_employer, busy_employer = employer_factory(), employer_factory()
+        for user in (idle_worker, busy_worker, idle_employer, busy_employer):
+            _age(user, 200)
+        VacancyUser.objects.create(user=busy_worker, vacancy=vacancy_factory(owner=busy_employer))
+        vacancy_factory(owner=idle_employer, date=timezone.localdate() - timedelta(days=190))
+
+        with CaptureQueriesContext(connection) as ctx:
+            ids = inactive_user_ids(timezone.now() - timedelta(days=180))
+
+        assert len(ctx.captured_queries) == 1
+        assert set(ids) == {idle_worker.id, idle_employer.id}
+
+
+@pytest.mark.django_db
+class TestProbeSweep:
+    def _probe(self, **kwargs):
+        return probe_telegram_accounts(sleep=lambda seconds: None, **kwargs)
+
+    def test_stamps_checked_accounts_and_deletes_gone_ones(self, worker_factory):
+        alive, gone = worker_factory(), worker_factory()
+
+        with patch("user.tasks.check_telegram_deleted", side_effect=lambda tg_id: tg_id == gone.telegram_id):
+            result = self._probe()
+
+        assert result == {"deleted": 1, "rate_limited": False}
+        assert not User.objects.filter(id=gone.id).exists()
+        alive.refresh_from_db()
+        assert alive.telegram_checked_at is not None
+
+    def test_resumes_from_unchecked_accounts(self, worker_factory):
+        first, second = worker_factory(), worker_factory()
+
+        with patch("user.tasks.check_telegram_deleted", return_value=False) as check:
+            self._probe(limit=1)
+            self._probe(limit=1)
+            self._probe(limit=1)
+
+        assert [c.args[0] for c in check.call_args_list] == [first.telegram_id, second.telegram_id]
+
+    def test_recheck_after_interval(self, worker_factory):
+        user = worker_factory()
+        User.objects.filter(id=user.id).update(telegram_checked_at=timezone.now() - timedelta(days=8))
+
+        with patch("user.tasks.check_telegram_deleted", return_value=False) as check:
+            self._probe()
+
+        check.assert_called_once_with(user.telegram_id)
+
+    def test_flood_control_stops_without_deleting(self, worker_factory):
+        first, second = worker_factory(), worker_factory()
+        flood = ApiTelegramException("getChat", None, {"error_code": 429, "description": "Too Many Requests"})
+
+        with patch("user.tasks.check_telegram_deleted", side_effect=[False, flood]):
+            result = self._probe()
+
+        assert result == {"deleted": 0, "rate_limited": True}
+        assert User.objects.filter(id__in=[first.id, second.id]).count() == 2
+        second.refresh_from_db()
+        assert second.telegram_checked_at is None
+
+
+@pytest.mark.django_db
+class TestDeleteUsers:
+    def test_recounts_and_invalidates_surviving_recipients(self, worker_factory, employer_factory):
+        reviewer, survivor = employer_factory(), worker_factory()
+        UserFeedback.objects.create(owner=reviewer, user=survivor, rating="like")
+        recount_rating_stats([survivor.id])
+        key = DASHBOARD_CACHE_KEY.format(user_id=survivor.id)
+        cache.set(key, {"stale": True})
+
+        assert delete_users([reviewer.id]) == 1
+
+        assert not UserFeedback.objects.filter(user=survivor).exists()
+        stats = UserRatingStats.objects.filter(user=survivor).values_list("likes", "dislikes").first()
+        assert (stats or (0, 0)) == (0, 0)
+        assert cache.get(key) is None
@@ -0,0 +1,119 @@
+"""Dashboard summary service: aggregate queries, per-user cache, invalidation, API endpoint."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from telegram.choices import Status
+from telegram.models import UserInGroup
+from user.models import UserFeedback
+from vacancy.choices import STATUS_APPROVED, STATUS_CLOSED
+from vacancy.models import VacancyUser
+from work.service.dashboard import get_dashboard_summary
+
+
+def _worker_in_vacancy(worker_factory, vacancy_factory, group_factory):
+    worker = worker_factory()
+    group = group_factory()
+    vacancy = vacancy_factory(status=STATUS_APPROVED, group=group)
+    VacancyUser.objects.create(user=worker, vacancy=vacancy, status=Status.MEMBER)
+    UserInGroup.objects.create(user=worker, group=group, status=Status.MEMBER)
+    return worker, vacancy
+
+
+@pytest.mark.django_db
+class TestWorkerSummary:
+    def test_current_vacancy_and_cache_hit(self, worker_factory, vacancy_factory, group_factory):
+        worker, vacancy = _worker_in_vacancy(worker_factory, vacancy_factory, group_factory)
+
+        summary = get_dashboard_summary(worker)
+
+        assert summary["current_vacancy"] == {"id": vacancy.id, "address": vacancy.address}
+        assert summary["is_blocked"] is False
+        with CaptureQueriesContext(connection) as ctx:
+            assert get_dashboard_summary(worker) == summary
+        assert len(ctx.captured_queries) == 0
+
+    def test_not_in_group_means_no_current_vacancy(self, worker_factory, vacancy_factory, group_factory):
+        worker = worker_factory()
+        vacancy = vacancy_factory(status=STATUS_APPROVED, group=group_factory())
+        VacancyUser.objects.create(user=worker, vacancy=vacancy, status=Status.MEMBER)
+
+        assert get_dashboard_summary(worker)["current_vacancy"] is None
+
+    def test_feedback_invalidates(self, worker_factory, user_factory):
+        worker = worker_factory()
+        assert get_dashboard_summary(worker)["text_reviews_count"] == 0
+
+        UserFeedback.objects.create(owner=user_factory(), user=worker, rating="like", text="Добре")
+
+        summary = get_dashboard_summary(worker)
+        assert summary["text_reviews_count"] == 1
+        assert summary["likes"] == 1
+
+    def test_vacancy_status_change_invalidates_members(self, worker_factory, vacancy_factory, group_factory):
+        worker, vacancy = _worker_in_vacancy(worker_factory, vacancy_factory, group_factory)
+        assert get_dashboard_summary(worker)["current_vacancy"] is not None
+
+        vacancy.status = STATUS_CLOSED
+        vacancy.save(update_fields=["status"])
+
+        assert get_dashboard_summary(worker)["current_vacancy"] is None
+
+    def test_kick_via_queryset_update_invalidates(self, worker_factory, vacancy_factory, group_factory):
+        from unittest.mock import patch
+
+        from django.core.cache import cache
+
+        from telegram.service.group import GroupService
+        from work.service.dashboard import DASHBOARD_CACHE_KEY
+
+        worker, vacancy = _worker_in_vacancy(worker_factory, vacancy_factory, group_factory)
+        get_dashboard_summary(worker)
+
+        with patch("telegram.service.group.bot"):
+            GroupService.kick_user(chat_id=vacancy.group_id, user_id=worker.id)
+
+        assert cache.get(DASHBOARD_CACHE_KEY.format(user_id=worker.id)) is None
+
+    def test_block_is_never_stale(self, worker_factory):
+        from user.choices import BlockType
+        from user.services import BlockService
+
+        worker = worker_factory()
+        get_dashboard_summary(worker)
+
+        BlockService.block_user(worker, BlockType.TEMPORARY)
+
+        summary = get_dashboard_summary(worker)
+        assert summary["is_blocked"] is True
+        assert summary["active_block"]["block_type"] == BlockType.TEMPORARY
+
+
+@pytest.mark.django_db
+class TestEmployerSummary:
+    def test_counts_come_from_one_aggregate(self, employer_factory, vacancy_factory):
+        employer = employer_factory()
+        vacancy_factory(owner=employer, status=STATUS_APPROVED, sent_start_call=True)
+        vacancy_factory(owner=employer, status=STATUS_CLOSED)
+
+        summary = get_dashboard_summary(employer)
+
+        assert summary["vacancies_count"] == 2
+        assert summary["active_vacancies_count"] == 1
+        assert summary["has_pending_rollcall"] is True
+
+    def test_api_endpoint_returns_summary(self, employer_factory, vacancy_factory):
+        employer = employer_factory()
+        vacancy_factory(owner=employer, status=STATUS_APPROVED)
+        client = APIClient()
+        client.force_authenticate(employer)
+
+        response = client.get("/api/v1/users/me/dashboard/")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["role"] == "employer"
+        assert body["active_vacancies_count"] == 1
+        assert body["has_pending_rollcall"] is False
@@ -0,0 +1,135 @@
+"""Read-replica routing: @replica_reads views, read-your-writes, primary pin after a write."""
+
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from service.db_routing import DatabaseRoutingMiddleware, ReadReplicaRouter, primary_reads, replica_reads
+from user.models import User
+
+router = ReadReplicaRouter()
+
+
+def _serve(view, user=None):
+    request = RequestFactory().get("/")
+    request.user = user or AnonymousUser()
+    return DatabaseRoutingMiddleware(view)(request)
+
+
+@pytest.fixture
+def replica():
+    with patch("service.db_routing.replica_configured", return_value=True):
+        yield
+
+
+def _recording_view(seen, write=False):
+    @replica_reads
+    def view(request):
+        seen.append(router.db_for_read(User))
+        if write:
+            seen.append(router.db_for_write(User))
+            seen.append(router.db_for_read(User))
+        return HttpResponse()
+
+    return view
+
+
+class TestRouter:
+    def test_primary_outside_marked_views(self, replica):
+        assert router.db_for_read(User) == "default"
+
+        seen = []
+        _serve(lambda request: seen.append(router.db_for_read(User)) or HttpResponse())
+
+        assert seen == ["default"]
+
+    def test_marked_view_reads_replica_until_it_writes(self, replica):
+        seen = []
+
+        _serve(_recording_view(seen, write=True))
+
+        assert seen == ["replica", "default", "default"]
+
+    def test_no_replica_configured(self):
+        seen = []
+
+        _serve(_recording_view(seen))
+
+        assert seen == ["default"]
+
+    def test_primary_reads_block_inside_marked_view(self, replica):
+        seen = []
+
+        @replica_reads
+        def view(request):
+            with primary_reads():
+                seen.append(router.db_for_read(User))
+            seen.append(router.db_for_read(User))
+            return HttpResponse()
+
+        _serve(view)
+
+        assert seen == ["default", "replica"]
+
+    def test_only_primary_is_migrated(self):
+        assert router.allow_migrate("default", "user")
+        assert not router.allow_migrate("replica", "user")
+
+
+@pytest.mark.django_db
+class TestPrimaryPin:
+    def test_user_who_wrote_reads_primary_next_request(self, replica, user_factory):
+        user = user_factory()
+        seen = []
+
+        _serve(_recording_view(seen, write=True), user)
+        _serve(_recording_view(seen), user)
+        _serve(_recording_view(seen), user_factory())
+
+        assert seen == ["replica", "default", "default", "default", "replica"]
+
+
+@pytest.mark.django_db
+class TestSharedCachesFillFromPrimary:
+    def test_dashboard_summary_rebuilt_from_primary(self, replica, user_factory):
+        from work.service.dashboard import get_dashboard_summary
+
+        user = user_factory()
+        seen = []
+
+        def build(user):
+            seen.append(router.db_for_read(User))
+            return {}
+
+        @replica_reads
+        def view(request):
+            with patch("work.service.dashboard.build_dashboard_summary", side_effect=build):
+                get_dashboard_summary(request.user)
+            return HttpResponse()
+
+        _serve(view, user)
+
+        assert seen == ["default"]
+
+    def test_block_status_loaded_from_primary(self, replica, user_factory):
+        from user.services import BlockService
+
+        user = user_factory()
+        seen = []
+
+        def load(user_id):
+            seen.append(router.db_for_read(User))
+            return BlockService._status_from_rows([])
+
+        @replica_reads
+        def view(request):
+            with patch.object(BlockService, "_load_status", side_effect=load):
+                BlockService.get_status(request.user)
+            return HttpResponse()
+
+        _serve(view, user)
+
+        assert seen == ["default"]
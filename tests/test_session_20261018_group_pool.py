@@ -0,0 +1,124 @@
+"""Group pool: atomic allocation, verification of pooled groups, low-watermark alert."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from telebot.apihelper import ApiTelegramException
+
+from telegram.choices import STATUS_AVAILABLE, STATUS_PROCESS, STATUS_RECYCLING
+from telegram.models import Group, UserInGroup
+from telegram.service import group_pool
+from telegram.service.group import GroupService
+from tests.perf import assert_max_queries
+
+
+@pytest.fixture
+def alerts(settings):
+    settings.GROUP_POOL_LOW_WATERMARK = 0
+    with patch("service.admin_notifications.notify_admins") as notify:
+        yield notify
+
+
+@pytest.mark.django_db
+class TestAllocate:
+    def test_claims_distinct_groups_until_empty(self, group_factory, alerts):
+        first = group_factory()
+        second = group_factory()
+
+        claimed = [GroupService.allocate_group(), GroupService.allocate_group(), GroupService.allocate_group()]
+
+        assert {claimed[0].pk, claimed[1].pk} == {first.pk, second.pk}
+        assert claimed[2] is None
+        assert set(Group.objects.values_list("status", flat=True)) == {STATUS_PROCESS}
+
+    def test_only_ready_groups_are_handed_out(self, group_factory, user_factory, alerts):
+        group_factory(has_bot_administrator=False)
+        group_factory(status=STATUS_RECYCLING)
+        occupied = group_factory()
+        UserInGroup.objects.create(group=occupied, user=user_factory(), status="member")
+
+        assert GroupService.allocate_group() is None
+
+    def test_constant_query_count(self, group_factory, alerts):
+        for _ in range(20):
+            group_factory()
+
+        with assert_max_queries(5, "allocate"):
+            assert GroupService.allocate_group() is not None
+
+
+@pytest.mark.django_db
+class TestClaimRollsBack:
+    def test_failed_assignment_returns_group_to_pool(self, group_factory, vacancy_factory, alerts):
+        group = group_factory()
+        vacancy = vacancy_factory()
+
+        with patch.object(type(vacancy), "save", side_effect=RuntimeError("db down")):
+            with pytest.raises(RuntimeError):
+                GroupService.find_and_set_group(vacancy)
+
+        group.refresh_from_db()
+        assert group.status == STATUS_AVAILABLE
+        assert group_pool.ready_groups().filter(pk=group.pk).exists()
+
+    def test_failed_auto_approve_returns_group_to_pool(
+        self, group_factory, vacancy_factory, channel_factory, employer_factory, alerts
+    ):
+        from vacancy.services.auto_approve import try_auto_approve
+
+        group = group_factory()
+        vacancy = vacancy_factory(owner=employer_factory(), channel=channel_factory())
+        vacancy.owner.work_profile.auto_approve_vacancy = True
+
+        with patch.object(type(vacancy), "save", side_effect=RuntimeError("db down")):
+            with pytest.raises(RuntimeError):
+                try_auto_approve(vacancy)
+
+        group.refresh_from_db()
+        assert group.status == STATUS_AVAILABLE
+
+
+@pytest.mark.django_db
+class TestLowWatermark:
+    def test_alert_once_when_pool_runs_low(self, settings, group_factory, alerts, django_capture_on_commit_callbacks):
+        settings.GROUP_POOL_LOW_WATERMARK = 2
+        group_factory()
+        group_factory()
+
+        for _ in range(2):
+            with django_capture_on_commit_callbacks(execute=True):
+                GroupService.allocate_group()
+
+        alerts.assert_called_once()
+        assert "залишилось: 1" in alerts.call_args.args[0]
+
+
+@pytest.mark.django_db
+class TestVerify:
+    def test_group_without_bot_admin_leaves_pool(self, group_factory, alerts):
+        from telegram.handlers.bot_instance import bot
+
+        kept, lost, gone = group_factory(), group_factory(), group_factory()
+        members = {kept.id: MagicMock(status="administrator"), lost.id: MagicMock(status="member")}
+
+        def get_chat_member(chat_id, user_id):
+            if chat_id == gone.id:
+                raise ApiTelegramException("getChatMember", MagicMock(), {"error_code": 400, "description": ""})
+            return members[chat_id]
+
+        with patch.object(bot, "get_chat_member", side_effect=get_chat_member) as api:
+            assert group_pool.verify() == 1
+            assert group_pool.verify() == 1
+
+        assert api.call_count == 3
+        assert list(Group.objects.filter(has_bot_administrator=True).values_list("pk", flat=True)) == [kept.pk]
+
+    def test_telegram_unreachable_keeps_group(self, group_factory, alerts):
+        from telegram.handlers.bot_instance import bot
+
+        group = group_factory()
+
+        with patch.object(bot, "get_chat_member", side_effect=ConnectionError("down")):
+            assert group_pool.verify() == 1
+
+        assert Group.objects.get(pk=group.pk).status == STATUS_AVAILABLE
@@ -0,0 +1,175 @@
+"""Group recycling: batched deleteMessages from the GroupMessage log, resumable steps, pool re-entry."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.utils import timezone
+from telebot.apihelper import ApiTelegramException
+
+from telegram.choices import STATUS_AVAILABLE, STATUS_PROCESS, STATUS_RECYCLING, MessageStatus
+from telegram.models import Group, GroupMessage
+from telegram.service import group_recycling
+from telegram.service.group import GroupService
+
+
+@pytest.fixture
+def chat_api():
+    from telegram.handlers.bot_instance import bot
+
+    with (
+        patch.object(bot, "get_chat", return_value=MagicMock(pinned_message=None)),
+        patch.object(bot, "unpin_all_chat_messages"),
+        patch.object(bot, "get_chat_administrators", return_value=[]),
+        patch.object(bot, "set_chat_permissions"),
+        patch.object(bot, "get_chat_member_count", return_value=1),
+    ):
+        yield bot
+
+
+def _log(group, *message_ids, status=MessageStatus.RECEIVED):
+    GroupMessage.objects.bulk_create(
+        [GroupMessage(group=group, message_id=mid, content_type="text", status=status) for mid in message_ids]
+    )
+
+
+def _deleted(bot):
+    return [c.kwargs["message_ids"] for c in bot.delete_messages.call_args_list]
+
+
+@pytest.mark.django_db
+class TestRecycling:
+    def test_logged_ids_and_margin_in_batches(self, chat_api, group_factory):
+        group = group_factory(status=STATUS_PROCESS)
+        _log(group, *range(2, 251))
+
+        GroupService.reset_group(group)
+
+        batches = _deleted(chat_api)
+        assert [len(b) for b in batches] == [100, 100, 100, 49]
+        assert batches[0][0] == 2 and batches[-1][-1] == 250 + group_recycling.SWEEP_MARGIN
+        chat_api.delete_message.assert_not_called()
+        group.refresh_from_db()
+        assert (group.status, group.recycle_cursor, group.recycle_target) == (STATUS_AVAILABLE, 250, None)
+        assert not GroupMessage.objects.filter(group=group).exists()
+
+    def test_next_recycle_starts_at_the_cursor(self, chat_api, group_factory):
+        group = group_factory(status=STATUS_PROCESS, recycle_cursor=250)
+        _log(group, 260, 261)
+        _log(group, 255, status=MessageStatus.DELETED)
+
+        GroupService.reset_group(group)
+
+        ids = [mid for batch in _deleted(chat_api) for mid in batch]
+        assert ids[0] == 251 and ids[-1] == 261 + group_recycling.SWEEP_MARGIN
+        assert 255 not in ids and {260, 261} <= set(ids)
+        group.refresh_from_db()
+        assert group.recycle_cursor == 261
+
+    def test_group_without_history_gets_legacy_sweep(self, chat_api, group_factory):
+        group = group_factory(status=STATUS_PROCESS)
+
+        GroupService.reset_group(group)
+
+        ids = [mid for batch in _deleted(chat_api) for mid in batch]
+        assert ids == list(range(2, group_recycling.LEGACY_SWEEP_UPPER + group_recycling.SWEEP_MARGIN + 1))
+
+    def test_incoming_and_service_messages_are_logged(self, group_factory):
+        from telebot import types
+
+        from telegram.handlers.messages.group import handle_all_messages
+
+        group = group_factory()
+        chat = {"id": group.id, "type": "supergroup", "title": "g"}
+        sender = {"id": 555, "is_bot": False, "first_name": "U"}
+        handle_all_messages(
+            types.Message.de_json({"message_id": 7, "date": 0, "chat": chat, "from": sender, "text": "hi"})
+        )
+        handle_all_messages(
+            types.Message.de_json(
+                {"message_id": 8, "date": 0, "chat": chat, "from": sender, "new_chat_members": [sender]}
+            )
+        )
+
+        rows = dict(GroupMessage.objects.filter(group=group).values_list("message_id", "status"))
+        assert rows == {7: MessageStatus.RECEIVED, 8: MessageStatus.DELETED}
+
+    def test_bot_messages_are_logged(self, group_factory):
+        group = group_factory()
+
+        group_recycling.record_bot_message(group.id, MagicMock(message_id=42), vacancy_id=None)
+
+        assert GroupMessage.objects.get(group=group).message_id == 42
+
+
+@pytest.mark.django_db
+class TestBackgroundSteps:
+    @pytest.fixture
+    def queued(self, settings, monkeypatch):
+        settings.GROUP_RECYCLE_ASYNC = True
+        monkeypatch.setattr(group_recycling, "RECYCLE_BATCHES_PER_STEP", 1)
+        with patch("telegram.tasks.recycle_group_task.apply_async") as apply_async:
+            yield apply_async
+
+    def test_group_leaves_pool_until_last_step(self, chat_api, group_factory, queued):
+        group = group_factory(status=STATUS_PROCESS)
+        _log(group, *range(2, 152))
+
+        GroupService.reset_group(group)
+
+        assert queued.call_count == 1
+        assert Group.objects.get(pk=group.pk).status == STATUS_RECYCLING
+        assert GroupService.get_available_group() is None
+
+        assert group_recycling.recycle_step(group.pk) is False
+        assert Group.objects.get(pk=group.pk).recycle_cursor == 101
+        assert group_recycling.recycle_step(group.pk) is False
+        assert group_recycling.recycle_step(group.pk) is True
+
+        assert len(_deleted(chat_api)) == 3
+        assert GroupService.get_available_group().pk == group.pk
+
+    def test_rate_limit_reschedules_without_losing_progress(self, chat_api, group_factory, queued):
+        from telegram.tasks import recycle_group_task
+
+        group = group_factory(status=STATUS_RECYCLING, recycle_target=150)
+        error = ApiTelegramException(
+            "deleteMessages", MagicMock(), {"error_code": 429, "description": "", "parameters": {"retry_after": 7}}
+        )
+        chat_api.delete_messages.side_effect = error
+
+        assert recycle_group_task(group.pk) is False
+
+        queued.assert_called_once_with(args=[group.pk], countdown=7)
+        assert Group.objects.get(pk=group.pk).recycle_cursor == 1
+
+    def test_stalled_recycling_is_resumed(self, group_factory, queued):
+        stalled = group_factory(status=STATUS_RECYCLING, recycle_updated_at=timezone.now() - timedelta(minutes=30))
+        group_factory(status=STATUS_RECYCLING, recycle_updated_at=timezone.now())
+
+        assert group_recycling.resume_stalled() == 1
+        queued.assert_called_once_with(args=[stalled.pk], countdown=0)
+
+
+@pytest.mark.django_db
+class TestCloseObserver:
+    def test_release_keeps_recycling_group_out_of_pool(self, vacancy_factory, group_factory):
+        from vacancy.services.observers.vacancy_close import VacancyGroupFeeStatusObserver
+
+        group = group_factory(status=STATUS_PROCESS)
+        vacancy = vacancy_factory(group=group)
+        Group.objects.filter(pk=group.pk).update(status=STATUS_RECYCLING)
+
+        VacancyGroupFeeStatusObserver(notifier=None).update("close", {"vacancy": vacancy})
+
+        group.refresh_from_db()
+        assert group.status == STATUS_RECYCLING and group.last_used_at is not None
+        assert vacancy.group is None
+
+
+class TestGetMe:
+    def test_asked_once_per_process(self):
+        from telegram.handlers.bot_instance import bot, get_me
+
+        assert get_me().id == get_me().id
+        assert bot.get_me.call_count == 1
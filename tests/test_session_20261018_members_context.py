@@ -0,0 +1,115 @@
+"""Members section: constant query count, prefetched rollcall calls, conditional members JSON."""
+
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from telegram.choices import CallStatus, CallType, Status
+from user.choices import BlockType
+from user.services import BlockService
+from vacancy.choices import STATUS_APPROVED
+from vacancy.models import VacancyUser, VacancyUserCall
+
+
+def _rollcall_vacancy(vacancy_factory, employer, members, worker_factory):
+    start = timezone.localtime() - timedelta(minutes=5)
+    vacancy = vacancy_factory(
+        owner=employer,
+        status=STATUS_APPROVED,
+        people_count=members,
+        date=start.date(),
+        start_time=start.time().replace(second=0, microsecond=0),
+        end_time=(start + timedelta(hours=4)).time().replace(second=0, microsecond=0),
+        sent_start_call=True,
+    )
+    users = [VacancyUser.objects.create(vacancy=vacancy, user=worker_factory()) for _ in range(members)]
+    return vacancy, users
+
+
+def _context_queries(vacancy, employer):
+    from vacancy.views import _build_members_context
+
+    request = RequestFactory().get("/")
+    request.user = employer
+    with CaptureQueriesContext(connection) as ctx:
+        mc = _build_members_context(vacancy, request)
+        str(mc["rollcall_form"]["users"])  # template renders the checkboxes
+    return mc, len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+class TestMembersContextQueries:
+    def test_query_count_does_not_grow_with_members(self, employer_factory, worker_factory, vacancy_factory):
+        employer = employer_factory()
+        small, _ = _rollcall_vacancy(vacancy_factory, employer, 2, worker_factory)
+        big, _ = _rollcall_vacancy(vacancy_factory, employer, 12, worker_factory)
+
+        _context_queries(small, employer)  # warm the rating/block caches
+        BlockService.get_statuses([vu.user_id for vu in big.users.all()])
+        _, small_queries = _context_queries(small, employer)
+        mc, big_queries = _context_queries(big, employer)
+
+        assert len(mc["members_list"]) == 12
+        assert big_queries == small_queries
+
+    def test_blocked_flag_and_confirmed_initial(self, employer_factory, worker_factory, vacancy_factory):
+        employer = employer_factory()
+        vacancy, (confirmed, other) = _rollcall_vacancy(vacancy_factory, employer, 2, worker_factory)
+        BlockService.block_user(other.user, BlockType.TEMPORARY)
+        VacancyUserCall.objects.create(vacancy_user=confirmed, call_type=CallType.START, status=CallStatus.CONFIRM)
+        VacancyUserCall.objects.create(vacancy_user=other, call_type=CallType.START, status=CallStatus.REJECT)
+
+        mc, _ = _context_queries(vacancy, employer)
+
+        flags = {item["user"].id: item["is_blocked"] for item in mc["members_list"]}
+        assert flags == {confirmed.user_id: False, other.user_id: True}
+        assert mc["rollcall_form"].initial["users"] == [confirmed]
+
+
+@pytest.mark.django_db
+class TestMembersJsonConditional:
+    def test_304_until_membership_changes(self, client, vacancy_factory, worker_factory):
+        vacancy = vacancy_factory(status=STATUS_APPROVED)
+        VacancyUser.objects.create(vacancy=vacancy, user=worker_factory())
+        url = f"/vacancy/{vacancy.pk}/members-json/"
+
+        first = client.get(url)
+        assert first.status_code == 200
+        assert first.json()["members_count"] == 1
+        etag = first["ETag"]
+        assert first["Last-Modified"]
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        VacancyUser.objects.create(vacancy=vacancy, user=worker_factory(), status=Status.MEMBER)
+        changed = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert changed.status_code == 200
+        assert changed.json()["members_count"] == 2
+
+    def test_status_change_changes_etag(self, client, vacancy_factory):
+        vacancy = vacancy_factory(status=STATUS_APPROVED)
+        url = f"/vacancy/{vacancy.pk}/members-json/"
+        etag = client.get(url)["ETag"]
+
+        vacancy.first_rollcall_passed = True
+        vacancy.save(update_fields=["first_rollcall_passed"])
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_member_rename_changes_etag(self, client, vacancy_factory, worker_factory):
+        vacancy = vacancy_factory(status=STATUS_APPROVED)
+        worker = worker_factory()
+        VacancyUser.objects.create(vacancy=vacancy, user=worker)
+        url = f"/vacancy/{vacancy.pk}/members-json/"
+        etag = client.get(url)["ETag"]
+
+        worker.full_name = "Renamed Worker"
+        worker.save(update_fields=["full_name"])
+
+        changed = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert changed.status_code == 200
+        assert changed.json()["members"][0]["name"] == "Renamed Worker"
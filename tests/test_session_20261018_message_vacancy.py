@@ -0,0 +1,80 @@
+"""ChannelMessage/GroupMessage ↔ Vacancy foreign key: backfill and lookups."""
+
+import importlib
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from django.apps import apps
+from django.utils import timezone
+
+from telegram.choices import MessageStatus
+from telegram.models import ChannelMessage, GroupMessage
+
+backfill = importlib.import_module("telegram.migrations.0023_backfill_message_vacancy")
+
+
+@pytest.mark.django_db
+class TestBackfill:
+    def test_links_rows_by_extra_and_skips_missing_vacancies(self, vacancy_factory, channel_factory, group_factory):
+        vacancy = vacancy_factory()
+        channel, group = channel_factory(), group_factory()
+        linked = ChannelMessage.objects.create(
+            channel=channel, content_type="text", message_id=1, extra={"vacancy_id": vacancy.id}
+        )
+        orphan = ChannelMessage.objects.create(
+            channel=channel, content_type="text", message_id=2, extra={"vacancy_id": vacancy.id + 1000}
+        )
+        plain = ChannelMessage.objects.create(channel=channel, content_type="text", message_id=3)
+        group_msg = GroupMessage.objects.create(
+            group=group, content_type="text", message_id=4, extra={"vacancy_id": vacancy.id}
+        )
+
+        backfill.backfill_message_vacancy(apps, None)
+
+        for row in (linked, orphan, plain, group_msg):
+            row.refresh_from_db()
+        assert linked.vacancy_id == vacancy.id
+        assert group_msg.vacancy_id == vacancy.id
+        assert orphan.vacancy_id is None
+        assert plain.vacancy_id is None
+
+
+@pytest.mark.django_db
+class TestLookups:
+    def test_last_channel_message_uses_fk(self, vacancy_factory, channel_factory):
+        vacancy = vacancy_factory()
+        channel = channel_factory()
+        older = ChannelMessage.objects.create(channel=channel, content_type="text", message_id=1, vacancy=vacancy)
+        ChannelMessage.objects.filter(pk=older.pk).update(created_at=timezone.now() - timedelta(minutes=5))
+        newer = ChannelMessage.objects.create(channel=channel, content_type="text", message_id=2, vacancy=vacancy)
+        ChannelMessage.objects.create(channel=channel, content_type="text", message_id=3, extra={"vacancy_id": 0})
+
+        assert vacancy.last_channel_message == newer
+
+    def test_delete_in_channel_by_vacancy(self, vacancy_factory, channel_factory):
+        from telegram.service.message_delete import MessageDeleter, MessageDeleteService
+
+        vacancy, other = vacancy_factory(), vacancy_factory()
+        channel = channel_factory()
+        mine = ChannelMessage.objects.create(channel=channel, content_type="text", message_id=1, vacancy=vacancy)
+        theirs = ChannelMessage.objects.create(channel=channel, content_type="text", message_id=2, vacancy=other)
+
+        stats = MessageDeleteService(MessageDeleter(MagicMock())).delete_in_channel_by_vacancy(vacancy)
+
+        mine.refresh_from_db()
+        theirs.refresh_from_db()
+        assert stats["deleted"] == 1
+        assert mine.status == MessageStatus.DELETED
+        assert theirs.status == MessageStatus.RECEIVED
+
+    def test_vacancy_delete_keeps_message_rows(self, vacancy_factory, channel_factory):
+        vacancy = vacancy_factory()
+        row = ChannelMessage.objects.create(
+            channel=channel_factory(), content_type="text", message_id=1, vacancy=vacancy
+        )
+
+        vacancy.delete()
+
+        row.refresh_from_db()
+        assert row.vacancy_id is None
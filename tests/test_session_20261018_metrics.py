@@ -0,0 +1,112 @@
+"""Metrics layer: buffered histograms, Prometheus export, task/Bot API/webhook instrumentation."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.db import connection
+
+from service import metrics
+from service.metrics import MetricsRegistry, get_histogram, observe, render_prometheus
+
+
+class TestHistograms:
+    def test_observations_are_buffered_until_flush(self):
+        clock = MagicMock(return_value=0.0)
+        registry = MetricsRegistry(clock=clock)
+
+        registry.observe("celery_task_duration_seconds", 0.02, task="t", outcome="ok")
+        flushed_by = []
+        flushed = threading.Event()
+        real_flush = registry.flush
+
+        def flush():
+            flushed_by.append(threading.current_thread().name)
+            real_flush()
+            flushed.set()
+
+        with patch.object(metrics, "registry", registry):
+            with patch.object(registry, "flush", side_effect=flush):
+                clock.return_value = 5.0
+                registry.observe("celery_task_duration_seconds", 0.3, task="t", outcome="ok")
+                assert not flushed.wait(0.1)
+                clock.return_value = 11.0
+                registry.observe("celery_task_duration_seconds", 100, task="t", outcome="ok")
+                assert flushed.wait(2)
+
+            assert flushed_by == ["metrics-flush"]
+            row = get_histogram("celery_task_duration_seconds", task="t", outcome="ok")
+
+        assert row["count"] == 3
+        assert row["sum"] == pytest.approx(100.32)
+        buckets = dict(row["buckets"])
+        assert buckets[0.025] == 1
+        assert buckets[0.5] == 2
+        assert buckets[60] == 2
+        assert buckets[float("inf")] == 3
+
+    def test_flush_writes_one_incr_per_field(self):
+        from django.core.cache import cache
+
+        registry = MetricsRegistry()
+        registry.inc("telegram_webhook_updates_total", outcome="new")
+        registry.flush()
+        registry.inc("telegram_webhook_updates_total", 2, outcome="new")
+
+        with patch.object(cache, "add", wraps=cache.add) as add, patch.object(cache, "incr", wraps=cache.incr) as incr:
+            registry.flush()
+
+        add.assert_not_called()
+        incr.assert_called_once()
+        with patch.object(metrics, "registry", registry):
+            assert metrics.get_counter("telegram_webhook_updates_total", outcome="new") == 3
+
+    def test_prometheus_text(self):
+        observe("telegram_api_duration_seconds", 0.2, method="sendMessage")
+        observe("telegram_api_duration_seconds", 0.4, method="sendMessage")
+
+        text = render_prometheus()
+
+        assert "# TYPE telegram_api_duration_seconds histogram" in text
+        assert 'telegram_api_duration_seconds_bucket{method="sendMessage",le="0.25"} 1' in text
+        assert 'telegram_api_duration_seconds_bucket{method="sendMessage",le="+Inf"} 2' in text
+        assert 'telegram_api_duration_seconds_count{method="sendMessage"} 2' in text
+
+
+@pytest.mark.django_db
+class TestInstrumentation:
+    def test_task_run_records_runtime_and_queries(self, user_factory):
+        from user.models import User
+
+        metrics.task_run_started("task-1")
+        User.objects.count()
+        User.objects.count()
+        metrics.task_run_finished("task-1", "vacancy.tasks.call.some_task", "SUCCESS")
+
+        assert get_histogram("celery_task_db_queries", task="vacancy.tasks.call.some_task")["sum"] == 2
+        assert get_histogram("celery_task_duration_seconds", task="vacancy.tasks.call.some_task", outcome="ok")
+        assert not connection.execute_wrappers
+
+    def test_bot_api_calls_are_timed_per_method(self):
+        with patch("telebot.apihelper._get_req_session") as session:
+            metrics.timed_request_sender("post", "https://api.telegram.org/bot0:x/getChat", timeout=(1, 1))
+
+        session.return_value.request.assert_called_once()
+        assert get_histogram("telegram_api_duration_seconds", method="getChat")["count"] == 1
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+    def test_token_or_staff_only(self, client, settings, user_factory):
+        settings.METRICS_TOKEN = "secret"
+        observe("vacancy_event_duration_seconds", 0.01, event="vacancy_close")
+
+        assert client.get("/metrics").status_code == 404
+        assert client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code == 404
+
+        response = client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret")
+        assert response.status_code == 200
+        assert b'vacancy_event_duration_seconds_count{event="vacancy_close"} 1' in response.content
+
+        client.force_login(user_factory(is_staff=True))
+        assert client.get("/metrics").status_code == 200
@@ -0,0 +1,183 @@
+"""Publisher dispatch policies: sync, on_commit, celery lanes; per-observer metrics."""
+
+from unittest.mock import patch
+
+import pytest
+
+from service.metrics import get_histogram
+from vacancy.services.observers.publisher import (
+    DISPATCH_CELERY,
+    DISPATCH_ON_COMMIT,
+    BasePublisher,
+    Observer,
+    deserialize_event_data,
+    serialize_event_data,
+)
+
+
+class Recorder(Observer):
+    def __init__(self, calls):
+        self.calls = calls
+
+    def update(self, event, data):
+        self.calls.append((self.__class__.__name__, data["vacancy"].pk))
+
+
+class First(Recorder): ...
+
+
+class Second(Recorder): ...
+
+
+class Third(Recorder): ...
+
+
+class Broken(Observer):
+    def update(self, event, data):
+        raise RuntimeError("boom")
+
+
+@pytest.fixture
+def publisher():
+    calls = []
+    pub = BasePublisher()
+    pub.subscribe("close", First(calls))
+    pub.subscribe("close", Second(calls), DISPATCH_CELERY, lane="teardown")
+    pub.subscribe("close", Third(calls), DISPATCH_CELERY, lane="teardown")
+    pub.subscribe("close", Broken(), DISPATCH_ON_COMMIT)
+    return pub, calls
+
+
+@pytest.mark.django_db
+class TestDispatch:
+    def test_everything_inline_when_async_is_off(self, publisher, vacancy_factory):
+        pub, calls = publisher
+        vacancy = vacancy_factory()
+
+        pub.notify("close", {"vacancy": vacancy})
+
+        assert [name for name, _ in calls] == ["First", "Second", "Third"]
+        failed = get_histogram(
+            "vacancy_observer_duration_seconds", event="close", observer="Broken", mode="sync", outcome="error"
+        )
+        assert failed["count"] == 1
+
+    def test_deferred_policies(self, publisher, vacancy_factory, settings, django_capture_on_commit_callbacks):
+        settings.VACANCY_OBSERVERS_ASYNC = True
+        pub, calls = publisher
+        vacancy = vacancy_factory()
+
+        with patch("vacancy.tasks.observers.run_vacancy_observers_task.apply_async") as enqueue:
+            with django_capture_on_commit_callbacks(execute=True) as callbacks:
+                pub.notify("close", {"vacancy": vacancy, "request": object()})
+                assert [name for name, _ in calls] == ["First"]
+
+        assert len(callbacks) == 2
+        enqueue.assert_called_once_with(
+            args=["close", ["Second", "Third"], {"vacancy": {"model": "vacancy.Vacancy", "pk": vacancy.pk}}]
+        )
+        assert (
+            get_histogram(
+                "vacancy_observer_duration_seconds", event="close", observer="Broken", mode="on_commit", outcome="error"
+            )["count"]
+            == 1
+        )
+
+    def test_broker_failure_runs_lane_inline(
+        self, publisher, vacancy_factory, settings, django_capture_on_commit_callbacks
+    ):
+        settings.VACANCY_OBSERVERS_ASYNC = True
+        pub, calls = publisher
+        vacancy = vacancy_factory()
+
+        with (
+            patch("vacancy.tasks.observers.run_vacancy_observers_task.apply_async", side_effect=OSError),
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            pub.notify("close", {"vacancy": vacancy})
+
+        assert [name for name, _ in calls] == ["First", "Second", "Third"]
+
+    def test_metrics_count_calls(self, publisher, vacancy_factory):
+        pub, _ = publisher
+        vacancy = vacancy_factory()
+
+        pub.notify("close", {"vacancy": vacancy})
+        pub.notify("close", {"vacancy": vacancy})
+
+        first = get_histogram(
+            "vacancy_observer_duration_seconds", event="close", observer="First", mode="sync", outcome="ok"
+        )
+        assert first["count"] == 2
+        assert get_histogram("vacancy_event_duration_seconds", event="close")["count"] == 2
+
+
+@pytest.mark.django_db
+class TestPayload:
+    def test_round_trip_reloads_instances(self, vacancy_factory):
+        vacancy = vacancy_factory()
+
+        data = deserialize_event_data(serialize_event_data({"vacancy": vacancy, "note": "x"}))
+
+        assert data["vacancy"] == vacancy and data["vacancy"] is not vacancy
+        assert data["note"] == "x"
+
+    def test_missing_row_skips_the_run(self, vacancy_factory):
+        from vacancy.tasks.observers import run_vacancy_observers_task
+
+        vacancy = vacancy_factory()
+        payload = serialize_event_data({"vacancy": vacancy})
+        vacancy.delete()
+
+        assert deserialize_event_data(payload) is None
+        run_vacancy_observers_task("vacancy_close", ["VacancyNotifyAdminsObserver"], payload)
+
+
+@pytest.mark.django_db
+class TestCloseTimerTeardown:
+    def test_queued_teardown_is_not_fired_again(
+        self, vacancy_factory, group_factory, settings, django_capture_on_commit_callbacks
+    ):
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from vacancy.choices import STATUS_CLOSED
+        from vacancy.tasks.call import close_lifecycle_timer_task
+
+        settings.VACANCY_OBSERVERS_ASYNC = True
+        vacancy = vacancy_factory(
+            status=STATUS_CLOSED, group=group_factory(), closed_at=timezone.now() - timedelta(hours=4)
+        )
+
+        with (
+            patch("vacancy.tasks.observers.run_vacancy_observers_task.apply_async") as enqueue,
+            patch("vacancy.tasks.call.connection"),
+        ):
+            for _ in range(2):
+                with django_capture_on_commit_callbacks(execute=True):
+                    close_lifecycle_timer_task()
+
+        lanes = [call.kwargs["args"][1] for call in enqueue.call_args_list]
+        assert lanes.count(["VacancyNotifyAdminsObserver"]) == 1
+        assert (
+            lanes.count(
+                ["VacancyDeleteMessagesObserver", "VacancyKickGroupUsersObserver", "VacancyGroupFeeStatusObserver"]
+            )
+            == 1
+        )
+        vacancy.refresh_from_db()
+        assert vacancy.group_teardown_at is not None
+
+    def test_released_group_clears_the_mark(self, vacancy_factory, group_factory):
+        from django.utils import timezone
+
+        from vacancy.services.observers.events import VACANCY_CLOSE
+        from vacancy.services.observers.vacancy_close import VacancyGroupFeeStatusObserver
+
+        vacancy = vacancy_factory(group=group_factory(), group_teardown_at=timezone.now())
+
+        VacancyGroupFeeStatusObserver(None).update(VACANCY_CLOSE, {"vacancy": vacancy})
+
+        vacancy.refresh_from_db()
+        assert vacancy.group_id is None and vacancy.group_teardown_at is None
@@ -0,0 +1,147 @@
+"""Query budgets for hot views, the join-request handler and bulk tasks, on a seeded data set.
+
+Each budget is the query count of a cold-cache run (session and auth lookups
+included) and must not depend on how many rows are seeded. Raise a budget only
+together with the change that needs the extra query. The one exception is
+allowed explicitly: Django's collector deletes rows that have a post_delete
+receiver in batches of GET_ITERATOR_CHUNK_SIZE.
+"""
+
+import math
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.sql.constants import GET_ITERATOR_CHUNK_SIZE
+from django.urls import reverse
+from django.utils import timezone
+
+from tests.perf import assert_max_queries, check_baseline, load_baselines, seed_world
+from tests.test_blocking_regression import _make_join_request
+
+QUERY_BUDGETS = {
+    "vacancy_detail": 16,
+    "vacancy_members_json": 6,
+    "index_employer": 9,
+    "index_worker": 9,
+    "admin_search_users": 4,
+    "auto_approve": 14,
+    "cleanup_inactive_users_task": 39,
+    "recount_rating_stats_task": 3,
+}
+
+
+def _cold(label, func, delete_batches=0):
+    cache.clear()
+    with assert_max_queries(QUERY_BUDGETS[label] + delete_batches, label):
+        return func()
+
+
+@pytest.mark.django_db
+class TestViewBudgets:
+    @pytest.mark.parametrize("hot_members", [2, 15])
+    def test_vacancy_owner_pages(self, client, hot_members):
+        world = seed_world(hot_members=hot_members)
+        vacancy = world.hot_vacancy
+        client.force_login(world.owner)
+
+        detail = _cold("vacancy_detail", lambda: client.get(reverse("vacancy:detail", args=[vacancy.pk])))
+        members = _cold("vacancy_members_json", lambda: client.get(f"/vacancy/{vacancy.pk}/members-json/"))
+        index = _cold("index_employer", lambda: client.get("/"))
+
+        assert detail.status_code == 200
+        assert members.json()["members_count"] == hot_members
+        assert index.status_code == 200
+
+    def test_worker_dashboard(self, client):
+        world = seed_world()
+        client.force_login(world.members[0])
+
+        response = _cold("index_worker", lambda: client.get("/"))
+
+        assert response.status_code == 200
+
+    def test_admin_search_users(self, client, user_factory):
+        seed_world(workers=400)
+        client.force_login(user_factory(is_staff=True, phone_number="+380670000002"))
+
+        response = _cold(
+            "admin_search_users", lambda: client.get(reverse("work:admin_search_users"), {"q": "петренко"})
+        )
+
+        assert len(response.context["users"]) == 100
+
+
+@pytest.mark.django_db
+class TestHandlerBudgets:
+    def test_auto_approve_join(self):
+        from telegram.handlers.bot_instance import bot
+        from telegram.handlers.member.user.group import auto_approve
+
+        world = seed_world()
+        joiner = world.workers[-1]
+        request = _make_join_request(joiner.id, world.hot_vacancy.group_id)
+
+        with patch.object(bot, "approve_chat_join_request") as approve:
+            _cold("auto_approve", lambda: auto_approve(request))
+
+        approve.assert_called_once_with(world.hot_vacancy.group_id, joiner.id)
+
+
+@pytest.mark.django_db
+class TestTaskBudgets:
+    @pytest.mark.parametrize("inactive", [5, 60])
+    def test_cleanup_inactive_users(self, inactive):
+        from user.models import User, UserFeedback, UserRatingStats
+        from user.tasks import cleanup_inactive_users_task
+        from vacancy.models import Vacancy, VacancyUser
+
+        world = seed_world(workers=inactive + 20)
+        gone = [u.id for u in world.employers[:1]] + [u.id for u in world.workers[-inactive:]]
+        VacancyUser.objects.filter(user_id__in=gone).delete()
+        User.objects.filter(id__in=gone).update(date_joined=timezone.now() - timedelta(days=400))
+        Vacancy.objects.filter(owner_id__in=gone).update(date=timezone.localdate() - timedelta(days=400))
+        reviewed = world.workers[0]
+        assert UserFeedback.objects.filter(owner_id__in=gone, user=reviewed).exists()
+        touched = UserFeedback.objects.filter(Q(owner_id__in=gone) | Q(user_id__in=gone)).count()
+
+        _cold(
+            "cleanup_inactive_users_task",
+            cleanup_inactive_users_task,
+            delete_batches=math.ceil(touched / GET_ITERATOR_CHUNK_SIZE),
+        )
+
+        assert not User.objects.filter(id__in=gone).exists()
+        stats = UserRatingStats.objects.filter(user=reviewed).values_list("likes", "dislikes").first()
+        feedback = UserFeedback.objects.filter(user=reviewed)
+        assert (stats or (0, 0)) == (feedback.filter(rating="like").count(), feedback.filter(rating="dislike").count())
+
+    def test_recount_rating_stats(self):
+        from user.tasks import recount_rating_stats_task
+
+        seed_world(feedback=2000)
+
+        _cold("recount_rating_stats_task", recount_rating_stats_task)
+
+
+class TestBaselines:
+    def test_regression_is_flagged_beyond_tolerance(self, tmp_path):
+        path = tmp_path / "benchmarks.json"
+
+        assert check_baseline("view", 0.100, path=path) is None  # first run records
+        assert check_baseline("view", 0.140, tolerance=0.5, path=path) is None
+        assert "view" in check_baseline("view", 0.160, tolerance=0.5, path=path)
+        assert load_baselines(path) == {"view": 0.1}
+
+        assert check_baseline("view", 0.160, update=True, path=path) is None
+        assert load_baselines(path) == {"view": 0.16}
+
+    @pytest.mark.django_db
+    def test_budget_failure_lists_the_queries(self):
+        from user.models import User
+
+        with pytest.raises(AssertionError, match=r"probe ran 1 queries, budget is 0:\n1\. SELECT"):
+            with assert_max_queries(0, "probe"):
+                User.objects.count()
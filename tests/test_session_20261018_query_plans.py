@@ -0,0 +1,68 @@
+"""Query plans: the beat-task and view filters are served by their composite/partial indexes (EXPLAIN on seeded data)."""
+
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from telegram.choices import CallStatus, CallType, Status
+from tests.perf import seed_world
+from user.models import UserBlock, UserFeedback
+from vacancy.choices import STATUS_APPROVED, STATUS_SEARCH_STOPPED
+from vacancy.models import Vacancy, VacancyUser, VacancyUserCall
+
+
+def _plan(queryset) -> str:
+    if connection.vendor == "postgresql":
+        # A seeded table this small is cheaper to scan; ask whether the index is usable at all.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+QUERIES = {
+    "vacancy_status_date_idx": lambda w: Vacancy.objects.filter(
+        status__in=[STATUS_APPROVED, STATUS_SEARCH_STOPPED], date=date.today()
+    ),
+    "vacancy_owner_status_idx": lambda w: Vacancy.objects.filter(owner=w.owner, status=STATUS_APPROVED),
+    "vacancy_closed_at_idx": lambda w: Vacancy.objects.filter(
+        closed_at__isnull=False, closed_at__lte=timezone.now(), group__isnull=False
+    ),
+    "vacancy_searching_status_idx": lambda w: Vacancy.objects.filter(status=STATUS_APPROVED, search_active=True),
+    "vacancyuser_vacancy_status_idx": lambda w: VacancyUser.objects.filter(vacancy=w.hot_vacancy, status=Status.MEMBER),
+    "vacancyuser_user_status_idx": lambda w: VacancyUser.objects.filter(user=w.workers[0], status=Status.MEMBER),
+    "vacancy_call_type_status_idx": lambda w: VacancyUserCall.objects.filter(
+        call_type=CallType.RENEWAL_WORKER, status=CallStatus.SENT
+    ),
+    "vacancy_disputed_idx": lambda w: Vacancy.objects.filter(disputed_rollcall__isnull=False),
+    "vacancy_renewal_due_idx": lambda w: Vacancy.objects.filter(
+        second_rollcall_passed=True, closed_at__isnull=True, is_paid=True, renewal_offered=False
+    ),
+    "user_feedback_user_rating_idx": lambda w: UserFeedback.objects.filter(
+        user=w.workers[0], rating__in=["like", "dislike"]
+    ),
+    "user_block_active_idx": lambda w: UserBlock.objects.filter(user_id__in=[w.workers[0].pk], is_active=True),
+}
+
+
+@pytest.fixture
+def world(db):
+    return seed_world()
+
+
+@pytest.mark.django_db
+class TestQueryPlans:
+    @pytest.mark.parametrize("index", QUERIES)
+    def test_filter_uses_index(self, world, index):
+        plan = _plan(QUERIES[index](world))
+
+        assert index in plan, plan
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="GIN index on Vacancy.extra is PostgreSQL-only")
+    def test_extra_has_key_uses_gin_index(self, world):
+        from vacancy.services.rollcall_snapshot import SNAPSHOT_KEY
+
+        plan = _plan(Vacancy.objects.filter(extra__has_key=SNAPSHOT_KEY))
+
+        assert "vacancy_extra_gin_idx" in plan, plan
@@ -0,0 +1,95 @@
+"""Incremental rating counters, cached platform mean and bulk ratings_for()."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from user.models import UserFeedback, UserRatingStats
+from user.rating import (
+    bayesian_rating,
+    get_platform_params,
+    ratings_for,
+    recount_rating_stats,
+)
+
+
+def _stats(user):
+    row = UserRatingStats.objects.filter(user=user).first()
+    return (row.likes, row.dislikes) if row else (0, 0)
+
+
+@pytest.mark.django_db
+class TestRatingCounters:
+    def test_create_update_delete_keep_counters_in_sync(self, user_factory):
+        owner, target = user_factory(), user_factory()
+        like = UserFeedback.objects.create(owner=owner, user=target, rating="like")
+        UserFeedback.objects.create(owner=owner, user=target, rating="dislike")
+        UserFeedback.objects.create(owner=owner, user=target, rating="none")
+        assert _stats(target) == (1, 1)
+
+        like.rating = "dislike"
+        like.save()
+        assert _stats(target) == (0, 2)
+
+        like.text = "still a dislike"
+        like.save()
+        assert _stats(target) == (0, 2)
+
+        like.delete()
+        assert _stats(target) == (0, 1)
+
+    def test_deleting_user_does_not_recreate_stats(self, user_factory):
+        owner, target = user_factory(), user_factory()
+        UserFeedback.objects.create(owner=owner, user=target, rating="like")
+
+        target.delete()
+
+        assert not UserRatingStats.objects.exists()
+
+    def test_recount_fixes_drift(self, user_factory):
+        owner, target = user_factory(), user_factory()
+        UserFeedback.objects.create(owner=owner, user=target, rating="like")
+        UserRatingStats.objects.filter(user=target).update(likes=7, dislikes=3)
+
+        recount_rating_stats()
+
+        assert _stats(target) == (1, 0)
+
+
+@pytest.mark.django_db
+class TestRatingsFor:
+    def test_one_query_for_many_users(self, user_factory):
+        owner = user_factory()
+        users = [user_factory() for _ in range(5)]
+        for user in users[:3]:
+            UserFeedback.objects.create(owner=owner, user=user, rating="like")
+        get_platform_params()
+
+        with CaptureQueriesContext(connection) as ctx:
+            ratings = ratings_for(u.id for u in users)
+
+        assert len(ctx.captured_queries) == 1
+        assert set(ratings) == {u.id for u in users}
+        assert ratings[users[0].id] == bayesian_rating(1, 0)
+        assert ratings[users[4].id] == bayesian_rating(0, 0)
+
+    def test_platform_mean_is_cached_until_refresh(self, user_factory):
+        from user.tasks import refresh_rating_params_task
+
+        owner, target = user_factory(), user_factory()
+        UserFeedback.objects.create(owner=owner, user=target, rating="like")
+        assert get_platform_params()[1] == 1.0
+
+        UserFeedback.objects.create(owner=owner, user=target, rating="dislike")
+        assert get_platform_params()[1] == 1.0
+
+        refresh_rating_params_task()
+        assert get_platform_params()[1] == 0.5
+
+    def test_threshold_change_invalidates_cache(self):
+        from work.models import RatingConfig
+
+        get_platform_params()
+        RatingConfig.objects.create(rating_threshold=9)
+
+        assert get_platform_params()[0] == 9
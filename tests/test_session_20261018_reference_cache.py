@@ -0,0 +1,139 @@
+"""Reference data cache: cities, public channels, FAQ, agreements, rating threshold; signal invalidation."""
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+
+from city.models import City
+from work.models import AgreementText, FaqItem, RatingConfig
+from work.service import reference_data
+
+
+def _queries(func):
+    with CaptureQueriesContext(connection) as ctx:
+        result = func()
+    return result, len(ctx.captured_queries)
+
+
+@pytest.fixture
+def city():
+    city = City.objects.create(order=1)
+    city.set_current_language("uk")
+    city.name = "Київ"
+    city.save()
+    return city
+
+
+class TestCacheSettings:
+    def test_production_cache_is_redis_on_its_own_db(self):
+        from config.django import base
+
+        cache = base.CACHES["default"]
+        assert cache["BACKEND"] == "django.core.cache.backends.redis.RedisCache"
+        assert cache["LOCATION"].endswith(f":6379/{base.REDIS_CACHE_DB}")
+        assert base.CELERY_BROKER_URL.endswith(":6379/0") and base.REDIS_CACHE_DB != 0
+
+    def test_tests_use_locmem(self):
+        assert settings.CACHES["default"]["BACKEND"] == "django.core.cache.backends.locmem.LocMemCache"
+
+
+@pytest.mark.django_db
+class TestCities:
+    def test_served_from_cache_after_first_read(self, city):
+        first, _ = _queries(reference_data.city_choices)
+        again, count = _queries(reference_data.city_choices)
+
+        assert first == again == [(city.pk, "Київ")]
+        assert count == 0
+
+    def test_translation_edit_invalidates(self, city):
+        reference_data.cities()
+
+        city.set_current_language("uk")
+        city.name = "Львів"
+        city.save()
+
+        assert reference_data.city_choices() == [(city.pk, "Львів")]
+
+    def test_name_follows_active_language(self, city):
+        city.set_current_language("en")
+        city.name = "Kyiv"
+        city.save()
+
+        with translation.override("en"):
+            assert reference_data.city_choices() == [(city.pk, "Kyiv")]
+        with translation.override("uk"):
+            assert reference_data.city_choices() == [(city.pk, "Київ")]
+
+
+@pytest.mark.django_db
+class TestPublicChannels:
+    def test_by_city(self, city, channel_factory):
+        channel = channel_factory(city=city)
+        channel_factory(city=city, has_bot_administrator=False)
+
+        assert reference_data.public_channel_for_city(city.pk) == channel
+        _, count = _queries(lambda: reference_data.public_channels([city.pk]))
+        assert count == 0
+        assert reference_data.public_channel_for_city(None) is None
+
+    def test_channel_save_invalidates(self, city, channel_factory):
+        channel = channel_factory(city=city)
+        assert reference_data.public_channel_for_city(city.pk) == channel
+
+        channel.is_active = False
+        channel.save()
+
+        assert reference_data.public_channel_for_city(city.pk) is None
+
+    def test_city_delete_drops_channel_link(self, city, channel_factory):
+        channel_factory(city=city)
+        reference_data.public_channels()
+
+        city.delete()
+
+        assert [c.city_id for c in reference_data.public_channels()] == [None]
+
+
+@pytest.mark.django_db
+class TestFaqAndAgreements:
+    def test_faq_invalidated_across_roles(self):
+        item = FaqItem.objects.create(role=FaqItem.ROLE_WORKER, question="Q", answer="A")
+        assert reference_data.faq_items(FaqItem.ROLE_WORKER) == [item]
+        assert reference_data.faq_items(FaqItem.ROLE_EMPLOYER) == []
+
+        item.role = FaqItem.ROLE_EMPLOYER
+        item.save()
+
+        assert reference_data.faq_items(FaqItem.ROLE_WORKER) == []
+        assert reference_data.faq_items(FaqItem.ROLE_EMPLOYER) == [item]
+
+    def test_missing_agreement_is_cached_too(self):
+        _, first = _queries(lambda: reference_data.agreement_text(AgreementText.TYPE_OFFER))
+        result, again = _queries(lambda: reference_data.agreement_text(AgreementText.TYPE_OFFER))
+
+        assert result is None
+        assert (first, again) == (1, 0)
+
+    def test_agreement_edit_invalidates(self):
+        agreement = AgreementText.objects.create(role=AgreementText.TYPE_OFFER, text="v1")
+        assert reference_data.agreement_text(AgreementText.TYPE_OFFER).text == "v1"
+
+        agreement.text = "v2"
+        agreement.save()
+
+        assert reference_data.agreement_text(AgreementText.TYPE_OFFER).text == "v2"
+
+
+@pytest.mark.django_db
+class TestRatingThreshold:
+    def test_config_save_invalidates(self):
+        assert RatingConfig.get_threshold() == reference_data.DEFAULT_RATING_THRESHOLD
+
+        RatingConfig.objects.create(rating_threshold=8)
+
+        _, count = _queries(RatingConfig.get_threshold)
+        assert RatingConfig.get_threshold() == 8
+        assert count == 1
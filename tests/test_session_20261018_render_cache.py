@@ -0,0 +1,83 @@
+"""Vacancy text render cache and skipping identical editMessageText calls."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from service.telegram_strategies import TextStrategy
+from telegram.choices import Status
+from vacancy.choices import STATUS_APPROVED
+from vacancy.models import VacancyUser
+from vacancy.services.vacancy_formatter import VacancyTelegramTextFormatter, bump_render_version
+
+
+@pytest.mark.django_db
+class TestRenderCache:
+    def test_unchanged_vacancy_renders_without_queries(self, vacancy_factory):
+        vacancy = vacancy_factory(status=STATUS_APPROVED, people_count=3)
+        first = VacancyTelegramTextFormatter(vacancy).for_channel()
+
+        with CaptureQueriesContext(connection) as ctx:
+            again = VacancyTelegramTextFormatter(vacancy).for_channel()
+
+        assert again == first
+        assert len(ctx.captured_queries) == 0
+        assert first == VacancyTelegramTextFormatter(vacancy)._render_base(show_needed=True)
+        assert "Кількість людей: 3" in first
+
+    def test_member_change_refreshes_needed_figure(self, vacancy_factory, worker_factory):
+        vacancy = vacancy_factory(status=STATUS_APPROVED, people_count=3)
+        VacancyTelegramTextFormatter(vacancy).for_channel()
+
+        member = VacancyUser.objects.create(vacancy=vacancy, user=worker_factory(), status=Status.MEMBER)
+        assert "2 (з 3)" in VacancyTelegramTextFormatter(vacancy).for_channel()
+
+        VacancyUser.objects.filter(pk=member.pk).update(status=Status.LEFT)
+        bump_render_version(vacancy.pk)
+        assert "Кількість людей: 3" in VacancyTelegramTextFormatter(vacancy).for_channel()
+
+    def test_field_edit_is_never_served_stale(self, vacancy_factory):
+        vacancy = vacancy_factory(status=STATUS_APPROVED, address="вул. Стара 1")
+        VacancyTelegramTextFormatter(vacancy).for_group()
+
+        vacancy.address = "вул. Нова 2"
+
+        assert "вул. Нова 2" in VacancyTelegramTextFormatter(vacancy).for_group()
+
+    def test_full_variant_is_cached_separately(self, vacancy_factory):
+        vacancy = vacancy_factory(status=STATUS_APPROVED)
+        formatter = VacancyTelegramTextFormatter(vacancy)
+
+        assert formatter.for_channel(status="full").endswith(formatter.labels["Vacancy is close"])
+        assert not formatter.for_channel().endswith(formatter.labels["Vacancy is close"])
+
+
+class TestEditSkip:
+    def test_identical_edit_is_not_sent(self):
+        from telegram.handlers.bot_instance import bot
+
+        strategy = TextStrategy()
+        strategy.update(bot, -100, message_id=7, text="A")
+        strategy.update(bot, -100, message_id=7, text="A")
+        strategy.update(bot, -100, message_id=7, text="B")
+
+        assert [c.kwargs["text"] for c in bot.edit_message_text.call_args_list] == ["A", "B"]
+
+    def test_edit_right_after_send_with_same_text_is_skipped(self):
+        from telegram.handlers.bot_instance import bot
+
+        strategy = TextStrategy()
+        message = strategy.send(bot, -100, text="A")
+        strategy.update(bot, -100, message_id=message.message_id, text="A")
+
+        bot.edit_message_text.assert_not_called()
+
+    def test_failed_edit_is_retried(self):
+        from telegram.handlers.bot_instance import bot
+
+        strategy = TextStrategy()
+        bot.edit_message_text.side_effect = [RuntimeError("timeout"), None]
+        strategy.update(bot, -100, message_id=7, text="A")
+        strategy.update(bot, -100, message_id=7, text="A")
+
+        assert bot.edit_message_text.call_count == 2
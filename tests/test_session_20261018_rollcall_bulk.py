@@ -0,0 +1,136 @@
+"""Rollcall calls in sets: unique (vacancy_user, call_type), bulk creation, one-UPDATE transitions, bulk bans/kicks."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from telegram.choices import CallStatus, CallType, Status
+from tests.perf import assert_max_queries
+from user.choices import BlockReason
+from user.models import UserBlock
+from user.services import BlockService
+from vacancy.choices import STATUS_SEARCH_STOPPED
+from vacancy.models import VacancyUser, VacancyUserCall
+from vacancy.services.call import apply_rollcall, create_vacancy_call
+from vacancy.services.disputed_rollcall import finalize_rollcall
+from vacancy.services.rollcall_snapshot import save_first_rollcall_snapshot
+
+WORKERS = 50
+
+
+def _vacancy_with_members(vacancy_factory, user_factory, n=WORKERS, **kwargs):
+    vacancy = vacancy_factory(**kwargs)
+    users = [user_factory() for _ in range(n)]
+    VacancyUser.objects.bulk_create([VacancyUser(vacancy=vacancy, user=u, status=Status.MEMBER) for u in users])
+    return vacancy, [u.id for u in users]
+
+
+@pytest.mark.django_db
+class TestCreateCalls:
+    def test_one_call_per_member_whatever_the_repeats(self, vacancy_factory, user_factory):
+        vacancy, _ = _vacancy_with_members(vacancy_factory, user_factory)
+
+        with assert_max_queries(3, "create_vacancy_call"):
+            created = create_vacancy_call(vacancy, status=CallStatus.CREATED, call_type=CallType.START)
+        again = create_vacancy_call(vacancy, status=CallStatus.CREATED, call_type=CallType.START)
+
+        assert (len(created), again) == (WORKERS, [])
+        assert VacancyUserCall.objects.filter(call_type=CallType.START).count() == WORKERS
+
+    def test_duplicate_call_is_rejected_by_the_database(self, vacancy_factory, user_factory):
+        vacancy, _ = _vacancy_with_members(vacancy_factory, user_factory, n=1)
+        vacancy_user = vacancy.members.get()
+        VacancyUserCall.objects.create(vacancy_user=vacancy_user, call_type=CallType.START)
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            VacancyUserCall.objects.create(vacancy_user=vacancy_user, call_type=CallType.START)
+
+
+@pytest.mark.django_db
+class TestApplyRollcall:
+    def test_delta_and_constant_query_count(self, vacancy_factory, user_factory):
+        vacancy, user_ids = _vacancy_with_members(vacancy_factory, user_factory)
+        create_vacancy_call(vacancy, status=CallStatus.CREATED, call_type=CallType.AFTER_START)
+        kept, dropped = user_ids[:40], user_ids[40:]
+
+        with assert_max_queries(5, "apply_rollcall"):
+            delta = apply_rollcall(vacancy.members, call_type=CallType.AFTER_START, confirmed_user_ids=kept)
+
+        assert sorted(delta.confirmed) == sorted(kept) and sorted(delta.rejected) == sorted(dropped)
+        assert len(delta.changed) == WORKERS
+        statuses = dict(VacancyUserCall.objects.values_list("vacancy_user__user_id", "status"))
+        assert {statuses[u] for u in kept} == {CallStatus.CONFIRM}
+        assert {statuses[u] for u in dropped} == {CallStatus.REJECT}
+
+    def test_repeat_only_reports_what_changed(self, vacancy_factory, user_factory):
+        vacancy, user_ids = _vacancy_with_members(vacancy_factory, user_factory, n=3)
+        create_vacancy_call(vacancy, status=CallStatus.CREATED, call_type=CallType.START)
+        apply_rollcall(vacancy.members, call_type=CallType.START, confirmed_user_ids=user_ids[:2])
+
+        delta = apply_rollcall(vacancy.members, call_type=CallType.START, confirmed_user_ids=user_ids)
+
+        assert delta.changed == [user_ids[2]]
+        assert delta.rejected == []
+
+
+@pytest.mark.django_db
+class TestFinalizeRollcall:
+    @pytest.fixture(autouse=True)
+    def _no_invoice(self, monkeypatch):
+        monkeypatch.setattr("vacancy.services.invoice.send_vacancy_invoice", lambda **kw: None)
+
+    def test_rejected_workers_banned_in_bulk(self, vacancy_factory, user_factory):
+        vacancy, user_ids = _vacancy_with_members(
+            vacancy_factory, user_factory, status=STATUS_SEARCH_STOPPED, first_rollcall_passed=True
+        )
+        save_first_rollcall_snapshot(vacancy, user_ids)
+        create_vacancy_call(vacancy, status=CallStatus.CREATED, call_type=CallType.AFTER_START)
+        rejected = user_ids[45:]
+        BlockService.auto_block_rollcall_reject(user=vacancy.members.get(user_id=rejected[0]).user)
+        assert BlockService.blocked_user_ids(rejected) == {rejected[0]}
+
+        with assert_max_queries(20, "finalize_rollcall"):
+            confirmed = finalize_rollcall(vacancy, final_selected_user_ids=user_ids[:45])
+
+        assert confirmed == 45
+        blocks = UserBlock.objects.filter(reason=BlockReason.ROLLCALL_REJECT, is_active=True)
+        assert sorted(blocks.values_list("user_id", flat=True)) == sorted(rejected)
+        assert BlockService.blocked_user_ids(user_ids) == set(rejected)
+
+
+@pytest.mark.django_db
+class TestAfterFirstCallCheck:
+    def test_overdue_unconfirmed_members_kicked_per_group(self, vacancy_factory, user_factory, group_factory):
+        from vacancy.tasks.call import after_first_call_check
+
+        vacancy, user_ids = _vacancy_with_members(vacancy_factory, user_factory, n=4, group=group_factory())
+        create_vacancy_call(vacancy, status=CallStatus.SENT, call_type=CallType.AFTER_START)
+        calls = VacancyUserCall.objects.filter(vacancy_user__vacancy=vacancy)
+        calls.update(created_at=timezone.now() - timedelta(minutes=30))
+        calls.filter(vacancy_user__user_id=user_ids[0]).update(status=CallStatus.CONFIRM)
+        calls.filter(vacancy_user__user_id=user_ids[1]).update(created_at=timezone.now())
+
+        with patch("telegram.service.group.GroupService.kick_users") as kick_users:
+            after_first_call_check([vacancy], delay=20)
+
+        kick_users.assert_called_once()
+        assert kick_users.call_args.kwargs["chat_id"] == vacancy.group_id
+        assert sorted(kick_users.call_args.kwargs["user_ids"]) == sorted(user_ids[2:])
+
+    def test_kicks_go_out_as_one_task(self, settings, group_factory):
+        from telegram.service.group import GroupService
+
+        settings.TELEGRAM_OUTBOUND_ASYNC = True
+        group = group_factory()
+
+        with (
+            patch("telegram.tasks.kick_users_task.apply_async") as apply_async,
+            patch.object(GroupService, "kick_user") as kick_user,
+        ):
+            GroupService.kick_users(chat_id=group.id, user_ids=[1, 2, 3])
+
+        apply_async.assert_called_once_with(args=[group.id, [1, 2, 3]])
+        kick_user.assert_not_called()
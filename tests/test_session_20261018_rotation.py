@@ -0,0 +1,81 @@
+"""Channel rotation: one-query planning, per-channel budget, cycle report."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from telegram.models import ChannelMessage
+from vacancy.choices import STATUS_APPROVED
+from vacancy.services.rotation import plan_rotation
+
+
+def _searching(vacancy_factory, channel, posted_minutes_ago=None):
+    vacancy = vacancy_factory(status=STATUS_APPROVED, search_active=True, channel=channel)
+    if posted_minutes_ago is not None:
+        msg = ChannelMessage.objects.create(
+            channel=channel, content_type="text", message_id=vacancy.id, vacancy=vacancy
+        )
+        ChannelMessage.objects.filter(pk=msg.pk).update(
+            created_at=timezone.now() - timedelta(minutes=posted_minutes_ago)
+        )
+    return vacancy
+
+
+@pytest.mark.django_db
+class TestPlanRotation:
+    def test_only_due_vacancies_scheduled_in_one_query(self, vacancy_factory, channel_factory):
+        channel = channel_factory()
+        fresh = _searching(vacancy_factory, channel, posted_minutes_ago=1)
+        stale = _searching(vacancy_factory, channel, posted_minutes_ago=6)
+        never = _searching(vacancy_factory, channel)
+        vacancy_factory(status=STATUS_APPROVED, search_active=False, channel=channel)
+
+        with CaptureQueriesContext(connection) as ctx:
+            plan = plan_rotation()
+
+        assert len(ctx.captured_queries) == 1
+        assert plan.report.candidates == 3
+        assert plan.report.due == 2
+        # one channel with 3 candidates -> budget of 1 per tick, never-posted first
+        assert plan.scheduled == [never]
+        assert fresh not in plan.scheduled and stale not in plan.scheduled
+
+    def test_big_channel_is_spread_over_the_window(self, vacancy_factory, channel_factory):
+        channel = channel_factory()
+        for _ in range(25):
+            _searching(vacancy_factory, channel, posted_minutes_ago=10)
+
+        plan = plan_rotation()
+
+        assert plan.report.due == 25
+        assert len(plan.scheduled) == 3  # ceil(25 / 10 ticks)
+
+    def test_channels_are_interleaved(self, vacancy_factory, channel_factory):
+        kyiv, lviv = channel_factory(), channel_factory()
+        for _ in range(11):
+            _searching(vacancy_factory, kyiv, posted_minutes_ago=10)
+        _searching(vacancy_factory, lviv, posted_minutes_ago=10)
+
+        plan = plan_rotation()
+
+        assert [v.channel_id for v in plan.scheduled] == [kyiv.id, lviv.id, kyiv.id]
+
+
+@pytest.mark.django_db
+class TestRotationTask:
+    def test_report_counts_due_republished_skipped(self, vacancy_factory, channel_factory):
+        from vacancy.tasks.resend import resend_vacancies_to_channel_task
+
+        channel = channel_factory()
+        for _ in range(15):
+            _searching(vacancy_factory, channel, posted_minutes_ago=10)
+
+        with patch("vacancy.tasks.resend.resend_vacancy_to_channel", side_effect=[True, False]) as resend:
+            report = resend_vacancies_to_channel_task()
+
+        assert resend.call_count == 2
+        assert report == {"candidates": 15, "due": 15, "republished": 1, "skipped": 14}
@@ -0,0 +1,234 @@
+"""Outbound Telegram queue: token buckets, payload encoding, batched bookkeeping, 429 handling."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from telebot import types
+from telebot.apihelper import ApiTelegramException
+
+from service.notifications import NotificationMethod
+from service.telegram_outbound import (
+    OP_SEND,
+    OP_UPDATE,
+    TelegramRateLimiter,
+    decode_kwargs,
+    deliver,
+    encode_kwargs,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _limiter(clock, **kwargs):
+    return TelegramRateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def _message(chat_id, message_id, chat_type="channel"):
+    return types.Message.de_json(
+        {
+            "message_id": message_id,
+            "date": 0,
+            "chat": {"id": chat_id, "type": chat_type},
+            "from": {"id": 777, "is_bot": True, "first_name": "bot"},
+            "text": "hello",
+        }
+    )
+
+
+def _too_many_requests(retry_after):
+    return ApiTelegramException(
+        "sendMessage",
+        MagicMock(status_code=429),
+        {"error_code": 429, "description": "Too Many Requests", "parameters": {"retry_after": retry_after}},
+    )
+
+
+class TestTelegramRateLimiter:
+    def test_same_private_chat_is_limited_to_one_per_second(self):
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        assert limiter.acquire(42) == 0
+        assert limiter.acquire(42) == pytest.approx(1.0)
+
+    def test_different_chats_share_only_the_global_bucket(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, global_per_second=3)
+        waits = [limiter.acquire(chat_id) for chat_id in (1, 2, 3, 4)]
+        assert waits[:3] == [0, 0, 0]
+        assert waits[3] == pytest.approx(1 / 3)
+
+    def test_group_is_limited_to_twenty_per_minute(self):
+        clock = FakeClock()
+        limiter = _limiter(clock, chat_per_second=100)
+        waits = [limiter.acquire(-100500) for _ in range(21)]
+        assert sum(waits[:20]) == pytest.approx(0.19, abs=0.01)
+        # one group token refills every 3s; 0.19s of it already elapsed
+        assert waits[20] == pytest.approx(3.0 - 0.19, abs=0.01)
+
+    def test_pause_blocks_every_chat(self):
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        limiter.pause(7)
+        assert limiter.acquire(1) == pytest.approx(7)
+
+
+def test_markup_survives_json_payload():
+    markup = types.InlineKeyboardMarkup()
+    markup.add(types.InlineKeyboardButton(text="Go", callback_data="go"))
+    payload = encode_kwargs({"text": "hi", "reply_markup": markup})
+
+    decoded = decode_kwargs(payload)
+
+    assert decoded["text"] == "hi"
+    assert decoded["reply_markup"].to_dict() == markup.to_dict()
+
+
+@pytest.mark.django_db
+class TestDeliver:
+    def test_channel_messages_logged_in_one_batch(self, channel_factory, vacancy_factory):
+        channel = channel_factory()
+        vacancy = vacancy_factory()
+        bot = MagicMock()
+        bot.send_message.side_effect = [_message(channel.id, 10), _message(555, 11, chat_type="private")]
+
+        from telegram.models import ChannelMessage
+
+        report = deliver(OP_SEND, [channel.id, 555], payload={"text": "hello"}, vacancy_id=vacancy.id, bot=bot)
+
+        assert report.sent == {channel.id: 10, 555: 11}
+        row = ChannelMessage.objects.get(channel=channel)
+        assert (row.message_id, row.vacancy_id, row.extra) == (10, vacancy.id, {"vacancy_id": vacancy.id})
+
+    def test_edit_is_not_logged_again(self, channel_factory):
+        from telegram.models import ChannelMessage
+
+        channel = channel_factory()
+        bot = MagicMock()
+        bot.edit_message_text.return_value = _message(channel.id, 10)
+
+        report = deliver(OP_UPDATE, [channel.id], payload={"text": "closed"}, message_id=10, bot=bot)
+
+        assert report.sent == {channel.id: 10}
+        assert bot.edit_message_text.call_args.kwargs["message_id"] == 10
+        assert not ChannelMessage.objects.exists()
+
+    def test_429_stops_and_reports_remaining_chats(self):
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        bot = MagicMock()
+        bot.send_message.side_effect = [_message(1, 1, "private"), _too_many_requests(12)]
+
+        report = deliver(OP_SEND, [1, 2, 3], payload={"text": "x"}, bot=bot, limiter=limiter)
+
+        assert report.sent == {1: 1}
+        assert report.pending == [2, 3]
+        assert report.retry_after == 12
+        assert limiter.acquire(99) == pytest.approx(12)
+
+    def test_other_errors_are_skipped(self):
+        bot = MagicMock()
+        bot.send_message.side_effect = [RuntimeError("blocked"), _message(2, 5, "private")]
+
+        report = deliver(OP_SEND, [1, 2], payload={"text": "x"}, bot=bot)
+
+        assert report.failed == [1]
+        assert report.sent == {2: 5}
+
+
+@pytest.mark.django_db
+class TestBroadcastQueue:
+    def test_admin_broadcast_enqueues_single_delivery(self, settings, user_factory):
+        from service.broadcast_service import TelegramBroadcastService
+        from service.notifications_impl import TelegramNotifier
+        from telegram.handlers.bot_instance import bot
+
+        settings.TELEGRAM_OUTBOUND_ASYNC = True
+        admins = [user_factory(is_staff=True), user_factory(is_staff=True)]
+
+        with patch("telegram.tasks.deliver_telegram_task.apply_async") as apply_async:
+            handle = TelegramBroadcastService(TelegramNotifier(bot)).admin_broadcast(text="hi")
+
+        assert handle is not None
+        args = apply_async.call_args.kwargs["args"]
+        assert args[0] == OP_SEND
+        assert sorted(args[1]) == sorted(a.id for a in admins)
+        assert args[2] == NotificationMethod.TEXT.name
+        bot.send_message.assert_not_called()
+
+    def test_broadcast_falls_back_inline_when_broker_is_down(self, settings, user_factory):
+        from service.broadcast_service import TelegramBroadcastService
+        from service.notifications_impl import TelegramNotifier
+        from telegram.handlers.bot_instance import bot
+
+        settings.TELEGRAM_OUTBOUND_ASYNC = True
+        admin = user_factory(is_staff=True)
+
+        with patch("telegram.tasks.deliver_telegram_task.apply_async", side_effect=OSError("refused")):
+            handle = TelegramBroadcastService(TelegramNotifier(bot)).admin_broadcast(text="hi")
+
+        assert handle is None
+        assert bot.send_message.call_args.kwargs["chat_id"] == admin.id
+
+    def test_notifier_queues_sends_and_edits(self, settings):
+        from service.notifications_impl import TelegramNotifier
+        from telegram.handlers.bot_instance import bot
+
+        settings.TELEGRAM_OUTBOUND_ASYNC = True
+        notifier = TelegramNotifier(bot)
+
+        with patch("telegram.tasks.deliver_telegram_task.apply_async") as apply_async:
+            notifier.notify(SimpleNamespace(chat_id=5), text="hi")
+            notifier.notify(SimpleNamespace(chat_id=5), is_update=True, text="edited", message_id=9)
+
+        sent, edited = (call.kwargs["args"] for call in apply_async.call_args_list)
+        assert sent == [OP_SEND, [5], NotificationMethod.TEXT.name, {"text": "hi"}, None, None]
+        assert edited == [OP_UPDATE, [5], NotificationMethod.TEXT.name, {"text": "edited"}, None, 9]
+        bot.send_message.assert_not_called()
+        bot.edit_message_text.assert_not_called()
+
+    def test_close_observer_queues_channel_edit(self, settings, channel_factory, vacancy_factory):
+        from service.notifications_impl import TelegramNotifier
+        from telegram.handlers.bot_instance import bot
+        from telegram.models import ChannelMessage
+        from vacancy.services.observers.events import VACANCY_CLOSE
+        from vacancy.services.observers.vacancy_close import VacancyStatusClosedObserver
+
+        settings.TELEGRAM_OUTBOUND_ASYNC = True
+        channel = channel_factory()
+        vacancy = vacancy_factory(channel=channel)
+        ChannelMessage.objects.create(channel=channel, vacancy=vacancy, content_type="text", message_id=42)
+
+        with patch("telegram.tasks.deliver_telegram_task.apply_async") as apply_async:
+            VacancyStatusClosedObserver(TelegramNotifier(bot)).update(VACANCY_CLOSE, {"vacancy": vacancy})
+
+        op, chat_ids, _, payload, _, message_id = apply_async.call_args.kwargs["args"]
+        assert (op, chat_ids, message_id) == (OP_UPDATE, [channel.id], 42)
+        assert payload["text"]
+        bot.edit_message_text.assert_not_called()
+
+    def test_task_retries_pending_chats_after_retry_after(self):
+        from telegram.tasks import deliver_telegram_task
+
+        bot = MagicMock()
+        bot.send_message.side_effect = [_message(1, 1, "private"), _too_many_requests(5)]
+
+        with (
+            patch("telegram.handlers.bot_instance.get_bot", return_value=bot),
+            patch("service.telegram_outbound.get_rate_limiter", return_value=None),
+            patch.object(deliver_telegram_task, "retry", side_effect=RuntimeError("retry")) as retry,
+        ):
+            with pytest.raises(RuntimeError):
+                deliver_telegram_task.run(OP_SEND, [1, 2], "TEXT", {"text": "x"})
+
+        assert retry.call_args.kwargs["args"][1] == [2]
+        assert retry.call_args.kwargs["countdown"] == 5
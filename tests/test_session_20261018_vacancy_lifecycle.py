@@ -0,0 +1,108 @@
+"""Vacancy lifecycle columns: data migration out of extra, column-granular writes, indexed beat-task filters."""
+
+import importlib
+from datetime import datetime, timedelta
+
+import pytest
+from django.apps import apps
+from django.utils import timezone
+
+from tests.perf import assert_max_queries
+from vacancy.choices import STATUS_CLOSED, STATUS_SEARCH_STOPPED
+from vacancy.models import Vacancy
+from vacancy.services.disputed_rollcall import clear_disputed, mark_disputed
+from vacancy.services.lifecycle import set_lifecycle
+
+migration = importlib.import_module("vacancy.migrations.0035_lifecycle_columns")
+
+
+@pytest.mark.django_db
+class TestDataMigration:
+    def test_keys_move_to_columns_and_leave_extra(self, vacancy_factory):
+        deadline = datetime(2026, 10, 18, 12, 30)
+        vacancy = vacancy_factory(
+            extra={
+                "is_paid": True,
+                "sent_start_call": True,
+                "pre_call_done": True,
+                "start_call_msg_id": "555",
+                "final_call_msg_id": "not-a-number",
+                "disputed_rollcall": {"reminders_count": 2},
+                "continue_deadline": deadline.isoformat(),
+                "calls": {"start": [1, 2]},
+            }
+        )
+        untouched = vacancy_factory(extra={"calls": {}})
+
+        migration.extra_to_columns(apps, None)
+
+        vacancy.refresh_from_db()
+        assert vacancy.extra == {"calls": {"start": [1, 2]}}
+        assert (vacancy.is_paid, vacancy.sent_start_call, vacancy.pre_call_done) == (True, True, True)
+        assert (vacancy.sent_final_call, vacancy.renewal_offered) == (False, False)
+        assert (vacancy.start_call_msg_id, vacancy.final_call_msg_id) == (555, None)
+        assert vacancy.disputed_rollcall == {"reminders_count": 2}
+        assert vacancy.continue_deadline == timezone.make_aware(deadline)
+        untouched.refresh_from_db()
+        assert untouched.extra == {"calls": {}}
+
+    def test_reverse_restores_extra_keys(self, vacancy_factory):
+        vacancy = vacancy_factory(is_paid=True, final_call_msg_id=77, extra={"calls": {}})
+
+        migration.columns_to_extra(apps, None)
+
+        vacancy.refresh_from_db()
+        assert vacancy.extra == {"calls": {}, "is_paid": True, "final_call_msg_id": 77}
+
+
+@pytest.mark.django_db
+class TestSetLifecycle:
+    def test_writes_only_its_columns(self, vacancy_factory):
+        vacancy = vacancy_factory()
+        stale = Vacancy.objects.get(pk=vacancy.pk)
+        vacancy.extra["original_start_datetime"] = "2026-10-18T10:00:00+03:00"
+        vacancy.save(update_fields=["extra"])
+
+        with assert_max_queries(1, "set_lifecycle"):
+            set_lifecycle(stale, pre_call_done=True, start_call_msg_id=10)
+
+        vacancy.refresh_from_db()
+        assert vacancy.pre_call_done is True and vacancy.start_call_msg_id == 10
+        assert "original_start_datetime" in vacancy.extra
+
+    def test_rejects_non_lifecycle_fields(self, vacancy_factory):
+        with pytest.raises(ValueError):
+            set_lifecycle(vacancy_factory(), status=STATUS_SEARCH_STOPPED)
+
+
+@pytest.mark.django_db
+class TestFilters:
+    def test_renewal_candidates(self, vacancy_factory):
+        from vacancy.tasks.call import _renewal_candidates
+
+        due = vacancy_factory(second_rollcall_passed=True, is_paid=True)
+        vacancy_factory(second_rollcall_passed=True, is_paid=False)
+        vacancy_factory(second_rollcall_passed=True, is_paid=True, renewal_offered=True)
+        vacancy_factory(second_rollcall_passed=True, is_paid=True, closed_at=timezone.now())
+
+        assert list(_renewal_candidates()) == [due]
+
+    def test_disputed_filter_follows_mark_and_clear(self, vacancy_factory):
+        vacancy = vacancy_factory(status=STATUS_SEARCH_STOPPED)
+        mark_disputed(vacancy, first_count=2, selected_user_ids=[1], rejected_user_ids=[2], is_full_uncheck=False)
+
+        assert list(Vacancy.objects.filter(disputed_rollcall__isnull=False)) == [vacancy]
+
+        clear_disputed(vacancy)
+
+        assert not Vacancy.objects.filter(disputed_rollcall__isnull=False).exists()
+
+    def test_my_list_keeps_recently_closed_by_column(self, client, employer_factory, vacancy_factory):
+        owner = employer_factory()
+        recent = vacancy_factory(owner=owner, status=STATUS_CLOSED, is_paid=True, closed_at=timezone.now())
+        vacancy_factory(owner=owner, status=STATUS_CLOSED, is_paid=True, closed_at=timezone.now() - timedelta(hours=4))
+        client.force_login(owner)
+
+        response = client.get("/vacancy/my/")
+
+        assert [item["vacancy"] for item in response.context["vacancy_list"]] == [recent]
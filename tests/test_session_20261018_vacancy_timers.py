@@ -0,0 +1,201 @@
+"""Timer-based rollcall dispatch: deadlines armed on approval, popped once when due."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from vacancy.choices import (
+    TIMER_AFTER_FIRST,
+    TIMER_BEFORE_START,
+    TIMER_CLOSE,
+    TIMER_FINAL,
+    TIMER_RENEWAL,
+    TIMER_START,
+)
+from vacancy.models import VacancyTimer
+
+
+def _vacancy_starting_in(vacancy_factory, owner, minutes, hours=4, **kwargs):
+    start = timezone.localtime(timezone.now()) + timedelta(minutes=minutes)
+    return vacancy_factory(
+        owner=owner,
+        status="approved",
+        date=start.date(),
+        start_time=start.time().replace(second=0, microsecond=0),
+        end_time=(start + timedelta(hours=hours)).time().replace(second=0, microsecond=0),
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+class TestScheduleVacancyTimers:
+    def test_approval_arms_all_deadlines(self, employer_factory, vacancy_factory):
+        from vacancy.services.observers.timers_observer import VacancyScheduleTimersObserver
+        from vacancy.tasks.call import _get_end_aware, _get_start_aware
+
+        v = _vacancy_starting_in(vacancy_factory, employer_factory(), minutes=300)
+        VacancyScheduleTimersObserver().update("vacancy_event_approved", {"vacancy": v})
+
+        timers = {t.kind: t.due_at for t in VacancyTimer.objects.filter(vacancy=v)}
+        start, end = _get_start_aware(v), _get_end_aware(v)
+        assert timers == {
+            TIMER_BEFORE_START: start - timedelta(minutes=120),
+            TIMER_AFTER_FIRST: start - timedelta(minutes=100),
+            TIMER_START: start,
+            TIMER_FINAL: end - timedelta(minutes=60),
+            TIMER_CLOSE: end + timedelta(minutes=120),
+        }
+
+    def test_observer_is_subscribed_to_approval(self):
+        from vacancy.services.observers.events import VACANCY_APPROVED
+        from vacancy.services.observers.subscriber_setup import vacancy_publisher
+        from vacancy.services.observers.timers_observer import VacancyScheduleTimersObserver
+
+        subscriptions = vacancy_publisher.subscriptions(VACANCY_APPROVED)
+        assert any(isinstance(s.observer, VacancyScheduleTimersObserver) for s in subscriptions)
+
+    def test_rescheduling_rearms_fired_timer(self, employer_factory, vacancy_factory):
+        from vacancy.services.timers import schedule_vacancy_timers
+
+        v = _vacancy_starting_in(vacancy_factory, employer_factory(), minutes=300)
+        schedule_vacancy_timers(v)
+        VacancyTimer.objects.filter(vacancy=v).update(fired_at=timezone.now())
+
+        schedule_vacancy_timers(v)
+
+        assert VacancyTimer.objects.filter(vacancy=v).count() == 5
+        assert not VacancyTimer.objects.filter(vacancy=v, fired_at__isnull=False).exists()
+
+
+@pytest.mark.django_db
+class TestPopDueTimers:
+    def test_only_due_timers_are_claimed_once(self, employer_factory, vacancy_factory):
+        from vacancy.services.timers import arm_timer, pop_due_timers
+
+        v = _vacancy_starting_in(vacancy_factory, employer_factory(), minutes=300)
+        now = timezone.now()
+        arm_timer(v, TIMER_START, now - timedelta(seconds=1))
+        arm_timer(v, TIMER_FINAL, now + timedelta(hours=1))
+
+        assert [t.kind for t in pop_due_timers(now)] == [TIMER_START]
+        assert pop_due_timers(now) == []
+        assert VacancyTimer.objects.get(vacancy=v, kind=TIMER_FINAL).fired_at is None
+
+
+@pytest.mark.django_db
+class TestDispatchVacancyTimersTask:
+    def test_start_timer_runs_rollcall_and_rearms_reminder(self, employer_factory, vacancy_factory):
+        from vacancy.services.timers import arm_timer
+        from vacancy.tasks.call import _REMINDER_INTERVAL, dispatch_vacancy_timers_task
+
+        v = _vacancy_starting_in(vacancy_factory, employer_factory(), minutes=-1)
+        arm_timer(v, TIMER_START, timezone.now() - timedelta(seconds=5))
+
+        with patch("vacancy.tasks.call.vacancy_publisher.notify") as notify:
+            dispatch_vacancy_timers_task()
+
+        assert notify.call_count == 1
+        v.refresh_from_db()
+        assert v.sent_start_call is True
+        assert v.status == "stopped"
+        timer = VacancyTimer.objects.get(vacancy=v, kind=TIMER_START)
+        assert timer.fired_at is None
+        expected = v.extra["start_call_sent_at"] + _REMINDER_INTERVAL
+        assert abs(timer.due_at.timestamp() - expected) < 1
+
+    def test_start_timer_not_rearmed_after_rollcall_passed(self, employer_factory, vacancy_factory):
+        from vacancy.services.timers import arm_timer
+        from vacancy.tasks.call import dispatch_vacancy_timers_task
+
+        v = _vacancy_starting_in(vacancy_factory, employer_factory(), minutes=-1, first_rollcall_passed=True)
+        arm_timer(v, TIMER_START, timezone.now() - timedelta(seconds=5))
+
+        with patch("vacancy.tasks.call.start_call_check") as start_call_check:
+            dispatch_vacancy_timers_task()
+
+        start_call_check.assert_not_called()
+        assert VacancyTimer.objects.get(vacancy=v, kind=TIMER_START).fired_at is not None
+
+    def test_close_timer_closes_once(self, employer_factory, vacancy_factory):
+        from vacancy.services.timers import arm_timer
+        from vacancy.tasks.call import dispatch_vacancy_timers_task
+
+        v = _vacancy_starting_in(vacancy_factory, employer_factory(), minutes=-1)
+        arm_timer(v, TIMER_CLOSE, timezone.now() - timedelta(seconds=5))
+
+        with patch("vacancy.tasks.call.close_vacancy") as close_vacancy:
+            dispatch_vacancy_timers_task()
+            dispatch_vacancy_timers_task()
+
+        assert close_vacancy.call_count == 1
+
+    def test_failed_handler_rearms_with_backoff(self, employer_factory, vacancy_factory):
+        from vacancy.services.timers import RETRY_DELAY, arm_timer
+        from vacancy.tasks.call import dispatch_vacancy_timers_task
+
+        v = _vacancy_starting_in(vacancy_factory, employer_factory(), minutes=-1)
+        arm_timer(v, TIMER_CLOSE, timezone.now() - timedelta(seconds=5))
+
+        with patch("vacancy.tasks.call.close_vacancy", side_effect=RuntimeError("telegram down")):
+            dispatch_vacancy_timers_task()
+
+        timer = VacancyTimer.objects.get(vacancy=v, kind=TIMER_CLOSE)
+        assert timer.fired_at is None and timer.attempts == 1
+        assert timer.due_at > timezone.now() + RETRY_DELAY - timedelta(seconds=5)
+
+    def test_failed_handler_gives_up_after_max_retries(self, employer_factory, vacancy_factory):
+        from vacancy.services.timers import MAX_RETRIES, arm_timer
+        from vacancy.tasks.call import dispatch_vacancy_timers_task
+
+        v = _vacancy_starting_in(vacancy_factory, employer_factory(), minutes=-1)
+        arm_timer(v, TIMER_CLOSE, timezone.now() - timedelta(seconds=5))
+        VacancyTimer.objects.filter(vacancy=v, kind=TIMER_CLOSE).update(attempts=MAX_RETRIES)
+
+        with patch("vacancy.tasks.call.close_vacancy", side_effect=RuntimeError("telegram down")):
+            dispatch_vacancy_timers_task()
+
+        assert VacancyTimer.objects.get(vacancy=v, kind=TIMER_CLOSE).fired_at is not None
+
+    def test_not_due_timer_is_untouched(self, employer_factory, vacancy_factory):
+        from vacancy.services.timers import schedule_vacancy_timers
+        from vacancy.tasks.call import dispatch_vacancy_timers_task
+
+        v = _vacancy_starting_in(vacancy_factory, employer_factory(), minutes=300)
+        schedule_vacancy_timers(v)
+
+        with patch("vacancy.tasks.call.vacancy_publisher.notify") as notify:
+            dispatch_vacancy_timers_task()
+
+        notify.assert_not_called()
+        assert not VacancyTimer.objects.filter(vacancy=v, fired_at__isnull=False).exists()
+
+    def test_renewal_timer_sends_offer_and_rearms(self, employer_factory, vacancy_factory):
+        from vacancy.services.timers import schedule_renewal_timer
+        from vacancy.tasks.call import dispatch_vacancy_timers_task
+
+        v = _vacancy_starting_in(vacancy_factory, employer_factory(), minutes=-300, second_rollcall_passed=True)
+        v.status = "paid"
+        v.is_paid = True
+        v.save(update_fields=["status", "is_paid"])
+        schedule_renewal_timer(v)
+
+        with patch("vacancy.tasks.call.send_and_track", return_value=42) as send:
+            dispatch_vacancy_timers_task()
+
+        send.assert_called_once()
+        v.refresh_from_db()
+        assert v.extra["renewal_started"] is True
+        timer = VacancyTimer.objects.get(vacancy=v, kind=TIMER_RENEWAL)
+        assert timer.fired_at is None
+        assert timer.due_at > timezone.now() + timedelta(minutes=29)
+
+
+class TestBeatSchedule:
+    def test_check_system_requires_only_scheduled_tasks(self):
+        from config.settings.celery import app
+        from work.management.commands.check_system import REQUIRED_BEAT_TASKS, _check_celery_beat
+
+        assert "dispatch_vacancy_timers_task" in REQUIRED_BEAT_TASKS
+        assert _check_celery_beat().ok, set(REQUIRED_BEAT_TASKS) - set(app.conf.beat_schedule)
@@ -0,0 +1,109 @@
+"""Webhook intake dedupe: seen update_ids in the cache, retries after a failed intake, counters."""
+
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from service.metrics import get_counter, inc, render_prometheus
+from telegram.models import TelegramUpdate
+from telegram.service import updates
+
+
+def _update(update_id, chat_id=555):
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "U"},
+            "text": "hi",
+        },
+    }
+
+
+def _post(client, data):
+    return client.post(
+        reverse("telegram:telegram_webhook"),
+        data=data,
+        content_type="application/json",
+        HTTP_X_TELEGRAM_BOT_API_SECRET_TOKEN=updates.webhook_secret_token(),
+    )
+
+
+def _intake(outcome):
+    return get_counter("telegram_webhook_updates_total", outcome=outcome)
+
+
+@pytest.mark.django_db
+class TestQueuedIntake:
+    @pytest.fixture(autouse=True)
+    def _mode(self, settings):
+        settings.TELEGRAM_WEBHOOK_MODE = updates.MODE_THREAD
+
+    def test_redelivery_is_dropped_before_the_database(self, client):
+        with patch("telegram.service.updates.dispatch_update") as dispatch:
+            _post(client, _update(10))
+            with CaptureQueriesContext(connection) as ctx:
+                assert _post(client, _update(10)).status_code == 200
+
+        assert len(ctx.captured_queries) == 0
+        assert dispatch.call_count == 1
+        assert (_intake("new"), _intake("duplicate")) == (1, 1)
+
+    def test_failed_intake_lets_the_retry_through(self, client):
+        client.raise_request_exception = False
+        with patch("telegram.service.updates.persist_update", side_effect=RuntimeError("db down")):
+            assert _post(client, _update(20)).status_code == 500
+
+        with patch("telegram.service.updates.dispatch_update") as dispatch:
+            assert _post(client, _update(20)).status_code == 200
+
+        dispatch.assert_called_once()
+        assert TelegramUpdate.objects.filter(update_id=20).exists()
+        assert _intake("retry") == 1
+
+    def test_expired_claim_still_deduped_by_the_stored_row(self, client):
+        from django.core.cache import cache
+
+        with patch("telegram.service.updates.dispatch_update") as dispatch:
+            _post(client, _update(30))
+            cache.clear()
+            _post(client, _update(30))
+
+        assert dispatch.call_count == 1
+        assert _intake("duplicate") == 1
+
+
+@pytest.mark.django_db
+class TestInlineIntake:
+    def test_slow_handler_redelivery_runs_once(self, client, settings):
+        from telegram.handlers.bot_instance import bot
+
+        settings.TELEGRAM_WEBHOOK_MODE = updates.MODE_INLINE
+        handled = []
+
+        def slow_handler(batch):
+            handled.append(batch[0].update_id)
+            # Telegram gives up waiting and redelivers while the first delivery is still running.
+            _post(client, _update(40))
+
+        with patch.object(bot, "process_new_updates", side_effect=slow_handler):
+            _post(client, _update(40))
+
+        assert handled == [40]
+        assert _intake("duplicate") == 1
+
+
+class TestCounters:
+    def test_counter_exported_to_prometheus(self):
+        inc("telegram_webhook_updates_total", outcome="new")
+        inc("telegram_webhook_updates_total", 2, outcome="new")
+
+        text = render_prometheus()
+
+        assert "# TYPE telegram_webhook_updates_total counter" in text
+        assert 'telegram_webhook_updates_total{outcome="new"} 3' in text
@@ -0,0 +1,165 @@
+"""Queued webhook mode: persist raw update, answer 200, drain per chat in update_id order."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+
+from telegram.choices import UpdateStatus
+from telegram.models import TelegramUpdate
+from telegram.service import updates
+
+
+def _message_update(update_id, chat_id=555):
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "U"},
+            "text": "hi",
+        },
+    }
+
+
+class TestExtractChatId:
+    def test_message(self):
+        assert updates.extract_chat_id(_message_update(1, chat_id=42)) == 42
+
+    def test_callback_without_message_uses_sender(self):
+        data = {"update_id": 1, "callback_query": {"id": "x", "from": {"id": 7}, "data": "d"}}
+        assert updates.extract_chat_id(data) == 7
+
+    def test_join_request(self):
+        data = {"update_id": 1, "chat_join_request": {"chat": {"id": -100}, "from": {"id": 7}}}
+        assert updates.extract_chat_id(data) == -100
+
+
+@pytest.mark.django_db
+class TestQueuedWebhookView:
+    def _post(self, client, data, token=None):
+        headers = {"HTTP_X_TELEGRAM_BOT_API_SECRET_TOKEN": token} if token else {}
+        return client.post(reverse("telegram:telegram_webhook"), data=data, content_type="application/json", **headers)
+
+    def test_update_is_stored_and_dispatched_once(self, client, settings):
+        settings.TELEGRAM_WEBHOOK_MODE = updates.MODE_THREAD
+        token = updates.webhook_secret_token()
+
+        with patch("telegram.service.updates.dispatch_update") as dispatch:
+            first = self._post(client, _message_update(10), token)
+            duplicate = self._post(client, _message_update(10), token)
+
+        assert first.status_code == duplicate.status_code == 200
+        assert dispatch.call_count == 1
+        row = TelegramUpdate.objects.get(update_id=10)
+        assert (row.chat_id, row.status) == (555, UpdateStatus.RECEIVED)
+
+    @pytest.mark.parametrize("body", [{"message": {}}, [1, 2], "text", {"update_id": "7"}])
+    def test_payload_without_update_id_is_acknowledged(self, client, settings, body):
+        settings.TELEGRAM_WEBHOOK_MODE = updates.MODE_THREAD
+
+        with patch("telegram.service.updates.dispatch_update") as dispatch:
+            response = self._post(client, body, updates.webhook_secret_token())
+
+        assert response.status_code == 200
+        dispatch.assert_not_called()
+        assert not TelegramUpdate.objects.exists()
+
+    def test_queued_mode_requires_secret_token(self, client, settings):
+        settings.TELEGRAM_WEBHOOK_MODE = updates.MODE_THREAD
+
+        response = self._post(client, _message_update(11))
+
+        assert response.status_code == 403
+        assert not TelegramUpdate.objects.exists()
+
+    def test_wrong_secret_token_rejected_in_inline_mode(self, client, settings):
+        settings.TELEGRAM_WEBHOOK_MODE = updates.MODE_INLINE
+
+        response = self._post(client, _message_update(12), token="wrong")
+
+        assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestDrainChatUpdates:
+    def test_updates_processed_in_order(self):
+        from telegram.handlers.bot_instance import bot
+
+        for update_id in (30, 10, 20):
+            updates.persist_update(_message_update(update_id))
+        updates.persist_update(_message_update(15, chat_id=999))
+
+        seen = []
+        with (
+            patch.object(bot, "threaded", True),
+            patch.object(bot, "process_new_updates", side_effect=lambda u: seen.append(u[0].update_id)),
+        ):
+            processed = updates.drain_chat_updates(555)
+
+        assert processed == 3
+        assert seen == [10, 20, 30]
+        assert TelegramUpdate.objects.filter(chat_id=555, status=UpdateStatus.DONE).count() == 3
+        assert TelegramUpdate.objects.get(update_id=15).status == UpdateStatus.RECEIVED
+
+    def test_failed_handler_does_not_block_chat(self):
+        from telegram.handlers.bot_instance import bot
+
+        updates.persist_update(_message_update(1))
+        updates.persist_update(_message_update(2))
+
+        with (
+            patch.object(bot, "threaded", True),
+            patch.object(bot, "process_new_updates", side_effect=[RuntimeError("boom"), None]),
+        ):
+            updates.drain_chat_updates(555)
+
+        statuses = dict(TelegramUpdate.objects.values_list("update_id", "status"))
+        assert statuses == {1: UpdateStatus.FAILED, 2: UpdateStatus.DONE}
+
+    def test_locked_chat_is_left_to_the_lock_holder(self):
+        updates.persist_update(_message_update(1))
+        cache.add("tg_updates_chat_lock:555", True)
+        try:
+            assert updates.drain_chat_updates(555) == 0
+        finally:
+            cache.delete("tg_updates_chat_lock:555")
+        assert TelegramUpdate.objects.get(update_id=1).status == UpdateStatus.RECEIVED
+
+
+@pytest.mark.django_db
+class TestPurgeProcessedUpdates:
+    def test_expired_processed_rows_are_deleted(self):
+        now = timezone.now()
+        rows = {
+            "old_done": (UpdateStatus.DONE, now - updates.DONE_RETENTION - timedelta(minutes=1)),
+            "fresh_done": (UpdateStatus.DONE, now - timedelta(minutes=5)),
+            "old_failed": (UpdateStatus.FAILED, now - updates.FAILED_RETENTION - timedelta(minutes=1)),
+            "recent_failed": (UpdateStatus.FAILED, now - updates.DONE_RETENTION - timedelta(minutes=1)),
+            "pending": (UpdateStatus.RECEIVED, None),
+        }
+        for update_id, (name, (status, processed_at)) in enumerate(rows.items(), start=1):
+            row = updates.persist_update(_message_update(update_id))
+            TelegramUpdate.objects.filter(pk=row.pk).update(status=status, processed_at=processed_at)
+            rows[name] = update_id
+
+        assert updates.purge_processed_updates() == 2
+
+        kept = set(TelegramUpdate.objects.values_list("update_id", flat=True))
+        assert kept == {rows["fresh_done"], rows["recent_failed"], rows["pending"]}
+
+    def test_drain_task_purges(self):
+        from telegram.tasks import drain_stale_telegram_updates_task
+
+        row = updates.persist_update(_message_update(1))
+        TelegramUpdate.objects.filter(pk=row.pk).update(
+            status=UpdateStatus.DONE, processed_at=timezone.now() - updates.DONE_RETENTION - timedelta(minutes=1)
+        )
+
+        drain_stale_telegram_updates_task()
+
+        assert not TelegramUpdate.objects.exists()
@@ -9,6 +9,7 @@ from django.utils import timezone
 from user.tasks import (
     cleanup_inactive_users_task,
     cleanup_unregistered_users_task,
+    probe_telegram_accounts_task,
 )
 
 
@@ -143,7 +144,7 @@ class TestCleanupDeletedTelegramAccount:
         from user.models import User
 
         WorkerFactory(id=900000030, telegram_id=900000030, username="deletedtg")
-        cleanup_inactive_users_task()
+        probe_telegram_accounts_task()
         assert not User.objects.filter(id=900000030).exists()
 
     @patch("user.tasks.check_telegram_deleted", return_value=False)
@@ -152,7 +153,7 @@ class TestCleanupDeletedTelegramAccount:
         from user.models import User
 
         WorkerFactory(id=900000031, telegram_id=900000031, username="activetg")
-        cleanup_inactive_users_task()
+        probe_telegram_accounts_task()
         assert User.objects.filter(id=900000031).exists()
 
 
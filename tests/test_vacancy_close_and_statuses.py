@@ -96,11 +96,11 @@ def test_stop_search_sets_stopped(vacancy_factory, channel_factory, group_factor
 def test_paid_status_transition(vacancy_factory):
     vacancy = vacancy_factory(status="closed")
     vacancy.status = "paid"
-    vacancy.extra["is_paid"] = True
+    vacancy.is_paid = True
     vacancy.save()
     vacancy.refresh_from_db()
     assert vacancy.status == "paid"
-    assert vacancy.extra["is_paid"] is True
+    assert vacancy.is_paid is True
 
 
 @pytest.mark.django_db
@@ -129,9 +129,9 @@ class CityFilter(admin.SimpleListFilter):
     parameter_name = "city"
 
     def lookups(self, request, model_admin):
-        from city.models import City
+        from work.service.reference_data import city_choices
 
-        return [(c.pk, c.safe_translation_getter("name", any_language=True)) for c in City.objects.all()]
+        return city_choices()
 
     def queryset(self, request, queryset):
         if self.value():
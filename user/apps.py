@@ -8,3 +8,4 @@ class UserConfig(AppConfig):
 
     def ready(self):
         import user.admin_site  # noqa: F401
+        import user.signals  # noqa: F401
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_rating_stats(apps, schema_editor):
+    UserFeedback = apps.get_model('user', 'UserFeedback')
+    UserRatingStats = apps.get_model('user', 'UserRatingStats')
+
+    rows = (
+        UserFeedback.objects.filter(rating__in=['like', 'dislike'])
+        .values('user_id')
+        .annotate(likes=Count('id', filter=Q(rating='like')), dislikes=Count('id', filter=Q(rating='dislike')))
+    )
+    UserRatingStats.objects.bulk_create(
+        [UserRatingStats(user_id=r['user_id'], likes=r['likes'], dislikes=r['dislikes']) for r in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0020_workervoluntaryexit'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserRatingStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_stats', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='User')),
+                ('likes', models.PositiveIntegerField(default=0, verbose_name='Лайки')),
+                ('dislikes', models.PositiveIntegerField(default=0, verbose_name='Дизлайки')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Статистика рейтингу',
+                'verbose_name_plural': 'Статистика рейтингу',
+            },
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
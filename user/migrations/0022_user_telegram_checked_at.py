@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0021_userratingstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='telegram_checked_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='Telegram account checked at'),
+        ),
+    ]
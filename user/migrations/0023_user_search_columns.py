@@ -0,0 +1,68 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:52
+
+import re
+
+from django.db import migrations, models
+
+TRGM_INDEXES = {
+    "user_search_text_trgm": "search_text",
+    "user_phone_digits_trgm": "phone_digits",
+}
+
+
+def backfill_search_columns(apps, schema_editor):
+    User = apps.get_model('user', 'User')
+
+    def digits(value):
+        return re.sub(r"\D+", "", value or "")
+
+    batch = []
+    for user in User.objects.only('id', 'full_name', 'username', 'phone_number', 'contact_phone').iterator(
+        chunk_size=2000
+    ):
+        text = " ".join(part for part in (user.full_name, user.username) if part)
+        user.search_text = re.sub(r"\s+", " ", text.lower()).strip()
+        user.phone_digits = " ".join(d for d in (digits(user.phone_number), digits(user.contact_phone)) if d)
+        batch.append(user)
+        if len(batch) >= 2000:
+            User.objects.bulk_update(batch, ['search_text', 'phone_digits'])
+            batch = []
+    if batch:
+        User.objects.bulk_update(batch, ['search_text', 'phone_digits'])
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in TRGM_INDEXES.items():
+        schema_editor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON "user" USING gin ({column} gin_trgm_ops)')
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in TRGM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0022_user_telegram_checked_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='phone_digits',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(backfill_search_columns, migrations.RunPython.noop),
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0023_user_search_columns'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userblock',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['user'], name='user_block_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userfeedback',
+            index=models.Index(fields=['user', 'rating'], name='user_feedback_user_rating_idx'),
+        ),
+    ]
@@ -36,11 +36,21 @@ class User(AbstractUser):
         verbose_name=_("Language"),
     )
     gender = models.CharField(choices=USER_GENDER_CHOICES, blank=True, null=True, verbose_name=_("Gender"))
+    telegram_checked_at = models.DateTimeField(
+        null=True, blank=True, db_index=True, verbose_name=_("Telegram account checked at")
+    )
+    # Also bumped by save(update_fields=...) that touches SEARCH_SOURCE_FIELDS.
+    updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Updated at"))
+    # Normalized copies for admin search (user/search.py), refreshed in save().
+    search_text = models.TextField(blank=True, default="", editable=False)
+    phone_digits = models.CharField(max_length=64, blank=True, default="", editable=False)
     USERNAME_FIELD = "id"
     REQUIRED_FIELDS = []
 
     objects = CustomUserManager()
 
+    SEARCH_SOURCE_FIELDS = frozenset({"full_name", "username", "phone_number", "contact_phone"})
+
     class Meta:
         db_table = "user"
         verbose_name = _("User")
@@ -49,6 +59,16 @@ class User(AbstractUser):
     def __str__(self) -> str:
         return f"User: {self.pk} {self.username}"
 
+    def save(self, *args, **kwargs):
+        from user.search import build_phone_digits, build_search_text
+
+        self.search_text = build_search_text(self)
+        self.phone_digits = build_phone_digits(self)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and self.SEARCH_SOURCE_FIELDS.intersection(update_fields):
+            kwargs["update_fields"] = {*update_fields, "search_text", "phone_digits", "updated_at"}
+        super().save(*args, **kwargs)
+
 
 class AuthIdentity(models.Model):
     class Provider(models.TextChoices):
@@ -111,6 +131,9 @@ class UserBlock(models.Model):
         verbose_name = _("Блокування користувача")
         verbose_name_plural = _("Блокування користувачів")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["user"], condition=models.Q(is_active=True), name="user_block_active_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user} — {self.block_type} ({self.reason})"
@@ -150,6 +173,9 @@ class UserFeedback(models.Model):
     class Meta:
         verbose_name = _("User feedback")
         verbose_name_plural = _("User feedbacks")
+        indexes = [
+            models.Index(fields=["user", "rating"], name="user_feedback_user_rating_idx"),
+        ]
 
     def __str__(self):
         return f"{self.owner} → {self.user} ({self.rating})"
@@ -180,3 +206,25 @@ class WorkerVoluntaryExit(models.Model):
 
     def __str__(self):
         return f"{self.user} — {self.created_at}"
+
+
+class UserRatingStats(models.Model):
+    """Лічильники лайків/дизлайків користувача, оновлюються сигналами UserFeedback."""
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="rating_stats",
+        verbose_name=_("User"),
+    )
+    likes = models.PositiveIntegerField(default=0, verbose_name="Лайки")
+    dislikes = models.PositiveIntegerField(default=0, verbose_name="Дизлайки")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Статистика рейтингу"
+        verbose_name_plural = "Статистика рейтингу"
+
+    def __str__(self) -> str:
+        return f"{self.user}: +{self.likes} / -{self.dislikes}"
@@ -1,26 +1,157 @@
-def bayesian_rating(likes: int, dislikes: int) -> int:
+"""
+User rating: Bayesian average over per-user like/dislike counters.
+
+Counters live in UserRatingStats and are kept up to date by the UserFeedback
+signals (user/signals.py). The platform parameters — threshold C and mean like
+ratio m — are cached and refreshed by refresh_rating_params_task, so scoring a
+list of users costs one query.
+
+Bulk deletes that recount afterwards run under rating_signals_muted(), so
+the per-row signals do not shift counters that are rebuilt anyway.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db.models import F, Sum
+from django.db.models.functions import Greatest
+
+PLATFORM_PARAMS_CACHE_KEY = "rating_platform_params"
+PLATFORM_PARAMS_TTL = 15 * 60
+DEFAULT_MEAN = 0.5
+
+_signals_muted: ContextVar[bool] = ContextVar("rating_signals_muted", default=False)
+
+
+@dataclass(frozen=True)
+class UserRating:
+    likes: int = 0
+    dislikes: int = 0
+    percent: int = 0
+
+
+def compute_platform_params() -> tuple[int, float]:
+    """(C, m) straight from the DB: admin threshold and platform-wide like ratio."""
+    from user.models import UserRatingStats
+    from work.models import RatingConfig
+
+    totals = UserRatingStats.objects.aggregate(likes=Sum("likes"), dislikes=Sum("dislikes"))
+    total_likes = totals["likes"] or 0
+    total_all = total_likes + (totals["dislikes"] or 0)
+    m = total_likes / total_all if total_all > 0 else DEFAULT_MEAN
+    return RatingConfig.get_threshold(), m
+
+
+def refresh_platform_params() -> tuple[int, float]:
+    params = compute_platform_params()
+    cache.set(PLATFORM_PARAMS_CACHE_KEY, params, PLATFORM_PARAMS_TTL)
+    return params
+
+
+def get_platform_params() -> tuple[int, float]:
+    params = cache.get(PLATFORM_PARAMS_CACHE_KEY)
+    if params is None:
+        params = refresh_platform_params()
+    return params
+
+
+def invalidate_platform_params() -> None:
+    cache.delete(PLATFORM_PARAMS_CACHE_KEY)
+
+
+def bayesian_rating(likes: int, dislikes: int, params: tuple[int, float] | None = None) -> int:
     """
     Bayesian average rating as integer percent (0-100).
 
     Formula: (C * m + likes) / (C + total) * 100
     C = rating_threshold from RatingConfig (admin-editable, default 5)
-    m = platform-wide average like ratio (computed dynamically)
+    m = platform-wide average like ratio (cached, see get_platform_params)
     """
-    from user.models import UserFeedback
-    from work.models import RatingConfig
-
-    C = RatingConfig.get_threshold()
-
-    # Platform-wide average
-    from django.db.models import Q
-
-    agg = UserFeedback.objects.filter(Q(rating="like") | Q(rating="dislike")).values_list("rating", flat=True)
-    total_likes = sum(1 for r in agg if r == "like")
-    total_all = len(agg)
-    m = total_likes / total_all if total_all > 0 else 0.5
+    C, m = params if params is not None else get_platform_params()
 
     total = likes + dislikes
     if total == 0 and C == 0:
         return 0
     score = (C * m + likes) / (C + total)
     return round(score * 100)
+
+
+def rating_stats_for(user_ids) -> dict[int, UserRating]:
+    """Counters and score for every user id, in one query. Users without feedback get the prior."""
+    from user.models import UserRatingStats
+
+    user_ids = set(user_ids)
+    params = get_platform_params()
+    counts = {
+        user_id: (likes, dislikes)
+        for user_id, likes, dislikes in UserRatingStats.objects.filter(user_id__in=user_ids).values_list(
+            "user_id", "likes", "dislikes"
+        )
+    }
+    result = {}
+    for user_id in user_ids:
+        likes, dislikes = counts.get(user_id, (0, 0))
+        result[user_id] = UserRating(likes, dislikes, bayesian_rating(likes, dislikes, params))
+    return result
+
+
+def ratings_for(user_ids) -> dict[int, int]:
+    """Rating percent by user id, in one query."""
+    return {user_id: stats.percent for user_id, stats in rating_stats_for(user_ids).items()}
+
+
+@contextmanager
+def rating_signals_muted():
+    """Skip the per-row counter updates of the UserFeedback signals; the caller recounts."""
+    token = _signals_muted.set(True)
+    try:
+        yield
+    finally:
+        _signals_muted.reset(token)
+
+
+def rating_signals_active() -> bool:
+    return not _signals_muted.get()
+
+
+def apply_rating_delta(user_id: int, likes: int = 0, dislikes: int = 0, create: bool = False) -> None:
+    """Shift a user's counters. Rows are only created for increments (a cascading user delete must not recreate them)."""
+    from user.models import UserRatingStats
+
+    if not likes and not dislikes:
+        return
+    if create:
+        UserRatingStats.objects.get_or_create(user_id=user_id)
+    UserRatingStats.objects.filter(user_id=user_id).update(
+        likes=Greatest(F("likes") + likes, 0),
+        dislikes=Greatest(F("dislikes") + dislikes, 0),
+    )
+
+
+def recount_rating_stats(user_ids=None) -> int:
+    """Rebuild counters from UserFeedback (all users, or the given ones). Returns rows written."""
+    from django.db.models import Count, Q
+
+    from user.models import UserFeedback, UserRatingStats
+
+    feedback = UserFeedback.objects.filter(rating__in=["like", "dislike"])
+    stats = UserRatingStats.objects.all()
+    if user_ids is not None:
+        feedback = feedback.filter(user_id__in=user_ids)
+        stats = stats.filter(user_id__in=user_ids)
+    rows = feedback.values("user_id").annotate(
+        likes=Count("id", filter=Q(rating="like")),
+        dislikes=Count("id", filter=Q(rating="dislike")),
+    )
+    objs = [UserRatingStats(user_id=r["user_id"], likes=r["likes"], dislikes=r["dislikes"]) for r in rows]
+    stats.exclude(user_id__in=[o.user_id for o in objs]).delete()
+    UserRatingStats.objects.bulk_create(
+        objs,
+        update_conflicts=True,
+        unique_fields=["user"],
+        update_fields=["likes", "dislikes"],
+        batch_size=1000,
+    )
+    return len(objs)
@@ -0,0 +1,80 @@
+"""Admin-panel user search over normalized columns.
+
+User.save() keeps `search_text` (lower-cased name and username) and
+`phone_digits` (digits of both phone fields) current, so lookups are plain
+LIKE '%…%' on pre-lowered text. On Postgres both columns carry pg_trgm GIN
+indexes (user/migrations/0023), which serve those LIKE patterns; icontains
+would wrap the column in UPPER() and bypass them. Trigrams cannot serve a
+pattern shorter than three characters, so a short phone fragment falls back
+to a scan.
+"""
+
+import re
+
+from django.db.models import Case, IntegerField, OuterRef, Q, QuerySet, Subquery, Value, When
+
+MIN_PHONE_DIGITS = 3
+
+_NON_DIGITS = re.compile(r"\D+")
+_SPACES = re.compile(r"\s+")
+_PHONE_LIKE = re.compile(r"[\d\s()+\-.]+")
+
+
+def normalize_text(value: str | None) -> str:
+    return _SPACES.sub(" ", (value or "").lower()).strip()
+
+
+def digits_only(value: str | None) -> str:
+    return _NON_DIGITS.sub("", value or "")
+
+
+def build_search_text(user) -> str:
+    return normalize_text(" ".join(part for part in (user.full_name, user.username) if part))
+
+
+def build_phone_digits(user) -> str:
+    return " ".join(d for d in (digits_only(user.phone_number), digits_only(user.contact_phone)) if d)
+
+
+def with_active_block(qs: QuerySet) -> QuerySet:
+    """Annotate active_block_id / active_block_type of the newest active UserBlock."""
+    from user.models import UserBlock
+
+    newest = UserBlock.objects.filter(user=OuterRef("pk"), is_active=True).order_by("-created_at")
+    return qs.annotate(
+        active_block_id=Subquery(newest.values("pk")[:1]),
+        active_block_type=Subquery(newest.values("block_type")[:1]),
+    )
+
+
+def search_users(qs: QuerySet, query: str) -> QuerySet:
+    """Filter `qs` by `query` and annotate `search_rank` (lower is better).
+
+    Every word must occur in the name/username text; a query with at least
+    MIN_PHONE_DIGITS digits, or a shorter one made only of phone characters,
+    also matches phone numbers however they were typed, and an all-digit query
+    matches the user id. Rank: exact id, then matches at
+    a word start, then the rest.
+    """
+    text = normalize_text(query)
+    if not text:
+        return qs.annotate(search_rank=Value(2, output_field=IntegerField()))
+
+    words = text.split(" ")
+    text_match = Q()
+    for word in words:
+        text_match &= Q(search_text__contains=word)
+    matches = text_match
+    prefix = Q(search_text__startswith=words[0]) | Q(search_text__contains=f" {words[0]}")
+
+    digits = digits_only(query)
+    if len(digits) >= MIN_PHONE_DIGITS or (digits and _PHONE_LIKE.fullmatch(text)):
+        matches |= Q(phone_digits__contains=digits)
+        prefix |= Q(phone_digits__startswith=digits) | Q(phone_digits__contains=f" {digits}")
+
+    rank_cases = [When(prefix, then=Value(1))]
+    if text.isdigit():
+        matches |= Q(pk=int(text))
+        rank_cases.insert(0, When(pk=int(text), then=Value(0)))
+
+    return qs.filter(matches).annotate(search_rank=Case(*rank_cases, default=Value(2), output_field=IntegerField()))
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
+from datetime import datetime
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import models, transaction
+from django.utils import timezone
 
+from service.db_routing import primary_reads
 from user.choices import BlockReason, BlockType
 from user.models import AuthIdentity, UserBlock
 
@@ -58,35 +63,125 @@ def get_or_create_user_from_telegram(
     return user, created
 
 
+BLOCK_STATUS_CACHE_KEY = "user_block_status:{user_id}"
+BLOCK_STATUS_TTL = 60
+
+
+@dataclass(frozen=True)
+class BlockStatus:
+    """Compact cached view of a user's active blocks."""
+
+    permanent: bool = False
+    temporary: bool = False
+    reason: str | None = None
+    # Latest expiry among temporary blocks; None means open-ended (or no temporary block).
+    blocked_until: datetime | None = None
+
+    def is_temporary_active(self, now: datetime) -> bool:
+        return self.temporary and (self.blocked_until is None or self.blocked_until > now)
+
+
+NOT_BLOCKED = BlockStatus()
+
+
 class BlockService:
     @staticmethod
-    def is_blocked(user) -> bool:
-        from user.models import UserBlock
-
+    def _active_rows(user_ids):
+        now = timezone.now()
         return (
-            UserBlock.objects.filter(
-                user=user,
-                is_active=True,
-            )
-            .filter(models.Q(block_type=BlockType.PERMANENT) | models.Q(block_type=BlockType.TEMPORARY))
-            .exists()
+            UserBlock.objects.filter(user_id__in=user_ids, is_active=True)
+            .filter(models.Q(blocked_until__isnull=True) | models.Q(blocked_until__gt=now))
+            .order_by("-created_at")
+            .values_list("user_id", "block_type", "reason", "blocked_until")
         )
 
     @staticmethod
-    def is_permanently_blocked(user) -> bool:
-        from user.models import UserBlock
+    def _status_from_rows(rows) -> BlockStatus:
+        """rows: (block_type, reason, blocked_until), newest first."""
+        if not rows:
+            return NOT_BLOCKED
+        temporary = [r for r in rows if r[0] == BlockType.TEMPORARY]
+        until = None
+        if temporary and all(r[2] is not None for r in temporary):
+            until = max(r[2] for r in temporary)
+        permanent = next((r for r in rows if r[0] == BlockType.PERMANENT), None)
+        return BlockStatus(
+            permanent=permanent is not None,
+            temporary=bool(temporary),
+            reason=(permanent or rows[0])[1],
+            blocked_until=until,
+        )
 
-        return UserBlock.objects.filter(user=user, is_active=True, block_type=BlockType.PERMANENT).exists()
+    @staticmethod
+    def _load_status(user_id: int) -> BlockStatus:
+        return BlockService._status_from_rows([row[1:] for row in BlockService._active_rows([user_id])])
 
     @staticmethod
-    def is_temporarily_blocked(user) -> bool:
-        from user.models import UserBlock
+    def _cache_timeout(status: BlockStatus) -> int:
+        if status.blocked_until is None or status.permanent:
+            return BLOCK_STATUS_TTL
+        remaining = (status.blocked_until - timezone.now()).total_seconds()
+        return max(1, min(BLOCK_STATUS_TTL, int(remaining) + 1))
 
-        return UserBlock.objects.filter(
-            user=user,
-            is_active=True,
-            block_type=BlockType.TEMPORARY,
-        ).exists()
+    @staticmethod
+    def get_status(user) -> BlockStatus:
+        """Active block status, cached per user until invalidated or the temporary block runs out."""
+        key = BLOCK_STATUS_CACHE_KEY.format(user_id=user.pk)
+        status = cache.get(key)
+        if status is None:
+            with primary_reads():
+                status = BlockService._load_status(user.pk)
+            cache.set(key, status, BlockService._cache_timeout(status))
+        return status
+
+    @staticmethod
+    def get_statuses(user_ids) -> dict[int, BlockStatus]:
+        """get_status() for many users: cached entries first, one query for the rest."""
+        user_ids = set(user_ids)
+        keys = {BLOCK_STATUS_CACHE_KEY.format(user_id=user_id): user_id for user_id in user_ids}
+        statuses = {keys[key]: status for key, status in cache.get_many(list(keys)).items()}
+        missing = user_ids - set(statuses)
+        if missing:
+            rows: dict[int, list] = {user_id: [] for user_id in missing}
+            with primary_reads():
+                active_rows = list(BlockService._active_rows(missing))
+            for user_id, *row in active_rows:
+                rows[user_id].append(row)
+            for user_id, user_rows in rows.items():
+                status = BlockService._status_from_rows(user_rows)
+                cache.set(BLOCK_STATUS_CACHE_KEY.format(user_id=user_id), status, BlockService._cache_timeout(status))
+                statuses[user_id] = status
+        return statuses
+
+    @staticmethod
+    def blocked_user_ids(user_ids) -> set[int]:
+        now = timezone.now()
+        return {
+            user_id
+            for user_id, status in BlockService.get_statuses(user_ids).items()
+            if status.permanent or status.is_temporary_active(now)
+        }
+
+    @staticmethod
+    def invalidate(user_id: int) -> None:
+        cache.delete(BLOCK_STATUS_CACHE_KEY.format(user_id=user_id))
+
+    @staticmethod
+    def invalidate_many(user_ids) -> None:
+        cache.delete_many([BLOCK_STATUS_CACHE_KEY.format(user_id=user_id) for user_id in user_ids])
+
+    @staticmethod
+    def is_blocked(user) -> bool:
+        status = BlockService.get_status(user)
+        return status.permanent or status.is_temporary_active(timezone.now())
+
+    @staticmethod
+    def is_permanently_blocked(user) -> bool:
+        return BlockService.get_status(user).permanent
+
+    @staticmethod
+    def is_temporarily_blocked(user) -> bool:
+        return BlockService.get_status(user).is_temporary_active(timezone.now())
 
     @staticmethod
     def get_active_block(user) -> UserBlock | None:
@@ -147,6 +242,36 @@ class BlockService:
             blocked_by=blocked_by,
         )
 
+    @staticmethod
+    def auto_block_rollcall_reject_many(user_ids, blocked_by=None) -> list[int]:
+        """auto_block_rollcall_reject() for many users in one INSERT; returns the newly blocked ids."""
+        user_ids = {int(x) for x in user_ids}
+        already = set(
+            UserBlock.objects.filter(
+                user_id__in=user_ids, is_active=True, reason=BlockReason.ROLLCALL_REJECT
+            ).values_list("user_id", flat=True)
+        )
+        new_ids = sorted(user_ids - already)
+        UserBlock.objects.bulk_create(
+            [
+                UserBlock(
+                    user_id=user_id,
+                    block_type=BlockType.TEMPORARY,
+                    reason=BlockReason.ROLLCALL_REJECT,
+                    blocked_by=blocked_by,
+                )
+                for user_id in new_ids
+            ]
+        )
+        # bulk_create skips post_save, which normally drops the cached status
+        BlockService.invalidate_many(new_ids)
+        if new_ids:
+            logger.info(
+                "block_created",
+                extra={"user_ids": new_ids, "block_type": BlockType.TEMPORARY, "reason": BlockReason.ROLLCALL_REJECT},
+            )
+        return new_ids
+
     @staticmethod
     def auto_block_employer_unpaid(user) -> UserBlock:
         existing = UserBlock.objects.filter(user=user, is_active=True, reason=BlockReason.UNPAID).first()
@@ -176,6 +301,7 @@ class BlockService:
         qs = UserBlock.objects.filter(user=user, is_active=True)
         had_permanent = qs.filter(block_type=BlockType.PERMANENT).exists()
         count = qs.update(is_active=False)
+        BlockService.invalidate(user.pk)
         if had_permanent:
             user.is_active = True
             user.save(update_fields=["is_active"])
@@ -221,16 +347,18 @@ def admin_mark_vacancies_paid(user, admin_user=None):
     """Mark all awaiting-payment vacancies as paid, unblock employer, notify."""
     from vacancy.choices import STATUS_AWAITING_PAYMENT, STATUS_PAID
     from vacancy.models import Vacancy
+    from vacancy.services.timers import schedule_renewal_timer
 
     paid_count = 0
     unpaid_vacancies = Vacancy.objects.filter(owner=user, status=STATUS_AWAITING_PAYMENT)
     for vac in unpaid_vacancies:
-        vac.extra["is_paid"] = True
+        vac.is_paid = True
         vac.extra["admin_marked_paid"] = True
         if admin_user:
             vac.extra["admin_marked_paid_by"] = admin_user.id
         vac.status = STATUS_PAID
-        vac.save(update_fields=["status", "extra"])
+        vac.save(update_fields=["status", "is_paid", "extra"])
+        schedule_renewal_timer(vac)
         logger.info(
             "vacancy_admin_marked_paid",
             extra={
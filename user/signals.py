@@ -0,0 +1,61 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from user.models import User, UserBlock, UserFeedback
+from user.rating import apply_rating_delta, rating_signals_active
+
+
+def _delta(rating: str, sign: int) -> tuple[int, int]:
+    return (sign if rating == "like" else 0, sign if rating == "dislike" else 0)
+
+
+@receiver(pre_save, sender=UserFeedback)
+def remember_previous_rating(sender, instance: UserFeedback, raw=False, **kwargs):
+    """Keep the stored rating/recipient so post_save can apply only the difference."""
+    instance._previous_rating = None
+    if raw or instance.pk is None:
+        return
+    instance._previous_rating = UserFeedback.objects.filter(pk=instance.pk).values_list("user_id", "rating").first()
+
+
+@receiver(post_save, sender=UserFeedback)
+def count_feedback_rating(sender, instance: UserFeedback, created: bool, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_previous_rating", None)
+    if previous is not None:
+        if previous == (instance.user_id, instance.rating):
+            return
+        apply_rating_delta(previous[0], *_delta(previous[1], -1))
+    apply_rating_delta(instance.user_id, *_delta(instance.rating, 1), create=True)
+
+
+@receiver(post_delete, sender=UserFeedback)
+def uncount_feedback_rating(sender, instance: UserFeedback, **kwargs):
+    if not rating_signals_active():
+        return
+    apply_rating_delta(instance.user_id, *_delta(instance.rating, -1))
+
+
+@receiver(post_save, sender=UserBlock)
+@receiver(post_delete, sender=UserBlock)
+def invalidate_block_status(sender, instance: UserBlock, **kwargs):
+    from user.services import BlockService
+
+    BlockService.invalidate(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+def sync_admin_recipients(sender, instance: User, raw=False, **kwargs):
+    if raw:
+        return
+    from service.admin_notifications import sync_admin_ids
+
+    sync_admin_ids(instance.pk, instance.is_staff)
+
+
+@receiver(post_delete, sender=User)
+def drop_admin_recipient(sender, instance: User, **kwargs):
+    from service.admin_notifications import sync_admin_ids
+
+    sync_admin_ids(instance.pk, False)
@@ -3,20 +3,31 @@ import time
 from datetime import timedelta
 
 from celery import shared_task
-from django.db.models import Max
+from django.core.cache import cache
+from django.db.models import F, Max, Q
 from django.utils import timezone
+from telebot.apihelper import ApiTelegramException
 
+from service.telegram_outbound import TokenBucket
 from telegram.handlers.bot_instance import bot
 
 logger = logging.getLogger(__name__)
 
 INACTIVE_DAYS = 180
 UNREGISTERED_DAYS = 1
-TELEGRAM_API_DELAY = 0.05
+DELETE_CHUNK_SIZE = 500
+
+# Deleted-account sweep: each account is re-probed at most every PROBE_INTERVAL_DAYS.
+PROBE_INTERVAL_DAYS = 7
+PROBE_BATCH_SIZE = 500
+PROBE_RATE = 10  # get_chat calls per second
+PROBE_TIME_BUDGET = 5 * 60
+PROBE_FLUSH_SIZE = 50
+PROBE_LOCK_KEY = "probe_telegram_accounts_lock"
 
 
 def check_telegram_deleted(telegram_id: int) -> bool:
-    """Check if Telegram account is deleted. Returns True if deleted."""
+    """Check if Telegram account is deleted. Returns True if deleted; re-raises 429 (flood control)."""
     try:
         chat = bot.get_chat(telegram_id)
         first_name = getattr(chat, "first_name", "") or ""
@@ -24,98 +35,148 @@ def check_telegram_deleted(telegram_id: int) -> bool:
         if not first_name or first_name in ["deleted account", "deleted"]:
             return True
         return False
+    except ApiTelegramException as e:
+        if e.error_code == 429:
+            raise
+        return True
     except Exception:
         return True
 
 
-def get_last_worker_activity_date(user):
-    """Get worker's last vacancy participation date."""
-    from vacancy.models import VacancyUser
-
-    result = VacancyUser.objects.filter(user=user).aggregate(last=Max("created_at"))
-    last_date = result.get("last")
+def inactive_user_ids(cutoff) -> list[int]:
+    """Workers/employers whose last activity is older than `cutoff`, from one grouped query.
 
-    if not last_date:
-        last_date = user.date_joined
-
-    return last_date
+    Worker activity is the latest VacancyUser.created_at, employer activity the
+    latest Vacancy.date; users with neither fall back to date_joined.
+    """
+    from user.models import User
+    from work.choices import WorkProfileRole
 
+    never_active = Q(date_joined__lt=cutoff)
+    worker_idle = Q(work_profile__role=WorkProfileRole.WORKER) & (
+        Q(last_joined__lt=cutoff) | Q(last_joined__isnull=True) & never_active
+    )
+    employer_idle = Q(work_profile__role=WorkProfileRole.EMPLOYER) & (
+        Q(last_vacancy_date__lt=timezone.localdate(cutoff)) | Q(last_vacancy_date__isnull=True) & never_active
+    )
+    return list(
+        User.objects.filter(
+            is_staff=False,
+            is_superuser=False,
+            work_profile__role__in=[WorkProfileRole.WORKER, WorkProfileRole.EMPLOYER],
+        )
+        .annotate(last_joined=Max("vacancyuser__created_at"), last_vacancy_date=Max("vacancies__date"))
+        .filter(worker_idle | employer_idle)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+
+
+def delete_users(user_ids: list[int]) -> int:
+    """Delete users in DELETE_CHUNK_SIZE chunks; returns how many were removed.
+
+    Feedback written or received by the chunk is deleted with the rating signal
+    muted; the surviving recipients' counters are then recounted in bulk and
+    their dashboards dropped.
+    """
+    from user.models import User, UserFeedback
+    from user.rating import rating_signals_muted, recount_rating_stats
+    from work.service.dashboard import invalidate_dashboard
+
+    deleted = 0
+    for i in range(0, len(user_ids), DELETE_CHUNK_SIZE):
+        chunk = user_ids[i : i + DELETE_CHUNK_SIZE]
+        feedback = UserFeedback.objects.filter(Q(owner_id__in=chunk) | Q(user_id__in=chunk))
+        recipients = set(feedback.exclude(user_id__in=chunk).values_list("user_id", flat=True))
+        with rating_signals_muted():
+            feedback.delete()
+        if recipients:
+            recount_rating_stats(recipients)
+            invalidate_dashboard(*recipients)
+        _, per_model = User.objects.filter(id__in=chunk).delete()
+        deleted += per_model.get(User._meta.label, 0)
+    return deleted
 
-def get_last_employer_activity_date(user):
-    """Get employer's last vacancy creation date."""
-    from vacancy.models import Vacancy
 
-    result = Vacancy.objects.filter(owner=user).aggregate(last=Max("date"))
-    last_date = result.get("last")
+@shared_task(name="user.tasks.cleanup_inactive_users_task")
+def cleanup_inactive_users_task():
+    """Daily task: delete workers/employers inactive for INACTIVE_DAYS.
 
-    if last_date:
-        last_date = timezone.make_aware(
-            timezone.datetime.combine(last_date, timezone.datetime.min.time()),
-            timezone.get_current_timezone(),
-        )
-    else:
-        last_date = user.date_joined
+    Deleted Telegram accounts are handled separately by probe_telegram_accounts_task.
+    """
+    cutoff = timezone.now() - timedelta(days=INACTIVE_DAYS)
+    user_ids = inactive_user_ids(cutoff)
+    deleted = delete_users(user_ids)
+    logger.info(
+        "task_completed",
+        extra={"task": "cleanup_inactive_users_task", "candidates": len(user_ids), "deleted": deleted},
+    )
 
-    return last_date
 
+def probe_candidates(now, limit: int) -> list[tuple[int, int]]:
+    """(id, telegram_id) of accounts never probed or probed more than PROBE_INTERVAL_DAYS ago.
 
-@shared_task(name="user.tasks.cleanup_inactive_users_task")
-def cleanup_inactive_users_task():
-    """Daily task: delete users with deleted Telegram accounts and inactive workers/employers (180 days)."""
+    Each probed row gets telegram_checked_at, so this ordering is the persisted
+    cursor: a crashed or time-boxed run is picked up by the next one.
+    """
     from user.models import User
-    from work.choices import WorkProfileRole
 
-    cutoff = timezone.now() - timedelta(days=INACTIVE_DAYS)
-    user_ids = list(User.objects.filter(is_staff=False, is_superuser=False).values_list("id", flat=True))
+    return list(
+        User.objects.filter(is_staff=False, is_superuser=False, telegram_id__isnull=False)
+        .filter(
+            Q(telegram_checked_at__isnull=True) | Q(telegram_checked_at__lt=now - timedelta(days=PROBE_INTERVAL_DAYS))
+        )
+        .order_by(F("telegram_checked_at").asc(nulls_first=True), "id")
+        .values_list("id", "telegram_id")[:limit]
+    )
 
-    deleted_count = 0
-    inactive_count = 0
-    total = len(user_ids)
 
-    logger.info(f"Cleanup started: checking {total} users")
+def probe_telegram_accounts(limit: int = PROBE_BATCH_SIZE, clock=time.monotonic, sleep=time.sleep) -> dict:
+    """Probe up to `limit` accounts at PROBE_RATE per second and delete the ones Telegram reports as gone."""
+    from user.models import User
 
-    for i, user_id in enumerate(user_ids):
+    deadline = clock() + PROBE_TIME_BUDGET
+    bucket = TokenBucket(PROBE_RATE, 1, clock())
+    checked: list[int] = []
+    gone: list[int] = []
+    rate_limited = False
+
+    for user_id, telegram_id in probe_candidates(timezone.now(), limit):
+        if clock() >= deadline:
+            break
+        wait = bucket.wait_time(clock())
+        if wait:
+            sleep(wait)
+        bucket.consume()
         try:
-            user = User.objects.select_related("work_profile").get(id=user_id)
-
-            # 1. Check if Telegram account is deleted
-            if user.telegram_id:
-                if check_telegram_deleted(user.telegram_id):
-                    username = user.username
-                    user.delete()
-                    deleted_count += 1
-                    logger.info(f"Deleted user with deleted Telegram account: {user_id} (@{username})")
-                    continue
-                time.sleep(TELEGRAM_API_DELAY)
-
-            # 2. Check inactivity (180 days) - workers and employers
-            profile = getattr(user, "work_profile", None)
-            if profile and profile.role == WorkProfileRole.WORKER:
-                last_activity = get_last_worker_activity_date(user)
-                if last_activity and last_activity < cutoff:
-                    username = user.username
-                    user.delete()
-                    inactive_count += 1
-                    logger.info(f"Deleted inactive worker: {user_id} (@{username}), last activity: {last_activity}")
-                    continue
-
-            if profile and profile.role == WorkProfileRole.EMPLOYER:
-                last_activity = get_last_employer_activity_date(user)
-                if last_activity and last_activity < cutoff:
-                    username = user.username
-                    user.delete()
-                    inactive_count += 1
-                    logger.info(f"Deleted inactive employer: {user_id} (@{username}), last activity: {last_activity}")
-
-        except User.DoesNotExist:
-            continue
-        except Exception as e:
-            logger.warning(f"Error checking user {user_id}: {e}")
-
-        if (i + 1) % 500 == 0:
-            logger.info(f"Cleanup progress: {i + 1}/{total}")
-
-    logger.info(f"Cleanup complete: {deleted_count} deleted accounts removed, {inactive_count} inactive users removed")
+            is_gone = check_telegram_deleted(telegram_id)
+        except ApiTelegramException as e:
+            logger.warning(f"Telegram probe rate-limited at user {user_id}: {e}")
+            rate_limited = True
+            break
+        (gone if is_gone else checked).append(user_id)
+        if len(checked) >= PROBE_FLUSH_SIZE:
+            User.objects.filter(id__in=checked).update(telegram_checked_at=timezone.now())
+            checked.clear()
+
+    if checked:
+        User.objects.filter(id__in=checked).update(telegram_checked_at=timezone.now())
+    for user_id in gone:
+        logger.info(f"Deleting user with deleted Telegram account: {user_id}")
+    deleted = delete_users(gone)
+    return {"deleted": deleted, "rate_limited": rate_limited}
+
+
+@shared_task(name="user.tasks.probe_telegram_accounts_task")
+def probe_telegram_accounts_task():
+    """Runs every 15 min. One time-boxed, rate-limited slice of the deleted-account sweep."""
+    if not cache.add(PROBE_LOCK_KEY, True, timeout=PROBE_TIME_BUDGET * 2):
+        return
+    try:
+        result = probe_telegram_accounts()
+    finally:
+        cache.delete(PROBE_LOCK_KEY)
+    logger.info("task_completed", extra={"task": "probe_telegram_accounts_task", **result})
 
 
 @shared_task(name="user.tasks.cleanup_unregistered_users_task")
@@ -143,3 +204,21 @@ def cleanup_unregistered_users_task():
             logger.info(f"Deleted unregistered user: {user_id} (@{username})")
 
     logger.info(f"Unregistered cleanup complete: {count} users removed")
+
+
+@shared_task(name="user.tasks.refresh_rating_params_task")
+def refresh_rating_params_task():
+    """Runs every 10 min. Recomputes the cached platform mean used by user.rating."""
+    from user.rating import refresh_platform_params
+
+    threshold, mean = refresh_platform_params()
+    logger.info("task_completed", extra={"task": "refresh_rating_params_task", "threshold": threshold, "mean": mean})
+
+
+@shared_task(name="user.tasks.recount_rating_stats_task")
+def recount_rating_stats_task():
+    """Nightly task: rebuild UserRatingStats from UserFeedback to correct any drift."""
+    from user.rating import recount_rating_stats
+
+    rows = recount_rating_stats()
+    logger.info("task_completed", extra={"task": "recount_rating_stats_task", "rows": rows})
@@ -8,7 +8,6 @@ from django.utils.encoding import smart_str
 from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 
-from telegram.choices import STATUS_PROCESS
 from telegram.models import Channel
 from telegram.service.group import GroupService
 from vacancy.models import Vacancy, VacancyStatusHistory, VacancyUser, VacancyUserCall
@@ -147,11 +146,9 @@ class VacancyAdmin(admin.ModelAdmin):
 
         if status_changed and obj.status == STATUS_APPROVED:
             if not obj.group:
-                group = GroupService.get_available_group()
+                group = GroupService.allocate_group()
                 if group:
                     obj.group = group
-                    group.status = STATUS_PROCESS
-                    group.save(update_fields=["status"])
                 else:
                     obj.status = form.initial.get("status", STATUS_PENDING)
                     self.message_user(
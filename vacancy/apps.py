@@ -5,3 +5,6 @@ class VacancyConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "vacancy"
     verbose_name = "Вакансії та робота"
+
+    def ready(self):
+        import vacancy.signals  # noqa: F401
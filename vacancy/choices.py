@@ -47,3 +47,18 @@ STATUS_CHOICES = [
     (STATUS_AWAITING_PAYMENT, _("Очікує оплати")),
     (STATUS_PAID, _("Сплачено")),
 ]
+
+TIMER_BEFORE_START = "before_start"
+TIMER_AFTER_FIRST = "after_first"
+TIMER_START = "start"
+TIMER_FINAL = "final"
+TIMER_CLOSE = "close"
+TIMER_RENEWAL = "renewal"
+TIMER_CHOICES = [
+    (TIMER_BEFORE_START, _("2 години до початку")),
+    (TIMER_AFTER_FIRST, _("Перевірка після першої переклички")),
+    (TIMER_START, _("Перша перекличка")),
+    (TIMER_FINAL, _("Друга перекличка")),
+    (TIMER_CLOSE, _("Закриття")),
+    (TIMER_RENEWAL, _("Пропозиція продовження")),
+]
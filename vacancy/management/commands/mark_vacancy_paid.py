@@ -12,8 +12,10 @@ from django.core.management.base import BaseCommand, CommandError
 
 from user.choices import BlockReason
 from user.models import UserBlock
+from user.services import BlockService
 from vacancy.choices import STATUS_PAID
 from vacancy.models import Vacancy
+from vacancy.services.timers import schedule_renewal_timer
 
 
 class Command(BaseCommand):
@@ -34,15 +36,16 @@ class Command(BaseCommand):
         except Vacancy.DoesNotExist:
             raise CommandError(f"Vacancy #{vid} not found") from None
 
-        if (vacancy.extra or {}).get("is_paid"):
+        if vacancy.is_paid:
             self.stdout.write(self.style.WARNING(f"Vacancy #{vid} is already paid."))
             return
 
         vacancy.extra = dict(vacancy.extra or {})
-        vacancy.extra["is_paid"] = True
+        vacancy.is_paid = True
         vacancy.extra["paid_via_management_command"] = True
         vacancy.status = STATUS_PAID
-        vacancy.save(update_fields=["extra", "status"])
+        vacancy.save(update_fields=["extra", "is_paid", "status"])
+        schedule_renewal_timer(vacancy)
 
         if not options["keep_block"]:
             lifted = UserBlock.objects.filter(
@@ -50,6 +53,7 @@ class Command(BaseCommand):
                 is_active=True,
                 reason__in=[BlockReason.UNPAID, BlockReason.EMPLOYER_ROLLCALL_FAIL],
             ).update(is_active=False)
+            BlockService.invalidate(vacancy.owner_id)
             self.stdout.write(self.style.SUCCESS(f"Vacancy #{vid} marked as paid. Owner blocks lifted: {lifted}"))
         else:
             self.stdout.write(self.style.SUCCESS(f"Vacancy #{vid} marked as paid. Owner blocks kept."))
@@ -0,0 +1,38 @@
+"""Management command: arm VacancyTimer rows for vacancies already in flight.
+
+Usage:
+    set -a && source .env && set +a
+    python manage.py schedule_vacancy_timers
+
+Run once after deploying the timer-based dispatcher. New approvals and
+payments arm their own timers.
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from vacancy.choices import STATUS_APPROVED, STATUS_SEARCH_STOPPED
+from vacancy.models import Vacancy
+from vacancy.services.timers import schedule_renewal_timer, schedule_vacancy_timers
+from vacancy.tasks.call import _renewal_candidates
+
+
+class Command(BaseCommand):
+    help = "Arm rollcall/close/renewal timers for active vacancies."
+
+    def handle(self, *args, **options):
+        since = timezone.localdate() - timedelta(days=1)
+        active = Vacancy.objects.filter(status__in=[STATUS_APPROVED, STATUS_SEARCH_STOPPED], date__gte=since)
+        scheduled = 0
+        for vacancy in active:
+            schedule_vacancy_timers(vacancy)
+            scheduled += 1
+
+        renewals = 0
+        for vacancy in _renewal_candidates():
+            schedule_renewal_timer(vacancy)
+            renewals += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Scheduled {scheduled} vacancies, {renewals} renewal offers."))
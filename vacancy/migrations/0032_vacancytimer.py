@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancy', '0031_alter_vacancyuser_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VacancyTimer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('before_start', '2 години до початку'), ('after_first', 'Перевірка після першої переклички'), ('start', 'Перша перекличка'), ('final', 'Друга перекличка'), ('close', 'Закриття'), ('renewal', 'Пропозиція продовження')], max_length=20, verbose_name='Kind')),
+                ('due_at', models.DateTimeField(verbose_name='Due at')),
+                ('fired_at', models.DateTimeField(blank=True, null=True, verbose_name='Fired at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timers', to='vacancy.vacancy', verbose_name='Vacancy')),
+            ],
+            options={
+                'verbose_name': 'Таймер вакансії',
+                'verbose_name_plural': 'Таймери вакансій',
+                'indexes': [models.Index(condition=models.Q(('fired_at__isnull', True)), fields=['due_at'], name='vacancy_timer_pending_due_idx')],
+                'unique_together': {('vacancy', 'kind')},
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:35
+
+from django.db import migrations
+from django.db.models import Count, Max
+
+
+def drop_duplicate_calls(apps, schema_editor):
+    """Keep the newest call per (vacancy_user, call_type); older duplicates would block the constraint."""
+    VacancyUserCall = apps.get_model('vacancy', 'VacancyUserCall')
+    duplicates = (
+        VacancyUserCall.objects.values('vacancy_user_id', 'call_type')
+        .annotate(rows=Count('id'), keep=Max('id'))
+        .filter(rows__gt=1)
+    )
+    for row in duplicates:
+        VacancyUserCall.objects.filter(
+            vacancy_user_id=row['vacancy_user_id'], call_type=row['call_type'], id__lt=row['keep']
+        ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancy', '0032_vacancytimer'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_calls, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='vacancyusercall',
+            unique_together={('vacancy_user', 'call_type')},
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+EXTRA_GIN_INDEX = "vacancy_extra_gin_idx"
+
+
+def create_extra_gin_index(apps, schema_editor):
+    # extra__has_key lookups (disputed rollcall, snapshot) compile to `extra ? key`, which jsonb_ops serves.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {EXTRA_GIN_INDEX} ON "vacancy_vacancy" USING gin (extra jsonb_ops)'
+    )
+
+
+def drop_extra_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {EXTRA_GIN_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telegram', '0024_group_recycling'),
+        ('vacancy', '0033_vacancyusercall_unique_call_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['status', 'date'], name='vacancy_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['owner', 'status'], name='vacancy_owner_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('closed_at__isnull', False)), fields=['closed_at'], name='vacancy_closed_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('search_active', True)), fields=['status'], name='vacancy_searching_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancyuser',
+            index=models.Index(fields=['vacancy', 'status'], name='vacancyuser_vacancy_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancyuser',
+            index=models.Index(fields=['user', 'status'], name='vacancyuser_user_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancyusercall',
+            index=models.Index(fields=['vacancy_user', 'call_type', 'status'], name='vacancy_call_user_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancyusercall',
+            index=models.Index(fields=['call_type', 'status'], name='vacancy_call_type_status_idx'),
+        ),
+        migrations.RunPython(create_extra_gin_index, drop_extra_gin_index),
+    ]
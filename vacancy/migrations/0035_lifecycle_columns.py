@@ -0,0 +1,152 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:43
+
+from datetime import datetime
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Q
+from django.utils import timezone
+
+BATCH_SIZE = 2000
+FLAGS = ('pre_call_done', 'sent_start_call', 'sent_final_call', 'is_paid', 'renewal_offered', 'pending_worker_renewal')
+MSG_IDS = ('start_call_msg_id', 'final_call_msg_id')
+MOVED = FLAGS + MSG_IDS + ('disputed_rollcall', 'continue_deadline')
+
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _deadline(value):
+    try:
+        deadline = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if timezone.is_naive(deadline):
+        deadline = timezone.make_aware(deadline, timezone.get_current_timezone())
+    return deadline
+
+
+def extra_to_columns(apps, schema_editor):
+    Vacancy = apps.get_model('vacancy', 'Vacancy')
+    has_any = Q()
+    for key in MOVED:
+        has_any |= Q(extra__has_key=key)
+
+    batch = []
+    for vacancy in Vacancy.objects.filter(has_any).only('id', 'extra', *MOVED).iterator(chunk_size=BATCH_SIZE):
+        extra = vacancy.extra
+        for key in FLAGS:
+            setattr(vacancy, key, bool(extra.pop(key, False)))
+        for key in MSG_IDS:
+            setattr(vacancy, key, _int_or_none(extra.pop(key, None)))
+        vacancy.disputed_rollcall = extra.pop('disputed_rollcall', None) or None
+        vacancy.continue_deadline = _deadline(extra.pop('continue_deadline', None))
+        batch.append(vacancy)
+        if len(batch) >= BATCH_SIZE:
+            Vacancy.objects.bulk_update(batch, ['extra', *MOVED])
+            batch = []
+    if batch:
+        Vacancy.objects.bulk_update(batch, ['extra', *MOVED])
+
+
+def columns_to_extra(apps, schema_editor):
+    Vacancy = apps.get_model('vacancy', 'Vacancy')
+    has_any = Q(disputed_rollcall__isnull=False) | Q(continue_deadline__isnull=False)
+    for key in FLAGS:
+        has_any |= Q(**{key: True})
+    for key in MSG_IDS:
+        has_any |= Q(**{f'{key}__isnull': False})
+
+    batch = []
+    for vacancy in Vacancy.objects.filter(has_any).only('id', 'extra', *MOVED).iterator(chunk_size=BATCH_SIZE):
+        extra = vacancy.extra or {}
+        for key in FLAGS:
+            if getattr(vacancy, key):
+                extra[key] = True
+        for key in MSG_IDS + ('disputed_rollcall',):
+            if getattr(vacancy, key) is not None:
+                extra[key] = getattr(vacancy, key)
+        if vacancy.continue_deadline is not None:
+            extra['continue_deadline'] = vacancy.continue_deadline.isoformat()
+        vacancy.extra = extra
+        batch.append(vacancy)
+        if len(batch) >= BATCH_SIZE:
+            Vacancy.objects.bulk_update(batch, ['extra'])
+            batch = []
+    if batch:
+        Vacancy.objects.bulk_update(batch, ['extra'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telegram', '0024_group_recycling'),
+        ('vacancy', '0034_lookup_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancy',
+            name='continue_deadline',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='disputed_rollcall',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='final_call_msg_id',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='is_paid',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='pending_worker_renewal',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='pre_call_done',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='renewal_offered',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='sent_final_call',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='sent_start_call',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='start_call_msg_id',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('disputed_rollcall__isnull', False)), fields=['status'], name='vacancy_disputed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('is_paid', True), ('renewal_offered', False), ('second_rollcall_passed', True)), fields=['closed_at'], name='vacancy_renewal_due_idx'),
+        ),
+        migrations.RunPython(extra_to_columns, columns_to_extra),
+    ]
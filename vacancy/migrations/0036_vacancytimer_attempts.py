@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancy', '0035_lifecycle_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancytimer',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Failed attempts'),
+        ),
+    ]
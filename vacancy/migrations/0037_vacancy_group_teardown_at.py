@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 16:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancy', '0036_vacancytimer_attempts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancy',
+            name='group_teardown_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
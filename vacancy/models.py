@@ -18,6 +18,7 @@ from .choices import (
     PAYMENT_UNIT_CHOICES,
     STATUS_CHOICES,
     STATUS_PENDING,
+    TIMER_CHOICES,
 )
 from .services.observers.events import VACANCY_DELETE
 
@@ -70,9 +71,48 @@ class Vacancy(models.Model):
     first_rollcall_passed = models.BooleanField(default=False)
     second_rollcall_passed = models.BooleanField(default=False)
 
+    # Lifecycle state the beat tasks filter on (formerly Vacancy.extra keys); see vacancy.services.lifecycle.
+    pre_call_done = models.BooleanField(default=False)
+    sent_start_call = models.BooleanField(default=False)
+    sent_final_call = models.BooleanField(default=False)
+    start_call_msg_id = models.BigIntegerField(null=True, blank=True)
+    final_call_msg_id = models.BigIntegerField(null=True, blank=True)
+    disputed_rollcall = models.JSONField(null=True, blank=True)
+    continue_deadline = models.DateTimeField(null=True, blank=True)
+    is_paid = models.BooleanField(default=False)
+    renewal_offered = models.BooleanField(default=False)
+    pending_worker_renewal = models.BooleanField(default=False)
+    # Set when VACANCY_CLOSE queued the Celery group teardown; cleared once the group is released.
+    group_teardown_at = models.DateTimeField(null=True, blank=True)
+
     class Meta:
         verbose_name = _("Vacancy")
         verbose_name_plural = _("Vacancies")
+        # Vacancy.extra has a GIN index too (PostgreSQL only, migration 0034).
+        indexes = [
+            models.Index(fields=["status", "date"], name="vacancy_status_date_idx"),
+            models.Index(fields=["owner", "status"], name="vacancy_owner_status_idx"),
+            models.Index(
+                fields=["closed_at"],
+                condition=models.Q(closed_at__isnull=False),
+                name="vacancy_closed_at_idx",
+            ),
+            models.Index(
+                fields=["status"],
+                condition=models.Q(search_active=True),
+                name="vacancy_searching_status_idx",
+            ),
+            models.Index(
+                fields=["status"],
+                condition=models.Q(disputed_rollcall__isnull=False),
+                name="vacancy_disputed_idx",
+            ),
+            models.Index(
+                fields=["closed_at"],
+                condition=models.Q(second_rollcall_passed=True, is_paid=True, renewal_offered=False),
+                name="vacancy_renewal_due_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"<{self.pk}>: {self.people_count}× ({self.get_status_display()})"
@@ -89,7 +129,7 @@ class Vacancy(models.Model):
 
     @property
     def last_channel_message(self) -> ChannelMessage | None:
-        return ChannelMessage.objects.filter(extra__vacancy_id=self.id).order_by("-created_at").first()
+        return self.channel_messages.order_by("-created_at").first()
 
 
 class VacancyUser(models.Model):
@@ -102,6 +142,10 @@ class VacancyUser(models.Model):
     class Meta:
         verbose_name = _("Учасник вакансії")
         verbose_name_plural = _("Учасники вакансій")
+        indexes = [
+            models.Index(fields=["vacancy", "status"], name="vacancyuser_vacancy_status_idx"),
+            models.Index(fields=["user", "status"], name="vacancyuser_user_status_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} → {self.vacancy}"
@@ -119,6 +163,11 @@ class VacancyUserCall(models.Model):
     class Meta:
         verbose_name = _("Перекличка")
         verbose_name_plural = _("Переклички")
+        unique_together = ("vacancy_user", "call_type")
+        indexes = [
+            models.Index(fields=["vacancy_user", "call_type", "status"], name="vacancy_call_user_type_idx"),
+            models.Index(fields=["call_type", "status"], name="vacancy_call_type_status_idx"),
+        ]
 
     def __str__(self):
         return f"{self.vacancy_user} [{self.call_type}]"
@@ -156,3 +205,29 @@ class VacancyContactPhone(models.Model):
 
     def __str__(self):
         return f"{self.user} → {self.vacancy}: {self.phone}"
+
+
+class VacancyTimer(models.Model):
+    """One pending lifecycle deadline of a vacancy, dispatched once by the timer tick."""
+
+    vacancy = models.ForeignKey("Vacancy", on_delete=models.CASCADE, related_name="timers", verbose_name=_("Vacancy"))
+    kind = models.CharField(max_length=20, choices=TIMER_CHOICES, verbose_name=_("Kind"))
+    due_at = models.DateTimeField(verbose_name=_("Due at"))
+    fired_at = models.DateTimeField(blank=True, null=True, verbose_name=_("Fired at"))
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name=_("Failed attempts"))
+    updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Updated at"))
+
+    class Meta:
+        verbose_name = _("Таймер вакансії")
+        verbose_name_plural = _("Таймери вакансій")
+        unique_together = ("vacancy", "kind")
+        indexes = [
+            models.Index(
+                fields=["due_at"],
+                condition=models.Q(fired_at__isnull=True),
+                name="vacancy_timer_pending_due_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.vacancy_id} [{self.kind}] @ {self.due_at}"
@@ -1,5 +1,8 @@
+import html
 import logging
 
+from django.db import transaction
+
 from telegram.service.group import GroupService
 from vacancy.choices import STATUS_APPROVED
 
@@ -26,23 +29,20 @@ def try_auto_approve(vacancy) -> bool:
             logger.warning("Auto-approve: no channel for city %s", work_profile.city)
             return False
 
-    # Assign group if not already set
-    if not vacancy.group:
-        from telegram.choices import STATUS_PROCESS
-
-        group = GroupService.get_available_group()
-        if not group:
-            logger.warning("Auto-approve: no available group for vacancy %s", vacancy.pk)
-            _notify_admins_no_group(vacancy)
-            return False
-        vacancy.group = group
-        group.status = STATUS_PROCESS
-        group.save(update_fields=["status"])
-
-    vacancy.status = STATUS_APPROVED
-    vacancy.search_active = True
-    vacancy.extra["auto_approved"] = True
-    vacancy.save()
+    # Assign group if not already set; claimed and saved together so a failure returns it to the pool
+    with transaction.atomic():
+        if not vacancy.group:
+            group = GroupService.allocate_group()
+            if not group:
+                logger.warning("Auto-approve: no available group for vacancy %s", vacancy.pk)
+                _notify_admins_no_group(vacancy)
+                return False
+            vacancy.group = group
+
+        vacancy.status = STATUS_APPROVED
+        vacancy.search_active = True
+        vacancy.extra["auto_approved"] = True
+        vacancy.save()
 
     # Notify admins with auto-approved mark
     _notify_admins_auto_approved(vacancy)
@@ -52,24 +52,19 @@ def try_auto_approve(vacancy) -> bool:
 
 def _notify_admins_auto_approved(vacancy):
     """Send admin notification with auto-approved mark."""
-    from telegram.handlers.bot_instance import bot
-    from user.models import User
+    from service.admin_notifications import notify_admins
     from vacancy.services.vacancy_formatter import VacancyTelegramTextFormatter
 
     text = "✅ Автоматично підтверджено\n\n" + VacancyTelegramTextFormatter(vacancy).for_admin_chat()
-    admin_ids = list(User.objects.filter(is_staff=True).values_list("id", flat=True))
-
-    for admin_id in admin_ids:
-        try:
-            bot.send_message(admin_id, text, parse_mode="HTML")
-        except Exception:
-            logger.exception("Failed to send auto-approve msg to admin %s", admin_id)
+    try:
+        notify_admins(text)
+    except Exception:
+        logger.exception("Failed to send auto-approve msg to admins")
 
 
 def _notify_admins_no_group(vacancy):
     """Notify admins that auto-approve failed due to no available groups."""
-    from telegram.handlers.bot_instance import bot
-    from user.models import User
+    from service.admin_notifications import DIGEST_NO_GROUP, notify_admins_digest
 
     owner_name = vacancy.owner.full_name or vacancy.owner.username
     text = (
@@ -78,10 +73,8 @@ def _notify_admins_no_group(vacancy):
         f"Замовник: {owner_name}\n\n"
         f"Автопідтвердження не спрацювало — вакансія очікує модерації."
     )
-    admin_ids = list(User.objects.filter(is_staff=True).values_list("id", flat=True))
-
-    for admin_id in admin_ids:
-        try:
-            bot.send_message(admin_id, text, parse_mode="HTML")
-        except Exception:
-            logger.exception("Failed to send no-group msg to admin %s", admin_id)
+    summary = f"{html.escape(vacancy.address)} — {html.escape(owner_name or '')}"
+    try:
+        notify_admins_digest(DIGEST_NO_GROUP, text, summary)
+    except Exception:
+        logger.exception("Failed to send no-group msg to admins")
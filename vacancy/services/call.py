@@ -1,27 +1,82 @@
+"""Rollcall calls (VacancyUserCall): one row per (vacancy_user, call_type).
+
+Calls are created and transitioned in sets: ensure_calls() inserts the missing
+rows in one statement, apply_rollcall() moves the calls of a rollcall to its result
+with a single UPDATE and reports which users it confirmed, rejected and
+actually changed, so callers can fan out the side effects in bulk.
+"""
+
 from collections.abc import Iterable
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import Case, QuerySet, Value, When
 
 from telegram.choices import CallStatus, CallType
-from vacancy.models import Vacancy, VacancyUserCall
-
-
-def create_vacancy_call(vacancy: Vacancy, status: CallStatus, call_type: CallType) -> Iterable[VacancyUserCall]:
-    users_queryset = vacancy.members
-
-    existing_calls = VacancyUserCall.objects.filter(vacancy_user__in=users_queryset, call_type=call_type)
-    existing_map = [call.vacancy_user.id for call in existing_calls]
-    missing_calls = []
-    for vacancy_user in users_queryset:
-        if vacancy_user.id not in existing_map:
-            missing_calls.append(
-                VacancyUserCall(
-                    vacancy_user=vacancy_user,
-                    status=status,
-                    call_type=call_type,
+from vacancy.models import Vacancy, VacancyUser, VacancyUserCall
+
+
+@dataclass(frozen=True)
+class RollcallDelta:
+    """User ids by outcome; `changed` holds those whose call status this rollcall flipped."""
+
+    confirmed: list[int]
+    rejected: list[int]
+    changed: list[int]
+
+
+def ensure_calls(
+    vacancy_users: QuerySet[VacancyUser], call_type: CallType, status: CallStatus
+) -> list[VacancyUserCall]:
+    """Create the calls vacancy_users do not have yet; returns the new (unsaved-pk) rows."""
+    vacancy_user_ids = list(vacancy_users.values_list("pk", flat=True))
+    existing = set(
+        VacancyUserCall.objects.filter(vacancy_user_id__in=vacancy_user_ids, call_type=call_type).values_list(
+            "vacancy_user_id", flat=True
+        )
+    )
+    missing = [
+        VacancyUserCall(vacancy_user_id=pk, status=status, call_type=call_type)
+        for pk in vacancy_user_ids
+        if pk not in existing
+    ]
+    if missing:
+        # A concurrent rollcall may have inserted some of them meanwhile; the unique constraint drops those.
+        VacancyUserCall.objects.bulk_create(missing, ignore_conflicts=True)
+    return missing
+
+
+def create_vacancy_call(vacancy: Vacancy, status: CallStatus, call_type: CallType) -> list[VacancyUserCall]:
+    return ensure_calls(vacancy.members, call_type=call_type, status=status)
+
+
+def apply_rollcall(
+    vacancy_users: QuerySet[VacancyUser], call_type: CallType, confirmed_user_ids: Iterable[int]
+) -> RollcallDelta:
+    """Confirm the existing calls of confirmed_user_ids and reject the rest of vacancy_users, in one UPDATE."""
+    confirmed_user_ids = {int(x) for x in confirmed_user_ids}
+
+    with transaction.atomic():
+        calls = list(
+            VacancyUserCall.objects.select_for_update(of=("self",))
+            .filter(vacancy_user__in=vacancy_users, call_type=call_type)
+            .values_list("pk", "status", "vacancy_user__user_id")
+        )
+        confirmed, rejected, changed, to_confirm, to_reject = [], [], [], [], []
+        for pk, status, user_id in calls:
+            target = CallStatus.CONFIRM if user_id in confirmed_user_ids else CallStatus.REJECT
+            (confirmed if target == CallStatus.CONFIRM else rejected).append(user_id)
+            if status != target:
+                changed.append(user_id)
+                (to_confirm if target == CallStatus.CONFIRM else to_reject).append(pk)
+        if to_confirm or to_reject:
+            VacancyUserCall.objects.filter(pk__in=to_confirm + to_reject).update(
+                status=Case(
+                    When(pk__in=to_confirm, then=Value(CallStatus.CONFIRM)),
+                    default=Value(CallStatus.REJECT),
                 )
             )
-    if missing_calls:
-        return VacancyUserCall.objects.bulk_create(missing_calls)
-    return []
+    return RollcallDelta(confirmed=confirmed, rejected=rejected, changed=changed)
 
 
 def reset_before_start_cycle(vacancy):
@@ -45,5 +100,5 @@ def reset_before_start_cycle(vacancy):
     if not vacancy.extra:
         vacancy.extra = {}
     vacancy.extra["original_start_datetime"] = start_aware.isoformat()
-    vacancy.extra.pop("pre_call_done", None)
-    vacancy.save(update_fields=["extra"])
+    vacancy.pre_call_done = False
+    vacancy.save(update_fields=["extra", "pre_call_done"])
@@ -5,7 +5,7 @@ Flow:
 - View vacancy_continue_search?confirm_rollcall=1 sets:
     extra["continue_after_first_rollcall"] = True
     extra["continue_started_at"] = ISO timestamp
-    extra["continue_deadline"]    = ISO timestamp (started + 1h)
+    continue_deadline             = started + 1h (Vacancy column)
     first_rollcall_passed = True
   and schedules finalize_continue_after_rollcall_task with countdown=3600.
 
@@ -27,7 +27,7 @@ from django.utils import timezone
 
 from telegram.choices import CallStatus, CallType
 from vacancy.choices import STATUS_CLOSED, STATUS_SEARCH_STOPPED
-from vacancy.models import Vacancy, VacancyUserCall
+from vacancy.models import Vacancy
 
 logger = logging.getLogger(__name__)
 
@@ -37,10 +37,11 @@ def is_in_continue_mode(vacancy: Vacancy) -> bool:
 
 
 def clear_continue_flags(vacancy: Vacancy) -> None:
-    """Remove continue-mode flags from extra (caller saves)."""
+    """Remove continue-mode flags from extra and clear continue_deadline (caller saves both)."""
+    vacancy.continue_deadline = None
     if not vacancy.extra:
         return
-    for k in ("continue_after_first_rollcall", "continue_started_at", "continue_deadline"):
+    for k in ("continue_after_first_rollcall", "continue_started_at"):
         vacancy.extra.pop(k, None)
 
 
@@ -65,7 +66,7 @@ def finalize_continue_after_first_rollcall(vacancy: Vacancy) -> dict:
             vacancy.extra = {}
         vacancy.extra["cancel_requested"] = True
         clear_continue_flags(vacancy)
-        vacancy.save(update_fields=["status", "closed_at", "search_active", "extra"])
+        vacancy.save(update_fields=["status", "closed_at", "search_active", "extra", "continue_deadline"])
 
         _remove_channel_button(vacancy)
         _notify_admin_no_workers(vacancy)
@@ -73,15 +74,11 @@ def finalize_continue_after_first_rollcall(vacancy: Vacancy) -> dict:
         return {"action": "auto_closed", "vacancy_id": vacancy.pk}
 
     # ≥1 worker → snapshot + stop search
-    from vacancy.services.call import create_vacancy_call
+    from vacancy.services.call import apply_rollcall, create_vacancy_call
     from vacancy.services.rollcall_snapshot import save_first_rollcall_snapshot
 
     create_vacancy_call(vacancy=vacancy, call_type=CallType.START, status=CallStatus.CREATED)
-    VacancyUserCall.objects.filter(
-        vacancy_user__vacancy=vacancy,
-        vacancy_user__user_id__in=member_ids,
-        call_type=CallType.START,
-    ).update(status=CallStatus.CONFIRM)
+    apply_rollcall(vacancy.members, call_type=CallType.START, confirmed_user_ids=member_ids)
 
     if vacancy.extra is None:
         vacancy.extra = {}
@@ -93,7 +90,7 @@ def finalize_continue_after_first_rollcall(vacancy: Vacancy) -> dict:
     vacancy.search_active = False
     vacancy.search_stopped_at = now
     clear_continue_flags(vacancy)
-    vacancy.save(update_fields=["status", "search_active", "search_stopped_at", "extra"])
+    vacancy.save(update_fields=["status", "search_active", "search_stopped_at", "extra", "continue_deadline"])
 
     # snapshot is the source of truth for 2nd rollcall — save_first_rollcall_snapshot
     # calls vacancy.save() itself, so it MUST come after our save above to avoid
@@ -128,9 +125,7 @@ def _remove_channel_button(vacancy: Vacancy) -> None:
 
         text = VacancyTelegramTextFormatter(vacancy).for_channel(status="full")
         channel_message = (
-            ChannelMessage.objects.filter(channel_id=vacancy.channel.id, extra__vacancy_id=vacancy.id)
-            .order_by("-id")
-            .first()
+            ChannelMessage.objects.filter(channel_id=vacancy.channel.id, vacancy=vacancy).order_by("-id").first()
         )
         if channel_message:
             strategy = TelegramStrategyFactory.get_strategy(NotificationMethod.TEXT)
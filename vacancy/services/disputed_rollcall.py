@@ -4,7 +4,7 @@ Used when the 2nd rollcall (AFTER_START) ends with mismatched checkboxes
 - Scenario B: employer unchecked some workers but at least 1 confirmed.
 - Scenario C: employer unchecked ALL workers (also kicked + blocked).
 
-State is stored in vacancy.extra["disputed_rollcall"] until either:
+State is stored in Vacancy.disputed_rollcall until either:
 - the employer re-submits the rollcall with a valid result, OR
 - the admin presses "Підтвердити кількість" / "Редагувати кількість".
 
@@ -18,18 +18,17 @@ import logging
 from collections.abc import Iterable
 
 from vacancy.models import Vacancy
+from vacancy.services.lifecycle import set_lifecycle
 
 logger = logging.getLogger(__name__)
 
-DISPUTED_KEY = "disputed_rollcall"
-
 
 def is_disputed(vacancy: Vacancy) -> bool:
-    return bool(vacancy.extra.get(DISPUTED_KEY))
+    return bool(vacancy.disputed_rollcall)
 
 
 def get_disputed(vacancy: Vacancy) -> dict:
-    return dict(vacancy.extra.get(DISPUTED_KEY) or {})
+    return dict(vacancy.disputed_rollcall or {})
 
 
 def mark_disputed(
@@ -51,8 +50,7 @@ def mark_disputed(
         "last_reminder_at": None,
         "admin_buttons_disabled": False,
     }
-    vacancy.extra[DISPUTED_KEY] = state
-    vacancy.save(update_fields=["extra"])
+    set_lifecycle(vacancy, disputed_rollcall=state)
     logger.info(
         "disputed_rollcall_marked",
         extra={"vacancy_id": vacancy.pk, "is_full_uncheck": is_full_uncheck},
@@ -66,8 +64,7 @@ def disable_admin_buttons(vacancy: Vacancy) -> None:
     if not state:
         return
     state["admin_buttons_disabled"] = True
-    vacancy.extra[DISPUTED_KEY] = state
-    vacancy.save(update_fields=["extra"])
+    set_lifecycle(vacancy, disputed_rollcall=state)
 
 
 def increment_reminders(vacancy: Vacancy) -> int:
@@ -78,15 +75,13 @@ def increment_reminders(vacancy: Vacancy) -> int:
         return 0
     state["reminders_count"] = int(state.get("reminders_count", 0)) + 1
     state["last_reminder_at"] = timezone.now().isoformat()
-    vacancy.extra[DISPUTED_KEY] = state
-    vacancy.save(update_fields=["extra"])
+    set_lifecycle(vacancy, disputed_rollcall=state)
     return state["reminders_count"]
 
 
 def clear_disputed(vacancy: Vacancy) -> None:
-    if DISPUTED_KEY in vacancy.extra:
-        vacancy.extra.pop(DISPUTED_KEY, None)
-        vacancy.save(update_fields=["extra"])
+    if vacancy.disputed_rollcall is not None:
+        set_lifecycle(vacancy, disputed_rollcall=None)
 
 
 def finalize_rollcall(
@@ -105,32 +100,23 @@ def finalize_rollcall(
 
     Returns the number of confirmed workers.
     """
-    from telegram.choices import CallStatus, CallType
+    from telegram.choices import CallType
     from user.services import BlockService
     from vacancy.choices import STATUS_AWAITING_PAYMENT
-    from vacancy.models import VacancyUserCall
+    from vacancy.services.call import apply_rollcall
     from vacancy.services.invoice import send_vacancy_invoice
     from vacancy.services.rollcall_snapshot import get_snapshot_vacancy_users
 
     final_ids = {int(x) for x in final_selected_user_ids}
-    rollcall_qs = get_snapshot_vacancy_users(vacancy)
-
-    confirm_qs = rollcall_qs.filter(user_id__in=final_ids)
-    reject_qs = rollcall_qs.exclude(user_id__in=final_ids)
-
-    VacancyUserCall.objects.filter(vacancy_user__in=confirm_qs, call_type=CallType.AFTER_START).update(
-        status=CallStatus.CONFIRM
-    )
-    VacancyUserCall.objects.filter(vacancy_user__in=reject_qs, call_type=CallType.AFTER_START).update(
-        status=CallStatus.REJECT
+    delta = apply_rollcall(
+        get_snapshot_vacancy_users(vacancy), call_type=CallType.AFTER_START, confirmed_user_ids=final_ids
     )
 
     # Ban rejected workers ONLY at finalization (no premature bans during the dispute)
-    for vu in reject_qs.select_related("user"):
-        try:
-            BlockService.auto_block_rollcall_reject(user=vu.user, blocked_by=vacancy.owner)
-        except Exception:
-            logger.exception("finalize_rollcall: ban failed for user_id=%s", vu.user_id)
+    try:
+        BlockService.auto_block_rollcall_reject_many(delta.rejected, blocked_by=vacancy.owner)
+    except Exception:
+        logger.exception("finalize_rollcall: ban failed for user_ids=%s", delta.rejected)
 
     # Update vacancy state
     vacancy.second_rollcall_passed = True
@@ -161,9 +147,9 @@ def finalize_rollcall(
         "rollcall_finalized",
         extra={
             "vacancy_id": vacancy.pk,
-            "confirmed": confirm_qs.count(),
-            "rejected": reject_qs.count(),
+            "confirmed": len(delta.confirmed),
+            "rejected": len(delta.rejected),
             "by": finalized_by,
         },
     )
-    return confirm_qs.count()
+    return len(delta.confirmed)
@@ -0,0 +1,58 @@
+"""Typed lifecycle state of a vacancy.
+
+The flags and message ids the beat tasks filter on are Vacancy columns
+(pre_call_done, sent_start_call/sent_final_call, the rollcall message ids,
+disputed_rollcall, continue_deadline, is_paid, renewal_offered,
+pending_worker_renewal, group_teardown_at). Migration 0035 moved them out of
+Vacancy.extra.
+
+Read them as attributes. Write them with set_lifecycle(), which saves only
+the given columns: concurrent writers of other lifecycle fields or of extra
+no longer overwrite each other's changes.
+"""
+
+from __future__ import annotations
+
+from telegram.choices import CallType
+from vacancy.models import Vacancy
+
+LIFECYCLE_FIELDS = (
+    "pre_call_done",
+    "sent_start_call",
+    "sent_final_call",
+    "start_call_msg_id",
+    "final_call_msg_id",
+    "disputed_rollcall",
+    "continue_deadline",
+    "is_paid",
+    "renewal_offered",
+    "pending_worker_renewal",
+    "group_teardown_at",
+)
+
+ROLLCALL_MSG_FIELDS = {
+    CallType.START: "start_call_msg_id",
+    CallType.AFTER_START: "final_call_msg_id",
+}
+
+# Cleared when a vacancy starts a new rollcall cycle (renewal for tomorrow).
+ROLLCALL_CYCLE_DEFAULTS = {
+    "sent_start_call": False,
+    "sent_final_call": False,
+    "start_call_msg_id": None,
+    "final_call_msg_id": None,
+}
+
+
+def set_lifecycle(vacancy: Vacancy, **fields) -> None:
+    """Assign lifecycle fields and UPDATE just those columns."""
+    unknown = set(fields) - set(LIFECYCLE_FIELDS)
+    if unknown:
+        raise ValueError(f"not lifecycle fields: {sorted(unknown)}")
+    for name, value in fields.items():
+        setattr(vacancy, name, value)
+    vacancy.save(update_fields=list(fields))
+
+
+def rollcall_message_id(vacancy: Vacancy, call_type: CallType) -> int | None:
+    return getattr(vacancy, ROLLCALL_MSG_FIELDS[call_type])
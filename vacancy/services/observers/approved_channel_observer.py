@@ -23,7 +23,7 @@ class VacancyApprovedChannelObserver(Observer):
         vacancy = data["vacancy"]
         # Skip channel publish for renewal — workers are already in the group;
         # VacancyRenewalWorkersObserver sends the poll instead.
-        if vacancy.extra.get("pending_worker_renewal"):
+        if vacancy.pending_worker_renewal:
             return
         if vacancy.status != STATUS_CLOSED:
             channel = vacancy.channel
@@ -26,6 +26,9 @@ class VacancyApprovedGroupObserver(Observer):
                     parse_mode="HTML",
                 )
                 if message:
+                    from telegram.service.group_recycling import record_bot_message
+
+                    record_bot_message(vacancy.group.id, message, vacancy_id=vacancy.id)
                     try:
                         bot.pin_chat_message(
                             chat_id=vacancy.group.id,
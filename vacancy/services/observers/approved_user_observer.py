@@ -32,7 +32,7 @@ class VacancyApprovedUserObserver(Observer):
 
     def update(self, event: str, data: dict[str, Any]) -> None:
         vacancy = data["vacancy"]
-        is_resume = vacancy.first_rollcall_passed or vacancy.extra.get("sent_start_call", False)
+        is_resume = vacancy.first_rollcall_passed or vacancy.sent_start_call
 
         from telegram.handlers.bot_instance import bot
 
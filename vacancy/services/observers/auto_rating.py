@@ -123,7 +123,7 @@ class AutoRatingObserver(Observer):
             return
 
         worker = first_member.user
-        if vacancy.extra.get("is_paid"):
+        if vacancy.is_paid:
             _create_feedback(
                 owner=worker,
                 user=vacancy.owner,
@@ -21,6 +21,7 @@ from vacancy.services.call_markup import (
     get_start_call_markup,
 )
 from vacancy.services.invoice import send_vacancy_invoice
+from vacancy.services.lifecycle import set_lifecycle
 from vacancy.services.observers.publisher import Observer
 from vacancy.services.reminder_utils import delete_bot_message, send_and_track
 
@@ -37,7 +38,7 @@ class VacancyBeforeCallObserver(Observer):
         from telegram.choices import Status as _Status
 
         # Layer 1: never re-dispatch the 2h notice within one cycle.
-        if (vacancy.extra or {}).get("pre_call_done"):
+        if vacancy.pre_call_done:
             return
 
         # Layer 2: anchor the 2h mark to the original cycle start.
@@ -104,13 +105,10 @@ class VacancyBeforeCallObserver(Observer):
                     any_dispatched = True
 
         # Mark cycle as done so the next Celery tick won't re-send.
-        # Survives continue_search (which does not touch this key);
+        # Survives continue_search (which does not touch this flag);
         # cleared only by resume_before_start_cycle on a NEW cycle.
         if any_dispatched:
-            if not vacancy.extra:
-                vacancy.extra = {}
-            vacancy.extra["pre_call_done"] = True
-            vacancy.save(update_fields=["extra"])
+            set_lifecycle(vacancy, pre_call_done=True)
 
     @staticmethod
     def check_before_5_start(vacancy: Vacancy):
@@ -205,10 +203,7 @@ class VacancyStartCallObserver(Observer):
             reply_markup=get_start_call_markup(vacancy=vacancy),
         )
         if new_msg_id:
-            if not vacancy.extra:
-                vacancy.extra = {}
-            vacancy.extra["start_call_msg_id"] = new_msg_id
-            vacancy.save(update_fields=["extra"])
+            set_lifecycle(vacancy, start_call_msg_id=new_msg_id)
 
 
 class VacancyStartCallFailObserver(Observer):
@@ -282,10 +277,7 @@ class VacancyAfterStartCallObserver(Observer):
             reply_markup=get_final_call_markup(vacancy=vacancy),
         )
         if new_msg_id:
-            if not vacancy.extra:
-                vacancy.extra = {}
-            vacancy.extra["final_call_msg_id"] = new_msg_id
-            vacancy.save(update_fields=["extra"])
+            set_lifecycle(vacancy, final_call_msg_id=new_msg_id)
 
 
 class VacancyAfterStartCallSuccessObserver(Observer):
@@ -15,9 +15,9 @@ class VacancyCreatedAdminObserver(Observer):
 
     def update(self, event: str, data: dict[str, Any]) -> None:
         vacancy = data["vacancy"]
-        from user.models import User
+        from service.admin_notifications import get_admin_ids
 
-        admin_ids = list(User.objects.filter(is_staff=True).values_list("id", flat=True))
+        admin_ids = get_admin_ids()
         admin_messages = {}
         for admin_id in admin_ids:
             try:
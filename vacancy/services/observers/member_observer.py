@@ -1,11 +1,10 @@
 import logging
+from types import SimpleNamespace
 from typing import Any
 
 import sentry_sdk
 
-from service.notifications import NotificationMethod
 from service.notifications_impl import TelegramNotifier
-from service.telegram_strategy_factory import TelegramStrategyFactory
 from telegram.choices import Status
 from telegram.handlers.bot_instance import bot
 from telegram.models import ChannelMessage
@@ -40,14 +39,16 @@ class VacancyIsFullObserver(Observer):
 
             text = VacancyTelegramTextFormatter(vacancy).for_channel(status="full")
             channel_message = (
-                ChannelMessage.objects.filter(channel_id=vacancy.channel.id, extra__vacancy_id=vacancy.id)
-                .order_by("-id")
-                .first()
+                ChannelMessage.objects.filter(channel_id=vacancy.channel.id, vacancy=vacancy).order_by("-id").first()
             )
 
             if channel_message:
-                strategy = TelegramStrategyFactory.get_strategy(NotificationMethod.TEXT)
-                strategy.update(bot, vacancy.channel.id, text=text, message_id=channel_message.message_id)
+                (self.notifier or telegram_notifier).notify(
+                    SimpleNamespace(chat_id=vacancy.channel.id),
+                    is_update=True,
+                    text=text,
+                    message_id=channel_message.message_id,
+                )
 
         # Notify employer about new worker during continued search
         if vacancy.first_rollcall_passed and not vacancy.second_rollcall_passed:
@@ -105,7 +106,7 @@ class VacancySlotFreedObserver(Observer):
                 # Immediate republish with button
                 try:
                     channel_message = (
-                        ChannelMessage.objects.filter(channel_id=vacancy.channel.id, extra__vacancy_id=vacancy.id)
+                        ChannelMessage.objects.filter(channel_id=vacancy.channel.id, vacancy=vacancy)
                         .order_by("-id")
                         .first()
                     )
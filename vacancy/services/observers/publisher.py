@@ -1,6 +1,43 @@
+"""
+Event publisher for vacancy observers.
+
+Each subscription carries a dispatch policy:
+  sync      - run inside notify(), in subscription order (the default);
+  on_commit - run once the surrounding transaction commits;
+  celery    - run in vacancy.tasks.observers.run_vacancy_observers_task on the
+              "vacancy_observers" queue, with model instances in `data` sent
+              as (label, pk) references and re-read by the worker.
+
+Celery observers that share a `lane` run in one task, in subscription order
+(e.g. group teardown steps that depend on each other); different lanes are
+separate tasks and run concurrently. Deferred policies only apply while
+settings.VACANCY_OBSERVERS_ASYNC is on; otherwise, or when the broker is
+unreachable, everything runs inline as before.
+
+Every run is recorded in service.metrics (vacancy_observer_duration_seconds,
+with an ok/error outcome label), and the inline part of notify() in
+vacancy_event_duration_seconds.
+"""
+
+import logging
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
+from django.conf import settings
+from django.db import models, transaction
+
+from service.metrics import observe, timed
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_SYNC = "sync"
+DISPATCH_ON_COMMIT = "on_commit"
+DISPATCH_CELERY = "celery"
+DISPATCH_POLICIES = (DISPATCH_SYNC, DISPATCH_ON_COMMIT, DISPATCH_CELERY)
+
 
 class Observer(ABC):
     @abstractmethod
@@ -8,25 +45,119 @@ class Observer(ABC):
         raise NotImplementedError()
 
 
+@dataclass(frozen=True)
+class Subscription:
+    observer: Observer
+    policy: str = DISPATCH_SYNC
+    lane: str | None = None
+
+    @property
+    def name(self) -> str:
+        return self.observer.__class__.__name__
+
+
+def observers_async_enabled() -> bool:
+    return getattr(settings, "VACANCY_OBSERVERS_ASYNC", False)
+
+
+def run_observer(observer: Observer, event: str, data: dict[str, Any], mode: str = DISPATCH_SYNC) -> bool:
+    """Run one observer, log and record the outcome; failures never propagate."""
+    name = observer.__class__.__name__
+    started = time.monotonic()
+    ok = True
+    try:
+        observer.update(event, data)
+    except Exception as e:
+        ok = False
+        logging.warning(f"Observer {name} failed on {event}: {e}", exc_info=True)
+    duration = time.monotonic() - started
+    observe(
+        "vacancy_observer_duration_seconds",
+        duration,
+        event=event,
+        observer=name,
+        mode=mode,
+        outcome="ok" if ok else "error",
+    )
+    logger.info(
+        "observer_run",
+        extra={"event": event, "observer": name, "mode": mode, "ok": ok, "duration_ms": int(duration * 1000)},
+    )
+    return ok
+
+
+def serialize_event_data(data: dict[str, Any]) -> dict[str, Any]:
+    """Model instances become {"model": label, "pk": pk}; plain JSON values pass; anything else is dropped."""
+    payload = {}
+    for key, value in data.items():
+        if isinstance(value, models.Model):
+            payload[key] = {"model": value._meta.label, "pk": value.pk}
+        elif value is None or isinstance(value, str | int | float | bool | list | dict):
+            payload[key] = value
+    return payload
+
+
+def deserialize_event_data(payload: dict[str, Any]) -> dict[str, Any] | None:
+    """Inverse of serialize_event_data(); None when a referenced row no longer exists."""
+    from django.apps import apps
+
+    data = {}
+    for key, value in payload.items():
+        if isinstance(value, dict) and set(value) == {"model", "pk"}:
+            instance = apps.get_model(value["model"])._default_manager.filter(pk=value["pk"]).first()
+            if instance is None:
+                return None
+            data[key] = instance
+        else:
+            data[key] = value
+    return data
+
+
 class BasePublisher:
     def __init__(self):
-        self._subscribers: dict[str, list[Observer]] = {}
+        self._subscribers: dict[str, list[Subscription]] = {}
 
-    def subscribe(self, event: str, observer: Observer) -> None:
-        self._subscribers.setdefault(event, []).append(observer)
+    def subscribe(self, event: str, observer: Observer, policy: str = DISPATCH_SYNC, lane: str | None = None) -> None:
+        if policy not in DISPATCH_POLICIES:
+            raise ValueError(f"Unknown dispatch policy: {policy}")
+        self._subscribers.setdefault(event, []).append(Subscription(observer, policy, lane))
 
     def unsubscribe(self, event: str, observer: Observer) -> None:
         if event in self._subscribers:
-            self._subscribers[event].remove(observer)
+            self._subscribers[event] = [s for s in self._subscribers[event] if s.observer is not observer]
+
+    def subscriptions(self, event: str) -> list[Subscription]:
+        return list(self._subscribers.get(event, []))
+
+    def observers_by_name(self, event: str, names: list[str]) -> list[Observer]:
+        by_name = {s.name: s.observer for s in self._subscribers.get(event, [])}
+        return [by_name[name] for name in names if name in by_name]
 
     def notify(self, event: str, data: dict[str, Any]) -> None:
-        for observer in self._subscribers.get(event, []):
+        deferred = observers_async_enabled()
+        lanes: dict[str, list[str]] = {}
+        with timed("vacancy_event_duration_seconds", event=event):
+            for sub in self._subscribers.get(event, []):
+                if not deferred or sub.policy == DISPATCH_SYNC:
+                    run_observer(sub.observer, event, data)
+                elif sub.policy == DISPATCH_ON_COMMIT:
+                    transaction.on_commit(partial(run_observer, sub.observer, event, data, DISPATCH_ON_COMMIT))
+                else:
+                    lanes.setdefault(sub.lane or sub.name, []).append(sub.name)
+            if lanes:
+                transaction.on_commit(partial(self._enqueue, event, data, list(lanes.values())))
+
+    def _enqueue(self, event: str, data: dict[str, Any], lanes: list[list[str]]) -> None:
+        from vacancy.tasks.observers import run_vacancy_observers_task
+
+        payload = serialize_event_data(data)
+        for names in lanes:
             try:
-                observer.update(event, data)
+                run_vacancy_observers_task.apply_async(args=[event, names, payload])
             except Exception as e:
-                import logging
-
-                logging.warning(f"Observer {observer.__class__.__name__} failed on {event}: {e}", exc_info=True)
+                logger.warning(f"observer_enqueue_failed ({event}): {e}")
+                for observer in self.observers_by_name(event, names):
+                    run_observer(observer, event, data)
 
 
 class VacancyEventPublisher(BasePublisher): ...
@@ -18,13 +18,14 @@ class VacancyRenewalWorkersObserver(Observer):
 
     def update(self, event: str, data: dict[str, Any]) -> None:
         vacancy = data["vacancy"]
-        if not vacancy.extra.get("pending_worker_renewal"):
+        if not vacancy.pending_worker_renewal:
             return
 
         from telegram.choices import CallStatus, CallType
-        from vacancy.models import VacancyUserCall
+        from vacancy.services.call import ensure_calls
         from vacancy.services.call_formatter import CallVacancyTelegramTextFormatter
         from vacancy.services.call_markup import get_renewal_worker_markup
+        from vacancy.services.lifecycle import set_lifecycle
 
         members = vacancy.members.select_related("user")
         if not members.exists():
@@ -33,13 +34,9 @@ class VacancyRenewalWorkersObserver(Observer):
         markup = get_renewal_worker_markup(vacancy)
         text = CallVacancyTelegramTextFormatter(vacancy).renewal_worker_ask()
 
+        # VacancyUserCall records for tracking
+        ensure_calls(members, call_type=CallType.RENEWAL_WORKER, status=CallStatus.SENT)
         for vacancy_user in members:
-            # Create VacancyUserCall record for tracking
-            VacancyUserCall.objects.create(
-                vacancy_user=vacancy_user,
-                call_type=CallType.RENEWAL_WORKER.value,
-                status=CallStatus.SENT.value,
-            )
             self.notifier.notify(
                 recipient=SimpleNamespace(chat_id=vacancy_user.user.id),
                 method=NotificationMethod.TEXT,
@@ -48,5 +45,4 @@ class VacancyRenewalWorkersObserver(Observer):
             )
 
         # Clear the flag — poll has been sent
-        vacancy.extra["pending_worker_renewal"] = False
-        vacancy.save(update_fields=["extra"])
+        set_lifecycle(vacancy, pending_worker_renewal=False)
@@ -15,16 +15,23 @@ class VacancyTopResendChannelObserver(Observer):
 
     def update(self, event: str, data: dict[str, Any]) -> None:
         vacancy = data["vacancy"]
-        filled_message = ChannelMessage.objects.filter(extra__vacancy_id=vacancy.id).last()
+        filled_message = ChannelMessage.objects.filter(vacancy=vacancy).last()
         if not filled_message:
             return
 
+        from django.db.models import OuterRef, Subquery
+
         from vacancy.choices import STATUS_APPROVED
         from vacancy.models import Vacancy
 
-        other_vacancies = Vacancy.objects.filter(status=STATUS_APPROVED, search_active=True).exclude(id=vacancy.id)
+        last_message_id = ChannelMessage.objects.filter(vacancy=OuterRef("pk")).order_by("-pk").values("message_id")[:1]
+        other_vacancies = (
+            Vacancy.objects.filter(status=STATUS_APPROVED, search_active=True)
+            .exclude(id=vacancy.id)
+            .annotate(last_message_id=Subquery(last_message_id))
+            .filter(last_message_id__lt=filled_message.message_id)
+            .select_related("channel")
+        )
 
         for v in other_vacancies:
-            v_message = ChannelMessage.objects.filter(extra__vacancy_id=v.id).last()
-            if v_message and v_message.message_id < filled_message.message_id:
-                resend_vacancy_to_channel(v)
+            resend_vacancy_to_channel(v)
@@ -36,16 +36,18 @@ from .events import (
 )
 from .feedback import VacancyFeedbackAdminObserver
 from .member_observer import VacancyIsFullObserver, VacancySlotFreedObserver
-from .publisher import VacancyEventPublisher
+from .publisher import DISPATCH_CELERY, DISPATCH_ON_COMMIT, VacancyEventPublisher
 from .refind_observer import VacancyRefindAdminObserver, VacancyRefindChannelObserver
 from .rejected_user_observer import VacancyRejectedUserObserver
 from .renewal_observer import VacancyRenewalWorkersObserver
 from .resend_channel_observer import VacancyTopResendChannelObserver
+from .timers_observer import VacancyScheduleTimersObserver
 from .vacancy_close import (
     VacancyDeleteEmployerInviteObserver,
     VacancyDeleteMessagesChannelObserver,
     VacancyDeleteMessagesObserver,
     VacancyGroupFeeStatusObserver,
+    VacancyGroupTeardownQueuedObserver,
     VacancyKickGroupUsersObserver,
     VacancyNotifyAdminsObserver,
     VacancyPaymentDoesNotExistObserver,
@@ -54,14 +56,21 @@ from .vacancy_close import (
 
 vacancy_publisher = VacancyEventPublisher()
 
+# Dispatch policies (publisher.py) apply only with VACANCY_OBSERVERS_ASYNC on.
+# Observers that change the vacancy row the caller keeps working with stay
+# sync; Telegram-only side effects go to Celery. Group teardown on close is one
+# "group_teardown" lane: delete messages, kick, then release the group. The lane
+# is marked queued by a sync step first, so the close timer does not re-fire it.
+
 telegram_notifier = TelegramNotifier(bot)
 vacancy_publisher.subscribe(VACANCY_CREATED, VacancyCreatedUserObserver(telegram_notifier))
-vacancy_publisher.subscribe(VACANCY_CREATED, VacancyCreatedAdminObserver(telegram_notifier))
+vacancy_publisher.subscribe(VACANCY_CREATED, VacancyCreatedAdminObserver(telegram_notifier), DISPATCH_ON_COMMIT)
 vacancy_publisher.subscribe(VACANCY_APPROVED, VacancyApprovedUserObserver(telegram_notifier))
 vacancy_publisher.subscribe(VACANCY_APPROVED, VacancyApprovedChannelObserver(telegram_notifier))
 vacancy_publisher.subscribe(VACANCY_APPROVED, VacancyApprovedGroupObserver(telegram_notifier))
 vacancy_publisher.subscribe(VACANCY_APPROVED, VacancyRenewalWorkersObserver(telegram_notifier))
-vacancy_publisher.subscribe(VACANCY_REJECTED, VacancyRejectedUserObserver(telegram_notifier))
+vacancy_publisher.subscribe(VACANCY_APPROVED, VacancyScheduleTimersObserver())
+vacancy_publisher.subscribe(VACANCY_REJECTED, VacancyRejectedUserObserver(telegram_notifier), DISPATCH_CELERY)
 
 vacancy_publisher.subscribe(VACANCY_NEW_MEMBER, VacancyIsFullObserver(telegram_notifier))
 vacancy_publisher.subscribe(VACANCY_NEW_MEMBER, VacancyTopResendChannelObserver(telegram_notifier))
@@ -69,7 +78,7 @@ vacancy_publisher.subscribe(VACANCY_LEFT_MEMBER, VacancySlotFreedObserver(telegr
 vacancy_publisher.subscribe(VACANCY_BEFORE_CALL, VacancyBeforeCallObserver(telegram_notifier))
 
 vacancy_publisher.subscribe(VACANCY_REFIND, VacancyRefindChannelObserver(telegram_notifier))
-vacancy_publisher.subscribe(VACANCY_REFIND, VacancyRefindAdminObserver(telegram_notifier))
+vacancy_publisher.subscribe(VACANCY_REFIND, VacancyRefindAdminObserver(telegram_notifier), DISPATCH_CELERY)
 
 vacancy_publisher.subscribe(VACANCY_START_CALL, VacancyStartCallObserver(telegram_notifier))
 vacancy_publisher.subscribe(VACANCY_START_CALL_FAIL, VacancyStartCallFailObserver(telegram_notifier))
@@ -77,7 +86,7 @@ vacancy_publisher.subscribe(VACANCY_AFTER_START_CALL, VacancyAfterStartCallObser
 vacancy_publisher.subscribe(VACANCY_AFTER_START_CALL_SUCCESS, VacancyAfterStartCallSuccessObserver(telegram_notifier))
 vacancy_publisher.subscribe(VACANCY_AFTER_START_CALL_FAIL, VacancyAfterStartCallFailObserver(telegram_notifier))
 
-vacancy_publisher.subscribe(VACANCY_NEW_FEEDBACK, VacancyFeedbackAdminObserver(telegram_notifier))
+vacancy_publisher.subscribe(VACANCY_NEW_FEEDBACK, VacancyFeedbackAdminObserver(telegram_notifier), DISPATCH_CELERY)
 
 auto_rating_observer = AutoRatingObserver()
 vacancy_publisher.subscribe(VACANCY_START_CALL_FAIL, auto_rating_observer)
@@ -87,13 +96,24 @@ vacancy_publisher.subscribe(VACANCY_CLOSE, auto_rating_observer)
 
 vacancy_publisher.subscribe(VACANCY_CLOSE, VacancyStatusClosedObserver(telegram_notifier))
 vacancy_publisher.subscribe(VACANCY_CLOSE, VacancyDeleteEmployerInviteObserver(telegram_notifier))
-vacancy_publisher.subscribe(VACANCY_CLOSE, VacancyDeleteMessagesObserver(telegram_notifier))
-vacancy_publisher.subscribe(VACANCY_CLOSE, VacancyKickGroupUsersObserver(telegram_notifier))
-vacancy_publisher.subscribe(VACANCY_CLOSE, VacancyGroupFeeStatusObserver(telegram_notifier))
-vacancy_publisher.subscribe(VACANCY_CLOSE, VacancyNotifyAdminsObserver(telegram_notifier))
-vacancy_publisher.subscribe(VACANCY_CLOSE_PAYMENT_DOES_NOT_EXIST, VacancyPaymentDoesNotExistObserver(telegram_notifier))
+vacancy_publisher.subscribe(VACANCY_CLOSE, VacancyGroupTeardownQueuedObserver())
+vacancy_publisher.subscribe(
+    VACANCY_CLOSE, VacancyDeleteMessagesObserver(telegram_notifier), DISPATCH_CELERY, lane="group_teardown"
+)
+vacancy_publisher.subscribe(
+    VACANCY_CLOSE, VacancyKickGroupUsersObserver(telegram_notifier), DISPATCH_CELERY, lane="group_teardown"
+)
+vacancy_publisher.subscribe(
+    VACANCY_CLOSE, VacancyGroupFeeStatusObserver(telegram_notifier), DISPATCH_CELERY, lane="group_teardown"
+)
+vacancy_publisher.subscribe(VACANCY_CLOSE, VacancyNotifyAdminsObserver(telegram_notifier), DISPATCH_CELERY)
+vacancy_publisher.subscribe(
+    VACANCY_CLOSE_PAYMENT_DOES_NOT_EXIST, VacancyPaymentDoesNotExistObserver(telegram_notifier), DISPATCH_CELERY
+)
 
-vacancy_publisher.subscribe(VACANCY_CLOSE_FORCIBLY, VacancyDeleteMessagesChannelObserver(telegram_notifier))
+vacancy_publisher.subscribe(
+    VACANCY_CLOSE_FORCIBLY, VacancyDeleteMessagesChannelObserver(telegram_notifier), DISPATCH_CELERY
+)
 
 vacancy_publisher.subscribe(VACANCY_DELETE, VacancyDeleteEmployerInviteObserver(telegram_notifier))
 vacancy_publisher.subscribe(VACANCY_DELETE, VacancyDeleteMessagesObserver(telegram_notifier))
@@ -0,0 +1,15 @@
+from typing import Any
+
+from .publisher import Observer
+
+
+class VacancyScheduleTimersObserver(Observer):
+    """
+    Fires on VACANCY_APPROVED (new vacancy, moderation, resume/continue search, renewal).
+    Re-arms the rollcall/close deadlines for the current cycle.
+    """
+
+    def update(self, event: str, data: dict[str, Any]) -> None:
+        from vacancy.services.timers import schedule_vacancy_timers
+
+        schedule_vacancy_timers(data["vacancy"])
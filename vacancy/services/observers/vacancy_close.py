@@ -1,16 +1,18 @@
 import functools
 import logging
+from types import SimpleNamespace
 from typing import Any
 
 from service.broadcast_service import TelegramBroadcastService
 from service.notifications_impl import TelegramNotifier
-from telegram.choices import STATUS_AVAILABLE
+from telegram.choices import STATUS_AVAILABLE, STATUS_RECYCLING
 from telegram.handlers.bot_instance import bot
 from telegram.service.group import GroupService
 from telegram.service.message_delete import MessageDeleter, MessageDeleteService
 from vacancy.choices import STATUS_CLOSED
 from vacancy.services.call_formatter import CallVacancyTelegramTextFormatter
-from vacancy.services.observers.publisher import Observer
+from vacancy.services.lifecycle import ROLLCALL_MSG_FIELDS, set_lifecycle
+from vacancy.services.observers.publisher import Observer, observers_async_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -50,15 +52,13 @@ class VacancyDeleteMessagesChannelObserver(Observer):
         # Edit channel message to "Вакансію закрито" instead of deleting
         if vacancy.channel:
             try:
-                from service.notifications import NotificationMethod
-                from service.telegram_strategy_factory import TelegramStrategyFactory
                 from telegram.models import ChannelMessage
                 from vacancy.services.vacancy_formatter import VacancyTelegramTextFormatter
 
                 channel_message = (
                     ChannelMessage.objects.filter(
                         channel_id=vacancy.channel.id,
-                        extra__vacancy_id=vacancy.id,
+                        vacancy=vacancy,
                     )
                     .order_by("-id")
                     .first()
@@ -66,8 +66,12 @@ class VacancyDeleteMessagesChannelObserver(Observer):
 
                 if channel_message:
                     text = VacancyTelegramTextFormatter(vacancy).for_channel(status="full")
-                    strategy = TelegramStrategyFactory.get_strategy(NotificationMethod.TEXT)
-                    strategy.update(bot, vacancy.channel.id, text=text, message_id=channel_message.message_id)
+                    self.notifier.notify(
+                        SimpleNamespace(chat_id=vacancy.channel.id),
+                        is_update=True,
+                        text=text,
+                        message_id=channel_message.message_id,
+                    )
                     logging.info(f"Channel message edited to closed for vacancy {vacancy.id}")
                 else:
                     logging.info(f"No channel message found for vacancy {vacancy.id}")
@@ -91,6 +95,23 @@ class VacancyKickGroupUsersObserver(Observer):
             logging.info("group reset skip - vacancy has no group")
 
 
+class VacancyGroupTeardownQueuedObserver(Observer):
+    """Mark the vacancy before the group_teardown lane goes to Celery.
+
+    The group is only detached at the end of that lane, so without the mark
+    close_lifecycle_timer_task would fire VACANCY_CLOSE again on every tick
+    until a worker got to it.
+    """
+
+    @log_warn_on_exception
+    def update(self, event: str, data: dict[str, Any]) -> None:
+        from django.utils import timezone as tz
+
+        vacancy = data["vacancy"]
+        if vacancy.group_id and observers_async_enabled():
+            set_lifecycle(vacancy, group_teardown_at=tz.now())
+
+
 class VacancyGroupFeeStatusObserver(Observer):
     def __init__(self, notifier: TelegramNotifier):
         self.notifier = notifier
@@ -100,15 +121,22 @@ class VacancyGroupFeeStatusObserver(Observer):
         from django.utils import timezone as tz
 
         vacancy = data["vacancy"]
-        if vacancy.group:
-            vacancy.group.status = STATUS_AVAILABLE
-            vacancy.group.last_used_at = tz.now()
-            vacancy.group.save(update_fields=["status", "last_used_at"])
+        group = vacancy.group
+        if group:
+            group.refresh_from_db(fields=["status"])
+            group.last_used_at = tz.now()
+            fields = ["last_used_at"]
+            # A recycling group goes back to the pool when group_recycling finishes with it.
+            if group.status != STATUS_RECYCLING:
+                group.status = STATUS_AVAILABLE
+                fields.append("status")
+            group.save(update_fields=fields)
 
             vacancy.group = None
-            vacancy.save(update_fields=["group"])
+            vacancy.group_teardown_at = None
+            vacancy.save(update_fields=["group", "group_teardown_at"])
 
-            logging.info(f"set vacancy group status - {STATUS_AVAILABLE}")
+            logging.info(f"set vacancy group status - {group.status}")
 
 
 class VacancyStatusClosedObserver(Observer):
@@ -127,15 +155,13 @@ class VacancyStatusClosedObserver(Observer):
         # Edit channel message: remove button, show "Вакансію закрито"
         if vacancy.channel:
             try:
-                from service.notifications import NotificationMethod
-                from service.telegram_strategy_factory import TelegramStrategyFactory
                 from telegram.models import ChannelMessage
                 from vacancy.services.vacancy_formatter import VacancyTelegramTextFormatter
 
                 channel_message = (
                     ChannelMessage.objects.filter(
                         channel_id=vacancy.channel.id,
-                        extra__vacancy_id=vacancy.id,
+                        vacancy=vacancy,
                     )
                     .order_by("-id")
                     .first()
@@ -143,8 +169,12 @@ class VacancyStatusClosedObserver(Observer):
 
                 if channel_message:
                     text = VacancyTelegramTextFormatter(vacancy).for_channel(status="full")
-                    strategy = TelegramStrategyFactory.get_strategy(NotificationMethod.TEXT)
-                    strategy.update(bot, vacancy.channel.id, text=text, message_id=channel_message.message_id)
+                    self.notifier.notify(
+                        SimpleNamespace(chat_id=vacancy.channel.id),
+                        is_update=True,
+                        text=text,
+                        message_id=channel_message.message_id,
+                    )
                     logging.info(f"Channel message updated to closed for vacancy {vacancy.id}")
             except Exception as e:
                 logging.warning(f"Failed to update channel message for vacancy {vacancy.id}: {e}")
@@ -189,10 +219,25 @@ class VacancyDeleteEmployerInviteObserver(Observer):
     @log_warn_on_exception
     def update(self, event: str, data: dict[str, Any]) -> None:
         vacancy = data["vacancy"]
+        owner_id = vacancy.owner.id
+
+        # Видалити повідомлення переклички заказчика (колонки Vacancy)
+        cleared = {}
+        for field in ROLLCALL_MSG_FIELDS.values():
+            msg_id = getattr(vacancy, field)
+            if msg_id:
+                try:
+                    bot.delete_message(chat_id=owner_id, message_id=msg_id)
+                    logging.info(f"Deleted {field}={msg_id} for vacancy {vacancy.id}")
+                except Exception as e:
+                    logging.warning(f"Failed to delete {field}={msg_id}: {e}")
+                cleared[field] = None
+        if cleared:
+            set_lifecycle(vacancy, **cleared)
+
         if not vacancy.extra:
             return
 
-        owner_id = vacancy.owner.id
         keys_to_delete = []
 
         # Видалити повідомлення заказчика: invite, created, approved
@@ -200,8 +245,6 @@ class VacancyDeleteEmployerInviteObserver(Observer):
             "employer_invite_msg_id",
             "created_msg_id",
             "approved_msg_id",
-            "start_call_msg_id",
-            "final_call_msg_id",
         ]:
             msg_id = vacancy.extra.get(key)
             if msg_id:
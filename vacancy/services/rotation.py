@@ -0,0 +1,83 @@
+"""Channel rotation planning: which searching vacancies get republished on this tick.
+
+The last channel-message time of every candidate comes from one annotated
+query. Due vacancies are grouped per channel and each channel gets a per-tick
+budget, so a city channel with many searching vacancies receives its
+republishes spread across the rotation window instead of in one burst.
+"""
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import chain, zip_longest
+
+from django.db.models import OuterRef, QuerySet, Subquery
+from django.utils import timezone
+
+from telegram.models import ChannelMessage
+from vacancy.choices import STATUS_APPROVED
+from vacancy.models import Vacancy
+
+ROTATION_INTERVAL = timedelta(minutes=5)
+ROTATION_TICK = timedelta(seconds=30)  # beat period of resend_vacancies_to_channel_task
+
+
+@dataclass
+class RotationReport:
+    candidates: int = 0
+    due: int = 0
+    republished: int = 0
+    skipped: int = 0
+
+
+@dataclass
+class RotationPlan:
+    scheduled: list[Vacancy] = field(default_factory=list)
+    report: RotationReport = field(default_factory=RotationReport)
+
+
+def with_last_channel_message_at(queryset: QuerySet[Vacancy]) -> QuerySet[Vacancy]:
+    """Annotate `last_channel_message_at` (None when the vacancy was never posted)."""
+    latest = ChannelMessage.objects.filter(vacancy=OuterRef("pk")).order_by("-created_at").values("created_at")[:1]
+    return queryset.annotate(last_channel_message_at=Subquery(latest))
+
+
+def rotation_candidates() -> QuerySet[Vacancy]:
+    return with_last_channel_message_at(
+        Vacancy.objects.filter(status=STATUS_APPROVED, search_active=True, channel__isnull=False).select_related(
+            "channel"
+        )
+    )
+
+
+def _is_due(vacancy: Vacancy, threshold: datetime) -> bool:
+    last = vacancy.last_channel_message_at
+    return last is None or last <= threshold
+
+
+def plan_rotation(now: datetime | None = None) -> RotationPlan:
+    """Pick this tick's republishes: oldest first, at most ceil(channel size / ticks per window) per channel."""
+    now = now or timezone.now()
+    threshold = now - ROTATION_INTERVAL
+    ticks_per_window = max(1, int(ROTATION_INTERVAL / ROTATION_TICK))
+
+    by_channel: dict[int, list[Vacancy]] = defaultdict(list)
+    for vacancy in rotation_candidates():
+        by_channel[vacancy.channel_id].append(vacancy)
+
+    plan = RotationPlan()
+    per_channel = []
+    for vacancies in by_channel.values():
+        due = sorted(
+            (v for v in vacancies if _is_due(v, threshold)),
+            key=lambda v: (v.last_channel_message_at is not None, v.last_channel_message_at or now, v.pk),
+        )
+        budget = math.ceil(len(vacancies) / ticks_per_window)
+        per_channel.append(due[:budget])
+        plan.report.candidates += len(vacancies)
+        plan.report.due += len(due)
+
+    # Interleave channels so consecutive sends go to different chats.
+    plan.scheduled = [v for v in chain.from_iterable(zip_longest(*per_channel)) if v is not None]
+    return plan
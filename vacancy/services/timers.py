@@ -0,0 +1,98 @@
+"""Per-vacancy lifecycle deadlines.
+
+Deadlines are computed once when a vacancy is (re)approved and stored in
+VacancyTimer. The timer tick only reads rows that are already due, so its
+cost does not grow with the number of active vacancies.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+from django.utils import timezone
+
+from vacancy.choices import (
+    TIMER_AFTER_FIRST,
+    TIMER_BEFORE_START,
+    TIMER_CLOSE,
+    TIMER_FINAL,
+    TIMER_RENEWAL,
+    TIMER_START,
+)
+from vacancy.models import Vacancy, VacancyTimer
+
+logger = logging.getLogger(__name__)
+
+BEFORE_START_MINUTES = 120
+AFTER_FIRST_MINUTES = 20
+FINAL_CALL_MINUTES = 60
+CLOSE_DELAY_MINUTES = 120
+DISPATCH_BATCH_SIZE = 100
+RETRY_DELAY = timedelta(seconds=30)
+MAX_RETRIES = 5
+
+
+def compute_deadlines(vacancy: Vacancy) -> dict[str, datetime]:
+    """Rollcall/close deadlines for the current cycle of the vacancy."""
+    from vacancy.tasks.call import _get_cycle_start_aware, _get_end_aware, _get_start_aware
+
+    cycle_start = _get_cycle_start_aware(vacancy)
+    end = _get_end_aware(vacancy)
+    return {
+        TIMER_BEFORE_START: cycle_start - timedelta(minutes=BEFORE_START_MINUTES),
+        TIMER_AFTER_FIRST: cycle_start - timedelta(minutes=BEFORE_START_MINUTES - AFTER_FIRST_MINUTES),
+        TIMER_START: _get_start_aware(vacancy),
+        TIMER_FINAL: end - timedelta(minutes=FINAL_CALL_MINUTES),
+        TIMER_CLOSE: end + timedelta(minutes=CLOSE_DELAY_MINUTES),
+    }
+
+
+def arm_timer(vacancy: Vacancy, kind: str, due_at: datetime) -> None:
+    """(Re)arm a single deadline; a fired timer becomes pending again."""
+    VacancyTimer.objects.update_or_create(
+        vacancy=vacancy,
+        kind=kind,
+        defaults={"due_at": due_at, "fired_at": None, "attempts": 0},
+    )
+
+
+def schedule_vacancy_timers(vacancy: Vacancy) -> None:
+    """Arm every rollcall/close deadline of the vacancy. Called on approval and edits."""
+    for kind, due_at in compute_deadlines(vacancy).items():
+        arm_timer(vacancy, kind, due_at)
+    logger.info("vacancy_timers_scheduled", extra={"vacancy_id": vacancy.pk})
+
+
+def schedule_renewal_timer(vacancy: Vacancy) -> None:
+    """Arm the renewal offer right away. Called once the vacancy is paid."""
+    arm_timer(vacancy, TIMER_RENEWAL, timezone.now())
+
+
+def retry_timer(timer: VacancyTimer, now: datetime) -> bool:
+    """Re-arm a timer whose handler failed, with exponential backoff. False once retries are exhausted."""
+    if timer.attempts >= MAX_RETRIES:
+        logger.error(
+            "vacancy_timer_gave_up",
+            extra={"vacancy_id": timer.vacancy_id, "kind": timer.kind, "attempts": timer.attempts},
+        )
+        return False
+    timer.attempts += 1
+    timer.due_at = now + RETRY_DELAY * 2 ** (timer.attempts - 1)
+    timer.fired_at = None
+    timer.save(update_fields=["attempts", "due_at", "fired_at", "updated_at"])
+    return True
+
+
+def pop_due_timers(now: datetime | None = None, limit: int = DISPATCH_BATCH_SIZE) -> list[VacancyTimer]:
+    """Claim due timers. Each armed timer is returned to exactly one caller."""
+    now = now or timezone.now()
+    due_ids = list(
+        VacancyTimer.objects.filter(fired_at__isnull=True, due_at__lte=now)
+        .order_by("due_at")
+        .values_list("id", flat=True)[:limit]
+    )
+    claimed = []
+    for timer_id in due_ids:
+        # Conditional UPDATE is the claim: a concurrent tick gets rowcount 0.
+        if VacancyTimer.objects.filter(pk=timer_id, fired_at__isnull=True).update(fired_at=now):
+            claimed.append(timer_id)
+    return list(VacancyTimer.objects.filter(pk__in=claimed).select_related("vacancy").order_by("due_at"))
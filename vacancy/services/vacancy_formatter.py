@@ -1,24 +1,125 @@
+"""
+Vacancy texts for Telegram.
+
+Channel/group texts are cached per vacancy: the key holds the vacancy id, a
+render version bumped on every membership change (the "needed" figure) and a
+fingerprint of the fields the text is built from (so an edited, even unsaved,
+instance never gets a stale text), plus today's date for the date label.
+Labels come from a per-language table built once per process.
+"""
+
+import hashlib
+import time
 from datetime import date
+from functools import lru_cache
 from typing import Literal
 
+from django.core.cache import cache
 from django.utils.translation import gettext as _
 from django.utils.translation import override
 
 from user.models import UserFeedback
+from vacancy.choices import GENDER_CHOICES, PAYMENT_METHOD_CHOICES, PAYMENT_UNIT_CHOICES
 from vacancy.models import Vacancy
 
+TEXT_LANGUAGE = "uk"
+RENDER_CACHE_TTL = 24 * 60 * 60
+_RENDER_VERSION_KEY = "vacancy_render_version:{vacancy_id}"
+_RENDER_KEY = "vacancy_render:{vacancy_id}:{version}:{variant}:{fingerprint}"
+
+_LABELS = (
+    "Today",
+    "Tomorrow",
+    "of",
+    "Gender",
+    "Working hours",
+    "from",
+    "to",
+    "Number of People",
+    "Need passport",
+    "Payment",
+    "uah",
+    "Vacancy is close",
+)
+
+
+@lru_cache(maxsize=8)
+def label_table(language: str) -> dict[str, str]:
+    """Translated labels and choice names for one language."""
+    with override(language):
+        table = {label: _(label) for label in _LABELS}
+        for field, choices in (
+            ("gender", GENDER_CHOICES),
+            ("payment_unit", PAYMENT_UNIT_CHOICES),
+            ("payment_method", PAYMENT_METHOD_CHOICES),
+        ):
+            table.update({f"{field}:{value}": str(name) for value, name in choices})
+    return table
+
+
+def render_version(vacancy_id: int) -> int:
+    key = _RENDER_VERSION_KEY.format(vacancy_id=vacancy_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), RENDER_CACHE_TTL)
+        version = cache.get(key)
+    return version
+
+
+def bump_render_version(vacancy_id: int) -> None:
+    """Call after changing the vacancy's members without a VacancyUser save (queryset .update())."""
+    # A fresh token rather than incr(): an expired key can never bring an old version back.
+    cache.set(_RENDER_VERSION_KEY.format(vacancy_id=vacancy_id), time.time_ns(), RENDER_CACHE_TTL)
+
 
 class VacancyTelegramTextFormatter:
     def __init__(self, vacancy: Vacancy):
         self.vacancy = vacancy
+        self.labels = label_table(TEXT_LANGUAGE)
+
+    def _choice(self, field: str) -> str:
+        value = getattr(self.vacancy, field)
+        return self.labels.get(f"{field}:{value}", value)
+
+    def _fingerprint(self) -> str:
+        v = self.vacancy
+        raw = repr(
+            (
+                date.today(),
+                v.date,
+                v.gender,
+                v.start_time,
+                v.end_time,
+                v.people_count,
+                v.map_link,
+                v.address,
+                v.skills,
+                v.has_passport,
+                v.payment_amount,
+                v.payment_unit,
+                v.payment_method,
+            )
+        )
+        return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
+    def _cached(self, variant: str, render) -> str:
+        if self.vacancy.pk is None:
+            return render()
+        key = _RENDER_KEY.format(
+            vacancy_id=self.vacancy.pk,
+            version=render_version(self.vacancy.pk),
+            variant=variant,
+            fingerprint=self._fingerprint(),
+        )
+        text = cache.get(key)
+        if text is None:
+            text = render()
+            cache.set(key, text, RENDER_CACHE_TTL)
+        return text
 
     def _get_date_label(self) -> str:
         """Dynamic: if vacancy.date == today -> Сьогодні, else Завтра."""
-        with override("uk"):
-            if self.vacancy.date == date.today():
-                return _("Today")
-            else:
-                return _("Tomorrow")
+        return self.labels["Today"] if self.vacancy.date == date.today() else self.labels["Tomorrow"]
 
     def _get_needed_count(self) -> int:
         """How many workers still needed."""
@@ -27,25 +128,28 @@ class VacancyTelegramTextFormatter:
         return max(needed, 0)
 
     def base_format(self, show_needed: bool = False) -> str:
-        with override("uk"):
-            date_label = self._get_date_label()
-            people_display = self.vacancy.people_count
-            if show_needed:
-                needed = self._get_needed_count()
-                if needed < self.vacancy.people_count:
-                    people_display = f"{needed} ({_('of')} {self.vacancy.people_count})"
-
-            return (
-                f"{date_label} {self.vacancy.date.strftime('%d.%m.%Y')}\n"
-                f"{_('Gender')}: {self.vacancy.get_gender_display()}\n"
-                f"{_('Working hours')}: {_('from')} {self.vacancy.start_time.strftime('%H:%M')} {_('to')} {self.vacancy.end_time.strftime('%H:%M')}\n"
-                f"{_('Number of People')}: {people_display}\n"
-                f'<a href="{self.vacancy.map_link}">{self.vacancy.address}</a>\n\n'
-                f"{self.vacancy.skills}\n\n"
-                + (f"{_('Need passport')}!\n" if self.vacancy.has_passport else "")
-                + f"{_('Payment')}: {int(self.vacancy.payment_amount)} {_('uah')} "
-                f"({self.vacancy.get_payment_unit_display()}/{self.vacancy.get_payment_method_display()})\n"
-            )
+        return self._cached("needed" if show_needed else "base", lambda: self._render_base(show_needed))
+
+    def _render_base(self, show_needed: bool) -> str:
+        labels = self.labels
+        people_display = self.vacancy.people_count
+        if show_needed:
+            needed = self._get_needed_count()
+            if needed < self.vacancy.people_count:
+                people_display = f"{needed} ({labels['of']} {self.vacancy.people_count})"
+
+        return (
+            f"{self._get_date_label()} {self.vacancy.date.strftime('%d.%m.%Y')}\n"
+            f"{labels['Gender']}: {self._choice('gender')}\n"
+            f"{labels['Working hours']}: {labels['from']} {self.vacancy.start_time.strftime('%H:%M')} "
+            f"{labels['to']} {self.vacancy.end_time.strftime('%H:%M')}\n"
+            f"{labels['Number of People']}: {people_display}\n"
+            f'<a href="{self.vacancy.map_link}">{self.vacancy.address}</a>\n\n'
+            f"{self.vacancy.skills}\n\n"
+            + (f"{labels['Need passport']}!\n" if self.vacancy.has_passport else "")
+            + f"{labels['Payment']}: {int(self.vacancy.payment_amount)} {labels['uah']} "
+            f"({self._choice('payment_unit')}/{self._choice('payment_method')})\n"
+        )
 
     def for_creator_chat(self) -> str:
         return _("Your request has been created and is being moderated") + "\n" * 2 + self.base_format()
@@ -78,21 +182,22 @@ class VacancyTelegramTextFormatter:
 
     def for_channel(self, status: Literal["full"] | None = None) -> str:
         if status == "full":
-            with override("uk"):
-                date_label = self._get_date_label()
-                return (
-                    f"{date_label} {self.vacancy.date.strftime('%d.%m.%Y')}\n"
-                    f"{_('Gender')}: {self.vacancy.get_gender_display()}\n"
-                    f"{_('Working hours')}: {_('from')} {self.vacancy.start_time.strftime('%H:%M')} {_('to')} {self.vacancy.end_time.strftime('%H:%M')}\n"
-                    f"{_('Number of People')}: {self.vacancy.people_count}\n\n"
-                    f"{self.vacancy.skills}\n\n"
-                    + (f"{_('Need passport')}!\n" if self.vacancy.has_passport else "")
-                    + f"{_('Payment')}: {int(self.vacancy.payment_amount)} {_('uah')} "
-                    f"({self.vacancy.get_payment_unit_display()}/{self.vacancy.get_payment_method_display()})\n"
-                    + f"{_('Vacancy is close')}"
-                )
-        else:
-            return self.base_format(show_needed=True)
+            return self._cached("full", self._render_full)
+        return self.base_format(show_needed=True)
+
+    def _render_full(self) -> str:
+        labels = self.labels
+        return (
+            f"{self._get_date_label()} {self.vacancy.date.strftime('%d.%m.%Y')}\n"
+            f"{labels['Gender']}: {self._choice('gender')}\n"
+            f"{labels['Working hours']}: {labels['from']} {self.vacancy.start_time.strftime('%H:%M')} "
+            f"{labels['to']} {self.vacancy.end_time.strftime('%H:%M')}\n"
+            f"{labels['Number of People']}: {self.vacancy.people_count}\n\n"
+            f"{self.vacancy.skills}\n\n"
+            + (f"{labels['Need passport']}!\n" if self.vacancy.has_passport else "")
+            + f"{labels['Payment']}: {int(self.vacancy.payment_amount)} {labels['uah']} "
+            f"({self._choice('payment_unit')}/{self._choice('payment_method')})\n" + labels["Vacancy is close"]
+        )
 
     def for_group(self) -> str:
         return self.base_format()
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from vacancy.models import VacancyUser
+from vacancy.services.vacancy_formatter import bump_render_version
+
+
+@receiver(post_save, sender=VacancyUser)
+@receiver(post_delete, sender=VacancyUser)
+def bump_vacancy_render_version(sender, instance: VacancyUser, **kwargs):
+    """Membership drives the "needed" figure in the channel text."""
+    bump_render_version(instance.vacancy_id)
@@ -1 +1,2 @@
 from vacancy.tasks.employer_group_invite import send_employer_group_invite_task  # noqa
+from vacancy.tasks.observers import run_vacancy_observers_task  # noqa
@@ -1,16 +1,29 @@
 import logging
+from collections import defaultdict
 from collections.abc import Iterable
 from datetime import date, datetime, timedelta
 
 import sentry_sdk
 from celery import shared_task
 from django.db import connection
+from django.db.models import Q
 from django.utils import timezone
 
-from telegram.choices import CallStatus, CallType
+from telegram.choices import CallStatus, CallType, Status
 from telegram.service.group import GroupService
-from vacancy.choices import STATUS_APPROVED, STATUS_CLOSED, STATUS_SEARCH_STOPPED
+from vacancy.choices import (
+    STATUS_APPROVED,
+    STATUS_CLOSED,
+    STATUS_SEARCH_STOPPED,
+    TIMER_AFTER_FIRST,
+    TIMER_BEFORE_START,
+    TIMER_CLOSE,
+    TIMER_FINAL,
+    TIMER_RENEWAL,
+    TIMER_START,
+)
 from vacancy.models import Vacancy, VacancyUserCall
+from vacancy.services.lifecycle import ROLLCALL_MSG_FIELDS, rollcall_message_id, set_lifecycle
 from vacancy.services.observers.events import (
     VACANCY_AFTER_START_CALL,
     VACANCY_BEFORE_CALL,
@@ -40,6 +53,21 @@ def _get_end_aware(vacancy: Vacancy) -> datetime:
     return timezone.make_aware(end_naive, timezone.get_current_timezone())
 
 
+def _get_cycle_start_aware(vacancy: Vacancy) -> datetime:
+    """Start of the current rollcall cycle: extra["original_start_datetime"] if set, else live start."""
+    orig_iso = (vacancy.extra or {}).get("original_start_datetime")
+    if orig_iso:
+        try:
+            start_aware = datetime.fromisoformat(orig_iso)
+            if timezone.is_naive(start_aware):
+                start_aware = timezone.make_aware(start_aware, timezone.get_current_timezone())
+            return start_aware
+        except (ValueError, TypeError):
+            pass
+    # Legacy fallback for vacancies created before this field existed.
+    return _get_start_aware(vacancy)
+
+
 def _get_owner_contact_phone(vacancy) -> str | None:
     from vacancy.models import VacancyContactPhone
 
@@ -55,20 +83,18 @@ def _send_rollcall_reminder(vacancy: Vacancy, call_type: CallType) -> None:
     if call_type == CallType.START:
         text = CallVacancyTelegramTextFormatter(vacancy=vacancy).start_call()
         markup = get_start_call_markup(vacancy=vacancy)
-        msg_key = "start_call_msg_id"
     else:
         text = CallVacancyTelegramTextFormatter(vacancy=vacancy).final_call()
         markup = get_final_call_markup(vacancy=vacancy)
-        msg_key = "final_call_msg_id"
 
-    prev_msg_id = (vacancy.extra or {}).get(msg_key)
     new_msg_id = send_and_track(
-        chat_id=vacancy.owner.id, text=text, reply_markup=markup, previous_message_id=prev_msg_id
+        chat_id=vacancy.owner.id,
+        text=text,
+        reply_markup=markup,
+        previous_message_id=rollcall_message_id(vacancy, call_type),
     )
     if new_msg_id:
-        if not vacancy.extra:
-            vacancy.extra = {}
-        vacancy.extra[msg_key] = new_msg_id
+        set_lifecycle(vacancy, **{ROLLCALL_MSG_FIELDS[call_type]: new_msg_id})
 
 
 def _escalate_rollcall(vacancy: Vacancy, call_label: str) -> None:
@@ -77,12 +103,11 @@ def _escalate_rollcall(vacancy: Vacancy, call_label: str) -> None:
     from vacancy.services.admin_format import format_group_link, format_user_block_with_contact
 
     # Delete last reminder message
-    for msg_key in ("start_call_msg_id", "final_call_msg_id"):
-        prev_msg_id = (vacancy.extra or {}).get(msg_key)
+    for msg_field in ROLLCALL_MSG_FIELDS.values():
+        prev_msg_id = getattr(vacancy, msg_field)
         if prev_msg_id:
             delete_bot_message(vacancy.owner.id, prev_msg_id)
-            vacancy.extra.pop(msg_key, None)
-    vacancy.save(update_fields=["extra"])
+            set_lifecycle(vacancy, **{msg_field: None})
 
     owner_block = format_user_block_with_contact(vacancy.owner, vacancy)
     group = format_group_link(vacancy)
@@ -123,16 +148,16 @@ def _escalate_rollcall(vacancy: Vacancy, call_label: str) -> None:
         except Exception:
             pass
     else:
-        from vacancy.models import VacancyUserCall
-        from vacancy.services.call import create_vacancy_call
+        from vacancy.services.call import apply_rollcall, create_vacancy_call
 
         if not vacancy.first_rollcall_passed:
             ct = CallType.START
+            member_ids = list(members.values_list("user_id", flat=True))
             create_vacancy_call(vacancy=vacancy, call_type=ct, status=CallStatus.CREATED)
-            VacancyUserCall.objects.filter(vacancy_user__in=members, call_type=ct).update(status=CallStatus.CONFIRM)
+            apply_rollcall(members, call_type=ct, confirmed_user_ids=member_ids)
             # Save confirmed workers to extra for invoice calculation
             extra_calls = vacancy.extra.get("calls", {})
-            extra_calls[ct] = list(members.values_list("user_id", flat=True))
+            extra_calls[ct] = member_ids
             vacancy.extra["calls"] = extra_calls
             vacancy.first_rollcall_passed = True
             vacancy.save(update_fields=["first_rollcall_passed", "extra"])
@@ -181,9 +206,7 @@ def _update_channel_search_stopped(vacancy: Vacancy) -> None:
         from vacancy.services.vacancy_formatter import VacancyTelegramTextFormatter
 
         channel_message = (
-            ChannelMessage.objects.filter(channel_id=vacancy.channel.id, extra__vacancy_id=vacancy.id)
-            .order_by("-id")
-            .first()
+            ChannelMessage.objects.filter(channel_id=vacancy.channel.id, vacancy=vacancy).order_by("-id").first()
         )
         if channel_message:
             text = VacancyTelegramTextFormatter(vacancy).for_channel(status="full")
@@ -197,33 +220,20 @@ def get_before_start_vacancies(delay: Minutes = 120) -> Iterable[Vacancy]:
     """Vacancies inside the 2h-before-start window for BEFORE_START rollcall.
 
     Two defense layers against re-sending the notice after continue_search:
-    (1) extra["pre_call_done"] flag — set after first successful dispatch,
+    (1) pre_call_done flag — set after first successful dispatch,
         cleared only when a NEW cycle begins (resume_search/renewal/moderation).
     (2) extra["original_start_datetime"] anchor — used instead of the live
         start_time, which continue_search may shift forward.
     """
-    vacancies = Vacancy.objects.filter(status=STATUS_APPROVED, date=date.today())
+    # Layer 1: skip if 2h notice already dispatched in current cycle.
+    vacancies = Vacancy.objects.filter(status=STATUS_APPROVED, date=date.today(), pre_call_done=False)
 
     naive_now = datetime.now()
     aware_now = timezone.make_aware(naive_now, timezone.get_current_timezone())
     filtered_vacancies = []
     for vacancy in vacancies:
-        # Layer 1: skip if 2h notice already dispatched in current cycle.
-        if (vacancy.extra or {}).get("pre_call_done"):
-            continue
-
         # Layer 2: anchor window to the original cycle start, not live start_time.
-        orig_iso = (vacancy.extra or {}).get("original_start_datetime")
-        if orig_iso:
-            try:
-                start_aware = datetime.fromisoformat(orig_iso)
-                if timezone.is_naive(start_aware):
-                    start_aware = timezone.make_aware(start_aware, timezone.get_current_timezone())
-            except (ValueError, TypeError):
-                start_aware = _get_start_aware(vacancy)
-        else:
-            # Legacy fallback for vacancies created before this field existed.
-            start_aware = _get_start_aware(vacancy)
+        start_aware = _get_cycle_start_aware(vacancy)
 
         before_start_time = start_aware - timedelta(minutes=delay)
         if before_start_time < aware_now < start_aware:
@@ -282,17 +292,26 @@ def before_start_call(vacancies: Iterable[Vacancy]):
 
 
 def after_first_call_check(vacancies: Iterable[Vacancy], delay: Minutes = 20):
-    for vacancy in vacancies:
-        calls = VacancyUserCall.objects.filter(vacancy_user__in=vacancy.members, call_type=CallType.AFTER_START)
-        for call in calls:
-            if timezone.now() - call.created_at > timedelta(minutes=delay):
-                if not call.status == CallStatus.CONFIRM:
-                    try:
-                        GroupService.kick_user(
-                            chat_id=call.vacancy_user.vacancy.group.id, user_id=call.vacancy_user.user.id
-                        )
-                    except Exception:
-                        sentry_sdk.capture_exception()
+    """Kick members whose AFTER_START call is still unconfirmed `delay` minutes after it was sent."""
+    overdue = (
+        VacancyUserCall.objects.filter(
+            vacancy_user__vacancy__in=[vacancy.pk for vacancy in vacancies],
+            vacancy_user__vacancy__group__isnull=False,
+            vacancy_user__status=Status.MEMBER,
+            call_type=CallType.AFTER_START,
+            created_at__lt=timezone.now() - timedelta(minutes=delay),
+        )
+        .exclude(status=CallStatus.CONFIRM)
+        .values_list("vacancy_user__vacancy__group_id", "vacancy_user__user_id")
+    )
+    by_group = defaultdict(list)
+    for group_id, user_id in overdue:
+        by_group[group_id].append(user_id)
+    for group_id, user_ids in by_group.items():
+        try:
+            GroupService.kick_users(chat_id=group_id, user_ids=user_ids)
+        except Exception:
+            sentry_sdk.capture_exception()
 
 
 _REMINDER_INTERVAL = 300  # 5 minutes in seconds
@@ -301,16 +320,14 @@ _MAX_REMINDERS = 12
 
 def start_call_check(vacancies: Iterable[Vacancy]):
     for vacancy in vacancies:
-        sent_start_call = vacancy.extra.get("sent_start_call", False)
-
-        if not sent_start_call:
+        if not vacancy.sent_start_call:
             # Initial send
             vacancy_publisher.notify(VACANCY_START_CALL, data={"vacancy": vacancy})
-            vacancy.extra["sent_start_call"] = True
+            vacancy.sent_start_call = True
             vacancy.extra["start_call_sent_at"] = timezone.now().timestamp()
             vacancy.extra["start_call_reminders"] = 0
 
-            fields_to_save = ["extra"]
+            fields_to_save = ["extra", "sent_start_call"]
             if vacancy.search_active or vacancy.status == STATUS_APPROVED:
                 vacancy.status = STATUS_SEARCH_STOPPED
                 vacancy.search_active = False
@@ -337,15 +354,13 @@ def start_call_check(vacancies: Iterable[Vacancy]):
 
 def final_call_check(vacancies: Iterable[Vacancy]):
     for vacancy in vacancies:
-        sent_final_call = vacancy.extra.get("sent_final_call", False)
-
-        if not sent_final_call:
+        if not vacancy.sent_final_call:
             # Initial send
             vacancy_publisher.notify(VACANCY_AFTER_START_CALL, data={"vacancy": vacancy})
-            vacancy.extra["sent_final_call"] = True
+            vacancy.sent_final_call = True
             vacancy.extra["final_call_sent_at"] = timezone.now().timestamp()
             vacancy.extra["final_call_reminders"] = 0
-            vacancy.save(update_fields=["extra"])
+            vacancy.save(update_fields=["extra", "sent_final_call"])
 
         elif not vacancy.second_rollcall_passed and not vacancy.extra.get("final_call_escalated"):
             elapsed = timezone.now().timestamp() - vacancy.extra.get("final_call_sent_at", 0)
@@ -365,7 +380,7 @@ def final_call_check(vacancies: Iterable[Vacancy]):
 
 def close_vacancy(vacancy: Vacancy):
     if not vacancy.extra.get("payment_checked", False):
-        if vacancy.extra.get("is_paid", False):
+        if vacancy.is_paid:
             vacancy_publisher.notify(VACANCY_CLOSE, data={"vacancy": vacancy})
         else:
             vacancy_publisher.notify(VACANCY_CLOSE_PAYMENT_DOES_NOT_EXIST, data={"vacancy": vacancy})
@@ -448,6 +463,10 @@ def close_vacancy_task(delay: Minutes = 120):
     logger.info("task_completed", extra={"task": "close_vacancy_task", "processed": processed})
 
 
+# A queued group teardown not finished by then is fired again.
+_GROUP_TEARDOWN_GRACE = timedelta(minutes=15)
+
+
 @shared_task
 def close_lifecycle_timer_task():
     """
@@ -459,7 +478,14 @@ def close_lifecycle_timer_task():
     threshold = timezone.now() - timedelta(hours=3)
 
     # Case a: employer pressed "Закрити вакансію" — closed_at timer, group still attached
-    for vacancy in Vacancy.objects.filter(closed_at__isnull=False, closed_at__lte=threshold, group__isnull=False):
+    # and no teardown queued (or the queued one is overdue).
+    teardown_overdue = timezone.now() - _GROUP_TEARDOWN_GRACE
+    for vacancy in Vacancy.objects.filter(
+        Q(group_teardown_at__isnull=True) | Q(group_teardown_at__lte=teardown_overdue),
+        closed_at__isnull=False,
+        closed_at__lte=threshold,
+        group__isnull=False,
+    ):
         logger.info(f"close_lifecycle_timer_task: freeing group for vacancy {vacancy.pk} (closed_at timer)")
         vacancy_publisher.notify(VACANCY_CLOSE, data={"vacancy": vacancy})
 
@@ -533,10 +559,14 @@ def worker_join_confirm_check_task():
             # Worker is NOT in group yet — mark as LEFT, notify
             from telegram.models import Status
             from vacancy.models import VacancyUser
+            from vacancy.services.vacancy_formatter import bump_render_version
+            from work.service.dashboard import invalidate_dashboard
 
             VacancyUser.objects.filter(user=user, vacancy=vacancy, status=Status.PENDING_CONFIRM).update(
-                status=Status.LEFT
+                status=Status.LEFT, updated_at=timezone.now()
             )
+            bump_render_version(vacancy.pk)
+            invalidate_dashboard(user.id)
             call.status = CallStatus.REJECT.value
             call.save(update_fields=["status"])
             # Clean up contact phone so re-apply starts fresh
@@ -611,78 +641,81 @@ _RENEWAL_WORKER_INTERVAL = 300  # 5 minutes in seconds
 _RENEWAL_WORKER_MAX_REMINDERS = 4
 
 
-@shared_task
-def renewal_offer_task():
-    """
-    Runs every 30s. Sends renewal offer to employer after payment.
-    Repeats every 30 min up to 6 times (3 hours total).
-    """
-    logger.info("task_started", extra={"task": "renewal_offer_task"})
-    connection.close()
-    from django.db.models import Q
-
+def _renewal_offer_step(vacancy: Vacancy) -> None:
+    """Send the renewal offer or the next 30-min reminder for one paid vacancy."""
     from vacancy.services.call_formatter import CallVacancyTelegramTextFormatter
     from vacancy.services.call_markup import get_renewal_offer_markup
 
-    candidates = (
-        Vacancy.objects.filter(second_rollcall_passed=True, closed_at__isnull=True)
-        .filter(extra__is_paid=True)
-        .exclude(Q(extra__renewal_offered=True))
-    )
+    extra = vacancy.extra
+    # Skip if employer already responded
+    if extra.get("renewal_accepted") or extra.get("renewal_declined"):
+        set_lifecycle(vacancy, renewal_offered=True)
+        return
 
-    for vacancy in candidates:
-        extra = vacancy.extra
-        # Skip if employer already responded
-        if extra.get("renewal_accepted") or extra.get("renewal_declined"):
-            extra["renewal_offered"] = True
-            vacancy.save(update_fields=["extra"])
-            continue
+    if not extra.get("renewal_started"):
+        # Initial send
+        new_msg_id = send_and_track(
+            chat_id=vacancy.owner.id,
+            text=CallVacancyTelegramTextFormatter(vacancy).renewal_offer(),
+            reply_markup=get_renewal_offer_markup(vacancy),
+        )
+        if not new_msg_id:
+            logger.warning(f"renewal_offer_task: initial send failed for vacancy {vacancy.pk}")
+            return
+        extra["renewal_started"] = True
+        extra["renewal_sent_at"] = timezone.now().timestamp()
+        extra["renewal_reminders"] = 0
+        extra["renewal_msg_id"] = new_msg_id
+        vacancy.save(update_fields=["extra"])
 
-        if not extra.get("renewal_started"):
-            # Initial send
+    elif not extra.get("renewal_expired"):
+        elapsed = timezone.now().timestamp() - extra.get("renewal_sent_at", 0)
+        if elapsed < _RENEWAL_OFFER_INTERVAL:
+            return
+
+        reminders = extra.get("renewal_reminders", 0)
+        if reminders >= _RENEWAL_MAX_REMINDERS:
+            # Delete last reminder on expiry
+            delete_bot_message(vacancy.owner.id, extra.get("renewal_msg_id"))
+            extra["renewal_expired"] = True
+            extra.pop("renewal_msg_id", None)
+            vacancy.renewal_offered = True
+            vacancy.save(update_fields=["extra", "renewal_offered"])
+            logger.info(f"renewal_offer_task: offer expired for vacancy {vacancy.pk}")
+        else:
+            prev_msg_id = extra.get("renewal_msg_id")
             new_msg_id = send_and_track(
                 chat_id=vacancy.owner.id,
                 text=CallVacancyTelegramTextFormatter(vacancy).renewal_offer(),
                 reply_markup=get_renewal_offer_markup(vacancy),
+                previous_message_id=prev_msg_id,
             )
             if not new_msg_id:
-                logger.warning(f"renewal_offer_task: initial send failed for vacancy {vacancy.pk}")
-                continue
-            extra["renewal_started"] = True
+                logger.warning(f"renewal_offer_task: reminder failed for vacancy {vacancy.pk}")
+                return
+            extra["renewal_reminders"] = reminders + 1
             extra["renewal_sent_at"] = timezone.now().timestamp()
-            extra["renewal_reminders"] = 0
             extra["renewal_msg_id"] = new_msg_id
             vacancy.save(update_fields=["extra"])
 
-        elif not extra.get("renewal_expired"):
-            elapsed = timezone.now().timestamp() - extra.get("renewal_sent_at", 0)
-            if elapsed < _RENEWAL_OFFER_INTERVAL:
-                continue
 
-            reminders = extra.get("renewal_reminders", 0)
-            if reminders >= _RENEWAL_MAX_REMINDERS:
-                # Delete last reminder on expiry
-                delete_bot_message(vacancy.owner.id, extra.get("renewal_msg_id"))
-                extra["renewal_expired"] = True
-                extra["renewal_offered"] = True
-                extra.pop("renewal_msg_id", None)
-                vacancy.save(update_fields=["extra"])
-                logger.info(f"renewal_offer_task: offer expired for vacancy {vacancy.pk}")
-            else:
-                prev_msg_id = extra.get("renewal_msg_id")
-                new_msg_id = send_and_track(
-                    chat_id=vacancy.owner.id,
-                    text=CallVacancyTelegramTextFormatter(vacancy).renewal_offer(),
-                    reply_markup=get_renewal_offer_markup(vacancy),
-                    previous_message_id=prev_msg_id,
-                )
-                if not new_msg_id:
-                    logger.warning(f"renewal_offer_task: reminder failed for vacancy {vacancy.pk}")
-                    continue
-                extra["renewal_reminders"] = reminders + 1
-                extra["renewal_sent_at"] = timezone.now().timestamp()
-                extra["renewal_msg_id"] = new_msg_id
-                vacancy.save(update_fields=["extra"])
+def _renewal_candidates():
+    return Vacancy.objects.filter(
+        second_rollcall_passed=True, closed_at__isnull=True, is_paid=True, renewal_offered=False
+    )
+
+
+@shared_task
+def renewal_offer_task():
+    """
+    Sends renewal offer to employer after payment.
+    Repeats every 30 min up to 6 times (3 hours total).
+    Scheduled per vacancy by dispatch_vacancy_timers_task; kept for manual runs.
+    """
+    logger.info("task_started", extra={"task": "renewal_offer_task"})
+    connection.close()
+    for vacancy in _renewal_candidates():
+        _renewal_offer_step(vacancy)
     logger.info("task_completed", extra={"task": "renewal_offer_task", "processed": None})
 
 
@@ -822,6 +855,116 @@ def renewal_worker_check_task():
     logger.info("task_completed", extra={"task": "renewal_worker_check_task", "processed": None})
 
 
+def _in_before_start_window(vacancy: Vacancy, now: datetime, delay: Minutes = 120) -> bool:
+    start_aware = _get_cycle_start_aware(vacancy)
+    return start_aware - timedelta(minutes=delay) <= now < start_aware
+
+
+def _next_after(sent_at: float | None, interval: int, now: datetime) -> datetime:
+    """Moment `interval` seconds after the `sent_at` timestamp (never in the past)."""
+    remaining = (sent_at or now.timestamp()) + interval - now.timestamp()
+    return now + timedelta(seconds=max(remaining, 0))
+
+
+def _timer_before_start(vacancy: Vacancy, now: datetime) -> datetime | None:
+    if vacancy.status != STATUS_APPROVED or vacancy.pre_call_done:
+        return None
+    if _in_before_start_window(vacancy, now):
+        before_start_call([vacancy])
+    return None
+
+
+def _timer_after_first(vacancy: Vacancy, now: datetime) -> datetime | None:
+    if vacancy.status != STATUS_APPROVED or vacancy.pre_call_done:
+        return None
+    if _in_before_start_window(vacancy, now):
+        after_first_call_check([vacancy])
+    return None
+
+
+def _timer_start(vacancy: Vacancy, now: datetime) -> datetime | None:
+    if vacancy.status not in (STATUS_APPROVED, STATUS_SEARCH_STOPPED) or vacancy.first_rollcall_passed:
+        return None
+    if vacancy.date != date.today():
+        return None
+    start_call_check([vacancy])
+    if vacancy.extra.get("start_call_escalated"):
+        return None
+    return _next_after(vacancy.extra.get("start_call_sent_at"), _REMINDER_INTERVAL, now)
+
+
+def _timer_final(vacancy: Vacancy, now: datetime) -> datetime | None:
+    if vacancy.second_rollcall_passed or vacancy.date != date.today():
+        return None
+    if vacancy.status == STATUS_APPROVED:
+        if now >= _get_end_aware(vacancy):
+            return None
+    elif vacancy.status != STATUS_SEARCH_STOPPED:
+        return None
+    final_call_check([vacancy])
+    if vacancy.extra.get("final_call_escalated"):
+        return None
+    return _next_after(vacancy.extra.get("final_call_sent_at"), _REMINDER_INTERVAL, now)
+
+
+def _timer_close(vacancy: Vacancy, now: datetime) -> datetime | None:
+    if vacancy.status != STATUS_APPROVED or vacancy.closed_at is not None or vacancy.date != date.today():
+        return None
+    close_vacancy(vacancy=vacancy)
+    return None
+
+
+def _timer_renewal(vacancy: Vacancy, now: datetime) -> datetime | None:
+    if not _renewal_candidates().filter(pk=vacancy.pk).exists():
+        return None
+    _renewal_offer_step(vacancy)
+    if vacancy.renewal_offered:
+        return None
+    extra = vacancy.extra
+    if not extra.get("renewal_started"):
+        # Initial send failed — retry on the next tick.
+        return now + timedelta(seconds=30)
+    return _next_after(extra.get("renewal_sent_at"), _RENEWAL_OFFER_INTERVAL, now)
+
+
+_TIMER_HANDLERS = {
+    TIMER_BEFORE_START: _timer_before_start,
+    TIMER_AFTER_FIRST: _timer_after_first,
+    TIMER_START: _timer_start,
+    TIMER_FINAL: _timer_final,
+    TIMER_CLOSE: _timer_close,
+    TIMER_RENEWAL: _timer_renewal,
+}
+
+
+@shared_task
+def dispatch_vacancy_timers_task():
+    """
+    Runs every 30s. Fires due VacancyTimer rows (armed on approval/payment)
+    instead of scanning every active vacancy. A handler may return the next
+    due time (reminders) — the timer is then re-armed for that moment.
+    """
+    logger.info("task_started", extra={"task": "dispatch_vacancy_timers_task"})
+    connection.close()
+    from vacancy.services.timers import arm_timer, pop_due_timers, retry_timer
+
+    now = timezone.now()
+    processed = 0
+    for timer in pop_due_timers(now):
+        try:
+            next_due = _TIMER_HANDLERS[timer.kind](timer.vacancy, now)
+        except Exception:
+            sentry_sdk.capture_exception()
+            logger.warning(f"dispatch_vacancy_timers_task: {timer.kind} failed for vacancy {timer.vacancy_id}")
+            # The claim already set fired_at; re-arm so the deadline is not lost.
+            retry_timer(timer, now)
+            continue
+        if next_due is not None:
+            arm_timer(timer.vacancy, timer.kind, next_due)
+        processed += 1
+    logger.info("task_completed", extra={"task": "dispatch_vacancy_timers_task", "processed": processed})
+
+
 @shared_task
 def finalize_continue_after_rollcall_task(vacancy_id: int):
     """Stage 6.A: auto-finalize the 1h continue-search window after 1st rollcall.
@@ -862,7 +1005,7 @@ def disputed_rollcall_reminders_task():
     the only path forward).
     """
     from vacancy.services.call_markup import get_rollcall_reminder_markup
-    from vacancy.services.disputed_rollcall import DISPUTED_KEY, increment_reminders
+    from vacancy.services.disputed_rollcall import increment_reminders
 
     logger.info("task_started", extra={"task": "disputed_rollcall_reminders_task"})
     connection.close()
@@ -872,9 +1015,9 @@ def disputed_rollcall_reminders_task():
     now = timezone.now()
     processed = 0
 
-    candidates = Vacancy.objects.filter(extra__has_key=DISPUTED_KEY)
+    candidates = Vacancy.objects.filter(disputed_rollcall__isnull=False)
     for vacancy in candidates:
-        state = (vacancy.extra or {}).get(DISPUTED_KEY) or {}
+        state = vacancy.disputed_rollcall or {}
         # Skip Scenario В (full uncheck) — employer is blocked, no reminders
         if state.get("is_full_uncheck"):
             continue
@@ -923,7 +1066,6 @@ def auto_confirm_ignored_rollcall_task():
     Behaves as Scenario A: all snapshot workers -> CONFIRM, invoice sent,
     employer NOT blocked, workers NOT blocked. Then unpaid reminders begin (5.D).
     """
-    from vacancy.services.disputed_rollcall import DISPUTED_KEY
     from vacancy.services.rollcall_snapshot import (
         SNAPSHOT_KEY,
         get_snapshot_user_ids,
@@ -937,8 +1079,9 @@ def auto_confirm_ignored_rollcall_task():
     candidates = Vacancy.objects.filter(
         status=STATUS_SEARCH_STOPPED,
         second_rollcall_passed=False,
+        disputed_rollcall__isnull=True,
         extra__has_key=SNAPSHOT_KEY,
-    ).exclude(extra__has_key=DISPUTED_KEY)
+    )
 
     for vacancy in candidates:
         if (vacancy.extra or {}).get("auto_confirmed_at_ignore"):
@@ -992,9 +1135,9 @@ def send_unpaid_reminders_task():
 
     candidates = Vacancy.objects.filter(status=_AWAITING).select_related("owner")
     for vacancy in candidates:
-        extra = vacancy.extra or {}
-        if extra.get("is_paid"):
+        if vacancy.is_paid:
             continue
+        extra = vacancy.extra or {}
         sent_count = int(extra.get("unpaid_reminders", 0))
         if sent_count >= UNPAID_MAX:
             # Stage 5.E: after 24 reminders -> permanent ban + final messages
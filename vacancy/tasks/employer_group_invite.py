@@ -86,10 +86,13 @@ def send_employer_group_invite_task(self, vacancy_id: int):
         # 3. Надіслати повідомлення в групу і кікнути рабочих
         if vacancy.group:
             try:
-                bot.send_message(
+                from telegram.service.group_recycling import record_bot_message
+
+                sent = bot.send_message(
                     chat_id=vacancy.group.id,
                     text="⚠️ Увага!\nДана вакансія відмінена!\nВийдіть з даної групи щоб знаходити інші вакансії!",
                 )
+                record_bot_message(vacancy.group.id, sent, vacancy_id=vacancy.id)
             except Exception:
                 sentry_sdk.capture_exception()
 
@@ -0,0 +1,19 @@
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def run_vacancy_observers_task(event: str, observer_names: list[str], payload: dict):
+    """Run one lane of celery-policy observers (see vacancy.services.observers.publisher)."""
+    from vacancy.services.observers.publisher import DISPATCH_CELERY, deserialize_event_data, run_observer
+    from vacancy.services.observers.subscriber_setup import vacancy_publisher
+
+    data = deserialize_event_data(payload)
+    if data is None:
+        logger.warning(f"run_vacancy_observers_task: {event} payload no longer exists, skipping {observer_names}")
+        return
+    for observer in vacancy_publisher.observers_by_name(event, observer_names):
+        run_observer(observer, event, data, DISPATCH_CELERY)
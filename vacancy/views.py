@@ -1,3 +1,4 @@
+import hashlib
 from collections import defaultdict
 
 from django.contrib import messages
@@ -6,8 +7,10 @@ from django.core.handlers.wsgi import WSGIRequest
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils.translation import gettext as _
+from django.views.decorators.http import condition
 
-from telegram.choices import CallStatus, CallType
+from service.db_routing import replica_reads
+from telegram.choices import CallStatus, CallType, Status
 from user.models import User, UserFeedback
 from vacancy.choices import (
     STATUS_APPROVED,
@@ -19,7 +22,8 @@ from vacancy.choices import (
 )
 from vacancy.forms import VacancyCallForm, VacancyForm, VacancyUserFeedbackForm
 from vacancy.models import Vacancy, VacancyUser, VacancyUserCall
-from vacancy.services.call import create_vacancy_call
+from vacancy.services.call import apply_rollcall, create_vacancy_call
+from vacancy.services.lifecycle import ROLLCALL_CYCLE_DEFAULTS, set_lifecycle
 from vacancy.services.observers import events
 from vacancy.services.observers.events import (
     VACANCY_AFTER_START_CALL_SUCCESS,
@@ -37,10 +41,14 @@ def vacancy_create(request):
         return redirect("index")
 
     # Block new vacancy creation if employer has an unpaid completed vacancy
-    for v in Vacancy.objects.filter(owner=request.user, second_rollcall_passed=True).exclude(status=STATUS_CLOSED):
-        if not v.extra.get("is_paid"):
-            messages.warning(request, "Спершу оплатіть попередню вакансію.")
-            return redirect("vacancy:payment", pk=v.pk)
+    unpaid = (
+        Vacancy.objects.filter(owner=request.user, second_rollcall_passed=True, is_paid=False)
+        .exclude(status=STATUS_CLOSED)
+        .first()
+    )
+    if unpaid:
+        messages.warning(request, "Спершу оплатіть попередню вакансію.")
+        return redirect("vacancy:payment", pk=unpaid.pk)
 
     work_profile = getattr(request.user, "work_profile", None)
     if request.method == "POST":
@@ -156,8 +164,9 @@ def vacancy_check_call(request: WSGIRequest, form: VacancyCallForm, vacancy: Vac
 
         create_vacancy_call(vacancy=vacancy, call_type=call_type, status=CallStatus.CREATED)
         selected_users = list(form.cleaned_data.get("users", []))
-        vacancy_users_call = VacancyUserCall.objects.filter(vacancy_user__in=users_queryset, call_type=call_type)
-        vacancy_users_call.filter(vacancy_user__in=selected_users).update(status=CallStatus.CONFIRM)
+        delta = apply_rollcall(
+            users_queryset, call_type=call_type, confirmed_user_ids=[vu.user_id for vu in selected_users]
+        )
 
         if call_type == CallType.START:
             vacancy.extra["start_pre_call"] = "continue"
@@ -167,9 +176,7 @@ def vacancy_check_call(request: WSGIRequest, form: VacancyCallForm, vacancy: Vac
                 .update(status=CallStatus.CONFIRM)
             )
 
-        rejected_users: int = vacancy_users_call.exclude(vacancy_user__in=selected_users).update(
-            status=CallStatus.REJECT
-        )
+        rejected_users: int = len(delta.rejected)
         extra_calls = vacancy.extra.get("calls", defaultdict(dict))
         extra_calls[call_type] = [i.user.id for i in selected_users]
         vacancy.extra.update({"calls": extra_calls})
@@ -193,7 +200,7 @@ def vacancy_check_call(request: WSGIRequest, form: VacancyCallForm, vacancy: Vac
             from vacancy.services.observers.events import VACANCY_CLOSE
 
             vacancy_publisher.notify(VACANCY_CLOSE, data={"vacancy": vacancy})
-        elif call_type == CallType.AFTER_START and ((vacancy.extra or {}).get("disputed_rollcall")):
+        elif call_type == CallType.AFTER_START and vacancy.disputed_rollcall:
             # === Repeat submit after a previous disputed rollcall ===
             from service.broadcast_service import TelegramBroadcastService
             from service.notifications_impl import TelegramNotifier
@@ -275,7 +282,7 @@ def vacancy_check_call(request: WSGIRequest, form: VacancyCallForm, vacancy: Vac
                 BlockService.auto_block_employer_rollcall_fail(user=vacancy.owner)
 
                 # Delete the old 'final_call' message (now obsolete)
-                old_msg_id = (vacancy.extra or {}).get("final_call_msg_id")
+                old_msg_id = vacancy.final_call_msg_id
                 if old_msg_id:
                     try:
                         _bot.delete_message(chat_id=vacancy.owner.id, message_id=old_msg_id)
@@ -302,8 +309,7 @@ def vacancy_check_call(request: WSGIRequest, form: VacancyCallForm, vacancy: Vac
                         reply_markup=kb,
                     )
                     if sent and hasattr(sent, "message_id"):
-                        vacancy.extra["final_call_msg_id"] = sent.message_id
-                        vacancy.save(update_fields=["extra"])
+                        set_lifecycle(vacancy, final_call_msg_id=sent.message_id)
                 except Exception:
                     import sentry_sdk
 
@@ -522,12 +528,10 @@ def vacancy_user_reviews(request: WSGIRequest, pk: int, user_id: int) -> HttpRes
     target_user = get_object_or_404(User, pk=user_id)
 
     feedbacks = UserFeedback.objects.filter(user=target_user).select_related("owner").order_by("-created_at")
-    likes = feedbacks.filter(rating="like").count()
-    dislikes = feedbacks.filter(rating="dislike").count()
-
-    from user.rating import bayesian_rating
+    from user.rating import rating_stats_for
 
-    rating_percent = bayesian_rating(likes, dislikes)
+    stats = rating_stats_for([target_user.pk])[target_user.pk]
+    likes, dislikes, rating_percent = stats.likes, stats.dislikes, stats.percent
 
     work_profile = getattr(request.user, "work_profile", None)
     user_role = work_profile.role if work_profile else None
@@ -583,11 +587,7 @@ def vacancy_my_list(request):
 
     vacancies = (
         Vacancy.objects.filter(owner=target_user)
-        .filter(
-            Q(status__in=statuses)
-            | Q(status=STATUS_CLOSED, closed_at__gte=threshold_3h)
-            | Q(status=STATUS_CLOSED, extra__is_paid=True, closed_at__gte=threshold_3h)
-        )
+        .filter(Q(status__in=statuses) | Q(status=STATUS_CLOSED, closed_at__gte=threshold_3h))
         .select_related("group", "channel")
         .order_by("-date", "-start_time")
     )
@@ -629,10 +629,10 @@ def _build_members_context(vacancy, request):
     """Build context for members section embedded in vacancy detail."""
     from datetime import timedelta
 
+    from django.db.models import Prefetch
     from django.utils import timezone
 
     from telegram.choices import CallStatus, CallType
-    from user.models import UserFeedback
     from user.services import BlockService
     from vacancy.forms import VacancyCallForm
     from vacancy.models import VacancyContactPhone, VacancyUserCall
@@ -640,7 +640,7 @@ def _build_members_context(vacancy, request):
 
     now = timezone.now()
     start_aware = _get_start_aware(vacancy)
-    rollcall_time_reached = now >= start_aware or vacancy.extra.get("sent_start_call", False)
+    rollcall_time_reached = now >= start_aware or vacancy.sent_start_call
 
     is_start_rollcall = (
         not vacancy.first_rollcall_passed
@@ -651,7 +651,7 @@ def _build_members_context(vacancy, request):
         vacancy.first_rollcall_passed
         and not vacancy.second_rollcall_passed
         and vacancy.status != STATUS_CLOSED
-        and vacancy.extra.get("sent_final_call", False)
+        and vacancy.sent_final_call
     )
     is_rollcall_mode = is_start_rollcall or is_end_rollcall
 
@@ -673,6 +673,7 @@ def _build_members_context(vacancy, request):
         rollcall_qs = get_snapshot_vacancy_users(vacancy)
     else:
         rollcall_qs = members_qs
+    rollcall_qs = rollcall_qs.select_related("user")
 
     scenario = None
     can_search_members = False
@@ -704,39 +705,43 @@ def _build_members_context(vacancy, request):
 
     contact_phones = dict(VacancyContactPhone.objects.filter(vacancy=vacancy).values_list("user_id", "phone"))
 
-    from user.rating import bayesian_rating
+    from user.rating import ratings_for
+
+    all_users = list(all_users_qs)
+    ratings = ratings_for(vu.user_id for vu in all_users)
+    blocked_ids = BlockService.blocked_user_ids(vu.user_id for vu in all_users)
 
     members_list = []
-    for vu in all_users_qs:
-        likes = UserFeedback.objects.filter(user=vu.user, rating="like").count()
-        dislikes = UserFeedback.objects.filter(user=vu.user, rating="dislike").count()
-        is_user_blocked = BlockService.is_blocked(vu.user)
+    for vu in all_users:
         members_list.append(
             {
                 "vacancy_user": vu,
                 "user": vu.user,
                 "status": vu.get_status_display(),
                 "is_member": vu.status == "member",
-                "is_blocked": is_user_blocked,
-                "rating_percent": bayesian_rating(likes, dislikes),
+                "is_blocked": vu.user_id in blocked_ids,
+                "rating_percent": ratings[vu.user_id],
                 "contact_phone": contact_phones.get(vu.user_id, ""),
             }
         )
 
     rollcall_form = None
     if is_rollcall_mode and scenario in ("B", "C", None) and call_type:
-        any_records_exist = VacancyUserCall.objects.filter(vacancy_user__in=rollcall_qs, call_type=call_type).exists()
-        if call_type == CallType.AFTER_START or not any_records_exist:
-            rollcall_form = VacancyCallForm(
-                queryset=rollcall_qs, call_type=call_type, initial={"users": list(rollcall_qs)}
+        rollcall_users = list(
+            rollcall_qs.prefetch_related(
+                Prefetch(
+                    "vacancyusercall_set",
+                    queryset=VacancyUserCall.objects.filter(call_type=call_type),
+                    to_attr="typed_calls",
+                )
             )
+        )
+        any_records_exist = any(vu.typed_calls for vu in rollcall_users)
+        if call_type == CallType.AFTER_START or not any_records_exist:
+            initial_users = rollcall_users
         else:
-            initial_calls = VacancyUserCall.objects.filter(
-                vacancy_user__in=rollcall_qs, status=CallStatus.CONFIRM, call_type=call_type
-            )
-            rollcall_form = VacancyCallForm(
-                queryset=rollcall_qs, call_type=call_type, initial={"users": list(initial_calls)}
-            )
+            initial_users = [vu for vu in rollcall_users if any(c.status == CallStatus.CONFIRM for c in vu.typed_calls)]
+        rollcall_form = VacancyCallForm(queryset=rollcall_qs, call_type=call_type, initial={"users": initial_users})
 
     # Attach checkbox HTML to each member for unified rollcall cards
     if rollcall_form and is_rollcall_mode:
@@ -807,7 +812,7 @@ def vacancy_detail(request, pk):
         and not mc["is_rollcall_mode"]
     )
     is_closed_lifecycle = vacancy.status == STATUS_CLOSED or vacancy.closed_at is not None
-    is_paid = vacancy.extra.get("is_paid", False)
+    is_paid = vacancy.is_paid
     show_payment = vacancy.second_rollcall_passed and not is_paid and vacancy.status != STATUS_PAID
 
     # Is the owner currently inside the vacancy's telegram group?
@@ -824,16 +829,7 @@ def vacancy_detail(request, pk):
     # Stage 6.A: "Триває добір" banner state
     _extra = vacancy.extra or {}
     continue_mode = bool(_extra.get("continue_after_first_rollcall"))
-    continue_ends_at = None
-    if continue_mode:
-        from datetime import datetime as _dt_parse
-
-        deadline_iso = _extra.get("continue_deadline")
-        if deadline_iso:
-            try:
-                continue_ends_at = _dt_parse.fromisoformat(deadline_iso)
-            except (ValueError, TypeError):
-                continue_ends_at = None
+    continue_ends_at = vacancy.continue_deadline if continue_mode else None
 
     context = {
         "vacancy": vacancy,
@@ -892,9 +888,7 @@ def vacancy_stop_search(request, pk):
         if vacancy.channel:
             text = VacancyTelegramTextFormatter(vacancy).for_channel(status="full")
             channel_message = (
-                ChannelMessage.objects.filter(channel_id=vacancy.channel.id, extra__vacancy_id=vacancy.id)
-                .order_by("-id")
-                .first()
+                ChannelMessage.objects.filter(channel_id=vacancy.channel.id, vacancy=vacancy).order_by("-id").first()
             )
             if channel_message:
                 strategy = TelegramStrategyFactory.get_strategy(NotificationMethod.TEXT)
@@ -969,18 +963,16 @@ def vacancy_continue_search(request, pk):
     vacancy.first_rollcall_passed = False
     vacancy.second_rollcall_passed = False
 
-    # Clean rollcall keys from extra so Celery starts fresh
+    # Clean rollcall state so Celery starts fresh
+    for field, value in ROLLCALL_CYCLE_DEFAULTS.items():
+        setattr(vacancy, field, value)
     for key in [
-        "sent_start_call",
-        "sent_final_call",
         "start_call_sent_at",
         "final_call_sent_at",
         "start_call_reminders",
         "final_call_reminders",
         "start_call_escalated",
         "final_call_escalated",
-        "start_call_msg_id",
-        "final_call_msg_id",
     ]:
         vacancy.extra.pop(key, None)
 
@@ -998,6 +990,7 @@ def vacancy_continue_search(request, pk):
             "first_rollcall_passed",
             "second_rollcall_passed",
             "extra",
+            *ROLLCALL_CYCLE_DEFAULTS,
         ]
     )
 
@@ -1065,12 +1058,12 @@ def _continue_search_after_first_rollcall(request, vacancy):
     vacancy.search_active = True
     vacancy.search_stopped_at = None
 
-    # 4. Set continue-mode flags in extra; preserve VacancyUserCall records
+    # 4. Set continue-mode flags; preserve VacancyUserCall records
     extra = vacancy.extra or {}
     extra["continue_after_first_rollcall"] = True
     extra["continue_started_at"] = now.isoformat()
-    extra["continue_deadline"] = (now + _td(hours=1)).isoformat()
     vacancy.extra = extra
+    vacancy.continue_deadline = now + _td(hours=1)
 
     vacancy.save(
         update_fields=[
@@ -1082,6 +1075,7 @@ def _continue_search_after_first_rollcall(request, vacancy):
             "search_active",
             "search_stopped_at",
             "extra",
+            "continue_deadline",
         ]
     )
 
@@ -1125,16 +1119,12 @@ def vacancy_resume_search(request, pk):
     if request.GET.get("confirm_rollcall") == "1" and not vacancy.first_rollcall_passed:
         members = vacancy.members
         if members.exists():
-            from vacancy.models import VacancyUserCall
-            from vacancy.services.call import create_vacancy_call
-
+            member_ids = list(members.values_list("user_id", flat=True))
             create_vacancy_call(vacancy=vacancy, call_type=CallType.START, status=CallStatus.CREATED)
-            VacancyUserCall.objects.filter(vacancy_user__in=members, call_type=CallType.START).update(
-                status=CallStatus.CONFIRM
-            )
+            apply_rollcall(members, call_type=CallType.START, confirmed_user_ids=member_ids)
             vacancy.extra["start_pre_call"] = "continue"
             extra_calls = vacancy.extra.get("calls", {})
-            extra_calls[CallType.START] = [m.user.id for m in members]
+            extra_calls[CallType.START] = member_ids
             vacancy.extra["calls"] = extra_calls
             vacancy.first_rollcall_passed = True
             vacancy.save(update_fields=["extra", "first_rollcall_passed"])
@@ -1176,7 +1166,7 @@ def vacancy_resume_search(request, pk):
                 vacancy.date = timezone.localdate() + timedelta(days=1)
                 vacancy.first_rollcall_passed = False
                 vacancy.second_rollcall_passed = False
-                vacancy.extra["pending_worker_renewal"] = True
+                vacancy.pending_worker_renewal = True
             elif data.get("date"):
                 vacancy.date = data["date"]
             vacancy.start_time = data["start_time"]
@@ -1305,9 +1295,7 @@ def vacancy_close_lifecycle(request, pk):
         if vacancy.channel:
             text = VacancyTelegramTextFormatter(vacancy).for_channel(status="full")
             channel_message = (
-                ChannelMessage.objects.filter(channel_id=vacancy.channel.id, extra__vacancy_id=vacancy.id)
-                .order_by("-id")
-                .first()
+                ChannelMessage.objects.filter(channel_id=vacancy.channel.id, vacancy=vacancy).order_by("-id").first()
             )
             if channel_message:
                 strategy = TelegramStrategyFactory.get_strategy(NotificationMethod.TEXT)
@@ -1396,7 +1384,7 @@ def vacancy_payment(request, pk):
     workers_count = len(vacancy.extra.get("calls", {}).get("after_start", []))
 
     is_paid = (
-        vacancy.extra.get("is_paid")
+        vacancy.is_paid
         or MonobankPayment.objects.filter(vacancy=vacancy, status=MonobankPayment.Status.SUCCESS).exists()
     )
 
@@ -1505,20 +1493,62 @@ def vacancy_kick_member(request, pk, user_id):
     from django.utils import timezone as kick_tz
 
     from vacancy.models import VacancyUser
+    from vacancy.services.vacancy_formatter import bump_render_version
+    from work.service.dashboard import invalidate_dashboard
 
     VacancyUser.objects.filter(vacancy=vacancy, user_id=user_id).update(status=Status.KICKED, updated_at=kick_tz.now())
+    bump_render_version(vacancy.pk)
+    invalidate_dashboard(user_id)
 
     return redirect("vacancy:detail", pk=pk)
 
 
-def vacancy_members_json(request, pk):
-    """JSON endpoint for auto-refresh: returns members count and list."""
-    from django.http import JsonResponse
+def _members_version(request, pk):
+    """Cheap change stamp for vacancy_members_json, computed once per request."""
+    if not hasattr(request, "_members_version"):
+        from django.db.models import Count, Max, Q
+
+        vacancy = get_object_or_404(Vacancy, pk=pk)
+        stamp = VacancyUser.objects.filter(vacancy=vacancy).aggregate(
+            members=Count("id", filter=Q(status=Status.MEMBER)),
+            updated=Max("updated_at"),
+            created=Max("created_at"),
+            renamed=Max("user__updated_at", filter=Q(status=Status.MEMBER)),
+        )
+        moments = [stamp["updated"], stamp["created"], stamp["renamed"], vacancy.closed_at, vacancy.search_stopped_at]
+        request._members_version = {
+            "etag": hashlib.md5(
+                "|".join(
+                    str(part)
+                    for part in (
+                        vacancy.status,
+                        vacancy.people_count,
+                        vacancy.first_rollcall_passed,
+                        vacancy.second_rollcall_passed,
+                        stamp["members"],
+                        stamp["updated"],
+                        stamp["created"],
+                        stamp["renamed"],
+                    )
+                ).encode(),
+                usedforsecurity=False,
+            ).hexdigest(),
+            "last_modified": max((m for m in moments if m), default=None),
+        }
+    return request._members_version
 
+
+@replica_reads
+@condition(
+    etag_func=lambda request, pk: _members_version(request, pk)["etag"],
+    last_modified_func=lambda request, pk: _members_version(request, pk)["last_modified"],
+)
+def vacancy_members_json(request, pk):
+    """JSON endpoint for auto-refresh: returns members count and list (304 while nothing changed)."""
     vacancy = get_object_or_404(Vacancy, pk=pk)
-    members = vacancy.members.select_related("user")
+    members = list(vacancy.members.select_related("user"))
     data = {
-        "members_count": members.count(),
+        "members_count": len(members),
         "people_count": vacancy.people_count,
         "members": [{"id": m.user.id, "name": m.user.full_name or f"ID {m.user.id}"} for m in members],
         "first_rollcall_passed": vacancy.first_rollcall_passed,
@@ -5,3 +5,6 @@ class WorkConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "work"
     verbose_name = "Документи"
+
+    def ready(self):
+        import work.signals  # noqa: F401
@@ -1,6 +1,6 @@
-from telegram.models import Channel
 from work.blocks.base import PageBlock
 from work.blocks.registry import block_registry
+from work.service.reference_data import public_channel_for_city
 
 
 @block_registry.register
@@ -11,14 +11,7 @@ class ChannelPreviewBlock(PageBlock):
         return True
 
     def get_context(self, request):
-        return {
-            "channel": Channel.objects.filter(
-                city=request.user.work_profile.city,
-                is_active=True,
-                has_bot_administrator=True,
-                invite_link__isnull=False,
-            ).first()
-        }
+        return {"channel": public_channel_for_city(request.user.work_profile.city_id)}
 
     @property
     def template_name(self):
@@ -10,16 +10,12 @@ logger = logging.getLogger(__name__)
 
 REQUIRED_BEAT_TASKS = [
     "test_heartbeat",
-    "before_start_call_task",
-    "after_first_call_check_task",
-    "start_call_check_task",
-    "final_call_check_task",
-    "close_vacancy_task",
+    "dispatch_vacancy_timers_task",
     "close_lifecycle_timer_task",
     "worker_join_confirm_check_task",
     "resend_vacancies_to_channel_task",
     "cleanup_inactive_users",
-    "renewal_offer_task",
+    "probe_telegram_accounts",
     "renewal_worker_check_task",
     "check_system",
     "cleanup_unregistered_users",
@@ -136,10 +136,12 @@ class RatingConfig(models.Model):
             existing = RatingConfig.objects.first()
             self.pk = existing.pk
         super().save(*args, **kwargs)
+        from user.rating import invalidate_platform_params
+
+        invalidate_platform_params()
 
     @classmethod
     def get_threshold(cls):
-        obj = cls.objects.first()
-        if obj:
-            return obj.rating_threshold
-        return 5
+        from work.service.reference_data import rating_threshold
+
+        return rating_threshold()
@@ -0,0 +1,166 @@
+"""Mini App home-page state for workers and employers.
+
+The summary is a plain dict (template context and JSON body alike), built with
+a few aggregate queries and cached per user. work/signals.py drops the entry
+when feedback, membership, vacancy status or the work profile change; the
+block part is read from BlockService's own cache on every call.
+"""
+
+from datetime import timedelta
+from typing import Any
+
+from django.core.cache import cache
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+
+from service.db_routing import primary_reads
+from telegram.choices import Status
+from telegram.models import Channel, UserInGroup
+from user.models import UserFeedback
+from user.services import BlockService
+from vacancy.choices import (
+    STATUS_APPROVED,
+    STATUS_AWAITING_PAYMENT,
+    STATUS_CLOSED,
+    STATUS_PAID,
+    STATUS_PENDING,
+    STATUS_SEARCH_STOPPED,
+)
+from vacancy.models import Vacancy, VacancyUser
+from work.choices import WorkProfileRole
+from work.service.reference_data import public_channel_for_city, public_channels
+
+DASHBOARD_CACHE_KEY = "dashboard_summary:{user_id}"
+DASHBOARD_TTL = 5 * 60
+RECENT_EXIT_WINDOW = timedelta(hours=1)
+RECENTLY_CLOSED_WINDOW = timedelta(hours=3)
+
+ACTIVE_STATUSES = [STATUS_PENDING, STATUS_APPROVED, STATUS_SEARCH_STOPPED, STATUS_AWAITING_PAYMENT, STATUS_PAID]
+
+
+def _channel_dict(channel: Channel | None) -> dict[str, Any] | None:
+    if channel is None:
+        return None
+    return {"id": channel.id, "title": channel.title, "invite_link": channel.invite_link}
+
+
+def _reviews(user) -> dict[str, Any]:
+    from user.rating import rating_stats_for
+
+    stats = rating_stats_for([user.pk])[user.pk]
+    text_reviews = UserFeedback.objects.filter(user=user).exclude(text="").count()
+    return {
+        "rating_percent": stats.percent,
+        "likes": stats.likes,
+        "dislikes": stats.dislikes,
+        "text_reviews_count": text_reviews,
+    }
+
+
+def _current_vacancy(user) -> dict[str, Any] | None:
+    """Approved vacancy the worker is in (and in its group), else one left/kicked within the last hour."""
+    recent = timezone.now() - RECENT_EXIT_WINDOW
+    in_group = UserInGroup.objects.filter(user=user, group_id=OuterRef("vacancy__group_id"), status=Status.MEMBER)
+    rows = list(
+        VacancyUser.objects.filter(user=user)
+        .filter(
+            Q(status=Status.MEMBER, vacancy__status=STATUS_APPROVED)
+            | Q(status__in=[Status.KICKED, Status.LEFT], updated_at__gte=recent)
+        )
+        .annotate(in_group=Exists(in_group))
+        .select_related("vacancy")
+        .order_by("pk")
+    )
+    member = next((vu for vu in rows if vu.status == Status.MEMBER), None)
+    if member and member.vacancy.group_id and member.in_group:
+        current = member.vacancy
+    else:
+        exits = [vu for vu in rows if vu.status != Status.MEMBER]
+        current = max(exits, key=lambda vu: vu.updated_at).vacancy if exits else None
+    return {"id": current.pk, "address": current.address} if current else None
+
+
+def _worker_summary(user, profile) -> dict[str, Any]:
+    channel = public_channel_for_city(profile.city_id)
+    return {
+        "role": WorkProfileRole.WORKER,
+        "channel": _channel_dict(channel),
+        "current_vacancy": _current_vacancy(user),
+        **_reviews(user),
+    }
+
+
+def _employer_summary(user, profile) -> dict[str, Any]:
+    pending_rollcall = Q(status__in=[STATUS_APPROVED, STATUS_SEARCH_STOPPED]) & (
+        Q(sent_start_call=True, first_rollcall_passed=False) | Q(sent_final_call=True, second_rollcall_passed=False)
+    )
+    active = Q(status__in=ACTIVE_STATUSES) | Q(
+        status=STATUS_CLOSED, closed_at__gte=timezone.now() - RECENTLY_CLOSED_WINDOW
+    )
+    counts = Vacancy.objects.filter(owner=user).aggregate(
+        total=Count("id"),
+        active=Count("id", filter=active),
+        pending_rollcall=Count("id", filter=pending_rollcall),
+    )
+
+    city_ids = []
+    if profile.city_id:
+        city_ids.append(profile.city_id)
+    if profile.multi_city_enabled:
+        city_ids.extend(profile.allowed_cities.values_list("id", flat=True))
+    channels = public_channels(city_ids)
+    home = next((c for c in channels if c.city_id == profile.city_id), None)
+
+    return {
+        "role": WorkProfileRole.EMPLOYER,
+        "vacancies_count": counts["total"],
+        "active_vacancies_count": counts["active"],
+        "has_pending_rollcall": counts["pending_rollcall"] > 0,
+        "channel": _channel_dict(home),
+        "city_channels": [_channel_dict(c) for c in channels] if profile.multi_city_enabled else None,
+        **_reviews(user),
+    }
+
+
+def _block_summary(user) -> dict[str, Any]:
+    is_blocked = BlockService.is_blocked(user)
+    block = BlockService.get_active_block(user) if is_blocked else None
+    return {
+        "is_blocked": is_blocked,
+        "active_block": {
+            "block_type": block.block_type,
+            "reason": block.reason,
+            "reason_display": block.get_reason_display(),
+            "blocked_until": block.blocked_until,
+        }
+        if block
+        else None,
+    }
+
+
+def build_dashboard_summary(user) -> dict[str, Any] | None:
+    """Uncached summary; None when the user has no worker/employer role."""
+    profile = getattr(user, "work_profile", None)
+    if profile is None:
+        return None
+    if profile.role == WorkProfileRole.WORKER:
+        return _worker_summary(user, profile)
+    if profile.role == WorkProfileRole.EMPLOYER:
+        return _employer_summary(user, profile)
+    return None
+
+
+def get_dashboard_summary(user) -> dict[str, Any] | None:
+    key = DASHBOARD_CACHE_KEY.format(user_id=user.pk)
+    summary = cache.get(key)
+    if summary is None:
+        with primary_reads():
+            summary = build_dashboard_summary(user)
+        if summary is None:
+            return None
+        cache.set(key, summary, DASHBOARD_TTL)
+    return {**summary, **_block_summary(user)}
+
+
+def invalidate_dashboard(*user_ids: int) -> None:
+    cache.delete_many([DASHBOARD_CACHE_KEY.format(user_id=user_id) for user_id in user_ids if user_id])
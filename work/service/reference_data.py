@@ -0,0 +1,145 @@
+"""
+Reference data served from the shared cache.
+
+Cities (with their parler translations), public channels by city, FAQ items,
+agreement texts and the rating threshold change a few times a year through
+the admin but are read on most Mini App pages. Each dataset is cached under
+its own key and dropped by the post_save/post_delete receivers in
+work/signals.py; REFERENCE_TTL only bounds staleness after writes that skip
+signals (queryset.update(), raw SQL).
+"""
+
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+
+from service.db_routing import primary_reads
+
+REFERENCE_TTL = 24 * 60 * 60
+
+CITIES_KEY = "ref:cities"
+PUBLIC_CHANNELS_KEY = "ref:public_channels"
+FAQ_KEY = "ref:faq:{role}"
+AGREEMENT_KEY = "ref:agreement:{role}"
+RATING_THRESHOLD_KEY = "ref:rating_threshold"
+
+DEFAULT_RATING_THRESHOLD = 5
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CityChoice:
+    pk: int
+    names: tuple[tuple[str, str], ...]
+
+    @property
+    def name(self) -> str:
+        names = dict(self.names)
+        for code in (get_language(), settings.PARLER_DEFAULT_LANGUAGE_CODE):
+            if names.get(code):
+                return names[code]
+        return next((name for name in names.values() if name), "")
+
+    def __str__(self):
+        return self.name or f"City #{self.pk}"
+
+
+def _cached(key: str, load):
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        with primary_reads():
+            value = load()
+        cache.set(key, value, REFERENCE_TTL)
+    return value
+
+
+def _load_cities() -> list[CityChoice]:
+    from city.models import City
+
+    return [
+        CityChoice(city.pk, tuple((t.language_code, t.name or "") for t in city.translations.all()))
+        for city in City.objects.prefetch_related("translations")
+    ]
+
+
+def cities() -> list[CityChoice]:
+    """All cities in admin order, names resolved in the active language."""
+    return _cached(CITIES_KEY, _load_cities)
+
+
+def city_choices() -> list[tuple[int, str]]:
+    return [(city.pk, city.name) for city in cities()]
+
+
+def _load_public_channels() -> list:
+    from telegram.models import Channel
+
+    return list(
+        Channel.objects.filter(is_active=True, has_bot_administrator=True, invite_link__isnull=False).order_by("pk")
+    )
+
+
+def public_channels(city_ids=None) -> list:
+    """Channels users can be sent to; optionally only those of the given cities."""
+    if city_ids is None:
+        return _cached(PUBLIC_CHANNELS_KEY, _load_public_channels)
+    city_ids = set(city_ids)
+    if not city_ids:
+        return []
+    return [channel for channel in public_channels() if channel.city_id in city_ids]
+
+
+def public_channel_for_city(city_id):
+    if city_id is None:
+        return None
+    return next(iter(public_channels([city_id])), None)
+
+
+def faq_items(role: str) -> list:
+    from work.models import FaqItem
+
+    return _cached(FAQ_KEY.format(role=role), lambda: list(FaqItem.objects.filter(role=role, is_active=True)))
+
+
+def agreement_text(role: str):
+    from work.models import AgreementText
+
+    return _cached(AGREEMENT_KEY.format(role=role), lambda: AgreementText.objects.filter(role=role).first())
+
+
+def rating_threshold() -> int:
+    from work.models import RatingConfig
+
+    def load():
+        config = RatingConfig.objects.first()
+        return config.rating_threshold if config else DEFAULT_RATING_THRESHOLD
+
+    return _cached(RATING_THRESHOLD_KEY, load)
+
+
+def invalidate_cities() -> None:
+    cache.delete(CITIES_KEY)
+
+
+def invalidate_public_channels() -> None:
+    cache.delete(PUBLIC_CHANNELS_KEY)
+
+
+def invalidate_faq() -> None:
+    # Every role: an edit may have moved an item from one list to the other.
+    from work.models import FaqItem
+
+    cache.delete_many([FAQ_KEY.format(role=role) for role, _ in FaqItem.ROLE_CHOICES])
+
+
+def invalidate_agreements() -> None:
+    from work.models import AgreementText
+
+    cache.delete_many([AGREEMENT_KEY.format(role=role) for role, _ in AgreementText.TYPE_CHOICES])
+
+
+def invalidate_rating_threshold() -> None:
+    cache.delete(RATING_THRESHOLD_KEY)
@@ -0,0 +1,74 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from city.models import City
+from telegram.models import Channel, UserInGroup
+from user.models import UserFeedback
+from vacancy.models import Vacancy, VacancyUser
+from work.models import AgreementText, FaqItem, RatingConfig, UserWorkProfile
+from work.service import reference_data
+from work.service.dashboard import invalidate_dashboard
+
+
+@receiver(post_save, sender=UserFeedback)
+@receiver(post_delete, sender=UserFeedback)
+@receiver(post_save, sender=VacancyUser)
+@receiver(post_delete, sender=VacancyUser)
+@receiver(post_save, sender=UserInGroup)
+@receiver(post_delete, sender=UserInGroup)
+@receiver(post_save, sender=UserWorkProfile)
+def invalidate_user_dashboard(sender, instance, **kwargs):
+    invalidate_dashboard(instance.user_id)
+
+
+@receiver(post_save, sender=Vacancy)
+def invalidate_vacancy_dashboards(sender, instance: Vacancy, update_fields=None, **kwargs):
+    """Owner always; members only when the status (or the whole row) was written."""
+    user_ids = [instance.owner_id]
+    if update_fields is None or "status" in update_fields:
+        user_ids += list(VacancyUser.objects.filter(vacancy_id=instance.pk).values_list("user_id", flat=True))
+    invalidate_dashboard(*user_ids)
+
+
+@receiver(post_delete, sender=Vacancy)
+def invalidate_deleted_vacancy_dashboard(sender, instance: Vacancy, **kwargs):
+    """Members were already invalidated by the cascaded VacancyUser deletes."""
+    invalidate_dashboard(instance.owner_id)
+
+
+@receiver(post_save, sender=City)
+@receiver(post_save, sender=City._parler_meta.root_model)
+@receiver(post_delete, sender=City._parler_meta.root_model)
+def invalidate_city_reference(sender, **kwargs):
+    reference_data.invalidate_cities()
+
+
+@receiver(post_delete, sender=City)
+def invalidate_deleted_city_reference(sender, **kwargs):
+    """Deleting a city also nulls Channel.city with a bulk UPDATE, which sends no signals."""
+    reference_data.invalidate_cities()
+    reference_data.invalidate_public_channels()
+
+
+@receiver(post_save, sender=Channel)
+@receiver(post_delete, sender=Channel)
+def invalidate_channel_reference(sender, **kwargs):
+    reference_data.invalidate_public_channels()
+
+
+@receiver(post_save, sender=FaqItem)
+@receiver(post_delete, sender=FaqItem)
+def invalidate_faq_reference(sender, **kwargs):
+    reference_data.invalidate_faq()
+
+
+@receiver(post_save, sender=AgreementText)
+@receiver(post_delete, sender=AgreementText)
+def invalidate_agreement_reference(sender, **kwargs):
+    reference_data.invalidate_agreements()
+
+
+@receiver(post_save, sender=RatingConfig)
+@receiver(post_delete, sender=RatingConfig)
+def invalidate_rating_reference(sender, **kwargs):
+    reference_data.invalidate_rating_threshold()
@@ -2,12 +2,13 @@ import logging
 
 import sentry_sdk
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.db.models import Q
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.http import require_POST
 
-from city.models import City
+from service.db_routing import replica_reads
 from user.models import User
 from vacancy.choices import (
     STATUS_APPROVED,
@@ -21,6 +22,7 @@ from vacancy.models import Vacancy
 from vacancy.services.observers.events import VACANCY_APPROVED as VACANCY_APPROVED_EVENT
 from vacancy.services.observers.subscriber_setup import vacancy_publisher
 from work.choices import WorkProfileRole
+from work.service import reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +44,7 @@ def staff_required(view_func):
 @staff_required
 def admin_dashboard(request):
     """Main admin dashboard page with filter tabs."""
-    cities = City.objects.all()
+    cities = reference_data.cities()
     return render(
         request,
         "work/admin_dashboard.html",
@@ -54,17 +56,14 @@ def admin_dashboard(request):
     )
 
 
+@replica_reads
 @staff_required
 def admin_search_users(request):
     """Search users by filters from tab."""
-    qs = User.objects.select_related("work_profile", "work_profile__city").all()
+    from user.search import search_users, with_active_block
 
-    q = request.GET.get("q", "").strip()
-    if q:
-        filters = Q(full_name__icontains=q) | Q(username__icontains=q) | Q(phone_number__icontains=q)
-        if q.isdigit():
-            filters |= Q(id=int(q))
-        qs = qs.filter(filters)
+    qs = User.objects.select_related("work_profile", "work_profile__city").all()
+    qs = with_active_block(search_users(qs, request.GET.get("q", "")))
 
     city_ids = request.GET.getlist("city")
     if city_ids:
@@ -75,16 +74,8 @@ def admin_search_users(request):
         qs = qs.filter(work_profile__role__in=roles)
 
     if request.GET.get("blocked"):
-        qs = qs.filter(blocks__is_active=True).distinct()
-    qs = qs.order_by("-date_joined")[:100]
-
-    from user.models import UserBlock
-
-    users_list = list(qs)
-    for u in users_list:
-        block = UserBlock.objects.filter(user=u, is_active=True).order_by("-created_at").first()
-        u.active_block_id = block.pk if block else None
-        u.active_block_type = block.block_type if block else None
+        qs = qs.filter(active_block_id__isnull=False)
+    users_list = list(qs.order_by("search_rank", "-date_joined")[:100])
 
     response = render(
         request,
@@ -99,6 +90,7 @@ def admin_search_users(request):
     return response
 
 
+@replica_reads
 @staff_required
 def admin_search_vacancies(request):
     """Search employers by vacancy filters."""
@@ -124,8 +116,8 @@ def admin_search_vacancies(request):
     if request.GET.get("to_pay"):
         status_filters |= Q(
             vacancies__status__in=[STATUS_AWAITING_PAYMENT, STATUS_CLOSED],
-            vacancies__extra__sent_final_call=True,
-            vacancies__extra__is_paid=False,
+            vacancies__sent_final_call=True,
+            vacancies__is_paid=False,
         )
         has_status_filter = True
 
@@ -141,21 +133,15 @@ def admin_search_vacancies(request):
         has_status_filter = True
 
     if request.GET.get("paid"):
-        status_filters |= Q(vacancies__status=STATUS_CLOSED, vacancies__extra__is_paid=True)
+        status_filters |= Q(vacancies__status=STATUS_CLOSED, vacancies__is_paid=True)
         has_status_filter = True
 
     if has_status_filter:
         qs = qs.filter(status_filters).distinct()
 
-    qs = qs.order_by("-date_joined")[:100]
+    from user.search import with_active_block
 
-    from user.models import UserBlock
-
-    users_list = list(qs)
-    for u in users_list:
-        block = UserBlock.objects.filter(user=u, is_active=True).order_by("-created_at").first()
-        u.active_block_id = block.pk if block else None
-        u.active_block_type = block.block_type if block else None
+    users_list = list(with_active_block(qs).order_by("-date_joined")[:100])
 
     response = render(
         request,
@@ -251,31 +237,29 @@ def admin_moderate_vacancy(request, vacancy_id):
                                 "work_profile": work_profile,
                             },
                         )
-                # Assign group from pool (same logic as Django Admin save_model)
-                if not vacancy.group:
-                    from telegram.choices import STATUS_PROCESS
-                    from telegram.service.group import GroupService
-
-                    group = GroupService.get_available_group()
-                    if group:
-                        vacancy.group = group
-                        group.status = STATUS_PROCESS
-                        group.save(update_fields=["status"])
-                    else:
-                        form.add_error(None, "Немає вільних груп для вакансії. Спробуйте пізніше.")
-                        return render(
-                            request,
-                            "work/admin_moderate_vacancy.html",
-                            {
-                                "form": form,
-                                "vacancy": vacancy,
-                                "target_user": vacancy.owner,
-                                "work_profile": work_profile,
-                            },
-                        )
-
-                vacancy.status = STATUS_APPROVED
-                vacancy.save()
+                # Assign group from pool (same logic as Django Admin save_model), saved in the same transaction
+                with transaction.atomic():
+                    if not vacancy.group:
+                        from telegram.service.group import GroupService
+
+                        group = GroupService.allocate_group()
+                        if group:
+                            vacancy.group = group
+                        else:
+                            form.add_error(None, "Немає вільних груп для вакансії. Спробуйте пізніше.")
+                            return render(
+                                request,
+                                "work/admin_moderate_vacancy.html",
+                                {
+                                    "form": form,
+                                    "vacancy": vacancy,
+                                    "target_user": vacancy.owner,
+                                    "work_profile": work_profile,
+                                },
+                            )
+
+                    vacancy.status = STATUS_APPROVED
+                    vacancy.save()
                 # New cycle: admin moderation may have changed start_time; re-anchor.
                 from vacancy.services.call import reset_before_start_cycle as _reset_pre_call_adm
 
@@ -593,9 +577,11 @@ def admin_debtors_list(request):
     from vacancy.models import Vacancy
 
     now = timezone.now()
-    vacancies = Vacancy.objects.filter(status=STATUS_AWAITING_PAYMENT).select_related("owner").order_by("-date", "-id")
-    # Filter out paid in Python (more reliable than SQLite JSONField .exclude)
-    vacancies = [v for v in vacancies if not (v.extra or {}).get("is_paid")]
+    vacancies = (
+        Vacancy.objects.filter(status=STATUS_AWAITING_PAYMENT, is_paid=False)
+        .select_related("owner")
+        .order_by("-date", "-id")
+    )
 
     rows = []
     for v in vacancies:
@@ -644,25 +630,29 @@ def admin_mark_paid(request, vacancy_id):
     from telegram.handlers.bot_instance import bot as _bot
     from user.choices import BlockReason
     from user.models import UserBlock
+    from user.services import BlockService
     from vacancy.choices import STATUS_PAID
     from vacancy.models import Vacancy
+    from vacancy.services.timers import schedule_renewal_timer
 
     if request.method != "POST":
         return redirect("work:admin_debtors")
 
     vacancy = get_object_or_404(Vacancy, pk=vacancy_id)
-    if (vacancy.extra or {}).get("is_paid"):
+    if vacancy.is_paid:
         messages.info(request, f"Вакансія #{vacancy.id} вже оплачена.")
         return redirect("work:admin_debtors")
 
     vacancy.extra = dict(vacancy.extra or {})
-    vacancy.extra["is_paid"] = True
+    vacancy.is_paid = True
     vacancy.extra["paid_manually_by"] = request.user.pk
     vacancy.status = STATUS_PAID
-    vacancy.save(update_fields=["extra", "status"])
+    vacancy.save(update_fields=["extra", "is_paid", "status"])
+    schedule_renewal_timer(vacancy)
 
     # Lift UNPAID block if it exists
     UserBlock.objects.filter(user=vacancy.owner, is_active=True, reason=BlockReason.UNPAID).update(is_active=False)
+    BlockService.invalidate(vacancy.owner_id)
 
     # Notify the employer
     try:
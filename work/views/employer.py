@@ -1,10 +1,10 @@
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render
 
-from telegram.models import Channel
 from user.models import UserFeedback
 from vacancy.models import Vacancy
 from work.models import FaqItem
+from work.service import reference_data
 
 
 @login_required
@@ -12,13 +12,11 @@ def employer_reviews(request):
     """Page showing all reviews about current employer."""
     reviews = UserFeedback.objects.filter(user=request.user).select_related("owner").order_by("-created_at")
 
-    likes_count = UserFeedback.objects.filter(user=request.user, rating="like").count()
-    dislikes_count = UserFeedback.objects.filter(user=request.user, rating="dislike").count()
-    total_count = likes_count + dislikes_count
-
-    from user.rating import bayesian_rating
+    from user.rating import rating_stats_for
 
-    rating_percent = bayesian_rating(likes_count, dislikes_count)
+    stats = rating_stats_for([request.user.pk])[request.user.pk]
+    likes_count, dislikes_count, rating_percent = stats.likes, stats.dislikes, stats.percent
+    total_count = likes_count + dislikes_count
 
     enriched_reviews = []
     for review in reviews:
@@ -51,7 +49,7 @@ def employer_reviews(request):
 @login_required
 def employer_faq(request):
     """FAQ page for employers."""
-    faq_items = FaqItem.objects.filter(role=FaqItem.ROLE_EMPLOYER, is_active=True)
+    faq_items = reference_data.faq_items(FaqItem.ROLE_EMPLOYER)
     return render(
         request,
         "work/employer_faq.html",
@@ -76,14 +74,9 @@ def employer_cities(request):
             allowed_ids.append(profile.city_id)
 
         if allowed_ids:
-            channels = Channel.objects.filter(
-                city_id__in=allowed_ids,
-                is_active=True,
-                has_bot_administrator=True,
-                invite_link__isnull=False,
-            ).select_related("city")
-            for ch in channels:
-                city_name = ch.city.safe_translation_getter("name", any_language=True) if ch.city else ch.title
+            city_names = dict(reference_data.city_choices())
+            for ch in reference_data.public_channels(allowed_ids):
+                city_name = city_names.get(ch.city_id) or ch.title
                 city_channels.append(
                     {
                         "city_name": city_name,
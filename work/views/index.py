@@ -1,23 +1,13 @@
 from django.core.handlers.wsgi import WSGIRequest
 from django.shortcuts import redirect, render
 
-from telegram.choices import Status
-from telegram.models import Channel
-from user.models import UserFeedback
-from user.services import BlockService
-from vacancy.choices import (
-    STATUS_APPROVED,
-    STATUS_AWAITING_PAYMENT,
-    STATUS_CLOSED,
-    STATUS_PAID,
-    STATUS_PENDING,
-    STATUS_SEARCH_STOPPED,
-)
-from vacancy.models import Vacancy, VacancyUser
+from service.db_routing import replica_reads
 from work.blocks.registry import block_registry
 from work.choices import WorkProfileRole
+from work.service.dashboard import get_dashboard_summary
 
 
+@replica_reads
 def index(request: WSGIRequest):
     if not request.user.is_authenticated:
         return redirect("https://robochi.work")
@@ -32,152 +22,18 @@ def index(request: WSGIRequest):
         return redirect("work:admin_dashboard")
 
     profile = getattr(user, "work_profile", None)
+    summary = get_dashboard_summary(user)
 
     # Worker — dedicated dashboard
-    if profile and profile.role == "worker":
-        # City channel link
-        channel = None
-        if profile.city:
-            channel = Channel.objects.filter(
-                city=profile.city, is_active=True, has_bot_administrator=True, invite_link__isnull=False
-            ).first()
-
-        # Current active vacancy (worker is member of)
-        current_vacancy = None
-        vacancy_user = (
-            VacancyUser.objects.filter(user=user, status=Status.MEMBER)
-            .select_related("vacancy", "vacancy__group")
-            .filter(vacancy__status=STATUS_APPROVED)
-            .first()
-        )
-        if vacancy_user and vacancy_user.vacancy.group:
-            from telegram.models import UserInGroup
-
-            in_group = UserInGroup.objects.filter(
-                user=user, group=vacancy_user.vacancy.group, status=Status.MEMBER
-            ).exists()
-            if in_group:
-                current_vacancy = vacancy_user.vacancy
-
-        # Recently kicked/left — show vacancy for 1 hour so worker can leave feedback
-        if not current_vacancy:
-            from datetime import timedelta
-
-            from django.utils import timezone as _dash_tz
-
-            one_hour_ago = _dash_tz.now() - timedelta(hours=1)
-            kicked_vu = (
-                VacancyUser.objects.filter(
-                    user=user,
-                    status__in=[Status.KICKED, Status.LEFT],
-                    updated_at__gte=one_hour_ago,
-                )
-                .select_related("vacancy")
-                .order_by("-updated_at")
-                .first()
-            )
-            if kicked_vu:
-                current_vacancy = kicked_vu.vacancy
-
-        # Rating & text reviews count
-        from user.rating import bayesian_rating
-
-        likes = UserFeedback.objects.filter(user=user, rating="like").count()
-        dislikes = UserFeedback.objects.filter(user=user, rating="dislike").count()
-        rating_percent = bayesian_rating(likes, dislikes)
-        text_reviews_count = UserFeedback.objects.filter(user=user).exclude(text="").count()
-
-        is_blocked = BlockService.is_blocked(user)
-        context = {
-            "work_profile": profile,
-            "channel": channel,
-            "current_vacancy": current_vacancy,
-            "rating_percent": rating_percent,
-            "text_reviews_count": text_reviews_count,
-            "is_blocked": is_blocked,
-            "active_block": BlockService.get_active_block(user) if is_blocked else None,
-        }
-        return render(request, "work/worker_dashboard.html", context)
+    if summary and summary["role"] == WorkProfileRole.WORKER:
+        return render(request, "work/worker_dashboard.html", {"work_profile": profile, **summary})
 
     # Employer — dedicated dashboard
-    if profile and profile.role == WorkProfileRole.EMPLOYER:
-        # Check if employer has pending rollcall (block vacancy creation)
-        has_pending_rollcall = False
-        for _v in Vacancy.objects.filter(owner=user, status__in=[STATUS_APPROVED, STATUS_SEARCH_STOPPED]):
-            if (_v.extra.get("sent_start_call") and not _v.first_rollcall_passed) or (
-                _v.extra.get("sent_final_call") and not _v.second_rollcall_passed
-            ):
-                has_pending_rollcall = True
-                break
-
+    if summary and summary["role"] == WorkProfileRole.EMPLOYER:
         # First visit: no vacancies yet → redirect to create
-        if Vacancy.objects.filter(owner=user).count() == 0:
+        if summary["vacancies_count"] == 0:
             return redirect("vacancy:create")
-
-        # Active vacancies count
-        from datetime import timedelta
-
-        from django.db.models import Q
-        from django.utils import timezone as _tz
-
-        _threshold_3h = _tz.now() - timedelta(hours=3)
-        active_vacancies_count = (
-            Vacancy.objects.filter(owner=user)
-            .filter(
-                Q(
-                    status__in=[
-                        STATUS_PENDING,
-                        STATUS_APPROVED,
-                        STATUS_SEARCH_STOPPED,
-                        STATUS_AWAITING_PAYMENT,
-                        STATUS_PAID,
-                    ]
-                )
-                | Q(status=STATUS_CLOSED, closed_at__gte=_threshold_3h)
-            )
-            .count()
-        )
-
-        # Rating & text reviews count
-        from user.rating import bayesian_rating
-
-        likes = UserFeedback.objects.filter(user=user, rating="like").count()
-        dislikes = UserFeedback.objects.filter(user=user, rating="dislike").count()
-        rating_percent = bayesian_rating(likes, dislikes)
-        text_reviews_count = UserFeedback.objects.filter(user=user).exclude(text="").count()
-
-        # City channel link (single city)
-        channel = None
-        if profile.city:
-            channel = Channel.objects.filter(
-                city=profile.city, is_active=True, has_bot_administrator=True, invite_link__isnull=False
-            ).first()
-
-        # Multi-city: collect all city channels
-        city_channels = None
-        if profile.multi_city_enabled:
-            allowed_ids = list(profile.allowed_cities.values_list("id", flat=True))
-            if profile.city_id:
-                allowed_ids.append(profile.city_id)
-            city_channels = list(
-                Channel.objects.filter(
-                    city_id__in=allowed_ids, is_active=True, has_bot_administrator=True, invite_link__isnull=False
-                ).select_related("city")
-            )
-
-        is_blocked = BlockService.is_blocked(user)
-        context = {
-            "work_profile": profile,
-            "active_vacancies_count": active_vacancies_count,
-            "rating_percent": rating_percent,
-            "text_reviews_count": text_reviews_count,
-            "channel": channel,
-            "city_channels": city_channels,
-            "is_blocked": is_blocked,
-            "active_block": BlockService.get_active_block(user) if is_blocked else None,
-            "has_pending_rollcall": has_pending_rollcall,
-        }
-        return render(request, "work/employer_dashboard.html", context)
+        return render(request, "work/employer_dashboard.html", {"work_profile": profile, **summary})
 
     # Fallback — block-based dashboard
     blocks = []
@@ -1,11 +1,12 @@
 from django.shortcuts import render
 
 from work.models import AgreementText
+from work.service import reference_data
 
 
 def legal_offer_view(request):
     """Public offer agreement and Privacy policy page."""
-    agreement = AgreementText.objects.filter(role=AgreementText.TYPE_OFFER).first()
+    agreement = reference_data.agreement_text(AgreementText.TYPE_OFFER)
     return render(
         request,
         "work/legal_offer.html",
@@ -0,0 +1,21 @@
+import hmac
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+
+from service.metrics import render_prometheus
+
+
+def _authorized(request) -> bool:
+    token = getattr(settings, "METRICS_TOKEN", "")
+    header = request.headers.get("Authorization", "")
+    if token and header.startswith("Bearer "):
+        return hmac.compare_digest(header.removeprefix("Bearer "), token)
+    return request.user.is_authenticated and request.user.is_staff
+
+
+def metrics(request):
+    """Prometheus scrape endpoint: bearer METRICS_TOKEN, or a staff session."""
+    if not _authorized(request):
+        raise Http404
+    return HttpResponse(render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -6,7 +6,8 @@ from formtools.wizard.views import SessionWizardView
 
 from work.choices import WorkProfileRole
 from work.forms import AgreementForm, CityForm, GenderForm, RoleForm
-from work.models import AgreementText, UserWorkProfile
+from work.models import UserWorkProfile
+from work.service import reference_data
 from work.service.events import WORK_PROFILE_COMPLETED
 from work.service.subscriber_setup import work_publisher
 
@@ -59,7 +60,7 @@ class ProfileWizard(SessionWizardView):
         if self.steps.current == "agreement":
             role_data = self.get_cleaned_data_for_step("role") or {}
             role = role_data.get("role")
-            agreement = AgreementText.objects.filter(role=role).first()
+            agreement = reference_data.agreement_text(role)
             context["agreement"] = agreement
 
         return context
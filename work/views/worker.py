@@ -4,6 +4,7 @@ from django.shortcuts import render
 from user.models import UserFeedback
 from vacancy.models import Vacancy
 from work.models import FaqItem
+from work.service import reference_data
 
 
 @login_required
@@ -11,13 +12,11 @@ def worker_reviews(request):
     """Page showing all reviews about current worker."""
     reviews = UserFeedback.objects.filter(user=request.user).select_related("owner").order_by("-created_at")
 
-    likes_count = UserFeedback.objects.filter(user=request.user, rating="like").count()
-    dislikes_count = UserFeedback.objects.filter(user=request.user, rating="dislike").count()
-    total_count = likes_count + dislikes_count
-
-    from user.rating import bayesian_rating
+    from user.rating import rating_stats_for
 
-    rating_percent = bayesian_rating(likes_count, dislikes_count)
+    stats = rating_stats_for([request.user.pk])[request.user.pk]
+    likes_count, dislikes_count, rating_percent = stats.likes, stats.dislikes, stats.percent
+    total_count = likes_count + dislikes_count
 
     enriched_reviews = []
     for review in reviews:
@@ -50,7 +49,7 @@ def worker_reviews(request):
 @login_required
 def worker_faq(request):
     """FAQ page for workers."""
-    faq_items = FaqItem.objects.filter(role=FaqItem.ROLE_WORKER, is_active=True)
+    faq_items = reference_data.faq_items(FaqItem.ROLE_WORKER)
     return render(
         request,
         "work/worker_faq.html",